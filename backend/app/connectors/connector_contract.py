@@ -20,6 +20,19 @@ class NormalizedIngestionInput(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class SourceValidators(BaseModel):
+    """Cheap identity of a connector source, used to key the ingestion result cache.
+
+    With ``revalidate`` a cached result is only reused after `fetch` confirms
+    the source is unchanged (e.g. an HTTP 304 for the stored ETag).
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    identity: str
+    revalidate: bool = False
+
+
 class NexoraConnector(ABC):
     """Fetch external/raw data, normalize to canonical ingestion input, then reuse `IngestionService.ingest`."""
 
@@ -45,3 +58,12 @@ class NexoraConnector(ABC):
     @abstractmethod
     async def normalize(self, raw: dict[str, Any], config: dict[str, Any]) -> NormalizedIngestionInput:
         """Map raw payload → `NormalizedIngestionInput` for the shared ingestion service."""
+
+    def source_validators(self, config: dict[str, Any]) -> SourceValidators | None:
+        """Identity of the source behind ``config`` for result caching; ``None`` disables it.
+
+        Revalidating connectors receive the cached entry's validators as
+        ``config["cache_validators"]`` and return ``{"not_modified": True}``
+        from `fetch` when they still hold.
+        """
+        return None
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+from ingestion.result_cache import CachedIngestion, cache_key
 from ingestion.schemas import SignalBundle
 from ingestion.service import IngestionService
 
@@ -15,8 +17,28 @@ logger = logging.getLogger(__name__)
 
 async def run_connector(connector_id: str, config: dict[str, Any], service: IngestionService) -> SignalBundle:
     connector = get_connector(connector_id)
+    cache = service.result_cache
+    source = connector.source_validators(config) if cache is not None else None
+    key: str | None = None
+    cached: CachedIngestion | None = None
+    if source is not None:
+        key = cache_key(f"connector:{connector_id}", source.identity, options=config)
+        cached = cache.get(key, count=not source.revalidate)
+        if cached is not None and not source.revalidate:
+            logger.info("[Nexora][Connector] cache_hit connector_id=%s", connector_id)
+            return cached.bundle
+        if cached is not None and cached.validators:
+            config = {**config, "cache_validators": cached.validators}
+
     logger.info("[Nexora][Connector] fetch_started connector_id=%s", connector_id)
     raw = await connector.fetch(config)
+    if source is not None and source.revalidate:
+        not_modified = cached is not None and bool(raw.get("not_modified"))
+        cache.record_revalidation(not_modified=not_modified)
+        if not_modified:
+            logger.info("[Nexora][Connector] cache_revalidated connector_id=%s", connector_id)
+            return cached.bundle
+
     logger.info("[Nexora][Connector] normalized connector_id=%s", connector_id)
     normalized = await connector.normalize(raw, config)
     logger.info(
@@ -24,8 +46,14 @@ async def run_connector(connector_id: str, config: dict[str, Any], service: Inge
         connector_id,
         normalized.input_type,
     )
-    return service.ingest(
+    # Extraction and signal building are synchronous; keep them off the event loop.
+    bundle = await asyncio.to_thread(
+        service.ingest,
         input_type=normalized.input_type,
         payload=normalized.payload,
         metadata=normalized.metadata,
     )
+    if key is not None:
+        validators = raw.get("validators")
+        cache.put(key, bundle, validators=validators if isinstance(validators, dict) else None)
+    return bundle
@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import asyncio
 import csv
 import io
 from pathlib import Path
 from typing import Any
 
-from app.connectors.connector_contract import NexoraConnector, NormalizedIngestionInput
+from app.connectors.connector_contract import NexoraConnector, NormalizedIngestionInput, SourceValidators
 
-_MAX_CSV_BYTES = 2 * 1024 * 1024  # 2 MiB safety cap
+_MAX_CSV_BYTES = 2 * 1024 * 1024  # larger files are streamed instead of read whole
+_STREAM_OPTION_KEYS = ("batch_size", "sample_every", "max_rows")
 
 
 def _resolve_file_path(config: dict[str, Any]) -> str:
@@ -31,8 +33,75 @@ def _row_to_phrase(row: dict[str, str]) -> str:
     return ", ".join(parts)
 
 
+def _read_csv(path: Path, stream: bool) -> dict[str, Any]:
+    """Stat, read and parse a CSV file; blocking, so fetch runs it on a worker thread."""
+    if not path.is_file():
+        raise ValueError(f"CSV file not found or not a file: {path}")
+    size = path.stat().st_size
+    if stream or size > _MAX_CSV_BYTES:
+        # Rows are read in batches later, inside IngestionService.
+        return {"stream": True, "file_path": str(path.resolve()), "size_bytes": size}
+    if size == 0:
+        return {"rows": [], "columns": [], "file_path": str(path.resolve())}
+
+    text = path.read_text(encoding="utf-8", errors="replace")
+    if not text.strip():
+        return {"rows": [], "columns": [], "file_path": str(path.resolve())}
+
+    buffer = io.StringIO(text)
+    dialect = csv.get_dialect("excel")
+    sample = text[:4096]
+    if len(sample) >= 2:
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            dialect = csv.get_dialect("excel")
+
+    buffer.seek(0)
+    rows: list[dict[str, str]] = []
+    columns: list[str] = []
+    try:
+        reader = csv.DictReader(buffer, dialect=dialect)
+        columns = [h.strip() for h in (reader.fieldnames or []) if isinstance(h, str) and h.strip()]
+        for raw_row in reader:
+            if raw_row is None:
+                continue
+            cleaned: dict[str, str] = {}
+            for k, v in raw_row.items():
+                if k is None:
+                    continue
+                key = str(k).strip()
+                if not key:
+                    continue
+                cleaned[key] = "" if v is None else str(v).strip()
+            if any(cleaned.values()):
+                rows.append(cleaned)
+    except csv.Error:
+        buffer.seek(0)
+        fallback = csv.reader(buffer, dialect=dialect)
+        grid = [list(r) for r in fallback if any((c or "").strip() for c in r)]
+        if not grid:
+            return {"rows": [], "columns": [], "file_path": str(path.resolve())}
+        width = max(len(r) for r in grid)
+        header = grid[0]
+        if len(header) < width:
+            header = header + [f"col_{i}" for i in range(len(header), width)]
+        columns = [str(h).strip() or f"col_{i}" for i, h in enumerate(header[:width])]
+        for parts in grid[1:]:
+            row = {columns[i]: (parts[i] if i < len(parts) else "").strip() for i in range(len(columns))}
+            if any(row.values()):
+                rows.append(row)
+
+    return {"rows": rows, "columns": columns, "file_path": str(path.resolve())}
+
+
 class CsvConnector(NexoraConnector):
-    """Read a local CSV file, flatten rows to short phrases, ingest as text."""
+    """Read a local CSV file, flatten rows to short phrases, ingest as text.
+
+    Files over the in-memory cap (or ``config["stream"]``) are handed to the
+    streaming CSV ingestion instead; ``batch_size``, ``sample_every`` and
+    ``max_rows`` tune that path.
+    """
 
     @property
     def id(self) -> str:
@@ -46,68 +115,36 @@ class CsvConnector(NexoraConnector):
     def description(self) -> str:
         return "CSV file upload: reads local file, maps rows to text, then B.1 text → signals."
 
+    def source_validators(self, config: dict[str, Any]) -> SourceValidators | None:
+        try:
+            path = Path(_resolve_file_path(config)).expanduser().resolve()
+            stat = path.stat()
+        except (ValueError, OSError):
+            return None
+        if not path.is_file():
+            return None
+        # Size + mtime identify an unchanged local file without reading it.
+        return SourceValidators(identity=f"{path}|{stat.st_size}|{stat.st_mtime_ns}")
+
     async def fetch(self, config: dict[str, Any]) -> dict[str, Any]:
         path_str = _resolve_file_path(config)
         path = Path(path_str).expanduser()
-        if not path.is_file():
-            raise ValueError(f"CSV file not found or not a file: {path}")
-        size = path.stat().st_size
-        if size > _MAX_CSV_BYTES:
-            raise ValueError(f"CSV exceeds maximum size ({_MAX_CSV_BYTES} bytes): {path}")
-        if size == 0:
-            return {"rows": [], "columns": [], "file_path": str(path.resolve())}
-
-        text = path.read_text(encoding="utf-8", errors="replace")
-        if not text.strip():
-            return {"rows": [], "columns": [], "file_path": str(path.resolve())}
-
-        stream = io.StringIO(text)
-        dialect = csv.get_dialect("excel")
-        sample = text[:4096]
-        if len(sample) >= 2:
-            try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
-            except csv.Error:
-                dialect = csv.get_dialect("excel")
-
-        stream.seek(0)
-        rows: list[dict[str, str]] = []
-        columns: list[str] = []
-        try:
-            reader = csv.DictReader(stream, dialect=dialect)
-            columns = [h.strip() for h in (reader.fieldnames or []) if isinstance(h, str) and h.strip()]
-            for raw_row in reader:
-                if raw_row is None:
-                    continue
-                cleaned: dict[str, str] = {}
-                for k, v in raw_row.items():
-                    if k is None:
-                        continue
-                    key = str(k).strip()
-                    if not key:
-                        continue
-                    cleaned[key] = "" if v is None else str(v).strip()
-                if any(cleaned.values()):
-                    rows.append(cleaned)
-        except csv.Error:
-            stream.seek(0)
-            fallback = csv.reader(stream, dialect=dialect)
-            grid = [list(r) for r in fallback if any((c or "").strip() for c in r)]
-            if not grid:
-                return {"rows": [], "columns": [], "file_path": str(path.resolve())}
-            width = max(len(r) for r in grid)
-            header = grid[0]
-            if len(header) < width:
-                header = header + [f"col_{i}" for i in range(len(header), width)]
-            columns = [str(h).strip() or f"col_{i}" for i, h in enumerate(header[:width])]
-            for parts in grid[1:]:
-                row = {columns[i]: (parts[i] if i < len(parts) else "").strip() for i in range(len(columns))}
-                if any(row.values()):
-                    rows.append(row)
-
-        return {"rows": rows, "columns": columns, "file_path": str(path.resolve())}
+        # The read and parse block; keep them off the event loop so concurrent
+        # connector runs keep flowing and their deadlines stay enforceable.
+        return await asyncio.to_thread(_read_csv, path, bool(config.get("stream")))
 
     async def normalize(self, raw: dict[str, Any], config: dict[str, Any]) -> NormalizedIngestionInput:
+        if raw.get("stream"):
+            payload: dict[str, Any] = {"file_path": raw["file_path"], "stream": True}
+            payload.update({key: config[key] for key in _STREAM_OPTION_KEYS if config.get(key) is not None})
+            meta = {
+                "source": "csv_upload",
+                "connector_id": self.id,
+                "file_path": raw["file_path"],
+                "size_bytes": raw.get("size_bytes"),
+            }
+            return NormalizedIngestionInput(input_type="csv", payload=payload, metadata=meta)
+
         rows = raw.get("rows")
         if not isinstance(rows, list):
             rows = []
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
+from ingestion.result_cache import get_result_cache
 from ingestion.schemas import Signal, SignalBundle
 from ingestion.service import IngestionService
 
 from app.connectors.connector_runner import run_connector
 from app.connectors.merge_contract import (
+    ConnectorRunInput,
     ConnectorRunResult,
     MergedSignalBundle,
     MultiSourceIngestionRequest,
@@ -23,6 +26,9 @@ from app.connectors.source_trust import (
 
 logger = logging.getLogger(__name__)
 
+MAX_CONCURRENT_SOURCES = 4
+CONNECTOR_TIMEOUT_SECONDS = 15.0
+
 
 def _signal_dedupe_key(signal: Signal) -> str:
     return f"{signal.type.strip().lower()}::{signal.label.strip().lower()}::{signal.description.strip().lower()}"
@@ -83,41 +89,79 @@ def _build_warnings(results: list[ConnectorRunResult]) -> list[str]:
     return warnings
 
 
+async def _run_source(
+    source: ConnectorRunInput,
+    *,
+    domain: str | None,
+    service: IngestionService,
+    semaphore: asyncio.Semaphore,
+    timeout_seconds: float,
+) -> tuple[ConnectorRunResult, str | None]:
+    """Run one connector under the shared concurrency limit and its own deadline."""
+    run_meta: dict[str, Any] = {"config_keys": sorted(source.config.keys())}
+    if domain:
+        run_meta["domain"] = domain
+    try:
+        async with semaphore:
+            bundle: SignalBundle = await asyncio.wait_for(
+                run_connector(source.connector_id, source.config, service),
+                timeout=timeout_seconds,
+            )
+    except asyncio.TimeoutError:
+        err = f"connector_timeout_after_{timeout_seconds:g}s"
+    except Exception as exc:
+        err = str(exc).strip() or "connector_run_failed"
+    else:
+        return (
+            ConnectorRunResult(
+                connector_id=source.connector_id,
+                ok=True,
+                bundle=bundle,
+                errors=[],
+                metadata=run_meta,
+            ),
+            None,
+        )
+    return (
+        ConnectorRunResult(
+            connector_id=source.connector_id,
+            ok=False,
+            bundle=None,
+            errors=[err],
+            metadata=run_meta,
+        ),
+        f"{source.connector_id}: {err}",
+    )
+
+
 async def run_multi_source_ingestion(
     request: MultiSourceIngestionRequest,
+    *,
+    max_concurrency: int = MAX_CONCURRENT_SOURCES,
+    timeout_seconds: float = CONNECTOR_TIMEOUT_SECONDS,
 ) -> MultiSourceIngestionResponse:
-    """Run all requested connectors, merge results, and keep partial failures."""
-    service = IngestionService()
-    source_results: list[ConnectorRunResult] = []
-    top_level_errors: list[str] = []
-
-    for source in request.sources:
-        run_meta: dict[str, Any] = {"config_keys": sorted(source.config.keys())}
-        if request.domain:
-            run_meta["domain"] = request.domain
-        try:
-            bundle: SignalBundle = await run_connector(source.connector_id, source.config, service)
-            source_results.append(
-                ConnectorRunResult(
-                    connector_id=source.connector_id,
-                    ok=True,
-                    bundle=bundle,
-                    errors=[],
-                    metadata=run_meta,
-                )
-            )
-        except Exception as exc:
-            err = str(exc).strip() or "connector_run_failed"
-            top_level_errors.append(f"{source.connector_id}: {err}")
-            source_results.append(
-                ConnectorRunResult(
-                    connector_id=source.connector_id,
-                    ok=False,
-                    bundle=None,
-                    errors=[err],
-                    metadata=run_meta,
-                )
+    """Run all requested connectors, merge results, and keep partial failures.
+
+    Sources run concurrently (at most `max_concurrency` at a time), each
+    cancelled after `timeout_seconds`. Results keep request order, so the
+    merge stays deterministic regardless of completion order.
+    """
+    service = IngestionService(result_cache=get_result_cache())
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+    outcomes = await asyncio.gather(
+        *(
+            _run_source(
+                source,
+                domain=request.domain,
+                service=service,
+                semaphore=semaphore,
+                timeout_seconds=timeout_seconds,
             )
+            for source in request.sources
+        )
+    )
+    source_results: list[ConnectorRunResult] = [result for result, _ in outcomes]
+    top_level_errors: list[str] = [error for _, error in outcomes if error is not None]
 
     weighted_results, source_weights = _with_trust_weighted_bundles(source_results)
     merged_signals = merge_signals(weighted_results)
@@ -2,14 +2,15 @@
 
 from __future__ import annotations
 
+import asyncio
 import re
 from html import unescape
 from html.parser import HTMLParser
 from typing import Any
-from urllib.error import URLError
+from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
-from app.connectors.connector_contract import NexoraConnector, NormalizedIngestionInput
+from app.connectors.connector_contract import NexoraConnector, NormalizedIngestionInput, SourceValidators
 from app.connectors.web_policy import WebIngestionPolicy, validate_url_policy
 
 _FETCH_TIMEOUT_SECONDS = 6
@@ -87,6 +88,26 @@ def _extract_readable_text(html: str) -> str:
     return _regex_fallback_extract(html)
 
 
+def _read_url(req: Request) -> tuple[bytes, str, str, dict[str, str]] | None:
+    """Fetch a page; ``None`` means the server answered 304 to a conditional request."""
+    try:
+        with urlopen(req, timeout=_FETCH_TIMEOUT_SECONDS) as resp:
+            raw = resp.read(_MAX_HTML_BYTES + 1)
+            content_type = resp.headers.get("Content-Type", "")
+            charset = resp.headers.get_content_charset() or "utf-8"
+            headers = resp.headers
+            validators = {
+                name: value
+                for name, value in (("etag", headers.get("ETag")), ("last_modified", headers.get("Last-Modified")))
+                if isinstance(value, str) and value
+            }
+    except HTTPError as exc:
+        if exc.code == 304:
+            return None
+        raise
+    return raw, content_type, charset, validators
+
+
 class WebConnector(NexoraConnector):
     """Fetch a single URL, extract readable text, pass through canonical ingestion."""
 
@@ -102,34 +123,60 @@ class WebConnector(NexoraConnector):
     def description(self) -> str:
         return "Web / news connector: fetches URL content and extracts readable article text."
 
+    def source_validators(self, config: dict[str, Any]) -> SourceValidators | None:
+        try:
+            url = _validate_url(config)
+        except ValueError:
+            return None
+        return SourceValidators(identity=url, revalidate=True)
+
     async def fetch(self, config: dict[str, Any]) -> dict[str, Any]:
         url = _validate_url(config)
         domain = validate_url_policy(url, _WEB_POLICY)
-        req = Request(
-            url,
-            headers={
-                "User-Agent": "NexoraConnector/1.0 (+https://nexora.local)",
-                "Accept": "text/html,application/xhtml+xml",
-            },
-        )
+        headers = {
+            "User-Agent": "NexoraConnector/1.0 (+https://nexora.local)",
+            "Accept": "text/html,application/xhtml+xml",
+        }
+        cached_validators = config.get("cache_validators")
+        if isinstance(cached_validators, dict):
+            if cached_validators.get("etag"):
+                headers["If-None-Match"] = str(cached_validators["etag"])
+            if cached_validators.get("last_modified"):
+                headers["If-Modified-Since"] = str(cached_validators["last_modified"])
+        req = Request(url, headers=headers)
         try:
-            with urlopen(req, timeout=_FETCH_TIMEOUT_SECONDS) as resp:
-                raw = resp.read(_MAX_HTML_BYTES + 1)
-                content_type = resp.headers.get("Content-Type", "")
-                charset = resp.headers.get_content_charset() or "utf-8"
+            # urlopen blocks; run it on a worker thread so other requests keep flowing.
+            response = await asyncio.to_thread(_read_url, req)
         except URLError as exc:
             raise ValueError(f"web fetch failed: {exc}") from exc
         except Exception as exc:  # Defensive against transport/runtime errors.
             raise ValueError(f"web fetch failed: {exc}") from exc
 
+        if response is None:
+            return {"not_modified": True, "url": url, "domain": domain}
+        raw, content_type, charset, validators = response
         if not raw:
-            return {"html": "", "url": url, "domain": domain, "content_type": content_type, "truncated": False}
+            return {
+                "html": "",
+                "url": url,
+                "domain": domain,
+                "content_type": content_type,
+                "truncated": False,
+                "validators": validators,
+            }
 
         truncated = len(raw) > _MAX_HTML_BYTES
         if truncated:
             raw = raw[:_MAX_HTML_BYTES]
         html = raw.decode(charset, errors="replace")
-        return {"html": html, "url": url, "domain": domain, "content_type": content_type, "truncated": truncated}
+        return {
+            "html": html,
+            "url": url,
+            "domain": domain,
+            "content_type": content_type,
+            "truncated": truncated,
+            "validators": validators,
+        }
 
     async def normalize(self, raw: dict[str, Any], config: dict[str, Any]) -> NormalizedIngestionInput:
         html = str(raw.get("html") or "")
@@ -170,6 +170,35 @@ class LocalAISettings(BaseSettings):
         default=False,
         validation_alias="AI_TELEMETRY_INCLUDE_PROVIDER_METADATA",
     )
+    ai_jsonl_batch_size: int = Field(
+        default=256,
+        validation_alias="AI_JSONL_BATCH_SIZE",
+        ge=1,
+    )
+    ai_jsonl_flush_interval_ms: int = Field(
+        default=200,
+        validation_alias="AI_JSONL_FLUSH_INTERVAL_MS",
+        ge=1,
+    )
+    ai_jsonl_queue_max_events: int = Field(
+        default=10000,
+        validation_alias="AI_JSONL_QUEUE_MAX_EVENTS",
+        ge=1,
+    )
+    ai_jsonl_overflow_policy: str = Field(
+        default="drop_oldest",
+        validation_alias="AI_JSONL_OVERFLOW_POLICY",
+    )
+    ai_jsonl_block_timeout_ms: int = Field(
+        default=1000,
+        validation_alias="AI_JSONL_BLOCK_TIMEOUT_MS",
+        ge=0,
+    )
+    ai_jsonl_rotate_max_bytes: int = Field(
+        default=50 * 1024 * 1024,
+        validation_alias="AI_JSONL_ROTATE_MAX_BYTES",
+        ge=0,
+    )
     ai_cloud_allowed_tasks: str = Field(
         default="analyze_scenario,explain,summarize_context",
         validation_alias="AI_CLOUD_ALLOWED_TASKS",
@@ -239,6 +268,86 @@ class LocalAISettings(BaseSettings):
         default="/api/tags",
         validation_alias="OLLAMA_HEALTH_PATH",
     )
+    ai_http_pool_max_connections: int = Field(
+        default=20,
+        validation_alias="AI_HTTP_POOL_MAX_CONNECTIONS",
+        ge=1,
+    )
+    ai_http_pool_max_keepalive: int = Field(
+        default=10,
+        validation_alias="AI_HTTP_POOL_MAX_KEEPALIVE",
+        ge=0,
+    )
+    ai_http_pool_keepalive_expiry_seconds: float = Field(
+        default=30.0,
+        validation_alias="AI_HTTP_POOL_KEEPALIVE_EXPIRY_SECONDS",
+        ge=0.0,
+    )
+    ai_http2_enabled: bool = Field(
+        default=True,
+        validation_alias="AI_HTTP2_ENABLED",
+    )
+    ai_provider_health_ttl_seconds: float = Field(
+        default=15.0,
+        validation_alias="AI_PROVIDER_HEALTH_TTL_SECONDS",
+        ge=0.0,
+    )
+    ai_provider_models_ttl_seconds: float = Field(
+        default=60.0,
+        validation_alias="AI_PROVIDER_MODELS_TTL_SECONDS",
+        ge=0.0,
+    )
+    ai_provider_negative_ttl_seconds: float = Field(
+        default=5.0,
+        validation_alias="AI_PROVIDER_NEGATIVE_TTL_SECONDS",
+        ge=0.0,
+    )
+    ai_provider_circuit_failure_threshold: int = Field(
+        default=3,
+        validation_alias="AI_PROVIDER_CIRCUIT_FAILURE_THRESHOLD",
+        ge=1,
+    )
+    ai_provider_circuit_open_seconds: float = Field(
+        default=30.0,
+        validation_alias="AI_PROVIDER_CIRCUIT_OPEN_SECONDS",
+        ge=0.0,
+    )
+    ai_response_cache_enabled: bool = Field(
+        default=True,
+        validation_alias="AI_RESPONSE_CACHE_ENABLED",
+    )
+    ai_response_cache_ttl_seconds: float = Field(
+        default=300.0,
+        validation_alias="AI_RESPONSE_CACHE_TTL_SECONDS",
+        ge=0.0,
+    )
+    ai_response_cache_max_entries: int = Field(
+        default=512,
+        validation_alias="AI_RESPONSE_CACHE_MAX_ENTRIES",
+        ge=0,
+    )
+    ai_response_cache_max_bytes: int = Field(
+        default=32 * 1024 * 1024,
+        validation_alias="AI_RESPONSE_CACHE_MAX_BYTES",
+        ge=0,
+    )
+    ai_response_cache_dir: str = Field(
+        default="",
+        validation_alias="AI_RESPONSE_CACHE_DIR",
+    )
+    ai_response_cache_disk_max_entries: int = Field(
+        default=5000,
+        validation_alias="AI_RESPONSE_CACHE_DISK_MAX_ENTRIES",
+        ge=0,
+    )
+    ai_response_cache_sensitivity_levels: str = Field(
+        default="public,internal,confidential",
+        validation_alias="AI_RESPONSE_CACHE_SENSITIVITY_LEVELS",
+    )
+    ai_response_cache_persist_sensitivity_levels: str = Field(
+        default="public,internal",
+        validation_alias="AI_RESPONSE_CACHE_PERSIST_SENSITIVITY_LEVELS",
+    )
     openai_base_url: str = Field(
         default="https://api.openai.com/v1",
         validation_alias="OPENAI_BASE_URL",
@@ -292,6 +401,91 @@ class LocalAISettings(BaseSettings):
         path = self.ollama_health_path.strip() or "/api/tags"
         return path if path.startswith("/") else f"/{path}"
 
+    @property
+    def http_pool_max_connections(self) -> int:
+        """Return the maximum number of pooled connections per provider base URL."""
+        return self.ai_http_pool_max_connections
+
+    @property
+    def http_pool_max_keepalive(self) -> int:
+        """Return the maximum number of idle keep-alive connections per provider base URL."""
+        return min(self.ai_http_pool_max_keepalive, self.ai_http_pool_max_connections)
+
+    @property
+    def http_pool_keepalive_expiry_seconds(self) -> float:
+        """Return how long idle provider connections are kept alive."""
+        return self.ai_http_pool_keepalive_expiry_seconds
+
+    @property
+    def http2_enabled(self) -> bool:
+        """Return whether provider clients may negotiate HTTP/2 when supported."""
+        return self.ai_http2_enabled
+
+    @property
+    def provider_health_ttl_seconds(self) -> float:
+        """Return how long a successful provider health probe is reused."""
+        return self.ai_provider_health_ttl_seconds
+
+    @property
+    def provider_models_ttl_seconds(self) -> float:
+        """Return how long a successful provider model listing is reused."""
+        return self.ai_provider_models_ttl_seconds
+
+    @property
+    def provider_negative_ttl_seconds(self) -> float:
+        """Return how long a failed provider probe is reused before retrying."""
+        return self.ai_provider_negative_ttl_seconds
+
+    @property
+    def provider_circuit_failure_threshold(self) -> int:
+        """Return consecutive probe failures that open a provider circuit."""
+        return self.ai_provider_circuit_failure_threshold
+
+    @property
+    def provider_circuit_open_seconds(self) -> float:
+        """Return how long an open provider circuit skips probing."""
+        return self.ai_provider_circuit_open_seconds
+
+    @property
+    def response_cache_enabled(self) -> bool:
+        """Return whether structured provider responses may be reused."""
+        return self.ai_response_cache_enabled
+
+    @property
+    def response_cache_ttl_seconds(self) -> float:
+        """Return how long a cached provider response stays valid."""
+        return self.ai_response_cache_ttl_seconds
+
+    @property
+    def response_cache_max_entries(self) -> int:
+        """Return the maximum number of in-memory cached responses."""
+        return self.ai_response_cache_max_entries
+
+    @property
+    def response_cache_max_bytes(self) -> int:
+        """Return the serialized size bound of the in-memory response cache (0 disables the bound)."""
+        return self.ai_response_cache_max_bytes
+
+    @property
+    def response_cache_dir(self) -> str | None:
+        """Return the on-disk response cache directory, or None when the disk tier is off."""
+        return self.ai_response_cache_dir.strip() or None
+
+    @property
+    def response_cache_disk_max_entries(self) -> int:
+        """Return the maximum number of responses kept in the on-disk tier."""
+        return self.ai_response_cache_disk_max_entries
+
+    @property
+    def response_cache_sensitivity_levels(self) -> set[str]:
+        """Return sensitivity levels whose responses may be cached in memory."""
+        return _parse_csv_to_set(self.ai_response_cache_sensitivity_levels)
+
+    @property
+    def response_cache_persist_sensitivity_levels(self) -> set[str]:
+        """Return sensitivity levels whose responses may be written to the disk tier."""
+        return _parse_csv_to_set(self.ai_response_cache_persist_sensitivity_levels)
+
     @property
     def log_raw_responses(self) -> bool:
         """Return whether raw provider responses should be logged."""
@@ -511,6 +705,37 @@ class LocalAISettings(BaseSettings):
         """Return whether provider metadata may be included in telemetry events."""
         return self.ai_telemetry_include_provider_metadata
 
+    @property
+    def jsonl_batch_size(self) -> int:
+        """Return the maximum number of JSONL records written per batch."""
+        return self.ai_jsonl_batch_size
+
+    @property
+    def jsonl_flush_interval_ms(self) -> int:
+        """Return how long buffered JSONL records may wait before a flush."""
+        return self.ai_jsonl_flush_interval_ms
+
+    @property
+    def jsonl_queue_max_events(self) -> int:
+        """Return the bound of the JSONL write-behind queue."""
+        return self.ai_jsonl_queue_max_events
+
+    @property
+    def jsonl_overflow_policy(self) -> str:
+        """Return what to do when the JSONL queue is full: drop_oldest, drop_newest or block."""
+        policy = self.ai_jsonl_overflow_policy.strip().lower()
+        return policy if policy in {"block", "drop_newest", "drop_oldest"} else "drop_oldest"
+
+    @property
+    def jsonl_block_timeout_ms(self) -> int:
+        """Return how long the block policy waits for queue space before dropping."""
+        return self.ai_jsonl_block_timeout_ms
+
+    @property
+    def jsonl_rotate_max_bytes(self) -> int:
+        """Return the JSONL file size that triggers rotation (0 disables size rotation)."""
+        return self.ai_jsonl_rotate_max_bytes
+
     @property
     def cloud_allowed_tasks(self) -> set[str]:
         """Return tasks that may route to cloud when policy allows."""
@@ -1,7 +1,12 @@
 # backend/app/engines/fragility_v1.py
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; only the batch API needs it
+    np = None
 
 
 def _clamp01(x: Any) -> float:
@@ -100,3 +105,43 @@ def compute_fragility_v1(
             "loop_risk": float(loop_risk),
         },
     }
+
+
+def compute_fragility_v1_batch(
+    kpis: Any,
+    loops: List[dict] | None,
+    chaos: Any | None,
+) -> Tuple[Any, Any]:
+    """
+    Vectorized Fragility Engine v1 for Monte Carlo sampling.
+
+    `kpis` is an (n, 3) array of inventory, delivery and risk values. Returns
+    `(scores, levels)` arrays matching `compute_fragility_v1` row by row;
+    reasons and drivers are not built. Requires numpy.
+    """
+    if np is None:
+        raise RuntimeError("compute_fragility_v1_batch requires numpy")
+    values = np.clip(np.asarray(kpis, dtype=float).reshape(-1, 3), 0.0, 1.0)
+    loops = loops if isinstance(loops, list) else []
+
+    vol = 0.0
+    if chaos is not None:
+        vol = _clamp01(getattr(chaos, "volatility", getattr(chaos, "intensity", 0.0)) or 0.0)
+    loop_risk = min(_clamp01(0.15 * len(loops)), 0.45)
+
+    inventory_pressure = np.clip(1.0 - values[:, 0], 0.0, 1.0)
+    time_pressure = np.clip(1.0 - values[:, 1], 0.0, 1.0)
+    quality_risk = values[:, 2]
+
+    # Same term order as the scalar engine so both produce identical floats.
+    scores = np.clip(
+        0.28 * inventory_pressure
+        + 0.28 * time_pressure
+        + 0.28 * quality_risk
+        + 0.16 * vol
+        + loop_risk,
+        0.0,
+        1.0,
+    )
+    levels = np.where(scores >= 0.67, "high", np.where(scores >= 0.34, "medium", "low"))
+    return scores, levels
@@ -3,48 +3,79 @@
 from __future__ import annotations
 
 import time
-from collections import defaultdict, deque
-from typing import Deque
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.services.session_state import SESSION_MAX_ENTRIES, SessionStateStore
+
+
+class _ClientWindow:
+    """Request counts of the current and previous fixed window for one client."""
+
+    __slots__ = ("window", "count", "previous")
+
+    def __init__(self, window: int) -> None:
+        self.window = window
+        self.count = 0
+        self.previous = 0
 
 
 class InMemoryRateLimiter:
-    """Track request timestamps per client IP using a rolling window."""
+    """Per-client sliding-window counter: O(1) state per client IP.
 
-    def __init__(self, max_requests: int = 60, window_seconds: int = 60) -> None:
+    The request count of the previous fixed window is weighted by how much of
+    it still overlaps the rolling window, which approximates a true rolling
+    log without keeping one timestamp per request. Clients idle for two
+    windows carry no weight and are purged by the store's TTL.
+    """
+
+    def __init__(
+        self,
+        max_requests: int = 60,
+        window_seconds: int = 60,
+        max_clients: int = SESSION_MAX_ENTRIES,
+    ) -> None:
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self._requests: dict[str, Deque[float]] = defaultdict(deque)
-
-    def allow_request(self, client_ip: str) -> bool:
-        now = time.time()
-        window_start = now - self.window_seconds
-        timestamps = self._requests[client_ip]
+        self._requests: SessionStateStore[_ClientWindow] = SessionStateStore(
+            "rate_limit_clients",
+            max_entries=max_clients,
+            ttl_seconds=2 * window_seconds,
+        )
 
-        while timestamps and timestamps[0] < window_start:
-            timestamps.popleft()
+    def allow_request(self, client_ip: str, now: float | None = None) -> bool:
+        now = time.time() if now is None else now
+        position = now / self.window_seconds
+        window = int(position)
+        with self._requests.lock(client_ip):
+            state = self._requests.get(client_ip)
+            if state is None:
+                state = self._requests.setdefault(client_ip, _ClientWindow(window))
+            if state.window != window:
+                state.previous = state.count if window == state.window + 1 else 0
+                state.count = 0
+                state.window = window
 
-        if len(timestamps) >= self.max_requests:
-            return False
+            estimated = state.previous * (1.0 - (position - window)) + state.count
+            if estimated >= self.max_requests:
+                return False
 
-        timestamps.append(now)
-        return True
+            state.count += 1
+            return True
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """MVP request limiter that applies simple per-IP rate limiting."""
+class RateLimitMiddleware:
+    """MVP request limiter that applies simple per-IP rate limiting (pure ASGI)."""
 
     def __init__(
         self,
-        app,
+        app: ASGIApp,
         *,
         max_requests: int = 60,
         window_seconds: int = 60,
     ) -> None:
-        super().__init__(app)
+        self.app = app
         # This in-memory limiter is suitable for MVP and local deployments.
         # Future production systems may replace it with Redis or gateway limits.
         self.limiter = InMemoryRateLimiter(
@@ -52,40 +83,49 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
             window_seconds=window_seconds,
         )
 
-    async def dispatch(self, request: Request, call_next):
-        if request.url.path == "/health":
-            return await call_next(request)
-
-        client_ip = self._get_client_ip(request)
-
-        if not self.limiter.allow_request(client_ip):
-            allowed_origins = {"http://localhost:3000", "http://127.0.0.1:3000"}
-            request_origin = request.headers.get("origin")
-            allow_origin = request_origin if request_origin in allowed_origins else "http://localhost:3000"
-            return JSONResponse(
-                status_code=429,
-                content={
-                    "ok": False,
-                    "error": {
-                        "type": "RATE_LIMIT_EXCEEDED",
-                        "message": "Too many requests. Please try again later.",
-                    },
-                },
-                headers={
-                    "Access-Control-Allow-Origin": allow_origin,
-                    "Access-Control-Allow-Credentials": "true",
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
+
+        if self.limiter.allow_request(self._get_client_ip(scope)):
+            await self.app(scope, receive, send)
+            return
+
+        allowed_origins = {"http://localhost:3000", "http://127.0.0.1:3000"}
+        request_origin = _header(scope, b"origin")
+        allow_origin = request_origin if request_origin in allowed_origins else "http://localhost:3000"
+        response = JSONResponse(
+            status_code=429,
+            content={
+                "ok": False,
+                "error": {
+                    "type": "RATE_LIMIT_EXCEEDED",
+                    "message": "Too many requests. Please try again later.",
                 },
-            )
-
-        return await call_next(request)
+            },
+            headers={
+                "Access-Control-Allow-Origin": allow_origin,
+                "Access-Control-Allow-Credentials": "true",
+            },
+        )
+        await response(scope, receive, send)
 
     @staticmethod
-    def _get_client_ip(request: Request) -> str:
-        forwarded_for = request.headers.get("x-forwarded-for")
+    def _get_client_ip(scope: Scope) -> str:
+        forwarded_for = _header(scope, b"x-forwarded-for")
         if forwarded_for:
             return forwarded_for.split(",")[0].strip()
 
-        if request.client and request.client.host:
-            return request.client.host
+        client = scope.get("client")
+        if client and client[0]:
+            return client[0]
 
         return "unknown"
+
+
+def _header(scope: Scope, name: bytes) -> str | None:
+    for key, value in scope.get("headers") or ():
+        if key == name:
+            return value.decode("latin-1")
+    return None
@@ -3,50 +3,79 @@
 from __future__ import annotations
 
 import logging
+import os
+import random
 import time
 from datetime import datetime, timezone
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
 logger = logging.getLogger("nexora.request_audit")
 
+# Fraction of ordinary requests written to the access log. Errors (status >= 400)
+# and requests slower than AUDIT_SLOW_MS are always logged.
+AUDIT_SAMPLE_RATE = float(os.getenv("NEXORA_AUDIT_SAMPLE_RATE", "1.0"))
+AUDIT_SLOW_MS = float(os.getenv("NEXORA_AUDIT_SLOW_MS", "1000"))
 
-def _get_client_ip(request: Request) -> str:
+
+def _get_client_ip(scope: Scope) -> str:
     """Return the best available client IP for safe request auditing."""
-    forwarded_for = request.headers.get("x-forwarded-for")
-    if forwarded_for:
-        return forwarded_for.split(",")[0].strip()
+    for key, value in scope.get("headers") or ():
+        if key == b"x-forwarded-for":
+            return value.decode("latin-1").split(",")[0].strip()
 
-    if request.client and request.client.host:
-        return request.client.host
+    client = scope.get("client")
+    if client and client[0]:
+        return client[0]
 
     return "unknown"
 
 
-class RequestAuditMiddleware(BaseHTTPMiddleware):
-    """Log request metadata for operational visibility and debugging."""
+class RequestAuditMiddleware:
+    """Log request metadata for operational visibility and debugging (pure ASGI)."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        sample_rate: float = AUDIT_SAMPLE_RATE,
+        slow_ms: float = AUDIT_SLOW_MS,
+    ) -> None:
+        self.app = app
+        self.sample_rate = min(1.0, max(0.0, sample_rate))
+        self.slow_ms = slow_ms
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         # This middleware provides lightweight audit visibility for the MVP.
         # It is useful for debugging and operational trails, but must never
         # log request bodies, secrets, or other sensitive payload contents.
-        started_at = time.perf_counter()
-        timestamp = datetime.now(timezone.utc).isoformat()
-
-        response = await call_next(request)
+        if scope["type"] != "http" or not logger.isEnabledFor(logging.INFO):
+            await self.app(scope, receive, send)
+            return
 
-        duration_ms = round((time.perf_counter() - started_at) * 1000, 2)
-
-        logger.info(
-            "request_audit timestamp=%s method=%s path=%s client_ip=%s status_code=%s duration_ms=%s",
-            timestamp,
-            request.method,
-            request.url.path,
-            _get_client_ip(request),
-            response.status_code,
-            duration_ms,
-        )
-
-        return response
+        started_wall = time.time()
+        started_at = time.perf_counter()
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            duration_ms = round((time.perf_counter() - started_at) * 1000, 2)
+            sampled = self.sample_rate >= 1.0 or random.random() < self.sample_rate
+            if sampled or status_code >= 400 or duration_ms >= self.slow_ms:
+                logger.info(
+                    "request_audit timestamp=%s method=%s path=%s client_ip=%s status_code=%s duration_ms=%s",
+                    datetime.fromtimestamp(started_wall, timezone.utc).isoformat(),
+                    scope.get("method"),
+                    scope.get("path"),
+                    _get_client_ip(scope),
+                    status_code,
+                    duration_ms,
+                )
@@ -60,3 +60,11 @@ class FragilityScanRequest(BaseModel):
         ):
             raise ValueError("Provide at least one of 'signal_bundle', 'text', 'payload', or 'source_url'.")
         return normalized
+
+
+class FragilityBatchScanRequest(BaseModel):
+    """Many fragility scan requests scored in one call."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    documents: list[FragilityScanRequest] = Field(min_length=1, max_length=200)
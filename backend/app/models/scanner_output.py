@@ -377,3 +377,36 @@ class FragilityScanResponse(BaseModel):
     @classmethod
     def _clamp_score(cls, value: float) -> float:
         return _clamp01(value)
+
+
+class FragilityBatchItem(BaseModel):
+    """Outcome of one document in a batch scan; ``error`` mirrors the single-scan error body."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    index: int
+    ok: bool
+    result: FragilityScanResponse | None = None
+    error: dict[str, Any] | None = None
+
+
+class FragilityDimensionAggregate(BaseModel):
+    """One fragility dimension across the documents of a batch."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    mean: float = 0.0
+    max: float = 0.0
+    document_count: int = 0
+
+
+class FragilityBatchScanResponse(BaseModel):
+    """Per-document scanner results plus dimension scores aggregated over the batch."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    ok: bool
+    document_count: int
+    failed_count: int = 0
+    results: list[FragilityBatchItem] = Field(default_factory=list)
+    dimension_scores: dict[str, FragilityDimensionAggregate] = Field(default_factory=dict)
@@ -11,6 +11,7 @@ from app.schemas.ai import (
     LocalAIResponse,
     ModelSelectionDebugRequest,
     ModelSelectionDebugResponse,
+    ProviderConnectionPoolListResponse,
     ProviderHealthListResponse,
     ProviderListResponse,
     SelectionStatsResponse,
@@ -34,7 +35,7 @@ from app.schemas.privacy import (
     PrivacyPolicyResponse as PrivacyClassificationPolicyResponse,
 )
 from app.routers.ai_control_plane import router as ai_control_plane_router
-from app.services.ai.orchestrator import LocalAIOrchestrator
+from app.services.ai.orchestrator import LocalAIOrchestrator, build_local_ai_orchestrator
 from app.services.ai.routing_types import RoutingDecision, RoutingDecisionRequest, RoutingPolicyResponse
 
 
@@ -127,9 +128,17 @@ _TELEMETRY_TRACE_EXAMPLE = {
 }
 
 
-def get_local_ai_orchestrator() -> LocalAIOrchestrator:
-    """Return the shared local AI orchestrator."""
-    return LocalAIOrchestrator()
+def get_local_ai_orchestrator(request: Request) -> LocalAIOrchestrator:
+    """Return the shared local AI orchestrator.
+
+    The orchestrator is created once at application startup and kept on
+    ``app.state``; it is built lazily here when startup hooks did not run.
+    """
+    orchestrator = getattr(request.app.state, "local_ai_orchestrator", None)
+    if orchestrator is None:
+        orchestrator = build_local_ai_orchestrator(getattr(request.app.state, "local_ai_settings", None))
+        request.app.state.local_ai_orchestrator = orchestrator
+    return orchestrator
 
 
 def _raise_service_unavailable(message: str) -> None:
@@ -529,6 +538,31 @@ async def local_ai_provider_health(
         )
 
 
+@router.get(
+    "/providers/connections",
+    response_model=ProviderConnectionPoolListResponse,
+    summary="Inspect AI provider connection pools",
+    description="Returns pooled HTTP connection statistics (in use, idle, reuse, wait time) for AI providers.",
+)
+async def local_ai_provider_connections(
+    orchestrator: LocalAIOrchestrator = Depends(get_local_ai_orchestrator),
+) -> ProviderConnectionPoolListResponse:
+    """Return pooled HTTP connection statistics for AI providers."""
+    try:
+        return orchestrator.get_provider_connection_stats()
+    except Exception:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "ok": False,
+                "error": {
+                    "type": "AI_PROVIDER_CONNECTIONS_ERROR",
+                    "message": "AI provider connection diagnostics are currently unavailable.",
+                },
+            },
+        )
+
+
 @router.get(
     "/health",
     response_model=LocalAIHealthResponse,
@@ -4,6 +4,9 @@ import os
 from fastapi import APIRouter, HTTPException
 
 from app.models.chat import ChatResponse, Action
+from app.services.perf_profiler import perf_snapshot
+from app.services.session_state import session_state_metrics
+from engines.scenario_simulation.simulation_cache import shared_simulation_cache
 from archetypes.visual_mapper import map_archetype_to_visual_state
 from archetypes.state_compat import normalize_archetype_state
 from archetypes.library import get_archetype_library
@@ -61,3 +64,24 @@ def state_fields():
         "fields": fields,
         "example": canonical,
     }
+
+
+@router.get("/session-state")
+def session_state():
+    if os.getenv("ENV") != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+    return {"ok": True, "stores": session_state_metrics()}
+
+
+@router.get("/perf")
+def perf(limit: int = 10):
+    if os.getenv("ENV") != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+    return {"ok": True, **perf_snapshot(trace_limit=max(1, min(limit, 100)))}
+
+
+@router.get("/simulation-cache")
+def simulation_cache():
+    if os.getenv("ENV") != "dev":
+        raise HTTPException(status_code=404, detail="Not found")
+    return {"ok": True, "shared": shared_simulation_cache().snapshot()}
@@ -7,8 +7,9 @@ import logging
 from fastapi import APIRouter, Depends, status
 from pydantic import ValidationError
 
-from app.models.scanner_input import FragilityScanRequest
-from app.models.scanner_output import FragilityScanResponse
+from app.models.scanner_input import FragilityBatchScanRequest, FragilityScanRequest
+from app.models.scanner_output import FragilityBatchScanResponse, FragilityScanResponse
+from app.services.scanner.batch_scanner import run_batch_scan
 from app.services.scanner.scanner_orchestrator import FragilityScannerOrchestrator
 from app.utils.responses import http_error
 
@@ -107,3 +108,25 @@ async def run_fragility_scan(
             "Fragility scanner is currently unavailable.",
             code="FRAGILITY_SCANNER_ERROR",
         )
+
+
+@router.post(
+    "/fragility/batch",
+    response_model=FragilityBatchScanResponse,
+    summary="Run fragility scanner over many documents",
+    description="Scores each document concurrently and aggregates dimension scores across the batch.",
+)
+async def run_fragility_batch_scan(
+    payload: FragilityBatchScanRequest,
+    orchestrator: FragilityScannerOrchestrator = Depends(get_fragility_scanner_orchestrator),
+) -> FragilityBatchScanResponse:
+    """Run a fragility scan per document; failures are reported per document, not for the batch."""
+    logger.info("fragility_batch_scan_requested document_count=%s", len(payload.documents))
+    response = await run_batch_scan(payload.documents, orchestrator)
+    logger.info(
+        "fragility_batch_scan_completed document_count=%s failed_count=%s dimensions=%s",
+        response.document_count,
+        response.failed_count,
+        sorted(response.dimension_scores),
+    )
+    return response
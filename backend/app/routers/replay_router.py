@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Literal, Optional
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from app.models.replay import ReplayEpisode, ReplayFrame
@@ -30,17 +30,6 @@ class BranchEpisodeIn(BaseModel):
     include_history: bool = False
 
 
-def _episode_summary(episode: ReplayEpisode) -> dict:
-    return {
-        "episode_id": episode.episode_id,
-        "title": episode.title,
-        "created_at": episode.created_at,
-        "updated_at": episode.updated_at,
-        "duration": episode.duration,
-        "frame_count": len(episode.frames),
-    }
-
-
 @router.post("/replay/episodes")
 def create_episode(payload: CreateEpisodeIn) -> dict:
     episode = store.create_episode(payload.title)
@@ -48,8 +37,19 @@ def create_episode(payload: CreateEpisodeIn) -> dict:
 
 
 @router.get("/replay/episodes")
-def list_episodes() -> List[dict]:
-    return store.list_episodes()
+def list_episodes(
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    offset: int = Query(0, ge=0),
+    sort: str = "episode_id",
+    order: Literal["asc", "desc"] = "asc",
+) -> List[dict]:
+    try:
+        return store.list_episodes(limit=limit, offset=offset, sort_by=sort, descending=order == "desc")
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=422,
+            detail=responses.error("INVALID_INPUT", str(exc)),
+        ) from None
 
 
 @router.get("/replay/episodes/{episode_id}")
@@ -66,8 +66,8 @@ def get_episode(episode_id: str) -> ReplayEpisode:
 @router.post("/replay/episodes/{episode_id}/frames")
 def append_frame(episode_id: str, frame: ReplayFrame) -> dict:
     try:
-        episode, warnings = store.append_frame(episode_id, frame)
-        return responses.ok(_episode_summary(episode), warnings=warnings or None)
+        summary, warnings = store.append_frame_summary(episode_id, frame)
+        return responses.ok(summary, warnings=warnings or None)
     except FileNotFoundError:
         raise HTTPException(
           status_code=404,
@@ -67,15 +67,13 @@ def _clamp01(x: Any) -> float:
 @router.post("/simulator/run")
 def simulator_run(payload: SimulatorRunIn):
     try:
-        episode = store.get_episode(payload.episode_id)
+        last = store.get_last_frame(payload.episode_id)
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=responses.error("NOT_FOUND", "Episode not found")) from None
 
-    frames = episode.frames or []
-    if not frames:
+    if last is None:
         raise HTTPException(status_code=404, detail=responses.error("NOT_FOUND", "Episode has no frames"))
 
-    last = frames[-1]
     ss = last.system_state if isinstance(last.system_state, dict) else {}
     base_kpi = ss.get("kpi") if isinstance(ss.get("kpi"), dict) else {}
     base_fragility = ss.get("fragility") if isinstance(ss.get("fragility"), dict) else {}
@@ -350,6 +350,30 @@ class ProviderHealthListResponse(BaseModel):
     providers: list[ProviderHealthEntry] = Field(default_factory=list)
 
 
+class ProviderConnectionPoolStats(BaseModel):
+    """Connection pool statistics for one provider base URL."""
+
+    base_url: str
+    http2: bool = False
+    max_connections: int = Field(default=0, ge=0)
+    max_keepalive_connections: int = Field(default=0, ge=0)
+    open_connections: int = Field(default=0, ge=0)
+    in_use: int = Field(default=0, ge=0)
+    idle: int = Field(default=0, ge=0)
+    requests: int = Field(default=0, ge=0)
+    connections_opened: int = Field(default=0, ge=0)
+    reuse_ratio: float = Field(default=0.0, ge=0.0, le=1.0)
+    avg_wait_ms: float = Field(default=0.0, ge=0.0)
+    max_wait_ms: float = Field(default=0.0, ge=0.0)
+
+
+class ProviderConnectionPoolListResponse(BaseModel):
+    """Connection pool diagnostics for HTTP-backed AI providers."""
+
+    ok: bool = True
+    pools: list[ProviderConnectionPoolStats] = Field(default_factory=list)
+
+
 class HealthResponse(BaseModel):
     """Health status for an AI provider integration."""
 
@@ -16,6 +16,7 @@ AuditStage = Literal[
     "provider_execution_started",
     "provider_execution_completed",
     "provider_execution_failed",
+    "cache_hit",
     "fallback_applied",
     "response_returned",
     "policy_change_submitted",
@@ -42,6 +42,10 @@ class PrivacyPolicyConfig(BaseModel):
     assume_uploaded_content_confidential: bool = True
     cloud_blocked_sensitivity_levels: list[str] = Field(default_factory=list)
     local_required_sensitivity_levels: list[str] = Field(default_factory=list)
+    response_cache_sensitivity_levels: list[str] = Field(
+        default_factory=lambda: ["confidential", "internal", "public"]
+    )
+    response_cache_persist_sensitivity_levels: list[str] = Field(default_factory=lambda: ["internal", "public"])
 
 
 class ProviderPolicyEntry(BaseModel):
@@ -18,6 +18,7 @@ TelemetryStage = Literal[
     "provider_execution_started",
     "provider_execution_completed",
     "provider_execution_failed",
+    "cache_hit",
     "fallback_applied",
     "response_returned",
 ]
@@ -2,16 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections import deque
 from datetime import UTC, datetime
 from functools import lru_cache
-from pathlib import Path
 
 from app.core.config import LocalAISettings, get_local_ai_settings
 from app.services.ai.audit_redaction import minimize_audit_metadata
 from app.services.ai.control_plane.control_plane_service import AIControlPlaneService
+from app.services.ai.jsonl_sink import get_jsonl_sink
 from app.services.ai.audit_types import (
     AuditEvent,
     AuditPolicyResponse,
@@ -34,9 +33,13 @@ POLICY_DECISION_STAGES: set[AuditStage] = {
 class AIAuditLogger:
     """Store recent audit events and optionally append JSONL records."""
 
-    def __init__(self, settings: LocalAISettings) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings,
+        control_plane: AIControlPlaneService | None = None,
+    ) -> None:
         self.settings = settings
-        self.control_plane = AIControlPlaneService(settings)
+        self.control_plane = control_plane or AIControlPlaneService(settings)
         self._events: deque[AuditEvent] = deque(maxlen=self.control_plane.get_audit_policy().max_events)
 
     def describe_policy(self) -> AuditPolicyResponse:
@@ -152,10 +155,7 @@ class AIAuditLogger:
         return events
 
     def _write_jsonl(self, event: AuditEvent) -> None:
-        path = Path(self.control_plane.get_audit_policy().file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(event.model_dump(), ensure_ascii=True) + "\n")
+        get_jsonl_sink(self.control_plane.get_audit_policy().file_path, self.settings).submit(event)
 
 
 @lru_cache(maxsize=1)
@@ -28,9 +28,13 @@ class BenchmarkPreferencesSnapshot:
 class BenchmarkPreferencesLoader:
     """Load benchmark summary data from a local JSON report file."""
 
-    def __init__(self, settings: LocalAISettings) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings,
+        control_plane: AIControlPlaneService | None = None,
+    ) -> None:
         self.settings = settings
-        self.control_plane = AIControlPlaneService(settings)
+        self.control_plane = control_plane or AIControlPlaneService(settings)
         self._lock = Lock()
         self._last_mtime_ns: int | None = None
         benchmark_policy = self.control_plane.get_benchmark_policy()
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import UTC, datetime
 from functools import lru_cache
 from pathlib import Path
@@ -93,6 +94,9 @@ from app.services.ai.control_plane.promotion_engine import PolicyPromotionEngine
 from app.services.ai.control_plane.promotion_gates import PromotionGateEvaluator
 
 
+_EFFECTIVE_POLICY_CACHE_SIZE = 256
+
+
 class AIControlPlaneService:
     """Source of truth for effective AI policy configuration."""
 
@@ -184,6 +188,9 @@ class AIControlPlaneService:
                 workspace_id=workspace_id,
             ),
         )
+        self._effective_policy_cache: OrderedDict[tuple[Any, ...], Any] = OrderedDict()
+        self._effective_policy_cache_hits = 0
+        self._effective_policy_cache_misses = 0
         self._snapshot = self._load_defaults()
         self._last_error: str | None = None
         self._overlay_last_error: str | None = None
@@ -257,13 +264,26 @@ class AIControlPlaneService:
         workspace_id: str | None = None,
     ) -> EffectivePolicyResolution:
         """Resolve effective policy for global, tenant, or workspace scope."""
-        return self.overlay_resolver.resolve(
+        cache_key = self._effective_policy_cache_key("scoped", tenant_id, workspace_id)
+        cached = self._get_cached_effective_policy(cache_key)
+        if cached is not None:
+            return cached
+        resolution = self.overlay_resolver.resolve(
             base_snapshot=self._get_active_global_snapshot(),
             tenant_overlay=self._get_effective_tenant_overlay(tenant_id),
             workspace_overlay=self._get_effective_workspace_overlay(tenant_id=tenant_id, workspace_id=workspace_id),
             tenant_id=tenant_id,
             workspace_id=workspace_id,
         )
+        return self._store_cached_effective_policy(cache_key, resolution)
+
+    def get_effective_policy_cache_stats(self) -> dict[str, int]:
+        """Return effective-policy cache counters for diagnostics."""
+        return {
+            "entries": len(self._effective_policy_cache),
+            "hits": self._effective_policy_cache_hits,
+            "misses": self._effective_policy_cache_misses,
+        }
 
     def preview_policy_change(self, request: PolicyChangeRequest | dict[str, Any]) -> PolicyChangePreview:
         """Preview a policy change before storage or activation."""
@@ -475,6 +495,7 @@ class AIControlPlaneService:
 
         scope_key = self._scope_key(record.scope_type, record.tenant_id, record.workspace_id)
         previous_active = self.policy_change_store.activate(scope_key, record.change_id)
+        self._invalidate_effective_policy_cache()
         record.status = "activated"
         record.updated_at = datetime.now(UTC).isoformat()
         record.activation = PolicyActivationResult(
@@ -564,6 +585,7 @@ class AIControlPlaneService:
 
         if result.promotion_status == "promoted" and request.target_environment == EnvironmentType.PRODUCTION:
             self._snapshot = self.environment_policy_store.get_snapshot(EnvironmentType.PRODUCTION)
+            self._invalidate_effective_policy_cache()
 
         if result.promotion_status == "promoted":
             self._record_promotion_audit_event(
@@ -607,6 +629,7 @@ class AIControlPlaneService:
         result = self.policy_rollback_service.rollback(environment=environment, request=request)
         if result.rolled_back and environment == EnvironmentType.PRODUCTION:
             self._snapshot = self.environment_policy_store.get_snapshot(EnvironmentType.PRODUCTION)
+            self._invalidate_effective_policy_cache()
         self._record_rollback_audit_event(result=result)
         return result
 
@@ -619,6 +642,7 @@ class AIControlPlaneService:
         config = PolicyCanaryConfig.model_validate(config)
         action = CanaryLifecycleAction.model_validate(action)
         state = self.canary_service.start(config, action)
+        self._invalidate_effective_policy_cache()
         self._record_canary_audit_event(
             stage="canary_started",
             state=state,
@@ -631,6 +655,7 @@ class AIControlPlaneService:
         """Pause the active canary release."""
         action = CanaryLifecycleAction.model_validate(action)
         state = self.canary_service.pause(action)
+        self._invalidate_effective_policy_cache()
         self._record_canary_audit_event(
             stage="canary_paused",
             state=state,
@@ -643,6 +668,7 @@ class AIControlPlaneService:
         """Resume the active canary release."""
         action = CanaryLifecycleAction.model_validate(action)
         state = self.canary_service.resume(action)
+        self._invalidate_effective_policy_cache()
         self._record_canary_audit_event(
             stage="canary_resumed",
             state=state,
@@ -655,6 +681,7 @@ class AIControlPlaneService:
         """Rollback the active canary release."""
         action = CanaryLifecycleAction.model_validate(action)
         state = self.canary_service.rollback(action)
+        self._invalidate_effective_policy_cache()
         self._record_canary_audit_event(
             stage="canary_rolled_back",
             state=state,
@@ -673,6 +700,7 @@ class AIControlPlaneService:
             source_environment=state.source_environment,
         )
         self._snapshot = self.environment_policy_store.get_snapshot(EnvironmentType.PRODUCTION)
+        self._invalidate_effective_policy_cache()
         self._record_canary_audit_event(
             stage="canary_promoted",
             state=state,
@@ -964,6 +992,7 @@ class AIControlPlaneService:
             self._last_error = None
         except Exception as exc:
             self._last_error = str(exc)
+        self._invalidate_effective_policy_cache()
         self.reload_overlays()
         self.reload_policy_changes()
         self._reload_environment_policies()
@@ -976,10 +1005,12 @@ class AIControlPlaneService:
         """Reload tenant and workspace overlays while retaining last known-good state on failure."""
         reloaded = self.overlay_store.reload()
         self._overlay_last_error = None if reloaded else self.overlay_store.last_error()
+        self._invalidate_effective_policy_cache()
         return self.get_state()
 
     def reload_policy_changes(self) -> PolicyChangeDiagnostics:
         """Revalidate active staged policy changes."""
+        self._invalidate_effective_policy_cache()
         try:
             for scope_key, change_id in list(self.policy_change_store.diagnostics().active_changes.items()):
                 record = self.policy_change_store.get(change_id)
@@ -1009,6 +1040,7 @@ class AIControlPlaneService:
             self.policy_change_store.mark_reload(succeeded=True, error=None)
         except Exception as exc:
             self.policy_change_store.mark_reload(succeeded=False, error=str(exc))
+        self._invalidate_effective_policy_cache()
         self._sync_environment_runtime()
         return self.policy_change_store.diagnostics()
 
@@ -1016,6 +1048,10 @@ class AIControlPlaneService:
         active_change_id = self.policy_change_store.get_active_change_id(self._scope_key("global", None, None))
         if active_change_id is None:
             return self._snapshot
+        cache_key = self._effective_policy_cache_key("global", None, None, active_change_id=active_change_id)
+        cached = self._get_cached_effective_policy(cache_key)
+        if cached is not None:
+            return cached
         record = self.policy_change_store.get(active_change_id)
         if record is None:
             return self._snapshot
@@ -1024,7 +1060,44 @@ class AIControlPlaneService:
         snapshot.version_info.updated_at = record.activation.activated_at
         snapshot.version_info.source = f"activated_change:{record.change_id}"
         snapshot.version_info.policy_version = record.activation.effective_policy_version or record.resulting_policy_version
-        return snapshot
+        return self._store_cached_effective_policy(cache_key, snapshot)
+
+    def _effective_policy_cache_key(
+        self,
+        scope: str,
+        tenant_id: str | None,
+        workspace_id: str | None,
+        *,
+        active_change_id: str | None = None,
+    ) -> tuple[Any, ...]:
+        if active_change_id is None:
+            active_change_id = self.policy_change_store.get_active_change_id(self._scope_key("global", None, None))
+        return (scope, self._snapshot.version_info.policy_version, active_change_id, tenant_id, workspace_id)
+
+    def _get_cached_effective_policy(self, cache_key: tuple[Any, ...]) -> Any:
+        cached = self._effective_policy_cache.get(cache_key)
+        if cached is None:
+            self._effective_policy_cache_misses += 1
+            return None
+        self._effective_policy_cache.move_to_end(cache_key)
+        self._effective_policy_cache_hits += 1
+        served = cached.model_copy(deep=True)
+        if isinstance(served, EffectivePolicyResolution):
+            # A cache hit is a fresh resolution as far as callers are concerned.
+            now = datetime.now(UTC).isoformat()
+            served.resolution_timestamp = now
+            served.effective_policy.version_info.loaded_at = now
+        return served
+
+    def _store_cached_effective_policy(self, cache_key: tuple[Any, ...], value: Any) -> Any:
+        # Callers get their own deep copy so mutating a returned snapshot cannot leak into the cache.
+        self._effective_policy_cache[cache_key] = value
+        while len(self._effective_policy_cache) > _EFFECTIVE_POLICY_CACHE_SIZE:
+            self._effective_policy_cache.popitem(last=False)
+        return value.model_copy(deep=True)
+
+    def _invalidate_effective_policy_cache(self) -> None:
+        self._effective_policy_cache.clear()
 
     def _get_effective_tenant_overlay(self, tenant_id: str | None) -> TenantPolicyOverlay | None:
         if not tenant_id:
@@ -1191,6 +1264,7 @@ class AIControlPlaneService:
         production_snapshot = self.environment_policy_store.get_snapshot(EnvironmentType.PRODUCTION)
         if production_snapshot.version_info.policy_version:
             self._snapshot = production_snapshot
+            self._invalidate_effective_policy_cache()
 
     def _sync_environment_runtime(self) -> None:
         self.environment_policy_store.sync_runtime_environment(
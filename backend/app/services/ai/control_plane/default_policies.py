@@ -48,6 +48,8 @@ def build_default_policy_snapshot(settings: LocalAISettings) -> AIPolicySnapshot
             assume_uploaded_content_confidential=settings.assume_uploaded_content_confidential,
             cloud_blocked_sensitivity_levels=sorted(settings.cloud_blocked_sensitivity_levels),
             local_required_sensitivity_levels=sorted(settings.local_required_sensitivity_levels),
+            response_cache_sensitivity_levels=sorted(settings.response_cache_sensitivity_levels),
+            response_cache_persist_sensitivity_levels=sorted(settings.response_cache_persist_sensitivity_levels),
         ),
         provider=ProviderPolicyConfig(
             default_provider=settings.default_provider,
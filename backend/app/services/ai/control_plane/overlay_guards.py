@@ -93,6 +93,24 @@ def apply_overlay_guards(
         field="local_required_sensitivity_levels",
         reverse_subset=True,
     )
+    _guard_list_subset(
+        conflicts=conflicts,
+        sanitized=sanitized,
+        base_payload=base_payload,
+        scope_type=scope_type,
+        scope_id=scope_id,
+        section="privacy",
+        field="response_cache_sensitivity_levels",
+    )
+    _guard_list_subset(
+        conflicts=conflicts,
+        sanitized=sanitized,
+        base_payload=base_payload,
+        scope_type=scope_type,
+        scope_id=scope_id,
+        section="privacy",
+        field="response_cache_persist_sensitivity_levels",
+    )
 
     return sanitized, conflicts
 
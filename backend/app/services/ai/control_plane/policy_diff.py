@@ -94,6 +94,8 @@ def _classify_risk(field_path: str, before_value: Any, after_value: Any) -> Poli
     if field_path in {
         "privacy.cloud_blocked_sensitivity_levels",
         "privacy.local_required_sensitivity_levels",
+        "privacy.response_cache_sensitivity_levels",
+        "privacy.response_cache_persist_sensitivity_levels",
         "routing.cloud_allowed_tasks",
     }:
         return "high"
@@ -84,6 +84,15 @@ class PolicyValidator:
                     message="Restricted sensitivity must require local execution.",
                 )
             )
+        if "restricted" in snapshot.privacy.response_cache_persist_sensitivity_levels:
+            issues.append(
+                PolicyValidationIssue(
+                    severity="warning",
+                    code="restricted_response_cache_persisted",
+                    field_path="privacy.response_cache_persist_sensitivity_levels",
+                    message="Restricted responses will be written to the on-disk response cache.",
+                )
+            )
         if snapshot.routing.cloud_fallback_enabled and not snapshot.provider.cloud_provider_enabled:
             issues.append(
                 PolicyValidationIssue(
@@ -0,0 +1,308 @@
+"""Write-behind batched JSONL sink shared by AI audit and telemetry logging."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import json
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from app.core.config import LocalAISettings
+
+
+logger = logging.getLogger("nexora.ai.jsonl_sink")
+
+OVERFLOW_POLICIES = {"block", "drop_newest", "drop_oldest"}
+
+
+class JsonlBatchSink:
+    """Buffer records in a bounded queue and append them in batches from one thread.
+
+    Records are serialized in `submit`, so later changes to a submitted dict
+    never reach the file, and the writer thread only joins and writes lines.
+    A batch is written when ``batch_size`` records are queued or
+    ``flush_interval_s`` after the first record arrived, through a single
+    long-lived file handle. The file rotates to
+    ``<stem>.<YYYY-MM-DD>.<n><suffix>`` when it would exceed
+    ``rotate_max_bytes`` or the UTC day changes.
+
+    When the queue is full, ``drop_oldest`` discards the oldest queued record,
+    ``drop_newest`` rejects the new one and ``block`` waits up to
+    ``block_timeout_s`` for the writer to catch up before dropping. ``block``
+    never waits on a thread running an event loop, where it would stall every
+    request on that loop; there it drops the new record. `close` drains the
+    queue; records submitted after close are written synchronously.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = 256,
+        flush_interval_s: float = 0.2,
+        max_queue: int = 10000,
+        overflow_policy: str = "drop_oldest",
+        block_timeout_s: float = 1.0,
+        rotate_max_bytes: int = 50 * 1024 * 1024,
+    ) -> None:
+        if overflow_policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"unknown overflow policy: {overflow_policy}")
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval_s = max(0.001, flush_interval_s)
+        self.max_queue = max(1, max_queue)
+        self.overflow_policy = overflow_policy
+        self.block_timeout_s = max(0.0, block_timeout_s)
+        self.rotate_max_bytes = max(0, rotate_max_bytes)
+
+        self._cond = threading.Condition()
+        self._queue: deque[str] = deque()
+        self._in_flight = 0
+        self._flush_waiters = 0
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._write_lock = threading.Lock()
+        self._handle = None
+        self._size = 0
+        self._opened_day: str | None = None
+
+        self.written = 0
+        self.dropped = 0
+        self.batches = 0
+        self.rotations = 0
+        self.write_errors = 0
+
+    def submit(self, record: Any) -> bool:
+        """Queue a pydantic model or dict for writing; False if it was dropped."""
+        try:
+            payload = record.model_dump() if hasattr(record, "model_dump") else record
+            line = json.dumps(payload, ensure_ascii=True) + "\n"
+        except Exception:
+            self.write_errors += 1
+            logger.warning("jsonl_sink_serialize_failed path=%s", self.path, exc_info=False)
+            return False
+        with self._cond:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                if len(self._queue) >= self.max_queue and not self._make_room():
+                    self.dropped += 1
+                    if self.dropped == 1 or self.dropped % 1000 == 0:
+                        logger.warning("jsonl_sink_dropped path=%s dropped=%s", self.path, self.dropped)
+                    return False
+                self._queue.append(line)
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, name=f"jsonl-sink:{self.path.name}", daemon=True)
+                    self._thread.start()
+                if len(self._queue) == 1 or len(self._queue) >= self.batch_size:
+                    self._cond.notify_all()
+        if closed:
+            self._write_batch([line])
+        return True
+
+    def _make_room(self) -> bool:
+        if self.overflow_policy == "drop_oldest":
+            self._queue.popleft()
+            self.dropped += 1
+            return True
+        if self.overflow_policy == "drop_newest" or _on_event_loop_thread():
+            return False
+        deadline = time.monotonic() + self.block_timeout_s
+        while len(self._queue) >= self.max_queue and not self._closed:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            self._cond.notify_all()
+            self._cond.wait(remaining)
+        return len(self._queue) < self.max_queue
+
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Write everything queued so far; True once the queue has drained."""
+        with self._cond:
+            if self._thread is None:
+                return not self._queue
+            self._flush_waiters += 1
+            self._cond.notify_all()
+            try:
+                return self._cond.wait_for(lambda: not self._queue and not self._in_flight, timeout)
+            finally:
+                self._flush_waiters -= 1
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        """Drain the queue, stop the writer thread and close the file."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout)
+        with self._write_lock:
+            self._close_handle()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._cond:
+            queued = len(self._queue) + self._in_flight
+        return {
+            "path": str(self.path),
+            "queued": queued,
+            "written": self.written,
+            "dropped": self.dropped,
+            "batches": self.batches,
+            "rotations": self.rotations,
+            "write_errors": self.write_errors,
+            "overflow_policy": self.overflow_policy,
+        }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                deadline = time.monotonic() + self.flush_interval_s
+                while len(self._queue) < self.batch_size and not self._closed and not self._flush_waiters:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                if not self._queue:
+                    self._thread = None
+                    return
+                batch = [self._queue.popleft() for _ in range(min(self.batch_size, len(self._queue)))]
+                self._in_flight = len(batch)
+                self._cond.notify_all()
+            self._write_batch(batch)
+            with self._cond:
+                self._in_flight = 0
+                self._cond.notify_all()
+
+    def _write_batch(self, lines: list[str]) -> None:
+        with self._write_lock:
+            try:
+                self._open_handle()
+                today = datetime.now(timezone.utc).date().isoformat()
+                chunk: list[str] = []
+                chunk_size = 0
+                for line in lines:
+                    # Rotate between records so a file never grows past the limit mid-batch.
+                    if self._size + chunk_size and self._needs_rotation(chunk_size + len(line), today):
+                        self._write_chunk(chunk, chunk_size)
+                        chunk, chunk_size = [], 0
+                        self._rotate()
+                    chunk.append(line)
+                    chunk_size += len(line)
+                self._write_chunk(chunk, chunk_size)
+                self.batches += 1
+            except Exception:
+                self.write_errors += len(lines)
+                logger.exception("jsonl_sink_write_failed path=%s records=%s", self.path, len(lines))
+                self._close_handle()
+
+    def _write_chunk(self, chunk: list[str], chunk_size: int) -> None:
+        if not chunk:
+            return
+        self._handle.write("".join(chunk))
+        self._handle.flush()
+        self._size += chunk_size
+        self.written += len(chunk)
+
+    def _needs_rotation(self, incoming: int, today: str) -> bool:
+        if self._opened_day != today:
+            return True
+        return bool(self.rotate_max_bytes) and self._size + incoming > self.rotate_max_bytes
+
+    def _open_handle(self) -> None:
+        if self._handle is not None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        if self.path.exists():
+            stat = self.path.stat()
+            self._size = stat.st_size
+            self._opened_day = datetime.fromtimestamp(stat.st_mtime, timezone.utc).date().isoformat()
+        else:
+            self._size = 0
+            self._opened_day = datetime.now(timezone.utc).date().isoformat()
+        self._handle = self.path.open("a", encoding="utf-8")
+
+    def _rotate(self) -> None:
+        self._close_handle()
+        index = 1
+        while True:
+            target = self.path.with_name(f"{self.path.stem}.{self._opened_day}.{index}{self.path.suffix}")
+            if not target.exists():
+                break
+            index += 1
+        self.path.rename(target)
+        self.rotations += 1
+        self._open_handle()
+
+    def _close_handle(self) -> None:
+        if self._handle is not None:
+            try:
+                self._handle.close()
+            finally:
+                self._handle = None
+
+
+def _on_event_loop_thread() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+_SINKS: dict[str, JsonlBatchSink] = {}
+_SINKS_LOCK = threading.Lock()
+
+
+def get_jsonl_sink(path: str | Path, settings: LocalAISettings) -> JsonlBatchSink:
+    """Return the shared sink for ``path``, creating it from ``settings`` on first use."""
+    key = str(Path(path).resolve())
+    with _SINKS_LOCK:
+        sink = _SINKS.get(key)
+        if sink is None or sink._closed:
+            sink = _SINKS[key] = JsonlBatchSink(
+                path,
+                batch_size=settings.jsonl_batch_size,
+                flush_interval_s=settings.jsonl_flush_interval_ms / 1000.0,
+                max_queue=settings.jsonl_queue_max_events,
+                overflow_policy=settings.jsonl_overflow_policy,
+                block_timeout_s=settings.jsonl_block_timeout_ms / 1000.0,
+                rotate_max_bytes=settings.jsonl_rotate_max_bytes,
+            )
+        return sink
+
+
+def flush_jsonl_sinks(timeout: float | None = 5.0) -> None:
+    with _SINKS_LOCK:
+        sinks = list(_SINKS.values())
+    for sink in sinks:
+        sink.flush(timeout)
+
+
+def close_jsonl_sinks(timeout: float | None = 5.0) -> None:
+    """Drain and close every sink; called on app shutdown and at interpreter exit."""
+    with _SINKS_LOCK:
+        sinks = list(_SINKS.values())
+        _SINKS.clear()
+    for sink in sinks:
+        try:
+            sink.close(timeout)
+        except Exception:
+            logger.warning("jsonl_sink_close_failed path=%s", sink.path, exc_info=False)
+
+
+def jsonl_sink_metrics() -> list[dict[str, Any]]:
+    with _SINKS_LOCK:
+        sinks = list(_SINKS.values())
+    return [sink.snapshot() for sink in sinks]
+
+
+atexit.register(close_jsonl_sinks)
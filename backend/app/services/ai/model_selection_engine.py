@@ -18,11 +18,15 @@ from app.services.ai.selection_policy import resolve_benchmark_priority, resolve
 class LocalAIModelSelectionEngine:
     """Select the best available model for a local AI task."""
 
-    def __init__(self, settings: LocalAISettings) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings,
+        control_plane: AIControlPlaneService | None = None,
+    ) -> None:
         self.settings = settings
-        self.control_plane = AIControlPlaneService(settings)
+        self.control_plane = control_plane or AIControlPlaneService(settings)
         self._profiles = build_default_model_profiles(settings)
-        self._benchmark_loader = BenchmarkPreferencesLoader(settings)
+        self._benchmark_loader = BenchmarkPreferencesLoader(settings, control_plane=self.control_plane)
 
     def select(self, request: ModelSelectionRequest, *, default_model: str) -> ModelSelectionResult:
         """Resolve a model selection result using deterministic policy rules."""
@@ -19,6 +19,7 @@ from app.schemas.ai import (
     ModelSelectionRequest,
     ProviderHealthEntry,
     ProviderHealthListResponse,
+    ProviderConnectionPoolListResponse,
     ProviderInfo,
     ProviderListResponse,
     SelectionStatsResponse,
@@ -37,9 +38,14 @@ from app.schemas.telemetry import (
     TelemetryStageListResponse,
 )
 from app.services.ai.audit_logger import AIAuditLogger
+from app.services.ai.control_plane.control_plane_service import (
+    AIControlPlaneService,
+    get_ai_control_plane_service,
+)
 from app.services.ai.model_selection_engine import LocalAIModelSelectionEngine
 from app.services.ai.ollama_client import OllamaClient
 from app.services.ai.privacy_classifier import PrivacyClassifier
+from app.services.ai.provider_state_cache import ProviderStateCache
 from app.services.ai.privacy_types import (
     PrivacyClassificationRequest,
     PrivacyClassificationResult,
@@ -51,6 +57,7 @@ from app.services.ai.providers.base import AIProvider
 from app.services.ai.providers.exceptions import AIProviderError
 from app.services.ai.providers.factory import AIProviderFactory
 from app.services.ai.providers.types import ProviderChatRequest, ProviderDescriptor
+from app.services.ai.response_cache import AIResponseCache, response_cache_key
 from app.services.ai.response_mapper import (
     map_ai_response,
     map_health_response,
@@ -132,22 +139,36 @@ class LocalAIOrchestrator:
         provider_factory: AIProviderFactory | None = None,
         audit_logger: AIAuditLogger | None = None,
         telemetry_collector: AITelemetryCollector | None = None,
+        control_plane: AIControlPlaneService | None = None,
+        provider_state_cache: ProviderStateCache | None = None,
+        response_cache: AIResponseCache | None = None,
     ) -> None:
         self.settings = settings or get_local_ai_settings()
+        # One control plane instance backs every policy-aware component so a
+        # single orchestrator costs one policy reload instead of one per component.
+        self.control_plane = control_plane or AIControlPlaneService(self.settings)
         self.provider_factory = provider_factory or AIProviderFactory(settings=self.settings)
         self.provider = provider or (_LegacyClientProviderAdapter(client) if client is not None else None)
-        self.selection_engine = LocalAIModelSelectionEngine(self.settings)
-        self.privacy_classifier = PrivacyClassifier(self.settings)
-        self.routing_policy = HybridRoutingPolicy(self.settings)
+        self.provider_state_cache = provider_state_cache or ProviderStateCache(self.settings)
+        self.response_cache = (
+            response_cache if response_cache is not None else AIResponseCache.from_settings(self.settings)
+        )
+        self.selection_engine = LocalAIModelSelectionEngine(self.settings, control_plane=self.control_plane)
+        self.privacy_classifier = PrivacyClassifier(self.settings, control_plane=self.control_plane)
+        self.routing_policy = HybridRoutingPolicy(self.settings, control_plane=self.control_plane)
         self.selection_metrics = get_selection_metrics_store()
-        self.audit_logger = audit_logger or AIAuditLogger(self.settings)
-        self.telemetry_collector = telemetry_collector or AITelemetryCollector(self.settings)
+        self.audit_logger = audit_logger or AIAuditLogger(self.settings, control_plane=self.control_plane)
+        self.telemetry_collector = telemetry_collector or AITelemetryCollector(
+            self.settings,
+            control_plane=self.control_plane,
+        )
         self.system_modeling_engine = UniversalSystemModelingEngine()
 
     async def get_health(self) -> HealthResponse:
         """Return local provider health status."""
         provider = await self._resolve_provider_for_task(task_type="analyze_scenario", metadata=None)
         result = await provider.health_check()
+        self.provider_state_cache.record_health(provider.provider_key, result)
         return map_health_response(
             provider=result.provider,
             base_url=result.base_url or "",
@@ -485,130 +506,173 @@ class LocalAIOrchestrator:
                 },
             )
 
-        self._audit(
-            trace_id=trace_id,
-            stage="provider_execution_started",
-            task_type=task,
-            privacy_mode=privacy.privacy_mode,
-            sensitivity_level=privacy.sensitivity_level,
-            selected_provider=provider.provider_key,
-            selected_model=selection.selected_model,
-            fallback_used=selection.fallback_used,
-            benchmark_used=selection.benchmark_used,
-            decision_reason="Provider execution started",
-            policy_tags=privacy.policy_tags,
-            success=True,
-        )
-        self._telemetry(
-            trace_id=trace_id,
-            stage="provider_execution_started",
-            task_type=task,
-            provider=provider.provider_key,
+        cache_key, cache_persist = self._response_cache_plan(
+            task=task,
+            prompt=prompt,
+            provider_key=provider.provider_key,
             model=selection.selected_model,
-            fallback_used=selection.fallback_used,
-            benchmark_used=selection.benchmark_used,
-            routing_reason="Provider execution started",
-            privacy_mode=privacy.privacy_mode,
-            sensitivity_level=privacy.sensitivity_level,
-            success=True,
+            privacy=privacy,
+            metadata=metadata,
         )
-        try:
-            result = await provider.chat_json(
-                ProviderChatRequest(
-                    model=selection.selected_model,
-                    messages=[{"role": "user", "content": prompt}],
-                    trace_id=trace_id,
-                )
-            )
-        except AIProviderError as exc:
+        cache_started_at = time.perf_counter()
+        result = self.response_cache.get(cache_key) if cache_key is not None else None
+        cache_hit = result is not None
+        if cache_hit:
             self._audit(
                 trace_id=trace_id,
-                stage="provider_execution_failed",
+                stage="cache_hit",
                 task_type=task,
                 privacy_mode=privacy.privacy_mode,
                 sensitivity_level=privacy.sensitivity_level,
-                selected_provider=selection.provider,
+                selected_provider=provider.provider_key,
                 selected_model=selection.selected_model,
                 fallback_used=selection.fallback_used,
                 benchmark_used=selection.benchmark_used,
-                decision_reason=selection.reason,
+                decision_reason="Cached provider response reused",
                 policy_tags=privacy.policy_tags,
-                success=False,
-                error_code=exc.code,
-                metadata={"provider_error_message": exc.message},
+                success=True,
+                metadata={"provider_latency_ms": result.latency_ms},
             )
             self._telemetry(
                 trace_id=trace_id,
-                stage="provider_execution_failed",
+                stage="cache_hit",
                 task_type=task,
-                provider=selection.provider,
+                provider=provider.provider_key,
                 model=selection.selected_model,
+                latency_ms=(time.perf_counter() - cache_started_at) * 1000,
                 fallback_used=selection.fallback_used,
                 benchmark_used=selection.benchmark_used,
-                routing_reason=selection.reason,
+                routing_reason="Cached provider response reused",
                 privacy_mode=privacy.privacy_mode,
                 sensitivity_level=privacy.sensitivity_level,
-                success=False,
-                error_code=exc.code,
-                metadata={"provider_error_message": exc.message},
+                success=True,
+                metadata={"provider_latency_ms": result.latency_ms},
             )
+        else:
             self._audit(
                 trace_id=trace_id,
-                stage="response_returned",
+                stage="provider_execution_started",
                 task_type=task,
                 privacy_mode=privacy.privacy_mode,
                 sensitivity_level=privacy.sensitivity_level,
-                selected_provider=selection.provider,
+                selected_provider=provider.provider_key,
                 selected_model=selection.selected_model,
                 fallback_used=selection.fallback_used,
                 benchmark_used=selection.benchmark_used,
-                decision_reason=selection.reason,
+                decision_reason="Provider execution started",
                 policy_tags=privacy.policy_tags,
-                success=False,
-                error_code=exc.code,
+                success=True,
             )
             self._telemetry(
                 trace_id=trace_id,
-                stage="response_returned",
+                stage="provider_execution_started",
                 task_type=task,
-                provider=selection.provider,
+                provider=provider.provider_key,
                 model=selection.selected_model,
-                latency_ms=(time.perf_counter() - started_at) * 1000,
                 fallback_used=selection.fallback_used,
                 benchmark_used=selection.benchmark_used,
-                routing_reason=selection.reason,
+                routing_reason="Provider execution started",
                 privacy_mode=privacy.privacy_mode,
                 sensitivity_level=privacy.sensitivity_level,
-                success=False,
-                error_code=exc.code,
-            )
-            return map_ai_response(
-                ok=False,
-                provider=selection.provider,
-                model=selection.selected_model,
-                output="",
-                trace_id=trace_id,
-                metadata={
-                    "task": task,
-                    "selection_reason": selection.reason,
-                    "selection_benchmark_used": selection.benchmark_used,
-                    "selection_strategy": selection.strategy,
-                    "selection_fallback_used": selection.fallback_used,
-                    "routing_reason": routing.routing_reason,
-                    "routing_fallback_allowed": routing.fallback_allowed,
-                    "routing_privacy_mode": routing.privacy_mode,
-                    "privacy_sensitivity_level": privacy.sensitivity_level,
-                    "privacy_classification_reason": privacy.classification_reason,
-                    "privacy_policy_tags": privacy.policy_tags,
-                    "provider_error": exc.code,
-                    "provider_error_message": exc.message,
-                },
+                success=True,
             )
+            try:
+                result = await provider.chat_json(
+                    ProviderChatRequest(
+                        model=selection.selected_model,
+                        messages=[{"role": "user", "content": prompt}],
+                        trace_id=trace_id,
+                    )
+                )
+            except AIProviderError as exc:
+                self._audit(
+                    trace_id=trace_id,
+                    stage="provider_execution_failed",
+                    task_type=task,
+                    privacy_mode=privacy.privacy_mode,
+                    sensitivity_level=privacy.sensitivity_level,
+                    selected_provider=selection.provider,
+                    selected_model=selection.selected_model,
+                    fallback_used=selection.fallback_used,
+                    benchmark_used=selection.benchmark_used,
+                    decision_reason=selection.reason,
+                    policy_tags=privacy.policy_tags,
+                    success=False,
+                    error_code=exc.code,
+                    metadata={"provider_error_message": exc.message},
+                )
+                self._telemetry(
+                    trace_id=trace_id,
+                    stage="provider_execution_failed",
+                    task_type=task,
+                    provider=selection.provider,
+                    model=selection.selected_model,
+                    fallback_used=selection.fallback_used,
+                    benchmark_used=selection.benchmark_used,
+                    routing_reason=selection.reason,
+                    privacy_mode=privacy.privacy_mode,
+                    sensitivity_level=privacy.sensitivity_level,
+                    success=False,
+                    error_code=exc.code,
+                    metadata={"provider_error_message": exc.message},
+                )
+                self._audit(
+                    trace_id=trace_id,
+                    stage="response_returned",
+                    task_type=task,
+                    privacy_mode=privacy.privacy_mode,
+                    sensitivity_level=privacy.sensitivity_level,
+                    selected_provider=selection.provider,
+                    selected_model=selection.selected_model,
+                    fallback_used=selection.fallback_used,
+                    benchmark_used=selection.benchmark_used,
+                    decision_reason=selection.reason,
+                    policy_tags=privacy.policy_tags,
+                    success=False,
+                    error_code=exc.code,
+                )
+                self._telemetry(
+                    trace_id=trace_id,
+                    stage="response_returned",
+                    task_type=task,
+                    provider=selection.provider,
+                    model=selection.selected_model,
+                    latency_ms=(time.perf_counter() - started_at) * 1000,
+                    fallback_used=selection.fallback_used,
+                    benchmark_used=selection.benchmark_used,
+                    routing_reason=selection.reason,
+                    privacy_mode=privacy.privacy_mode,
+                    sensitivity_level=privacy.sensitivity_level,
+                    success=False,
+                    error_code=exc.code,
+                )
+                return map_ai_response(
+                    ok=False,
+                    provider=selection.provider,
+                    model=selection.selected_model,
+                    output="",
+                    trace_id=trace_id,
+                    metadata={
+                        "task": task,
+                        "selection_reason": selection.reason,
+                        "selection_benchmark_used": selection.benchmark_used,
+                        "selection_strategy": selection.strategy,
+                        "selection_fallback_used": selection.fallback_used,
+                        "routing_reason": routing.routing_reason,
+                        "routing_fallback_allowed": routing.fallback_allowed,
+                        "routing_privacy_mode": routing.privacy_mode,
+                        "privacy_sensitivity_level": privacy.sensitivity_level,
+                        "privacy_classification_reason": privacy.classification_reason,
+                        "privacy_policy_tags": privacy.policy_tags,
+                        "provider_error": exc.code,
+                        "provider_error_message": exc.message,
+                    },
+                )
 
         validated = validate_structured_output(result.data)
         total_latency_ms = round((time.perf_counter() - started_at) * 1000, 2)
         logger.info(
-            "local_ai_analyze_complete trace_id=%s task=%s provider=%s model=%s ok=%s provider_error=%s validation_error=%s latency_ms=%s",
+            "local_ai_analyze_complete trace_id=%s task=%s provider=%s model=%s ok=%s provider_error=%s validation_error=%s cache_hit=%s latency_ms=%s",
             trace_id,
             task,
             provider.provider_key,
@@ -616,40 +680,44 @@ class LocalAIOrchestrator:
             bool(result.ok and validated.ok),
             result.error,
             validated.error,
+            cache_hit,
             total_latency_ms,
         )
-        self._audit(
-            trace_id=trace_id,
-            stage="provider_execution_completed",
-            task_type=task,
-            privacy_mode=privacy.privacy_mode,
-            sensitivity_level=privacy.sensitivity_level,
-            selected_provider=provider.provider_key,
-            selected_model=selection.selected_model,
-            fallback_used=selection.fallback_used,
-            benchmark_used=selection.benchmark_used,
-            decision_reason=selection.reason,
-            policy_tags=privacy.policy_tags,
-            success=bool(result.ok and validated.ok),
-            error_code=result.error or validated.error,
-            metadata={"provider_latency_ms": result.latency_ms},
-        )
-        self._telemetry(
-            trace_id=trace_id,
-            stage="provider_execution_completed",
-            task_type=task,
-            provider=provider.provider_key,
-            model=selection.selected_model,
-            latency_ms=result.latency_ms,
-            fallback_used=selection.fallback_used,
-            benchmark_used=selection.benchmark_used,
-            routing_reason=selection.reason,
-            privacy_mode=privacy.privacy_mode,
-            sensitivity_level=privacy.sensitivity_level,
-            success=bool(result.ok and validated.ok),
-            error_code=result.error or validated.error,
-            metadata={"response_valid": validated.ok},
-        )
+        if not cache_hit:
+            self._audit(
+                trace_id=trace_id,
+                stage="provider_execution_completed",
+                task_type=task,
+                privacy_mode=privacy.privacy_mode,
+                sensitivity_level=privacy.sensitivity_level,
+                selected_provider=provider.provider_key,
+                selected_model=selection.selected_model,
+                fallback_used=selection.fallback_used,
+                benchmark_used=selection.benchmark_used,
+                decision_reason=selection.reason,
+                policy_tags=privacy.policy_tags,
+                success=bool(result.ok and validated.ok),
+                error_code=result.error or validated.error,
+                metadata={"provider_latency_ms": result.latency_ms},
+            )
+            self._telemetry(
+                trace_id=trace_id,
+                stage="provider_execution_completed",
+                task_type=task,
+                provider=provider.provider_key,
+                model=selection.selected_model,
+                latency_ms=result.latency_ms,
+                fallback_used=selection.fallback_used,
+                benchmark_used=selection.benchmark_used,
+                routing_reason=selection.reason,
+                privacy_mode=privacy.privacy_mode,
+                sensitivity_level=privacy.sensitivity_level,
+                success=bool(result.ok and validated.ok),
+                error_code=result.error or validated.error,
+                metadata={"response_valid": validated.ok},
+            )
+            if cache_key is not None and result.ok and validated.ok:
+                self.response_cache.put(cache_key, result, persist=cache_persist)
         self._audit(
             trace_id=trace_id,
             stage="response_returned",
@@ -715,6 +783,7 @@ class LocalAIOrchestrator:
                 "provider_error": result.error,
                 "validation_error": validated.error,
                 "provider_latency_ms": result.latency_ms,
+                "response_cache_hit": cache_hit,
             },
         )
 
@@ -979,25 +1048,32 @@ class LocalAIOrchestrator:
 
     async def get_provider_health(self) -> ProviderHealthListResponse:
         """Return health information for all registered providers."""
-        provider_entries: list[ProviderHealthEntry] = []
-        for provider in self.provider_factory.registry().list():
-            health = await provider.health_check()
-            provider_entries.append(
-                ProviderHealthEntry(
-                    provider=health.provider,
-                    available=health.available,
-                    default_model=health.default_model,
-                    latency_ms=health.latency_ms,
-                    error=health.error,
-                    metadata=health.metadata,
-                )
+        provider_entries = [
+            ProviderHealthEntry(
+                provider=health.provider,
+                available=health.available,
+                default_model=health.default_model,
+                latency_ms=health.latency_ms,
+                error=health.error,
+                metadata=health.metadata,
             )
+            for health in await self.provider_state_cache.probe_health_many(self.provider_factory.registry().list())
+        ]
         return ProviderHealthListResponse(
             default_provider=self.settings.default_provider,
             fallback_provider=self.settings.fallback_provider,
             providers=provider_entries,
         )
 
+    def get_provider_connection_stats(self) -> ProviderConnectionPoolListResponse:
+        """Return pooled HTTP connection statistics for registered providers."""
+        return self.provider_factory.connection_stats()
+
+    async def aclose(self) -> None:
+        """Release long-lived provider resources held by this orchestrator."""
+        await self.provider_state_cache.aclose()
+        await self.provider_factory.aclose()
+
     async def _select_model_for_provider(
         self,
         *,
@@ -1023,47 +1099,33 @@ class LocalAIOrchestrator:
         return selection_result
 
     async def _get_available_model_names(self, provider: AIProvider) -> list[str]:
-        result = await provider.list_models()
+        result = await self.provider_state_cache.get_models(provider)
         return [model.name for model in result.models if model.name]
 
     async def _collect_provider_states(
         self,
         payload: RoutingDecisionRequest,
     ) -> list[RoutingProviderState]:
-        """Collect compact provider states for routing decisions."""
-        states: list[RoutingProviderState] = []
-        for provider in self.provider_factory.registry().list():
-            descriptor = provider.describe()
-            if not descriptor.enabled:
-                states.append(
-                    RoutingProviderState(
-                        provider=descriptor.key,
-                        kind=descriptor.kind,
-                        available=False,
-                        enabled=descriptor.enabled,
-                        configured=descriptor.configured,
-                    )
-                )
-                continue
-
-            if descriptor.kind == "cloud" and not self._should_probe_cloud(payload):
-                states.append(
-                    RoutingProviderState(
-                        provider=descriptor.key,
-                        kind=descriptor.kind,
-                        available=False,
-                        enabled=descriptor.enabled,
-                        configured=descriptor.configured,
-                    )
-                )
-                continue
+        """Collect compact provider states for routing decisions.
 
-            health = await provider.health_check()
+        Health comes from the provider state cache, so steady-state routing
+        needs no network round trip and cache misses are probed concurrently.
+        """
+        described = [(provider, provider.describe()) for provider in self.provider_factory.registry().list()]
+        probed = [
+            provider
+            for provider, descriptor in described
+            if descriptor.enabled and not (descriptor.kind == "cloud" and not self._should_probe_cloud(payload))
+        ]
+        health_by_key = await self.provider_state_cache.get_health_many(probed)
+        states: list[RoutingProviderState] = []
+        for provider, descriptor in described:
+            health = health_by_key.get(provider.provider_key)
             states.append(
                 RoutingProviderState(
                     provider=descriptor.key,
                     kind=descriptor.kind,
-                    available=health.available,
+                    available=bool(health and health.available),
                     enabled=descriptor.enabled,
                     configured=descriptor.configured,
                 )
@@ -1195,6 +1257,40 @@ class LocalAIOrchestrator:
             return self.provider_factory.get_default_provider()
         return self._get_provider_by_key(routing.selected_provider)
 
+    def _response_cache_plan(
+        self,
+        *,
+        task: str,
+        prompt: str,
+        provider_key: str,
+        model: str | None,
+        privacy: PrivacyClassificationResult,
+        metadata: dict,
+    ) -> tuple[str | None, bool]:
+        """Return the response cache key, or None to bypass the cache, and whether the entry may be persisted.
+
+        Only sensitivity levels the privacy policy lists in
+        ``response_cache_sensitivity_levels`` are cached, and only those in
+        ``response_cache_persist_sensitivity_levels`` reach the disk tier.
+        """
+        if self.response_cache is None or metadata.get("response_cache") is False:
+            return None, False
+        policy = self.control_plane.get_privacy_policy()
+        if privacy.sensitivity_level not in set(policy.response_cache_sensitivity_levels):
+            return None, False
+        key = response_cache_key(
+            task_type=task,
+            prompt=prompt,
+            provider=provider_key,
+            model=model or "",
+            policy_version=self.control_plane.get_version_info().policy_version,
+            scope=(
+                str(metadata["tenant_id"]) if metadata.get("tenant_id") else None,
+                str(metadata["workspace_id"]) if metadata.get("workspace_id") else None,
+            ),
+        )
+        return key, privacy.sensitivity_level in set(policy.response_cache_persist_sensitivity_levels)
+
     def _audit(
         self,
         *,
@@ -1272,3 +1368,16 @@ class LocalAIOrchestrator:
             )
         except Exception:
             logger.exception("ai_telemetry_emit_failed trace_id=%s stage=%s", trace_id, stage)
+
+
+def build_local_ai_orchestrator(settings: LocalAISettings | None = None) -> LocalAIOrchestrator:
+    """Build the process-wide orchestrator graph on the shared control plane.
+
+    The shared control plane is the same instance served by the control plane
+    routes, so policy activations made there are visible to routing and audit.
+    """
+    resolved_settings = settings or get_local_ai_settings()
+    control_plane = get_ai_control_plane_service()
+    if control_plane.settings is not resolved_settings:
+        control_plane = AIControlPlaneService(resolved_settings)
+    return LocalAIOrchestrator(settings=resolved_settings, control_plane=control_plane)
@@ -53,9 +53,13 @@ INTERNAL_KEYWORDS = {
 class PrivacyClassifier:
     """Classify request sensitivity before provider routing."""
 
-    def __init__(self, settings: LocalAISettings) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings,
+        control_plane: AIControlPlaneService | None = None,
+    ) -> None:
         self.settings = settings
-        self.control_plane = AIControlPlaneService(settings)
+        self.control_plane = control_plane or AIControlPlaneService(settings)
 
     def describe_policy(self) -> PrivacyPolicyResponse:
         """Return a static snapshot of the active privacy policy."""
@@ -0,0 +1,194 @@
+"""TTL-cached, concurrent provider health and model-list probing."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any, Literal
+
+from app.core.config import LocalAISettings, get_local_ai_settings
+from app.services.ai.providers.base import AIProvider
+from app.services.ai.providers.types import ProviderHealthStatus, ProviderModelList
+
+
+logger = logging.getLogger("nexora.ai.provider_state")
+
+ProbeKind = Literal["health", "models"]
+CIRCUIT_OPEN_ERROR = "provider_circuit_open"
+PROBE_FAILED_ERROR = "provider_probe_failed"
+
+
+@dataclass
+class _CachedProbe:
+    value: Any
+    ok: bool
+    expires_at: float
+
+
+@dataclass
+class _ProviderCircuit:
+    consecutive_failures: int = 0
+    open_until: float = 0.0
+
+
+class ProviderStateCache:
+    """Cache provider health and model listings for routing and model selection.
+
+    Fresh entries are served without a network round trip. Stale entries are
+    served immediately while a background probe refreshes them, and failed
+    probes are cached for a shorter negative TTL. A provider that keeps
+    failing opens a circuit and is reported unavailable without probing until
+    the circuit cools down.
+    """
+
+    def __init__(
+        self,
+        settings: LocalAISettings | None = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.settings = settings or get_local_ai_settings()
+        self._clock = clock
+        self._entries: dict[tuple[ProbeKind, str], _CachedProbe] = {}
+        self._circuits: dict[str, _ProviderCircuit] = {}
+        self._refresh_tasks: dict[tuple[ProbeKind, str], asyncio.Task] = {}
+
+    async def get_health(self, provider: AIProvider) -> ProviderHealthStatus:
+        """Return cached provider health, probing only when nothing usable is cached."""
+        return await self._get("health", provider)
+
+    async def get_models(self, provider: AIProvider) -> ProviderModelList:
+        """Return the cached provider model listing, probing only when needed."""
+        return await self._get("models", provider)
+
+    async def get_health_many(self, providers: Iterable[AIProvider]) -> dict[str, ProviderHealthStatus]:
+        """Return cached health for several providers, probing misses concurrently."""
+        provider_list = list(providers)
+        results = await asyncio.gather(*(self.get_health(provider) for provider in provider_list))
+        return {provider.provider_key: result for provider, result in zip(provider_list, results)}
+
+    async def probe_health_many(self, providers: Iterable[AIProvider]) -> list[ProviderHealthStatus]:
+        """Probe several providers concurrently, bypassing the cache, and store the results."""
+        return list(await asyncio.gather(*(self._probe("health", provider) for provider in providers)))
+
+    def record_health(self, provider_key: str, health: ProviderHealthStatus) -> None:
+        """Store a health result obtained outside the cache."""
+        self._store("health", provider_key, health, ok=bool(health.available))
+
+    def is_circuit_open(self, provider_key: str) -> bool:
+        """Return whether probing is currently suspended for a provider."""
+        circuit = self._circuits.get(provider_key)
+        return circuit is not None and circuit.open_until > self._clock()
+
+    def invalidate(self, provider_key: str | None = None) -> None:
+        """Drop cached entries and circuit state for one provider or all providers."""
+        if provider_key is None:
+            self._entries.clear()
+            self._circuits.clear()
+            return
+        for kind in ("health", "models"):
+            self._entries.pop((kind, provider_key), None)
+        self._circuits.pop(provider_key, None)
+
+    async def aclose(self) -> None:
+        """Cancel background refreshes scheduled on the running loop."""
+        tasks = [task for task in self._refresh_tasks.values() if not task.done()]
+        self._refresh_tasks.clear()
+        for task in tasks:
+            task.cancel()
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        pending = [task for task in tasks if task.get_loop() is current_loop]
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _get(self, kind: ProbeKind, provider: AIProvider) -> Any:
+        provider_key = provider.provider_key
+        if self.is_circuit_open(provider_key):
+            return self._circuit_open_result(kind, provider)
+
+        entry = self._entries.get((kind, provider_key))
+        if entry is None:
+            return await self._probe(kind, provider)
+        if entry.expires_at <= self._clock():
+            self._schedule_refresh(kind, provider)
+        return entry.value
+
+    def _schedule_refresh(self, kind: ProbeKind, provider: AIProvider) -> None:
+        key = (kind, provider.provider_key)
+        running = self._refresh_tasks.get(key)
+        if running is not None and not running.done():
+            return
+        task = asyncio.get_running_loop().create_task(self._probe(kind, provider))
+        self._refresh_tasks[key] = task
+        task.add_done_callback(lambda finished, key=key: self._forget_refresh(key, finished))
+
+    def _forget_refresh(self, key: tuple[ProbeKind, str], task: asyncio.Task) -> None:
+        if self._refresh_tasks.get(key) is task:
+            self._refresh_tasks.pop(key, None)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning("provider_state_refresh_failed provider=%s kind=%s", key[1], key[0])
+
+    async def _probe(self, kind: ProbeKind, provider: AIProvider) -> Any:
+        probe: Callable[[], Awaitable[Any]] = provider.health_check if kind == "health" else provider.list_models
+        try:
+            result = await probe()
+        except Exception:
+            logger.warning("provider_state_probe_failed provider=%s kind=%s", provider.provider_key, kind)
+            result = self._failed_result(kind, provider, PROBE_FAILED_ERROR)
+        ok = bool(result.available) if kind == "health" else bool(result.ok)
+        self._store(kind, provider.provider_key, result, ok=ok)
+        return result
+
+    def _store(self, kind: ProbeKind, provider_key: str, value: Any, *, ok: bool) -> None:
+        now = self._clock()
+        if ok:
+            ttl = (
+                self.settings.provider_health_ttl_seconds
+                if kind == "health"
+                else self.settings.provider_models_ttl_seconds
+            )
+        else:
+            ttl = self.settings.provider_negative_ttl_seconds
+        self._entries[(kind, provider_key)] = _CachedProbe(value=value, ok=ok, expires_at=now + ttl)
+
+        circuit = self._circuits.setdefault(provider_key, _ProviderCircuit())
+        if ok:
+            circuit.consecutive_failures = 0
+            circuit.open_until = 0.0
+            return
+        circuit.consecutive_failures += 1
+        if circuit.consecutive_failures >= self.settings.provider_circuit_failure_threshold:
+            circuit.open_until = now + self.settings.provider_circuit_open_seconds
+            logger.warning(
+                "provider_circuit_opened provider=%s failures=%s",
+                provider_key,
+                circuit.consecutive_failures,
+            )
+
+    def _circuit_open_result(self, kind: ProbeKind, provider: AIProvider) -> Any:
+        return self._failed_result(kind, provider, CIRCUIT_OPEN_ERROR)
+
+    @staticmethod
+    def _failed_result(kind: ProbeKind, provider: AIProvider, error: str) -> Any:
+        if kind == "health":
+            return ProviderHealthStatus(
+                ok=True,
+                provider=provider.provider_key,
+                available=False,
+                default_model=provider.default_model,
+                error=error,
+                metadata={"circuit_open": error == CIRCUIT_OPEN_ERROR},
+            )
+        return ProviderModelList(
+            ok=False,
+            provider=provider.provider_key,
+            models=[],
+            error=error,
+            metadata={"circuit_open": error == CIRCUIT_OPEN_ERROR},
+        )
@@ -0,0 +1,192 @@
+"""Pooled keep-alive HTTP clients shared by HTTP-backed AI providers."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+import httpx
+
+from app.core.config import LocalAISettings, get_local_ai_settings
+from app.schemas.ai import ProviderConnectionPoolListResponse, ProviderConnectionPoolStats
+
+
+logger = logging.getLogger("nexora.ai.providers.connections")
+
+_REQUEST_SENT_EVENTS = {
+    "http11.send_request_headers.started",
+    "http2.send_request_headers.started",
+}
+_CONNECTION_OPENED_EVENTS = {
+    "connection.connect_tcp.complete",
+    "connection.connect_unix_socket.complete",
+}
+
+
+def _http2_available() -> bool:
+    try:
+        import h2  # type: ignore  # noqa: F401
+    except Exception:
+        return False
+    return True
+
+
+@dataclass
+class _PoolCounters:
+    requests: int = 0
+    in_flight: int = 0
+    connections_opened: int = 0
+    total_wait_ms: float = 0.0
+    max_wait_ms: float = 0.0
+
+
+@dataclass
+class _PooledClient:
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+    http2: bool
+    counters: _PoolCounters = field(default_factory=_PoolCounters)
+
+
+class ProviderConnectionManager:
+    """Own one long-lived pooled ``httpx.AsyncClient`` per provider base URL.
+
+    Clients are bound to the event loop that created them; a client requested
+    from a different loop is replaced instead of being reused across loops.
+    """
+
+    def __init__(self, settings: LocalAISettings | None = None) -> None:
+        self.settings = settings or get_local_ai_settings()
+        self._clients: dict[str, _PooledClient] = {}
+        self._counters: dict[str, _PoolCounters] = {}
+
+    def get_client(
+        self,
+        base_url: str,
+        *,
+        timeout_seconds: float,
+        headers: dict[str, str] | None = None,
+    ) -> httpx.AsyncClient:
+        """Return the pooled client for a base URL, creating it on first use."""
+        return self._get_pooled(base_url, timeout_seconds=timeout_seconds, headers=headers).client
+
+    async def request(
+        self,
+        base_url: str,
+        method: str,
+        path: str,
+        *,
+        timeout_seconds: float,
+        headers: dict[str, str] | None = None,
+        json_body: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Send a request through the pooled client and record pool statistics."""
+        pooled = self._get_pooled(base_url, timeout_seconds=timeout_seconds, headers=headers)
+        counters = pooled.counters
+        started_at = time.perf_counter()
+        wait_recorded = False
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            nonlocal wait_recorded
+            if event_name in _CONNECTION_OPENED_EVENTS:
+                counters.connections_opened += 1
+            elif event_name in _REQUEST_SENT_EVENTS and not wait_recorded:
+                wait_recorded = True
+                wait_ms = (time.perf_counter() - started_at) * 1000
+                counters.total_wait_ms += wait_ms
+                counters.max_wait_ms = max(counters.max_wait_ms, wait_ms)
+
+        counters.requests += 1
+        counters.in_flight += 1
+        try:
+            return await pooled.client.request(method, path, json=json_body, extensions={"trace": trace})
+        finally:
+            counters.in_flight -= 1
+
+    def stats(self) -> ProviderConnectionPoolListResponse:
+        """Return pool statistics for every base URL used so far."""
+        pools: list[ProviderConnectionPoolStats] = []
+        for base_url in sorted(self._counters):
+            counters = self._counters[base_url]
+            pooled = self._clients.get(base_url)
+            open_connections, idle = self._connection_counts(pooled)
+            reused = max(counters.requests - counters.connections_opened, 0)
+            pools.append(
+                ProviderConnectionPoolStats(
+                    base_url=base_url,
+                    http2=bool(pooled and pooled.http2),
+                    max_connections=self.settings.http_pool_max_connections,
+                    max_keepalive_connections=self.settings.http_pool_max_keepalive,
+                    open_connections=open_connections,
+                    in_use=counters.in_flight,
+                    idle=idle,
+                    requests=counters.requests,
+                    connections_opened=counters.connections_opened,
+                    reuse_ratio=round(reused / counters.requests, 4) if counters.requests else 0.0,
+                    avg_wait_ms=round(counters.total_wait_ms / counters.requests, 3) if counters.requests else 0.0,
+                    max_wait_ms=round(counters.max_wait_ms, 3),
+                )
+            )
+        return ProviderConnectionPoolListResponse(pools=pools)
+
+    async def aclose(self) -> None:
+        """Close every pooled client owned by the running event loop."""
+        clients = list(self._clients.values())
+        self._clients.clear()
+        try:
+            current_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            current_loop = None
+        for pooled in clients:
+            if pooled.loop is not current_loop:
+                continue
+            try:
+                await pooled.client.aclose()
+            except Exception:
+                logger.warning("provider_client_close_failed", exc_info=False)
+
+    def _get_pooled(
+        self,
+        base_url: str,
+        *,
+        timeout_seconds: float,
+        headers: dict[str, str] | None,
+    ) -> _PooledClient:
+        loop = asyncio.get_running_loop()
+        pooled = self._clients.get(base_url)
+        if pooled is not None and pooled.loop is loop and not pooled.client.is_closed:
+            return pooled
+
+        counters = self._counters.setdefault(base_url, _PoolCounters())
+        http2 = self.settings.http2_enabled and _http2_available()
+        client = httpx.AsyncClient(
+            base_url=base_url,
+            timeout=httpx.Timeout(timeout_seconds),
+            headers=headers or {"Accept": "application/json"},
+            limits=httpx.Limits(
+                max_connections=self.settings.http_pool_max_connections,
+                max_keepalive_connections=self.settings.http_pool_max_keepalive,
+                keepalive_expiry=self.settings.http_pool_keepalive_expiry_seconds,
+            ),
+            http2=http2,
+        )
+        pooled = _PooledClient(client=client, loop=loop, http2=http2, counters=counters)
+        self._clients[base_url] = pooled
+        return pooled
+
+    @staticmethod
+    def _connection_counts(pooled: _PooledClient | None) -> tuple[int, int]:
+        if pooled is None or pooled.client.is_closed:
+            return 0, 0
+        pool = getattr(getattr(pooled.client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []) or [])
+        idle = 0
+        for connection in connections:
+            try:
+                idle += 1 if connection.is_idle() else 0
+            except Exception:
+                continue
+        return len(connections), idle
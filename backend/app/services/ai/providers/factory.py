@@ -4,7 +4,9 @@ from __future__ import annotations
 
 from app.core.config import LocalAISettings, get_local_ai_settings
 from app.services.ai.providers.anthropic_provider import AnthropicProvider
+from app.schemas.ai import ProviderConnectionPoolListResponse
 from app.services.ai.providers.base import AIProvider
+from app.services.ai.providers.connection_manager import ProviderConnectionManager
 from app.services.ai.providers.exceptions import ProviderNotConfiguredError, UnknownProviderError
 from app.services.ai.providers.ollama_provider import OllamaProvider
 from app.services.ai.providers.openai_provider import OpenAIProvider
@@ -14,11 +16,16 @@ from app.services.ai.providers.registry import AIProviderRegistry
 class AIProviderFactory:
     """Build and resolve AI providers for orchestration code."""
 
-    def __init__(self, settings: LocalAISettings | None = None) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings | None = None,
+        connection_manager: ProviderConnectionManager | None = None,
+    ) -> None:
         self.settings = settings or get_local_ai_settings()
+        self.connection_manager = connection_manager or ProviderConnectionManager(self.settings)
         self._registry = AIProviderRegistry(
             {
-                "ollama": OllamaProvider(settings=self.settings),
+                "ollama": OllamaProvider(settings=self.settings, connection_manager=self.connection_manager),
                 "openai": OpenAIProvider(settings=self.settings),
                 "anthropic": AnthropicProvider(settings=self.settings),
             }
@@ -28,6 +35,14 @@ class AIProviderFactory:
         """Return the provider registry."""
         return self._registry
 
+    def connection_stats(self) -> ProviderConnectionPoolListResponse:
+        """Return pooled HTTP connection statistics for registered providers."""
+        return self.connection_manager.stats()
+
+    async def aclose(self) -> None:
+        """Release pooled provider connections."""
+        await self.connection_manager.aclose()
+
     def get_provider(self, provider_key: str) -> AIProvider:
         """Return a provider by key or raise a controlled error."""
         provider = self._registry.get(provider_key)
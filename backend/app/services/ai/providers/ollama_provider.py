@@ -11,6 +11,7 @@ import httpx
 
 from app.core.config import LocalAISettings, get_local_ai_settings
 from app.services.ai.providers.base import AIProvider
+from app.services.ai.providers.connection_manager import ProviderConnectionManager
 from app.services.ai.providers.exceptions import (
     ProviderInvalidResponseError,
     ProviderUnavailableError,
@@ -35,9 +36,11 @@ class OllamaProvider(AIProvider):
         self,
         settings: LocalAISettings | None = None,
         http_client: httpx.AsyncClient | None = None,
+        connection_manager: ProviderConnectionManager | None = None,
     ) -> None:
         self.settings = settings or get_local_ai_settings()
         self._http_client = http_client
+        self._connection_manager = connection_manager
 
     @property
     def provider_key(self) -> str:
@@ -203,12 +206,10 @@ class OllamaProvider(AIProvider):
     ) -> dict[str, Any]:
         """Execute an Ollama request and return a normalized result."""
         started_at = time.perf_counter()
-        client = self._http_client or self._build_client()
-        close_client = self._http_client is None
         normalized_path = path if path.startswith("/") else f"/{path}"
 
         try:
-            response = await client.request(method, normalized_path, json=json_body)
+            response = await self._send(method, normalized_path, json_body=json_body)
             latency_ms = round((time.perf_counter() - started_at) * 1000, 2)
             response.raise_for_status()
             data = response.json() if response.content else {}
@@ -297,9 +298,27 @@ class OllamaProvider(AIProvider):
                 "error": ProviderInvalidResponseError().code,
                 "trace_id": trace_id,
             }
-        finally:
-            if close_client:
-                await client.aclose()
+
+    async def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json_body: dict[str, Any] | None,
+    ) -> httpx.Response:
+        """Send a request through the injected client, the shared pool, or a one-off client."""
+        if self._http_client is not None:
+            return await self._http_client.request(method, path, json=json_body)
+        if self._connection_manager is not None:
+            return await self._connection_manager.request(
+                self.settings.base_url,
+                method,
+                path,
+                timeout_seconds=self.settings.timeout_seconds,
+                json_body=json_body,
+            )
+        async with self._build_client() as client:
+            return await client.request(method, path, json=json_body)
 
     def _build_client(self) -> httpx.AsyncClient:
         """Create a short-lived async HTTP client for provider requests."""
@@ -0,0 +1,232 @@
+"""Privacy-aware cache of structured provider responses."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.core.config import LocalAISettings, get_local_ai_settings
+from app.services.ai.providers.types import ProviderChatResponse
+
+
+logger = logging.getLogger("nexora.ai.response_cache")
+
+# Every Nth disk write trims the disk tier back to its entry bound.
+_DISK_PRUNE_EVERY = 64
+
+
+def response_cache_key(
+    *,
+    task_type: str,
+    prompt: str,
+    provider: str,
+    model: str,
+    policy_version: str,
+    scope: tuple[str | None, str | None] = (None, None),
+) -> str:
+    """Hash everything that decides a provider answer, plus the tenant/workspace scope."""
+    payload = json.dumps(
+        [task_type, provider, model, policy_version, list(scope), prompt],
+        ensure_ascii=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class _CachedResponse:
+    payload: dict[str, Any]
+    size: int
+    expires_at: float
+
+
+class AIResponseCache:
+    """Reuse successful provider responses for identical prompts.
+
+    Entries live in an in-memory LRU bounded by entry count and serialized
+    size, and expire ``ttl_seconds`` after they were stored. With a
+    ``disk_dir``, entries the caller marks persistable are also written there
+    as one JSON file per key, so they survive restarts; a memory miss falls
+    back to the disk tier and promotes fresh entries. The cache never decides
+    what may be stored: callers pass ``persist`` and only call `put` for
+    content their privacy policy allows to be cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = 512,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 300.0,
+        disk_dir: str | Path | None = None,
+        disk_max_entries: int = 5000,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.max_entries = max(0, max_entries)
+        self.max_bytes = max(0, max_bytes)
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.disk_dir = Path(disk_dir) if disk_dir else None
+        self.disk_max_entries = max(0, disk_max_entries)
+        # Wall-clock time, so disk entries keep their expiry across restarts.
+        self._clock = clock
+        self._entries: OrderedDict[str, _CachedResponse] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._disk_writes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+
+    @classmethod
+    def from_settings(cls, settings: LocalAISettings | None = None) -> AIResponseCache | None:
+        """Build the cache configured by ``settings``; None when response caching is off."""
+        settings = settings or get_local_ai_settings()
+        if not settings.response_cache_enabled or not settings.response_cache_max_entries:
+            return None
+        return cls(
+            max_entries=settings.response_cache_max_entries,
+            max_bytes=settings.response_cache_max_bytes,
+            ttl_seconds=settings.response_cache_ttl_seconds,
+            disk_dir=settings.response_cache_dir,
+            disk_max_entries=settings.response_cache_disk_max_entries,
+        )
+
+    def get(self, key: str) -> ProviderChatResponse | None:
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._drop(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return ProviderChatResponse.model_validate(entry.payload)
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._insert(key, entry)
+        return ProviderChatResponse.model_validate(entry.payload)
+
+    def put(self, key: str, response: ProviderChatResponse, *, persist: bool = False) -> None:
+        """Store ``response``; ``persist`` also writes it to the disk tier when one is configured."""
+        if not self.ttl_seconds:
+            return
+        payload = response.model_dump(mode="json")
+        encoded = json.dumps(payload, ensure_ascii=True, separators=(",", ":"))
+        entry = _CachedResponse(payload=payload, size=len(encoded), expires_at=self._clock() + self.ttl_seconds)
+        with self._lock:
+            self.stores += 1
+            self._insert(key, entry)
+        if persist and self.disk_dir is not None:
+            self._write_disk(key, entry, encoded)
+
+    def invalidate(self) -> None:
+        """Forget every entry, including the disk tier."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+        if self.disk_dir is not None and self.disk_dir.is_dir():
+            for path in self.disk_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "ttl_seconds": self.ttl_seconds,
+                "disk_enabled": self.disk_dir is not None,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "evictions": self.evictions,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+            }
+
+    def _insert(self, key: str, entry: _CachedResponse) -> None:
+        if self.max_bytes and entry.size > self.max_bytes:
+            return
+        self._drop(key)
+        self._entries[key] = entry
+        self._bytes += entry.size
+        while self._entries and (
+            len(self._entries) > self.max_entries or (self.max_bytes and self._bytes > self.max_bytes)
+        ):
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.size
+            self.evictions += 1
+
+    def _drop(self, key: str) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.json"
+
+    def _read_disk(self, key: str, now: float) -> _CachedResponse | None:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            raw = path.read_text(encoding="utf-8")
+            record = json.loads(raw)
+            expires_at = float(record["expires_at"])
+            payload = record["response"]
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning("ai_response_cache_disk_read_failed key=%s", key[:12], exc_info=False)
+            path.unlink(missing_ok=True)
+            return None
+        if expires_at <= now:
+            path.unlink(missing_ok=True)
+            return None
+        return _CachedResponse(payload=payload, size=len(raw), expires_at=expires_at)
+
+    def _write_disk(self, key: str, entry: _CachedResponse, encoded: str) -> None:
+        path = self._disk_path(key)
+        temporary = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(
+                f'{{"expires_at":{entry.expires_at!r},"response":{encoded}}}',
+                encoding="utf-8",
+            )
+            os.replace(temporary, path)
+        except Exception:
+            logger.warning("ai_response_cache_disk_write_failed key=%s", key[:12], exc_info=False)
+            temporary.unlink(missing_ok=True)
+            return
+        with self._lock:
+            self._disk_writes += 1
+            prune = self._disk_writes % _DISK_PRUNE_EVERY == 0
+        if prune:
+            self._prune_disk()
+
+    def _prune_disk(self) -> None:
+        try:
+            files = sorted(self.disk_dir.glob("*.json"), key=lambda item: item.stat().st_mtime)
+        except OSError:
+            return
+        for path in files[: max(0, len(files) - self.disk_max_entries)]:
+            path.unlink(missing_ok=True)
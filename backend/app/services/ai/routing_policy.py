@@ -19,9 +19,13 @@ REASONING_TASKS = {"analyze_scenario", "explain", "summarize_context"}
 class HybridRoutingPolicy:
     """Compute deterministic provider routing decisions for Nexora AI requests."""
 
-    def __init__(self, settings: LocalAISettings) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings,
+        control_plane: AIControlPlaneService | None = None,
+    ) -> None:
         self.settings = settings
-        self.control_plane = AIControlPlaneService(settings)
+        self.control_plane = control_plane or AIControlPlaneService(settings)
 
     def describe_policy(self) -> RoutingPolicyResponse:
         """Return a static snapshot of the current routing policy."""
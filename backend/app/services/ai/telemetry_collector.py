@@ -2,11 +2,9 @@
 
 from __future__ import annotations
 
-import json
 import logging
 from collections import deque
 from datetime import UTC, datetime
-from pathlib import Path
 
 from app.core.config import LocalAISettings
 from app.schemas.telemetry import (
@@ -20,6 +18,7 @@ from app.schemas.telemetry import (
 )
 from app.services.ai.audit_redaction import minimize_audit_metadata
 from app.services.ai.control_plane.control_plane_service import AIControlPlaneService
+from app.services.ai.jsonl_sink import get_jsonl_sink
 from app.services.ai.telemetry_metrics import build_stage_metric_response, build_telemetry_metrics
 
 
@@ -29,9 +28,13 @@ logger = logging.getLogger("nexora.ai.telemetry")
 class AITelemetryCollector:
     """Collect recent AI telemetry events and optional JSONL records."""
 
-    def __init__(self, settings: LocalAISettings) -> None:
+    def __init__(
+        self,
+        settings: LocalAISettings,
+        control_plane: AIControlPlaneService | None = None,
+    ) -> None:
         self.settings = settings
-        self.control_plane = AIControlPlaneService(settings)
+        self.control_plane = control_plane or AIControlPlaneService(settings)
         self._events: deque[TelemetryEvent] = deque(maxlen=self.control_plane.get_telemetry_policy().max_events)
 
     def record_event(
@@ -158,7 +161,4 @@ class AITelemetryCollector:
         return build_stage_metric_response(list(self._events))
 
     def _write_jsonl(self, event: TelemetryEvent) -> None:
-        path = Path(self.control_plane.get_telemetry_policy().file_path)
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(event.model_dump(), ensure_ascii=True) + "\n")
+        get_jsonl_sink(self.control_plane.get_telemetry_policy().file_path, self.settings).submit(event)
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
 import time
-from dataclasses import dataclass
+from collections.abc import Mapping, MutableMapping
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from fastapi import Request
@@ -11,8 +13,10 @@ from fastapi.responses import JSONResponse
 
 from app.models.replay import ReplayFrame, ReplayMeta
 from app.services.chat_contract_alignment import build_replay_system_state
+from app.services.chat_stages import ChatStage, run_chat_stages
 from app.services.decision_analysis_chat_attachment import try_build_decision_analysis_payload
 from app.services.event_store_mem import EventStoreMem
+from app.services.perf_profiler import perf_span, record_stage, request_trace
 from app.services.replay_store import ReplayStore
 from app.utils.responses import build_error_envelope
 
@@ -23,10 +27,10 @@ logger = logging.getLogger(__name__)
 @dataclass(frozen=True)
 class ChatPipelineDependencies:
     object_types: dict[str, dict]
-    object_instances: dict[str, dict]
+    object_instances: MutableMapping[str, dict]
     legacy_objects: dict[str, dict]
-    instance_counters: dict[str, int]
-    episode_by_user: dict[str, str]
+    instance_counters: MutableMapping[str, int]
+    episode_by_user: MutableMapping[str, str]
     tick_text: str
     check_ai_input_safety: Callable[[str], dict[str, Any]]
     semantic_infer_allowed_objects_from_text: Callable[[str], list[str]]
@@ -194,7 +198,19 @@ def _build_chat_error_payload(
     )
 
 
-def execute_chat_pipeline(payload: Any, request: Request, deps: ChatPipelineDependencies) -> dict[str, Any] | JSONResponse:
+_GAME_KEYWORDS = ("competitor", "pricing", "game", "strategy", "market", "rival")
+
+
+@dataclass
+class _PreparedChat:
+    """State handed from the core chat turn to the enrichment stages."""
+
+    state: dict[str, Any] = field(default_factory=dict)
+
+
+@perf_span("chat.prepare")
+def _prepare_chat(payload: Any, request: Request, deps: ChatPipelineDependencies) -> dict[str, Any] | JSONResponse | _PreparedChat:
+    """Core chat turn: intent, scene, KPI/fragility and persistence, up to the enrichment stages."""
     text = (payload.text or payload.message or "").strip()
     user_id = (
         payload.user_id
@@ -313,7 +329,8 @@ def execute_chat_pipeline(payload: Any, request: Request, deps: ChatPipelineDepe
     chaos = None
 
     try:
-        chaos = engine.analyze(text, payload.history, candidate_objects=allowed_objects if allowed_objects else None)
+        with perf_span("chat.analyze"):
+            chaos = engine.analyze(text, payload.history, candidate_objects=allowed_objects if allowed_objects else None)
         scene_actions = deps.build_scene_actions(chaos, mode=mode)
 
         analysis_summary = (getattr(chaos, "explanation", None) or "").strip() or None
@@ -691,13 +708,15 @@ def execute_chat_pipeline(payload: Any, request: Request, deps: ChatPipelineDepe
             pass
 
         try:
-            kpi_payload = deps.kpi_step(user_id, text, allowed_objects, mode)
+            with perf_span("chat.kpi_step"):
+                kpi_payload = deps.kpi_step(user_id, text, allowed_objects, mode)
             scene_section = scene_json.get("scene")
             if not isinstance(scene_section, dict):
                 scene_section = {}
                 scene_json["scene"] = scene_section
             scene_section["kpi"] = kpi_payload.get("kpi")
-            loops_out = deps.evaluate_loops(kpi_payload.get("kpi", {}), allowed_objects if allowed_objects else None, top_k=3)
+            with perf_span("chat.evaluate_loops"):
+                loops_out = deps.evaluate_loops(kpi_payload.get("kpi", {}), allowed_objects if allowed_objects else None, top_k=3)
             if isinstance(loops_out, dict):
                 loops = loops_out.get("loops") or []
                 loop_suggestions = loops_out.get("loops_suggestions") or []
@@ -706,12 +725,13 @@ def execute_chat_pipeline(payload: Any, request: Request, deps: ChatPipelineDepe
             scene_section["active_loop"] = active_loop
             scene_section["loops_suggestions"] = loop_suggestions
             try:
-                fragility = deps.compute_fragility(
-                    kpi=scene_section.get("kpi") if isinstance(scene_section.get("kpi"), dict) else None,
-                    loops=loops if isinstance(loops, list) else None,
-                    chaos=chaos if chaos is not None else None,
-                    allowed_objects=allowed_objects if isinstance(allowed_objects, list) else None,
-                )
+                with perf_span("chat.compute_fragility"):
+                    fragility = deps.compute_fragility(
+                        kpi=scene_section.get("kpi") if isinstance(scene_section.get("kpi"), dict) else None,
+                        loops=loops if isinstance(loops, list) else None,
+                        chaos=chaos if chaos is not None else None,
+                        allowed_objects=allowed_objects if isinstance(allowed_objects, list) else None,
+                    )
                 scene_section["fragility"] = fragility
             except Exception:
                 fragility = None
@@ -876,7 +896,8 @@ def execute_chat_pipeline(payload: Any, request: Request, deps: ChatPipelineDepe
             },
             meta=ReplayMeta(note=None, tags=["chat"]),
         )
-        replay_store.append_frame(ep_id, frame)
+        with perf_span("chat.replay_write"):
+            replay_store.append_frame_summary(ep_id, frame)
     except Exception:
         pass
 
@@ -944,301 +965,446 @@ def execute_chat_pipeline(payload: Any, request: Request, deps: ChatPipelineDepe
                 continue
         actions = filtered_actions
 
-    context_allowed_objects = allowed_objects
-    context_focused_object_id = focused_object_id
-    context_inference = inference_info
-    try:
-        fragility_drivers = fragility.get("drivers") if isinstance(fragility, dict) else {}
-        selection = deps.select_objects_v2(
-            text=text,
-            mode=mode or "business",
-            k=15,
-            recent_object_ids=allowed_objects if isinstance(allowed_objects, list) else [],
-            fragility_drivers=fragility_drivers if isinstance(fragility_drivers, dict) else {},
-            preferred_focus_id=focused_object_id,
-        )
-        if selection.allowed_objects:
-            context_allowed_objects = selection.allowed_objects
-        if selection.focused_object_id:
-            context_focused_object_id = selection.focused_object_id
-
-        scores_top = [
-            {"id": oid, "score": float(score)}
-            for oid, score in sorted(selection.scores.items(), key=lambda kv: kv[1], reverse=True)[:5]
-        ]
-        context_inference = {
-            "method": selection.method,
-            "source": selection.source,
-            "matched": selection.matched,
-            "scores_top": scores_top,
-            "why": selection.why,
+    should_include_game = (mode == "strategy") or any(k in text_lower for k in _GAME_KEYWORDS)
+    return _PreparedChat(
+        state={
+            "deps": deps,
+            "request": request,
+            "text": text,
+            "user_id": user_id,
+            "mode": mode,
+            "intent": intent,
+            "reply": reply,
+            "actions": actions,
+            "source": source,
+            "analysis_summary": analysis_summary,
+            "scene_json": scene_json,
+            "chaos": chaos,
+            "fragility": fragility,
+            "allowed_objects": allowed_objects,
+            "focused_object_id": focused_object_id,
+            "inference_info": inference_info,
+            "context_object_info": context_object_info,
+            "loops": loops,
+            "loop_suggestions": loop_suggestions,
+            "active_loop": active_loop,
+            "debug": debug,
+            "include_game": should_include_game,
+            # Stage outputs keep these defaults when a stage fails or runs out of budget.
+            "context_allowed_objects": allowed_objects,
+            "context_focused_object_id": focused_object_id,
+            "context_inference": inference_info,
+            "conflicts": [],
+            "risk_propagation": {},
+            "memory_ctx": {},
+            "memory_v2": {},
+            "object_selection": {},
+            "strategic_advice": {},
         }
-    except Exception:
-        context_allowed_objects = allowed_objects
-        context_focused_object_id = focused_object_id
-        context_inference = inference_info
+    )
 
-    conflicts = []
-    try:
-        scene_kpi = (
-            scene_json.get("scene", {}).get("kpi")
-            if isinstance(scene_json, dict) and isinstance(scene_json.get("scene"), dict)
-            else {}
-        )
-        conflicts = deps.build_conflict_map_v0(scene_kpi if isinstance(scene_kpi, dict) else {}, fragility if isinstance(fragility, dict) else {})
-        if isinstance(scene_json, dict) and isinstance(scene_json.get("scene"), dict):
-            scene_json["scene"]["conflicts"] = conflicts
-    except Exception:
-        conflicts = []
 
-    risk_propagation = {}
-    try:
-        risk_propagation = deps.build_risk_propagation_v0(
-            scene_json if isinstance(scene_json, dict) else {},
-            fragility if isinstance(fragility, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-        )
-        if isinstance(scene_json, dict):
-            scene_json["risk_propagation"] = risk_propagation
-            if isinstance(scene_json.get("scene"), dict):
-                scene_json["scene"]["risk_propagation"] = risk_propagation
-    except Exception:
-        risk_propagation = {}
+def _dict_or_empty(value: Any) -> dict:
+    return value if isinstance(value, dict) else {}
+
+
+def _list_or_empty(value: Any) -> list:
+    return value if isinstance(value, list) else []
+
+
+def _stage_select_objects(state: Mapping[str, Any]) -> dict[str, Any]:
+    fragility = state["fragility"]
+    allowed_objects = state["allowed_objects"]
+    fragility_drivers = fragility.get("drivers") if isinstance(fragility, dict) else {}
+    selection = state["deps"].select_objects_v2(
+        text=state["text"],
+        mode=state["mode"] or "business",
+        k=15,
+        recent_object_ids=allowed_objects if isinstance(allowed_objects, list) else [],
+        fragility_drivers=fragility_drivers if isinstance(fragility_drivers, dict) else {},
+        preferred_focus_id=state["focused_object_id"],
+    )
+    out: dict[str, Any] = {}
+    if selection.allowed_objects:
+        out["context_allowed_objects"] = selection.allowed_objects
+    if selection.focused_object_id:
+        out["context_focused_object_id"] = selection.focused_object_id
+    scores_top = [
+        {"id": oid, "score": float(score)}
+        for oid, score in sorted(selection.scores.items(), key=lambda kv: kv[1], reverse=True)[:5]
+    ]
+    out["context_inference"] = {
+        "method": selection.method,
+        "source": selection.source,
+        "matched": selection.matched,
+        "scores_top": scores_top,
+        "why": selection.why,
+    }
+    return out
+
+
+def _stage_conflict_map(state: Mapping[str, Any]) -> dict[str, Any]:
+    scene_json = state["scene_json"]
+    scene_kpi = (
+        scene_json.get("scene", {}).get("kpi")
+        if isinstance(scene_json, dict) and isinstance(scene_json.get("scene"), dict)
+        else {}
+    )
+    conflicts = state["deps"].build_conflict_map_v0(_dict_or_empty(scene_kpi), _dict_or_empty(state["fragility"]))
+    return {"conflicts": conflicts}
 
+
+def _apply_conflict_map(state: dict[str, Any], result: dict[str, Any]) -> None:
+    scene_json = state["scene_json"]
+    if isinstance(scene_json, dict) and isinstance(scene_json.get("scene"), dict):
+        scene_json["scene"]["conflicts"] = result["conflicts"]
+
+
+def _stage_risk_propagation(state: Mapping[str, Any]) -> dict[str, Any]:
+    risk_propagation = state["deps"].build_risk_propagation_v0(
+        _dict_or_empty(state["scene_json"]),
+        _dict_or_empty(state["fragility"]),
+        _list_or_empty(state["conflicts"]),
+    )
+    return {"risk_propagation": risk_propagation}
+
+
+def _apply_risk_propagation(state: dict[str, Any], result: dict[str, Any]) -> None:
+    scene_json = state["scene_json"]
+    if isinstance(scene_json, dict):
+        scene_json["risk_propagation"] = result["risk_propagation"]
+        if isinstance(scene_json.get("scene"), dict):
+            scene_json["scene"]["risk_propagation"] = result["risk_propagation"]
+
+
+def _stage_package_response(state: Mapping[str, Any]) -> dict[str, Any]:
+    scene_json = state["scene_json"]
+    loops = state["loops"]
+    conflicts = state["conflicts"]
+    risk_propagation = state["risk_propagation"]
+    fragility = state["fragility"]
+    context_allowed_objects = state["context_allowed_objects"]
+    scene_loops = scene_json.get("scene", {}).get("loops") if isinstance(scene_json, dict) else None
     response_body = {
         "ok": True,
-        "user_id": user_id,
-        "reply": reply,
-        "actions": actions,
+        "user_id": state["user_id"],
+        "reply": state["reply"],
+        "actions": state["actions"],
         "scene_json": scene_json,
         "conflicts": conflicts,
         "risk_propagation": risk_propagation,
-        "source": source,
-        "analysis_summary": analysis_summary,
+        "source": state["source"],
+        "analysis_summary": state["analysis_summary"],
         "fragility": fragility,
         "context": _build_chat_context(
-            intent=intent,
+            intent=state["intent"],
             allowed_objects=context_allowed_objects,
-            focused_object_id=context_focused_object_id,
-            mode=mode,
-            object_info=context_object_info,
-            inference=context_inference,
+            focused_object_id=state["context_focused_object_id"],
+            mode=state["mode"],
+            object_info=state["context_object_info"],
+            inference=state["context_inference"],
             kpi=scene_json.get("scene", {}).get("kpi") if isinstance(scene_json, dict) else None,
-            loops=loops if isinstance(loops, list) else scene_json.get("scene", {}).get("loops") if isinstance(scene_json, dict) else None,
+            loops=loops if isinstance(loops, list) else scene_loops,
             fragility=fragility,
             conflicts=conflicts,
             risk_propagation=risk_propagation,
-            loops_suggestions=loop_suggestions,
-            active_loop=active_loop,
+            loops_suggestions=state["loop_suggestions"],
+            active_loop=state["active_loop"],
         ),
         "error": None,
-        "debug": debug,
+        "debug": state["debug"],
     }
-    response_body = deps.package_chat_response(
+    response_body = state["deps"].package_chat_response(
         base_response=response_body,
-        scene_json=scene_json if isinstance(scene_json, dict) else {},
-        chaos=chaos,
-        mode=mode,
-        allowed_objects=context_allowed_objects if isinstance(context_allowed_objects, list) else [],
-        focused_object_id=context_focused_object_id,
-        fragility=fragility if isinstance(fragility, dict) else {},
-        risk_propagation=risk_propagation if isinstance(risk_propagation, dict) else {},
-        loops=loops if isinstance(loops, list) else scene_json.get("scene", {}).get("loops") if isinstance(scene_json, dict) else [],
-        conflicts=conflicts if isinstance(conflicts, list) else [],
-        active_loop=active_loop,
-        analysis_summary=analysis_summary,
-        engine_roles=getattr(request.app.state, "backend_engine_roles", None),
+        scene_json=_dict_or_empty(scene_json),
+        chaos=state["chaos"],
+        mode=state["mode"],
+        allowed_objects=_list_or_empty(context_allowed_objects),
+        focused_object_id=state["context_focused_object_id"],
+        fragility=_dict_or_empty(fragility),
+        risk_propagation=_dict_or_empty(risk_propagation),
+        loops=loops if isinstance(loops, list) else scene_loops if isinstance(scene_json, dict) else [],
+        conflicts=_list_or_empty(conflicts),
+        active_loop=state["active_loop"],
+        analysis_summary=state["analysis_summary"],
+        engine_roles=getattr(state["request"].app.state, "backend_engine_roles", None),
     )
-    try:
-        response_body["workspace"] = deps.ensure_default_workspace()
-    except Exception:
-        pass
-    game_keywords = ("competitor", "pricing", "game", "strategy", "market", "rival")
-    should_include_game = (mode == "strategy") or any(k in text_lower for k in game_keywords)
-    if should_include_game:
-        try:
-            context_kpi = (
-                response_body.get("context", {}).get("kpi")
-                if isinstance(response_body.get("context"), dict)
-                else None
-            )
-            context_fragility = (
-                response_body.get("context", {}).get("fragility")
-                if isinstance(response_body.get("context"), dict)
-                else None
-            )
-            context_allowed = (
-                response_body.get("context", {}).get("allowed_objects")
-                if isinstance(response_body.get("context"), dict)
-                else []
-            )
-            response_body["game"] = deps.game_advice(
-                kpi=context_kpi if isinstance(context_kpi, dict) else {},
-                fragility=context_fragility if isinstance(context_fragility, dict) else {},
-                allowed_objects=context_allowed if isinstance(context_allowed, list) else [],
-            )
-        except Exception:
-            pass
+    return {"response_body": response_body}
 
-    memory_ctx = {}
-    memory_v2 = {}
-    try:
-        ctx = response_body.get("context") if isinstance(response_body.get("context"), dict) else {}
-        episode_id = deps.episode_by_user.get(user_id, "")
-        deps.record_decision_event(
-            user_id=user_id,
-            episode_id=episode_id or "",
-            text=text,
-            mode=str(ctx.get("mode") or mode or "business"),
-            focused_object_id=ctx.get("focused_object_id") if isinstance(ctx.get("focused_object_id"), str) else None,
-            allowed_objects=ctx.get("allowed_objects") if isinstance(ctx.get("allowed_objects"), list) else [],
-            fragility=ctx.get("fragility") if isinstance(ctx.get("fragility"), dict) else (response_body.get("fragility") if isinstance(response_body.get("fragility"), dict) else {}),
-            kpi=ctx.get("kpi") if isinstance(ctx.get("kpi"), dict) else {},
-            actions=response_body.get("actions") if isinstance(response_body.get("actions"), list) else [],
-        )
-        memory_ctx = deps.build_memory_context(
-            user_id,
-            kpi=ctx.get("kpi") if isinstance(ctx.get("kpi"), dict) else {},
-            fragility=ctx.get("fragility") if isinstance(ctx.get("fragility"), dict) else {},
-            focused_object_id=ctx.get("focused_object_id") if isinstance(ctx.get("focused_object_id"), str) else None,
-        )
-        if isinstance(ctx, dict):
-            ctx["memory"] = memory_ctx
-            response_body["context"] = ctx
-    except Exception:
-        pass
 
-    try:
-        memory_v2 = deps.build_memory_v2(
-            memory_ctx if isinstance(memory_ctx, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-            {},
-        )
-        _attach_response_extension(response_body, "memory_v2", memory_v2, scene_json=scene_json)
-    except Exception:
-        pass
+def _stage_workspace(state: Mapping[str, Any]) -> dict[str, Any]:
+    return {"workspace": state["deps"].ensure_default_workspace()}
+
+
+def _apply_workspace(state: dict[str, Any], result: dict[str, Any]) -> None:
+    state["response_body"]["workspace"] = result["workspace"]
 
-    object_selection = {}
-    try:
-        object_selection = deps.build_object_selection(
-            scene_json if isinstance(scene_json, dict) else {},
-            fragility if isinstance(fragility, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-            memory_ctx if isinstance(memory_ctx, dict) else {},
-            memory_v2 if isinstance(memory_v2, dict) else {},
-        )
-        _attach_response_extension(response_body, "object_selection", object_selection, scene_json=scene_json)
 
-        memory_v2 = deps.build_memory_v2(
-            memory_ctx if isinstance(memory_ctx, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-            object_selection if isinstance(object_selection, dict) else {},
+def _stage_game(state: Mapping[str, Any]) -> dict[str, Any]:
+    ctx = _dict_or_empty(state["response_body"].get("context"))
+    return {
+        "game": state["deps"].game_advice(
+            kpi=_dict_or_empty(ctx.get("kpi")),
+            fragility=_dict_or_empty(ctx.get("fragility")),
+            allowed_objects=_list_or_empty(ctx.get("allowed_objects")),
         )
-        _attach_response_extension(response_body, "memory_v2", memory_v2, scene_json=scene_json)
-    except Exception:
-        pass
+    }
+
+
+def _apply_game(state: dict[str, Any], result: dict[str, Any]) -> None:
+    state["response_body"]["game"] = result["game"]
+
+
+def _stage_decision_memory(state: Mapping[str, Any]) -> dict[str, Any]:
+    deps = state["deps"]
+    user_id = state["user_id"]
+    response_body = state["response_body"]
+    ctx = _dict_or_empty(response_body.get("context"))
+    focused_object_id = ctx.get("focused_object_id") if isinstance(ctx.get("focused_object_id"), str) else None
+    fragility = ctx.get("fragility") if isinstance(ctx.get("fragility"), dict) else _dict_or_empty(response_body.get("fragility"))
+    events = deps.record_decision_event(
+        user_id=user_id,
+        episode_id=deps.episode_by_user.get(user_id, "") or "",
+        text=state["text"],
+        mode=str(ctx.get("mode") or state["mode"] or "business"),
+        focused_object_id=focused_object_id,
+        allowed_objects=_list_or_empty(ctx.get("allowed_objects")),
+        fragility=fragility,
+        kpi=_dict_or_empty(ctx.get("kpi")),
+        actions=_list_or_empty(response_body.get("actions")),
+    )
+    memory_ctx = deps.build_memory_context(
+        user_id,
+        kpi=_dict_or_empty(ctx.get("kpi")),
+        fragility=_dict_or_empty(ctx.get("fragility")),
+        focused_object_id=focused_object_id,
+        events=events if isinstance(events, list) else None,
+    )
+    return {"memory_ctx": memory_ctx}
+
+
+def _apply_decision_memory(state: dict[str, Any], result: dict[str, Any]) -> None:
+    response_body = state["response_body"]
+    ctx = response_body.get("context") if isinstance(response_body.get("context"), dict) else {}
+    ctx["memory"] = result["memory_ctx"]
+    response_body["context"] = ctx
+
 
+def _stage_object_selection(state: Mapping[str, Any]) -> dict[str, Any]:
+    deps = state["deps"]
+    memory_ctx = _dict_or_empty(state["memory_ctx"])
+    conflicts = _list_or_empty(state["conflicts"])
+    out: dict[str, Any] = {}
     try:
-        strategic_patterns = deps.build_strategic_patterns(
-            memory_ctx if isinstance(memory_ctx, dict) else {},
-            memory_v2 if isinstance(memory_v2, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-            risk_propagation if isinstance(risk_propagation, dict) else {},
-            object_selection if isinstance(object_selection, dict) else {},
-        )
-        _attach_response_extension(
-            response_body,
-            "strategic_patterns",
-            strategic_patterns,
-            scene_json=scene_json,
-            include_in_scene_section=True,
-        )
+        out["memory_v2"] = deps.build_memory_v2(memory_ctx, conflicts, {})
     except Exception:
         pass
-
-    strategic_advice = {}
     try:
-        strategic_advice = deps.build_strategic_advice(
-            scene_json if isinstance(scene_json, dict) else {},
-            fragility if isinstance(fragility, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-            risk_propagation if isinstance(risk_propagation, dict) else {},
-            object_selection if isinstance(object_selection, dict) else {},
-            memory_v2 if isinstance(memory_v2, dict) else {},
-        )
-        _attach_response_extension(
-            response_body,
-            "strategic_advice",
-            strategic_advice,
-            scene_json=scene_json,
-            include_in_scene_section=True,
+        object_selection = deps.build_object_selection(
+            _dict_or_empty(state["scene_json"]),
+            _dict_or_empty(state["fragility"]),
+            conflicts,
+            memory_ctx,
+            _dict_or_empty(out.get("memory_v2", state["memory_v2"])),
         )
+        out["object_selection"] = object_selection
+        # Memory v2 is rebuilt once the object selection is known.
+        out["memory_v2"] = deps.build_memory_v2(memory_ctx, conflicts, _dict_or_empty(object_selection))
     except Exception:
         pass
+    return out
+
+
+def _attach_stage_outputs(*keys: str, scene_section: bool = False) -> Callable[[dict[str, Any], dict[str, Any]], None]:
+    def apply(state: dict[str, Any], result: dict[str, Any]) -> None:
+        for key in keys:
+            if key in result and result[key] is not None:
+                _attach_response_extension(
+                    state["response_body"],
+                    key,
+                    result[key],
+                    scene_json=state["scene_json"],
+                    include_in_scene_section=scene_section,
+                )
 
-    try:
-        decision_analysis = try_build_decision_analysis_payload(text)
-        if decision_analysis is not None:
-            _attach_response_extension(
-                response_body,
-                "decision_analysis",
-                decision_analysis,
-                scene_json=scene_json,
-                include_in_scene_section=True,
-            )
-    except Exception:
-        pass
+    return apply
 
-    try:
-        strategic_council = deps.run_strategic_council_service(
-            {
-                "text": text,
-                "mode": mode,
-                "focused_object_id": context_focused_object_id,
-                "allowed_objects": context_allowed_objects if isinstance(context_allowed_objects, list) else [],
-                "fragility": fragility if isinstance(fragility, dict) else {},
-                "propagation": risk_propagation if isinstance(risk_propagation, dict) else {},
-                "decision_path": response_body.get("decision_path")
-                if isinstance(response_body.get("decision_path"), dict)
-                else {},
-                "compare_result": response_body.get("decision_comparison")
-                if isinstance(response_body.get("decision_comparison"), dict)
-                else {},
-                "strategy_result": strategic_advice if isinstance(strategic_advice, dict) else {},
-                "memory_summary": memory_v2 if isinstance(memory_v2, dict) else {},
-                "learning_summary": response_body.get("strategic_patterns")
-                if isinstance(response_body.get("strategic_patterns"), dict)
-                else {},
-                "scene_json": scene_json if isinstance(scene_json, dict) else {},
-            }
-        )
-        _attach_response_extension(
-            response_body,
-            "strategic_council",
-            strategic_council.model_dump(mode="python"),
-            scene_json=scene_json,
-            include_in_scene_section=True,
+
+def _stage_strategic_patterns(state: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "strategic_patterns": state["deps"].build_strategic_patterns(
+            _dict_or_empty(state["memory_ctx"]),
+            _dict_or_empty(state["memory_v2"]),
+            _list_or_empty(state["conflicts"]),
+            _dict_or_empty(state["risk_propagation"]),
+            _dict_or_empty(state["object_selection"]),
         )
-    except Exception:
-        pass
+    }
 
-    try:
-        opponent_model = deps.build_opponent_model(
-            scene_json if isinstance(scene_json, dict) else {},
-            fragility if isinstance(fragility, dict) else {},
-            conflicts if isinstance(conflicts, list) else [],
-            risk_propagation if isinstance(risk_propagation, dict) else {},
-            object_selection if isinstance(object_selection, dict) else {},
-            memory_v2 if isinstance(memory_v2, dict) else {},
-            strategic_advice if isinstance(strategic_advice, dict) else {},
+
+def _stage_strategic_advice(state: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "strategic_advice": state["deps"].build_strategic_advice(
+            _dict_or_empty(state["scene_json"]),
+            _dict_or_empty(state["fragility"]),
+            _list_or_empty(state["conflicts"]),
+            _dict_or_empty(state["risk_propagation"]),
+            _dict_or_empty(state["object_selection"]),
+            _dict_or_empty(state["memory_v2"]),
         )
-        _attach_response_extension(
-            response_body,
-            "opponent_model",
-            opponent_model,
-            scene_json=scene_json,
-            include_in_scene_section=True,
+    }
+
+
+def _stage_decision_analysis(state: Mapping[str, Any]) -> dict[str, Any]:
+    return {"decision_analysis": try_build_decision_analysis_payload(state["text"])}
+
+
+def _stage_strategic_council(state: Mapping[str, Any]) -> dict[str, Any]:
+    response_body = state["response_body"]
+    strategic_council = state["deps"].run_strategic_council_service(
+        {
+            "text": state["text"],
+            "mode": state["mode"],
+            "focused_object_id": state["context_focused_object_id"],
+            "allowed_objects": _list_or_empty(state["context_allowed_objects"]),
+            "fragility": _dict_or_empty(state["fragility"]),
+            "propagation": _dict_or_empty(state["risk_propagation"]),
+            "decision_path": _dict_or_empty(response_body.get("decision_path")),
+            "compare_result": _dict_or_empty(response_body.get("decision_comparison")),
+            "strategy_result": _dict_or_empty(state["strategic_advice"]),
+            "memory_summary": _dict_or_empty(state["memory_v2"]),
+            "learning_summary": _dict_or_empty(response_body.get("strategic_patterns")),
+            "scene_json": _dict_or_empty(state["scene_json"]),
+        }
+    )
+    return {"strategic_council": strategic_council.model_dump(mode="python")}
+
+
+def _stage_opponent_model(state: Mapping[str, Any]) -> dict[str, Any]:
+    return {
+        "opponent_model": state["deps"].build_opponent_model(
+            _dict_or_empty(state["scene_json"]),
+            _dict_or_empty(state["fragility"]),
+            _list_or_empty(state["conflicts"]),
+            _dict_or_empty(state["risk_propagation"]),
+            _dict_or_empty(state["object_selection"]),
+            _dict_or_empty(state["memory_v2"]),
+            _dict_or_empty(state["strategic_advice"]),
         )
-    except Exception:
-        pass
+    }
+
+
+# Declared in response order. Builders that only look up ``scene.kpi`` do not
+# list scene_json as an input; stages that copy it (packaging, the council)
+# do, so they wait for every earlier stage that attaches into it.
+CHAT_ENRICHMENT_STAGES: tuple[ChatStage, ...] = (
+    ChatStage(
+        "select_objects",
+        _stage_select_objects,
+        outputs=("context_allowed_objects", "context_focused_object_id", "context_inference"),
+    ),
+    ChatStage("conflict_map", _stage_conflict_map, outputs=("conflicts", "scene_json"), apply=_apply_conflict_map),
+    ChatStage(
+        "risk_propagation",
+        _stage_risk_propagation,
+        inputs=("conflicts",),
+        outputs=("risk_propagation", "scene_json"),
+        apply=_apply_risk_propagation,
+    ),
+    ChatStage(
+        "package_response",
+        _stage_package_response,
+        inputs=("context_allowed_objects", "context_focused_object_id", "context_inference", "scene_json"),
+        outputs=("response_body",),
+        required=True,
+    ),
+    ChatStage("workspace", _stage_workspace, outputs=("workspace",), apply=_apply_workspace, blocking=True),
+    ChatStage(
+        "game",
+        _stage_game,
+        inputs=("response_body",),
+        outputs=("game",),
+        apply=_apply_game,
+        when=lambda state: bool(state["include_game"]),
+    ),
+    ChatStage(
+        "decision_memory",
+        _stage_decision_memory,
+        inputs=("response_body",),
+        outputs=("memory_ctx",),
+        apply=_apply_decision_memory,
+        blocking=True,
+    ),
+    ChatStage(
+        "object_selection",
+        _stage_object_selection,
+        inputs=("memory_ctx", "conflicts"),
+        outputs=("memory_v2", "object_selection", "scene_json"),
+        apply=_attach_stage_outputs("memory_v2", "object_selection"),
+    ),
+    ChatStage(
+        "strategic_patterns",
+        _stage_strategic_patterns,
+        inputs=("memory_ctx", "memory_v2", "object_selection", "conflicts", "risk_propagation"),
+        outputs=("strategic_patterns", "scene_json"),
+        apply=_attach_stage_outputs("strategic_patterns", scene_section=True),
+    ),
+    ChatStage(
+        "strategic_advice",
+        _stage_strategic_advice,
+        inputs=("memory_v2", "object_selection", "conflicts", "risk_propagation"),
+        outputs=("strategic_advice", "scene_json"),
+        apply=_attach_stage_outputs("strategic_advice", scene_section=True),
+    ),
+    ChatStage(
+        "decision_analysis",
+        _stage_decision_analysis,
+        outputs=("decision_analysis", "scene_json"),
+        apply=_attach_stage_outputs("decision_analysis", scene_section=True),
+        blocking=True,
+    ),
+    ChatStage(
+        "strategic_council",
+        _stage_strategic_council,
+        inputs=("response_body", "strategic_patterns", "strategic_advice", "scene_json"),
+        outputs=("strategic_council", "scene_json"),
+        apply=_attach_stage_outputs("strategic_council", scene_section=True),
+    ),
+    ChatStage(
+        "opponent_model",
+        _stage_opponent_model,
+        inputs=("memory_v2", "object_selection", "conflicts", "risk_propagation", "strategic_advice"),
+        outputs=("opponent_model", "scene_json"),
+        apply=_attach_stage_outputs("opponent_model", scene_section=True),
+    ),
+)
+
+
+async def execute_chat_pipeline(
+    payload: Any,
+    request: Request,
+    deps: ChatPipelineDependencies,
+    *,
+    parallel_stages: bool | None = None,
+) -> dict[str, Any] | JSONResponse:
+    """Run one chat turn: the core turn on a worker thread, then the enrichment stages."""
+    profile = True if os.getenv("ENV") == "dev" and request.headers.get("x-nexora-profile") == "1" else None
+    with request_trace("chat", profile=profile):
+        prepared = await asyncio.to_thread(_prepare_chat, payload, request, deps)
+        if not isinstance(prepared, _PreparedChat):
+            return prepared
+
+        state = prepared.state
+        with perf_span("chat.stages"):
+            timings = await run_chat_stages(CHAT_ENRICHMENT_STAGES, state, parallel=parallel_stages)
+        for timing in timings:
+            if timing["status"] != "skipped":
+                record_stage(f"chat.stage.{timing['stage']}", timing["ms"], timing["status"] == "ok")
+    response_body = state["response_body"]
+    degraded = [timing["stage"] for timing in timings if timing["status"] in {"error", "timeout"}]
+    if degraded:
+        logger.info("chat_stages_degraded user_id=%s stages=%s", state["user_id"], ",".join(degraded))
+    logger.debug("chat_stage_timings %s", " ".join(f"{t['stage']}={t['ms']}" for t in timings))
+    if isinstance(response_body.get("debug"), dict):
+        response_body["debug"]["stages"] = timings
     return _normalize_chat_response_shape(response_body)
@@ -0,0 +1,224 @@
+"""Staged execution of the `/chat` enrichment tail.
+
+A `ChatStage` reads named values from a shared ``state`` dict and returns the
+values it produces; `apply` then merges them into the response on the event
+loop. Stages are declared in response order. A stage starts once every
+earlier stage that lists one of its inputs among its outputs has been
+applied, so independent stages run concurrently (sync stages on worker
+threads, ``async def`` stages on the loop), while results are still applied
+strictly in declaration order and the response matches a serial run.
+
+Containers that stages mutate on apply (``scene_json``) are listed as outputs
+by those stages and as inputs only by stages that copy or iterate them; key
+lookups of values that exist before the tail runs need no declaration.
+
+Each optional stage has a latency budget. A stage that fails is skipped: its
+outputs keep their seeded defaults, exactly as the serial pipeline's
+``except: pass`` branches did. Budgets are enforced only when stages run in
+parallel, where an overrunning stage is abandoned and skipped the same way.
+`run_chat_stages_serial` (the default on one CPU) runs each stage to
+completion on the calling thread and only flags overruns in the stage
+timings (``over_budget``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+import os
+import time
+from collections.abc import Callable, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+CHAT_STAGE_BUDGET_MS = float(os.getenv("NEXORA_CHAT_STAGE_BUDGET_MS", "1500"))
+# On a single core the thread handoffs cost more than the overlap saves.
+CHAT_PARALLEL_STAGES = os.getenv("NEXORA_CHAT_PARALLEL_STAGES", "1" if (os.cpu_count() or 1) > 1 else "0") != "0"
+
+
+@dataclass(frozen=True)
+class ChatStage:
+    name: str
+    run: Callable[[Mapping[str, Any]], Any]
+    inputs: tuple[str, ...] = ()
+    outputs: tuple[str, ...] = ()
+    apply: Callable[[dict[str, Any], dict[str, Any]], None] | None = None
+    when: Callable[[Mapping[str, Any]], bool] | None = None
+    budget_ms: float | None = None
+    # Required stages are never skipped: their errors propagate and no budget applies.
+    required: bool = False
+    # File I/O or heavy CPU: run on a worker thread. Other sync stages take
+    # microseconds and run inline, where a thread handoff would cost more.
+    blocking: bool = False
+
+    @property
+    def budget_s(self) -> float | None:
+        if self.required:
+            return None
+        return (self.budget_ms if self.budget_ms is not None else CHAT_STAGE_BUDGET_MS) / 1000.0
+
+
+def stage_dependencies(stages: Sequence[ChatStage]) -> list[set[int]]:
+    """For each stage, the indexes of the latest earlier producers of its inputs."""
+    deps: list[set[int]] = []
+    for index, stage in enumerate(stages):
+        needed: set[int] = set()
+        for key in stage.inputs:
+            for earlier in range(index - 1, -1, -1):
+                if key in stages[earlier].outputs:
+                    needed.add(earlier)
+                    break
+        deps.append(needed)
+    return deps
+
+
+def _finish(
+    stage: ChatStage,
+    state: dict[str, Any],
+    result: Any,
+    *,
+    status: str,
+    elapsed_ms: float,
+) -> dict[str, Any]:
+    if status == "ok" and isinstance(result, dict):
+        state.update(result)
+        if stage.apply is not None:
+            try:
+                stage.apply(state, result)
+            except Exception:
+                if stage.required:
+                    raise
+                logger.warning("chat_stage_apply_failed stage=%s", stage.name, exc_info=False)
+                status = "error"
+    timing: dict[str, Any] = {"stage": stage.name, "status": status, "ms": round(elapsed_ms, 2)}
+    if stage.budget_s is not None:
+        timing["budget_ms"] = round(stage.budget_s * 1000.0, 1)
+    return timing
+
+
+def _invoke(stage: ChatStage, state: Mapping[str, Any]) -> tuple[Any, float]:
+    started_at = time.perf_counter()
+    result = stage.run(state)
+    return result, (time.perf_counter() - started_at) * 1000.0
+
+
+async def _invoke_async(stage: ChatStage, state: Mapping[str, Any]) -> tuple[Any, float]:
+    if inspect.iscoroutinefunction(stage.run):
+        started_at = time.perf_counter()
+        result = await stage.run(state)
+        return result, (time.perf_counter() - started_at) * 1000.0
+    return await asyncio.to_thread(_invoke, stage, state)
+
+
+def _run_inline(stage: ChatStage, state: Mapping[str, Any]) -> tuple[Any, str, float]:
+    try:
+        result, elapsed_ms = _invoke(stage, state)
+    except Exception:
+        if stage.required:
+            raise
+        logger.warning("chat_stage_failed stage=%s", stage.name, exc_info=False)
+        return None, "error", 0.0
+    return result, "ok", elapsed_ms
+
+
+def run_chat_stages_serial(stages: Sequence[ChatStage], state: dict[str, Any]) -> list[dict[str, Any]]:
+    """Run every stage in order on the calling thread.
+
+    Budgets are not enforced here: a stage cannot be abandoned mid-call on its
+    own thread, so overruns are only marked ``over_budget`` in the timings.
+    """
+    timings: list[dict[str, Any]] = []
+    for stage in stages:
+        if stage.when is not None and not stage.when(state):
+            timings.append(_finish(stage, state, None, status="skipped", elapsed_ms=0.0))
+            continue
+        started_at = time.perf_counter()
+        try:
+            result, status = stage.run(state), "ok"
+        except Exception:
+            if stage.required:
+                raise
+            result, status = None, "error"
+        elapsed_ms = (time.perf_counter() - started_at) * 1000.0
+        timing = _finish(stage, state, result, status=status, elapsed_ms=elapsed_ms)
+        if stage.budget_s is not None and elapsed_ms > stage.budget_s * 1000.0:
+            timing["over_budget"] = True
+        timings.append(timing)
+    return timings
+
+
+async def run_chat_stages(
+    stages: Sequence[ChatStage],
+    state: dict[str, Any],
+    *,
+    parallel: bool | None = None,
+) -> list[dict[str, Any]]:
+    """Run ``stages`` against ``state`` and return per-stage timings in declaration order."""
+    if not (CHAT_PARALLEL_STAGES if parallel is None else parallel):
+        return await asyncio.to_thread(run_chat_stages_serial, stages, state)
+
+    deps = stage_dependencies(stages)
+    applied = [False] * len(stages)
+    timings: list[dict[str, Any]] = []
+    outcomes: dict[int, tuple[Any, str, float]] = {}
+    running: dict[asyncio.Future, int] = {}
+    deadlines: dict[int, float] = {}
+    started: set[int] = set()
+
+    try:
+        while len(timings) < len(stages):
+            for index, stage in enumerate(stages):
+                if index in started or not all(applied[dep] for dep in deps[index]):
+                    continue
+                started.add(index)
+                if stage.when is not None and not stage.when(state):
+                    outcomes[index] = (None, "skipped", 0.0)
+                    continue
+                if not stage.blocking and not inspect.iscoroutinefunction(stage.run):
+                    outcomes[index] = _run_inline(stage, state)
+                    continue
+                running[asyncio.ensure_future(_invoke_async(stage, state))] = index
+                if stage.budget_s is not None:
+                    deadlines[index] = time.monotonic() + stage.budget_s
+
+            # Apply the finished prefix; that may unblock further stages.
+            next_apply = len(timings)
+            if next_apply in outcomes:
+                while next_apply in outcomes:
+                    result, status, elapsed_ms = outcomes.pop(next_apply)
+                    timings.append(_finish(stages[next_apply], state, result, status=status, elapsed_ms=elapsed_ms))
+                    applied[next_apply] = True
+                    next_apply += 1
+                continue
+            if not running:
+                raise RuntimeError("chat stage graph stalled")
+
+            pending = [deadlines[index] for index in running.values() if index in deadlines]
+            timeout = max(0.0, min(pending) - time.monotonic()) if pending else None
+            done, _ = await asyncio.wait(list(running), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                index = running.pop(future)
+                try:
+                    result, elapsed_ms = future.result()
+                    outcomes[index] = (result, "ok", elapsed_ms)
+                except Exception:
+                    if stages[index].required:
+                        raise
+                    logger.warning("chat_stage_failed stage=%s", stages[index].name, exc_info=False)
+                    outcomes[index] = (None, "error", 0.0)
+            now = time.monotonic()
+            for future, index in list(running.items()):
+                if index in deadlines and deadlines[index] <= now:
+                    # A worker thread cannot be interrupted; its late result is discarded.
+                    running.pop(future)
+                    future.cancel()
+                    logger.warning("chat_stage_over_budget stage=%s", stages[index].name)
+                    outcomes[index] = (None, "timeout", (stages[index].budget_s or 0.0) * 1000.0)
+    finally:
+        for future in running:
+            future.cancel()
+    return timings
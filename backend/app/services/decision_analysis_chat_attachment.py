@@ -7,14 +7,17 @@ from typing import Any
 
 from engines.decision_engine.decision_engine import StrategicDecisionEngine
 from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine
+from engines.scenario_simulation.simulation_cache import shared_simulation_cache
 from engines.scenario_simulation.simulation_schema import ScenarioInput
 from engines.system_modeling.system_model_builder import UniversalSystemModelBuilder
 
 logger = logging.getLogger(__name__)
 
 _builder = UniversalSystemModelBuilder()
-_simulation_engine = ScenarioSimulationEngine()
-_decision_engine = StrategicDecisionEngine()
+# One engine and the process-wide cache: prompts that build the same system
+# model reuse the baseline and every strategy simulation across requests.
+_simulation_engine = ScenarioSimulationEngine(cache=shared_simulation_cache())
+_decision_engine = StrategicDecisionEngine(simulation_engine=_simulation_engine)
 
 
 def build_decision_analysis_from_prompt_text(text: str) -> dict[str, Any] | None:
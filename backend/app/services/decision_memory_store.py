@@ -59,14 +59,17 @@ class DecisionMemoryStore:
         except Exception:
             self._fallback_mem[user_id] = doc
 
-    def upsert_event(self, user_id: str, event: Dict[str, Any]) -> None:
+    def upsert_event(self, user_id: str, event: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Append ``event`` and return the stored event list (saves callers a reload)."""
         doc = self.load(user_id)
         events = doc.get("events") if isinstance(doc.get("events"), list) else []
-        events.append(event if isinstance(event, dict) else {})
+        # Keep the on-disk (sorted-key) form so callers see what a reload would return.
+        events.append(json.loads(json.dumps(event, sort_keys=True)) if isinstance(event, dict) else {})
         if len(events) > self.max_events:
             events = events[-self.max_events :]
         doc["events"] = events
         self.save(user_id, doc)
+        return events
 
     def get_events(self, user_id: str) -> List[Dict[str, Any]]:
         doc = self.load(user_id)
@@ -138,7 +138,7 @@ def record_decision_event_v0(
     fragility: dict | None,
     kpi: dict | None,
     actions: list[dict] | None,
-) -> None:
+) -> list[dict]:
     store = DecisionMemoryStore()
     safe_actions = actions if isinstance(actions, list) else []
     actions_summary: List[str] = []
@@ -163,12 +163,13 @@ def record_decision_event_v0(
         "kpi": _safe_dict(kpi),
         "actions_summary": actions_summary,
     }
-    store.upsert_event(user_id or "anon", ev)
+    return store.upsert_event(user_id or "anon", ev)
 
 
-def build_memory_context_v0(user_id, *, kpi, fragility, focused_object_id) -> dict:
-    store = DecisionMemoryStore()
-    events = store.get_events(user_id or "anon")
+def build_memory_context_v0(user_id, *, kpi, fragility, focused_object_id, events: list | None = None) -> dict:
+    # Chat passes the list returned by record_decision_event_v0 instead of re-reading the file.
+    if events is None:
+        events = DecisionMemoryStore().get_events(user_id or "anon")
     summary = summarize_memory(events)
     similar = find_similar_episode_v0(
         events,
@@ -4,15 +4,26 @@ from datetime import datetime, timezone
 from typing import Dict, List
 from uuid import uuid4
 
+from app.services.session_state import SESSION_MAX_ENTRIES, SESSION_TTL_SECONDS, SessionStateStore
+
 Event = Dict[str, object]
 
 
 class EventStoreMem:
-    """In-memory per-user event store."""
-
-    def __init__(self, max_per_user: int = 50):
+    """In-memory per-user event store; idle users expire and the user count is bounded."""
+
+    def __init__(
+        self,
+        max_per_user: int = 50,
+        max_users: int = SESSION_MAX_ENTRIES,
+        ttl_seconds: float | None = SESSION_TTL_SECONDS,
+    ):
         self.max_per_user = max_per_user
-        self._events: Dict[str, List[Event]] = {}
+        self._events: SessionStateStore[List[Event]] = SessionStateStore(
+            "chat_events",
+            max_entries=max_users,
+            ttl_seconds=ttl_seconds,
+        )
 
     def _now_iso(self) -> str:
         return datetime.now(timezone.utc).isoformat()
@@ -26,11 +37,12 @@ class EventStoreMem:
             "reply": reply,
             "actions": [a for a in actions] if actions else [],
         }
-        bucket = self._events.get(user_id, [])
-        bucket.append(event)
-        if len(bucket) > self.max_per_user:
-            bucket = bucket[-self.max_per_user :]
-        self._events[user_id] = bucket
+        with self._events.lock(user_id):
+            bucket = self._events.get(user_id, [])
+            bucket.append(event)
+            if len(bucket) > self.max_per_user:
+                bucket = bucket[-self.max_per_user :]
+            self._events[user_id] = bucket
         return event
 
     def recent(self, user_id: str, limit: int = 20) -> List[Event]:
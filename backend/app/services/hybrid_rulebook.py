@@ -6,6 +6,8 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Tuple
 
+from app.services.object_text_index import ObjectTextIndex
+
 
 @lru_cache(maxsize=1)
 def load_object_dictionary(path: Path | None = None) -> Dict[str, object]:
@@ -44,6 +46,69 @@ def _text_tokens(text: str) -> List[str]:
     return out
 
 
+def _rulebook_terms(entry: Dict, oid: str) -> Dict[str, Dict[str, float]]:
+    fields: List[str] = []
+    for key in ("id", "label", "name", "display_name", "summary", "one_liner"):
+        val = entry.get(key)
+        if isinstance(val, str):
+            fields.append(val)
+    for key in ("tags", "synonyms"):
+        vals = entry.get(key)
+        if isinstance(vals, list):
+            fields.extend(str(v) for v in vals if isinstance(v, str))
+    domain = entry.get("domain_hints")
+    if isinstance(domain, dict):
+        # Every mode's hints are already part of the field set, so the mode only
+        # duplicates tokens and never changes the overlap.
+        for v in domain.values():
+            if isinstance(v, list):
+                fields.extend(str(x) for x in v if isinstance(x, str))
+
+    field_tokens = set()
+    for f in fields:
+        field_tokens.update(_text_tokens(f))
+    # base score: token overlap; small stability bias: exact id token match gets a tiny boost
+    return {"base": dict.fromkeys(field_tokens, 1.0), "id": {oid.lower(): 0.25}}
+
+
+def _rulebook_entries(object_dict: Dict[str, object]):
+    for inst in (object_dict.get("instances") or []):
+        if isinstance(inst, dict) and inst.get("id"):
+            yield inst, str(inst["id"])
+    types = object_dict.get("types") or {}
+    if isinstance(types, dict):
+        for tid, tentry in types.items():
+            if isinstance(tentry, dict):
+                yield tentry, str(tid)
+    for obj in (object_dict.get("objects") or []):
+        if isinstance(obj, dict) and obj.get("id"):
+            yield obj, str(obj["id"])
+
+
+_RULEBOOK_INDEXES: Dict[int, Tuple[Dict[str, object], Tuple[int, ...], ObjectTextIndex]] = {}
+_RULEBOOK_INDEX_LIMIT = 4
+
+
+def _dictionary_fingerprint(object_dict: Dict[str, object]) -> Tuple[int, ...]:
+    return tuple(len(object_dict.get(key) or ()) for key in ("instances", "types", "objects"))
+
+
+def get_rulebook_index(object_dict: Dict[str, object]) -> ObjectTextIndex:
+    """Return the token index for an object dictionary, built once per dictionary."""
+    fingerprint = _dictionary_fingerprint(object_dict)
+    cached = _RULEBOOK_INDEXES.get(id(object_dict))
+    if cached is not None and cached[0] is object_dict and cached[1] == fingerprint:
+        return cached[2]
+    index = ObjectTextIndex()
+    for entry, oid in _rulebook_entries(object_dict):
+        index.add("rulebook", oid, _rulebook_terms(entry, oid))
+    if len(_RULEBOOK_INDEXES) >= _RULEBOOK_INDEX_LIMIT:
+        _RULEBOOK_INDEXES.clear()
+    # Keep a reference to the dictionary so its id cannot be reused while cached.
+    _RULEBOOK_INDEXES[id(object_dict)] = (object_dict, fingerprint, index)
+    return index
+
+
 def infer_objects_from_text_scored(text: str, mode: str, object_dict: Dict[str, object]) -> List[Tuple[str, float]]:
     """Infer object ids from text and return scored candidates (sorted desc)."""
     if not text:
@@ -52,69 +117,14 @@ def infer_objects_from_text_scored(text: str, mode: str, object_dict: Dict[str,
     if not tokens:
         return []
 
-    scored: List[Tuple[str, float]] = []
-
-    def score_entry(entry: Dict, oid: str) -> float:
-        score = 0.0
-        fields: List[str] = []
-        for key in ("id", "label", "name", "display_name", "summary", "one_liner"):
-            val = entry.get(key)
-            if isinstance(val, str):
-                fields.append(val)
-        for key in ("tags", "synonyms"):
-            vals = entry.get(key)
-            if isinstance(vals, list):
-                fields.extend(str(v) for v in vals if isinstance(v, str))
-        domain = entry.get("domain_hints")
-        if isinstance(domain, dict):
-            for v in domain.values():
-                if isinstance(v, list):
-                    fields.extend(str(x) for x in v if isinstance(x, str))
-            if mode in domain and isinstance(domain[mode], list):
-                fields.extend(str(x) for x in domain[mode] if isinstance(x, str))
-
-        field_tokens = set()
-        for f in fields:
-            field_tokens.update(_text_tokens(f))
-
-        # base score: token overlap
-        score += float(len(tokens.intersection(field_tokens)))
-
-        # small stability bias: exact id token match gets a tiny boost
-        if oid.lower() in tokens:
-            score += 0.25
-
-        return score
-
-    # instances
-    for inst in (object_dict.get("instances") or []):
-        if not isinstance(inst, dict) or not inst.get("id"):
-            continue
-        oid = str(inst["id"])
-        s = score_entry(inst, oid)
-        if s > 0:
-            scored.append((oid, s))
-
-    # types
-    types = object_dict.get("types") or {}
-    if isinstance(types, dict):
-        for tid, tentry in types.items():
-            if not isinstance(tentry, dict):
-                continue
-            oid = str(tid)
-            s = score_entry(tentry, oid)
-            if s > 0:
-                scored.append((oid, s))
-
-    # legacy objects
-    for obj in (object_dict.get("objects") or []):
-        if not isinstance(obj, dict) or not obj.get("id"):
-            continue
-        oid = str(obj["id"])
-        s = score_entry(obj, oid)
-        if s > 0:
-            scored.append((oid, s))
+    index = get_rulebook_index(object_dict)
+    scores = index.score(tokens, "base")
+    index.score(tokens, "id", into=scores)
 
+    # Instances, then types, then legacy objects: position order keeps ties stable.
+    scored: List[Tuple[str, float]] = [
+        (index.document(position)[1], score) for position, score in sorted(scores.items()) if score > 0
+    ]
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored
 
@@ -2,12 +2,25 @@ from __future__ import annotations
 
 import random
 import math
+from dataclasses import dataclass
 from typing import Dict, Any, List, Optional
 
+try:
+    import numpy as np
+except ImportError:  # optional: falls back to the per-sample loop
+    np = None
+
+from app.engines.fragility_v1 import compute_fragility_v1, compute_fragility_v1_batch
 from app.services.replay_store import ReplayStore
 from app.services.montecarlo_report_adapter import build_manager_report
 
 
+# Largest `n` accepted by the API; the vectorized sampler makes 1M runs practical.
+MAX_SAMPLES = 1_000_000 if np is not None else 5_000
+
+_FRAGILITY_KPIS = ("inventory", "delivery", "risk")
+
+
 def _clamp01(x: float) -> float:
     return 0.0 if x < 0.0 else 1.0 if x > 1.0 else x
 
@@ -35,41 +48,142 @@ def _percentile(sorted_vals: List[float], p: float) -> float:
     return sorted_vals[lo] * (1.0 - w) + sorted_vals[hi] * w
 
 
-def _fragility_for_kpi(kpi: Dict[str, float], base_fragility: Dict[str, Any], ss: Dict[str, Any] | None = None) -> Dict[str, Any]:
-    try:
-        from app.engines.fragility_v1 import compute_fragility_v1
-
-        ss = ss if isinstance(ss, dict) else {}
-        loops = ss.get("loops") if isinstance(ss.get("loops"), list) else []
-        allowed_objects = ss.get("allowed_objects") if isinstance(ss.get("allowed_objects"), list) else []
-        chaos_dict = ss.get("chaos") if isinstance(ss.get("chaos"), dict) else {}
-
-        class _ChaosShim:
-            def __init__(self, intensity: float, volatility: float):
-                self.intensity = intensity
-                self.volatility = volatility
-
-        intensity = _clamp01(_fnum(chaos_dict.get("intensity", 0.0)))
-        volatility = _clamp01(_fnum(chaos_dict.get("volatility", intensity)))
-        chaos = _ChaosShim(intensity=intensity, volatility=volatility)
-
-        out = compute_fragility_v1(
-            kpi=kpi,
-            loops=loops,
-            chaos=chaos,
-            allowed_objects=[x for x in allowed_objects if isinstance(x, str)],
-        )
-        score = _clamp01(_fnum(out.get("score", 0.0)))
+@dataclass(frozen=True)
+class _ChaosShim:
+    intensity: float
+    volatility: float
+
+
+def _worst_case(kpi: Dict[str, float], score: float, level: Any) -> Dict[str, Any]:
+    return {"kpi": kpi, "fragility": {"score": score, "level": level}}
+
+
+def _sample_loop(
+    base_vec: Dict[str, float],
+    *,
+    loops: List[Any],
+    chaos: _ChaosShim,
+    n: int,
+    sigma: float,
+    seed: Optional[int],
+    high_score_threshold: float,
+) -> Dict[str, Any]:
+    """Pure-Python sampler, used when numpy is not installed."""
+    rng = random.Random(seed)
+    samples: List[Dict[str, Any]] = []
+    scores: List[float] = []
+    high_count = 0
+    for _ in range(n):
+        kv = dict(base_vec)
+        for kk in kv:
+            kv[kk] = _clamp01(kv[kk] + rng.gauss(0.0, sigma))
+        out = compute_fragility_v1(kpi=kv, loops=loops, chaos=chaos)
+        score = _clamp01(_fnum(out.get("score"), 0.0))
         level = out.get("level")
-        return {"score": score, "level": level}
-    except Exception:
-        risk = _fnum(kpi.get("risk"), 0.5)
-        inv = _fnum(kpi.get("inventory"), 0.5)
-        dlv = _fnum(kpi.get("delivery"), 0.5)
-        base_score = _fnum(base_fragility.get("score"), 0.5)
-        score = _clamp01(base_score + 0.35 * (risk - 0.5) - 0.20 * (inv - 0.5) - 0.20 * (dlv - 0.5))
-        level = "high" if score >= 0.65 else "medium" if score >= 0.40 else "low"
-        return {"score": score, "level": level}
+        scores.append(score)
+        if level == "high" or score >= high_score_threshold:
+            high_count += 1
+        samples.append(_worst_case(kv, score, level))
+
+    scores_sorted = sorted(scores)
+    mean = sum(scores) / len(scores)
+    var = sum((x - mean) ** 2 for x in scores) / len(scores)
+    return {
+        "stats": {
+            "mean": mean,
+            "std": math.sqrt(var),
+            "p50": _percentile(scores_sorted, 0.50),
+            "p90": _percentile(scores_sorted, 0.90),
+            "p95": _percentile(scores_sorted, 0.95),
+            "min": scores_sorted[0],
+            "max": scores_sorted[-1],
+        },
+        "prob": {"p_high": high_count / len(scores), "high_count": high_count},
+        "worst_cases": sorted(samples, key=lambda s: float(s["fragility"]["score"]), reverse=True)[:3],
+        "scores": scores,
+    }
+
+
+def _sample_vectorized(
+    base_vec: Dict[str, float],
+    *,
+    loops: List[Any],
+    chaos: _ChaosShim,
+    n: int,
+    sigma: float,
+    seed: Optional[int],
+    high_score_threshold: float,
+) -> Dict[str, Any]:
+    keys = list(base_vec)
+    rng = np.random.default_rng(seed)
+    base = np.array([base_vec[k] for k in keys], dtype=float)
+    sampled = np.clip(base + rng.normal(0.0, sigma, size=(n, len(keys))), 0.0, 1.0)
+
+    # KPIs the caller did not perturb fall back to the engine's neutral default.
+    kpis = np.full((n, 3), 0.5)
+    for column, key in enumerate(_FRAGILITY_KPIS):
+        if key in base_vec:
+            kpis[:, column] = sampled[:, keys.index(key)]
+    scores, levels = compute_fragility_v1_batch(kpis, loops, chaos)
+
+    high_count = int(np.count_nonzero((levels == "high") | (scores >= high_score_threshold)))
+    p50, p90, p95 = np.percentile(scores, [50.0, 90.0, 95.0])
+
+    # Top-3 without a full sort; ties keep the earliest sample, as the stable sort did.
+    k = min(3, n)
+    top = np.argpartition(scores, n - k)[n - k:]
+    top = top[np.lexsort((top, -scores[top]))]
+    worst_cases = [
+        _worst_case(
+            {key: float(sampled[i, column]) for column, key in enumerate(keys)},
+            float(scores[i]),
+            str(levels[i]),
+        )
+        for i in top
+    ]
+    return {
+        "stats": {
+            "mean": float(scores.mean()),
+            "std": float(scores.std()),
+            "p50": float(p50),
+            "p90": float(p90),
+            "p95": float(p95),
+            "min": float(scores.min()),
+            "max": float(scores.max()),
+        },
+        "prob": {"p_high": high_count / n, "high_count": high_count},
+        "worst_cases": worst_cases,
+        "scores": scores,
+    }
+
+
+def sample_fragility(
+    base_vec: Dict[str, float],
+    *,
+    loops: List[Any],
+    volatility: float,
+    intensity: float = 0.0,
+    n: int = 200,
+    sigma: float = 0.08,
+    seed: Optional[int] = None,
+    high_score_threshold: float = 0.65,
+) -> Dict[str, Any]:
+    """Perturb `base_vec` with Gaussian noise `n` times and summarize fragility.
+
+    Uses the numpy batch engine when available (seeded `Generator`, reproducible
+    per seed); otherwise falls back to the per-sample loop. `scores` in the
+    result is a numpy array on the vectorized path.
+    """
+    sampler = _sample_vectorized if np is not None else _sample_loop
+    return sampler(
+        base_vec,
+        loops=_safe_list(loops),
+        chaos=_ChaosShim(intensity=intensity, volatility=volatility),
+        n=max(1, int(n)),
+        sigma=float(sigma),
+        seed=seed,
+        high_score_threshold=float(high_score_threshold),
+    )
 
 
 def run_simulation(
@@ -86,52 +200,31 @@ def run_simulation(
         "delivery": _clamp01(_fnum(kpi.get("delivery"), 0.5)),
         "risk": _clamp01(_fnum(kpi.get("risk"), 0.5)),
     }
-    ss = {
-        "loops": _safe_list(fragility.get("loops")) if isinstance(fragility, dict) else [],
-        "allowed_objects": _safe_list(fragility.get("allowed_objects")) if isinstance(fragility, dict) else [],
-        "chaos": _safe_dict(fragility.get("chaos")) if isinstance(fragility, dict) else {},
-    }
     base_fragility = fragility if isinstance(fragility, dict) else {}
+    chaos_dict = _safe_dict(base_fragility.get("chaos"))
+    intensity = _clamp01(_fnum(chaos_dict.get("intensity", 0.0)))
+    volatility = _clamp01(_fnum(chaos_dict.get("volatility", intensity)))
 
-    rng = random.Random(seed)
     n_runs = max(1, int(n))
     sigma_v = float(sigma)
-
-    samples: List[Dict[str, Any]] = []
-    scores: List[float] = []
-    high_count = 0
-
-    for _ in range(n_runs):
-        kv = dict(base_vec)
-        for kk in ("inventory", "delivery", "risk"):
-            kv[kk] = _clamp01(kv[kk] + rng.gauss(0.0, sigma_v))
-        fr = _fragility_for_kpi(kpi=kv, base_fragility=base_fragility, ss=ss)
-        score = _clamp01(_fnum(fr.get("score"), 0.0))
-        level = fr.get("level")
-        scores.append(score)
-        if level == "high" or score >= float(high_score_threshold):
-            high_count += 1
-        samples.append({"kpi": kv, "fragility": {"score": score, "level": level}})
-
-    scores_sorted = sorted(scores)
-    mean = sum(scores) / len(scores) if scores else 0.0
-    var = sum((x - mean) ** 2 for x in scores) / len(scores) if scores else 0.0
-    std = math.sqrt(var)
+    sampled = sample_fragility(
+        base_vec,
+        loops=_safe_list(base_fragility.get("loops")),
+        volatility=volatility,
+        intensity=intensity,
+        n=n_runs,
+        sigma=sigma_v,
+        seed=seed,
+        high_score_threshold=high_score_threshold,
+    )
+    scores = sampled["scores"]
     return {
         "n": n_runs,
         "sigma": sigma_v,
-        "stats": {
-            "mean": mean,
-            "std": std,
-            "p50": _percentile(scores_sorted, 0.50),
-            "p90": _percentile(scores_sorted, 0.90),
-            "p95": _percentile(scores_sorted, 0.95),
-            "min": scores_sorted[0] if scores_sorted else 0.0,
-            "max": scores_sorted[-1] if scores_sorted else 0.0,
-        },
-        "prob": {"p_high": (high_count / len(scores)) if scores else 0.0, "high_count": high_count},
-        "worst_cases": sorted(samples, key=lambda s: float(s["fragility"]["score"]), reverse=True)[:3],
-        "scores": scores,
+        "stats": sampled["stats"],
+        "prob": sampled["prob"],
+        "worst_cases": sampled["worst_cases"],
+        "scores": scores.tolist() if hasattr(scores, "tolist") else scores,
     }
 
 
@@ -153,10 +246,7 @@ def run_montecarlo_v0(
     high_score_threshold: float = 0.65,
 ) -> Dict[str, Any]:
     store = ReplayStore()
-    episode = store.get_episode(episode_id)
-
-    frames = episode.frames or []
-    ss = frames[-1].system_state if frames and isinstance(frames[-1].system_state, dict) else {}
+    ss = store.get_last_system_state(episode_id)
     base_kpi = ss.get("kpi") if isinstance(ss.get("kpi"), dict) else {}
     base_fragility = ss.get("fragility") if isinstance(ss.get("fragility"), dict) else {}
 
@@ -7,6 +7,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from app.services.object_text_index import ObjectTextIndex
+
 
 def load_object_dict(object_dict_path: Path, instance_dict_path: Path) -> dict[str, dict[str, dict]]:
     try:
@@ -237,6 +239,59 @@ def text_tokens(value: str) -> set[str]:
     return set(out)
 
 
+_REGISTRY_GROUPS = ("instances", "types", "legacy")
+
+
+def object_index_terms(object_id: str, entry: Any) -> dict[str, dict[str, float]]:
+    """Weighted terms of one registry entry, per index channel.
+
+    ``base`` weights a token by the number of text fields containing it;
+    ``mode:<name>`` carries the doubled bonus for that mode's domain hints.
+    """
+    if not isinstance(entry, dict):
+        return {}
+    fields = []
+    for key in ("id", "canonical_id", "name", "display_name", "label", "summary", "one_liner"):
+        val = entry.get(key)
+        if isinstance(val, str):
+            fields.append(val)
+    tags = entry.get("tags")
+    if isinstance(tags, list):
+        fields.extend(str(t) for t in tags if isinstance(t, str))
+    syns = entry.get("synonyms")
+    if isinstance(syns, list):
+        fields.extend(str(s) for s in syns if isinstance(s, str))
+    channels: dict[str, dict[str, float]] = {}
+    domain_hints = entry.get("domain_hints")
+    if isinstance(domain_hints, dict):
+        for mode_name, v in domain_hints.items():
+            if not isinstance(v, list):
+                continue
+            fields.extend(str(x) for x in v if isinstance(x, str))
+            mode_tokens = text_tokens(" ".join(str(x) for x in v if isinstance(x, str)))
+            if mode_tokens:
+                channels[f"mode:{mode_name}"] = dict.fromkeys(mode_tokens, 2.0)
+    base: dict[str, float] = {}
+    for f in fields:
+        for token in text_tokens(f):
+            base[token] = base.get(token, 0.0) + 1.0
+    channels["base"] = base
+    return channels
+
+
+def sync_object_index(
+    index: ObjectTextIndex,
+    *,
+    object_instances: dict[str, dict],
+    object_types: dict[str, dict],
+    legacy_objects: dict[str, dict],
+) -> ObjectTextIndex:
+    """Bring the index up to date with the registry dictionaries (append-only)."""
+    for group, source in zip(_REGISTRY_GROUPS, (object_instances, object_types, legacy_objects)):
+        index.sync_group(group, source, object_index_terms)
+    return index
+
+
 def infer_allowed_objects_from_text(
     text: str,
     *,
@@ -245,6 +300,7 @@ def infer_allowed_objects_from_text(
     object_types: dict[str, dict],
     legacy_objects: dict[str, dict],
     allowed_only: list[str] | None = None,
+    index: ObjectTextIndex | None = None,
 ) -> list[str]:
     if not text:
         return []
@@ -253,65 +309,33 @@ def infer_allowed_objects_from_text(
         return []
     allow_set = set(allowed_only) if allowed_only else None
 
-    def score_entry(entry: dict[str, Any]) -> float:
-        score = 0.0
-        fields = []
-        for key in ("id", "canonical_id", "name", "display_name", "label", "summary", "one_liner"):
-            val = entry.get(key)
-            if isinstance(val, str):
-                fields.append(val)
-        tags = entry.get("tags")
-        if isinstance(tags, list):
-            fields.extend(str(t) for t in tags if isinstance(t, str))
-        syns = entry.get("synonyms")
-        if isinstance(syns, list):
-            fields.extend(str(s) for s in syns if isinstance(s, str))
-        domain_hints = entry.get("domain_hints")
-        mode_tokens: set[str] = set()
-        if isinstance(domain_hints, dict):
-            for v in domain_hints.values():
-                if isinstance(v, list):
-                    fields.extend(str(x) for x in v if isinstance(x, str))
-            if mode and mode in domain_hints and isinstance(domain_hints[mode], list):
-                mode_tokens = text_tokens(" ".join(str(x) for x in domain_hints[mode] if isinstance(x, str)))
-        for f in fields:
-            score += len(tokens.intersection(text_tokens(f)))
-        if mode_tokens:
-            score += len(tokens.intersection(mode_tokens)) * 2
-        return score
-
-    scored_instances: list[tuple[str, float]] = []
-    for oid, entry in object_instances.items():
-        if allow_set is not None and oid not in allow_set:
-            continue
-        s = score_entry(entry)
-        if s > 0:
-            scored_instances.append((oid, s))
+    index = sync_object_index(
+        index if index is not None else ObjectTextIndex(),
+        object_instances=object_instances,
+        object_types=object_types,
+        legacy_objects=legacy_objects,
+    )
+    scores = index.score(tokens, "base")
+    if mode:
+        index.score(tokens, f"mode:{mode}", into=scores)
 
-    scored_types: list[tuple[str, float]] = []
-    for oid, entry in object_types.items():
-        if allow_set is not None and oid not in allow_set:
+    tiers: dict[str, list[tuple[int, str, float]]] = {group: [] for group in _REGISTRY_GROUPS}
+    for position, score in scores.items():
+        if score <= 0:
             continue
-        s = score_entry(entry)
-        if s > 0:
-            scored_types.append((oid, s))
-
-    scored_legacy: list[tuple[str, float]] = []
-    for oid, entry in legacy_objects.items():
+        group, oid = index.document(position)
         if allow_set is not None and oid not in allow_set:
             continue
-        s = score_entry(entry)
-        if s > 0:
-            scored_legacy.append((oid, s))
+        tiers[group].append((position, oid, score))
 
-    if scored_instances:
-        scored_instances.sort(key=lambda item: item[1], reverse=True)
-        return [oid for oid, _ in scored_instances[:3]]
-    if scored_types:
-        scored_types.sort(key=lambda item: item[1], reverse=True)
-        return [oid for oid, _ in scored_types[:3]]
-    scored_legacy.sort(key=lambda item: item[1], reverse=True)
-    return [oid for oid, _ in scored_legacy[:3]]
+    for group in _REGISTRY_GROUPS:
+        scored = tiers[group]
+        if scored:
+            # Position order mirrors dictionary order, so ties keep the registry order.
+            scored.sort(key=lambda item: item[0])
+            scored.sort(key=lambda item: item[2], reverse=True)
+            return [oid for _, oid, _ in scored[:3]]
+    return []
 
 
 def initialize_registry_state(object_dict_path: Path, instance_dict_path: Path) -> dict[str, Any]:
@@ -358,4 +382,10 @@ def initialize_registry_state(object_dict_path: Path, instance_dict_path: Path)
         "object_instances": object_instances,
         "legacy_objects": computed_legacy,
         "instance_counters": instance_counters,
+        "object_index": sync_object_index(
+            ObjectTextIndex(),
+            object_instances=object_instances,
+            object_types=object_types,
+            legacy_objects=computed_legacy,
+        ),
     }
@@ -2,10 +2,13 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from typing import Dict, Any, List, Optional, Tuple
+import logging
 import re
 import math
 
-from app.services.hybrid_rulebook import load_object_dictionary, infer_objects_from_text_scored
+from app.services.hybrid_rulebook import get_rulebook_index, load_object_dictionary, infer_objects_from_text_scored
+from app.services.object_text_index import ObjectTextIndex
+from chaos_engine.keyword_matcher import KeywordAutomaton
 
 
 @dataclass
@@ -63,9 +66,7 @@ def _merge_entry(catalog: Dict[str, Dict[str, Any]], oid: str, entry: Dict[str,
     catalog[oid] = {"label": str(label), "tags": tags, "synonyms": synonyms, "domain_hints": domain_hints}
 
 
-def load_object_catalog() -> Dict[str, Dict[str, Any]]:
-    """Build a normalized object catalog from the canonical dictionary loader."""
-    data = load_object_dictionary()
+def _build_object_catalog(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     catalog: Dict[str, Dict[str, Any]] = {}
 
     for inst in _safe_list(data.get("instances")):
@@ -102,6 +103,76 @@ def load_object_catalog() -> Dict[str, Dict[str, Any]]:
     }
 
 
+@dataclass
+class _CatalogIndex:
+    catalog: Dict[str, Dict[str, Any]]
+    positions: Dict[str, int]
+    tokens: ObjectTextIndex
+    direct: KeywordAutomaton
+    direct_owners: Dict[str, List[str]]
+    always_direct: List[str]
+
+
+_CATALOG_INDEX: Optional[Tuple[Dict[str, Any], _CatalogIndex]] = None
+
+
+def _build_catalog_index(catalog: Dict[str, Dict[str, Any]]) -> _CatalogIndex:
+    tokens = ObjectTextIndex()
+    direct_owners: Dict[str, List[str]] = {}
+    always_direct: List[str] = []
+    for oid, meta in catalog.items():
+        label = str(meta.get("label") or oid)
+        synonyms = [s for s in _safe_list(meta.get("synonyms")) if isinstance(s, str)]
+        tags = [t for t in _safe_list(meta.get("tags")) if isinstance(t, str)]
+        tokens.add(
+            "catalog",
+            oid,
+            {
+                "label": dict.fromkeys(tokenize(" ".join([label] + synonyms)), 1.0),
+                "tag": dict.fromkeys(tokenize(" ".join(tags)), 1.0),
+            },
+        )
+        phrases = {normalize(label)} | {n for n in (normalize(syn) for syn in synonyms) if len(n) > 2}
+        if "" in phrases:
+            always_direct.append(oid)
+        for phrase in phrases - {""}:
+            direct_owners.setdefault(phrase, []).append(oid)
+    return _CatalogIndex(
+        catalog=catalog,
+        positions={oid: position for position, oid in enumerate(catalog)},
+        tokens=tokens,
+        # Request texts rarely repeat, so skip the automaton's per-string cache.
+        direct=KeywordAutomaton(direct_owners, cache_size=0),
+        direct_owners=direct_owners,
+        always_direct=always_direct,
+    )
+
+
+def _catalog_index() -> _CatalogIndex:
+    global _CATALOG_INDEX
+    data = load_object_dictionary()
+    cached = _CATALOG_INDEX
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    index = _build_catalog_index(_build_object_catalog(data))
+    _CATALOG_INDEX = (data, index)
+    return index
+
+
+def load_object_catalog() -> Dict[str, Dict[str, Any]]:
+    """Normalized object catalog from the canonical dictionary loader (built once per dictionary)."""
+    return _catalog_index().catalog
+
+
+def warm_object_catalog_index() -> None:
+    """Build the catalog and rulebook token indexes ahead of the first request."""
+    try:
+        _catalog_index()
+        get_rulebook_index(load_object_dictionary())
+    except Exception:
+        logging.exception("object_catalog_index_warmup_failed")
+
+
 def select_objects_v2(
     text: str,
     mode: str,
@@ -111,7 +182,8 @@ def select_objects_v2(
     fragility_drivers: Optional[Dict[str, float]] = None,
     preferred_focus_id: Optional[str] = None,
 ) -> SelectionResult:
-    catalog = load_object_catalog()
+    index = _catalog_index()
+    catalog = index.catalog
     if not catalog:
         return SelectionResult([], None, {}, [], "No catalog available.", "scoring_v2", "dictionary+heuristics")
 
@@ -129,22 +201,24 @@ def select_objects_v2(
         "loop_risk": ["obj_risk_zone"],
     }
 
-    scores: Dict[str, float] = {}
-    matched: List[str] = []
-    direct_matches: List[str] = []
-
-    for oid, meta in catalog.items():
-        label = str(meta.get("label") or oid)
-        synonyms = [s for s in _safe_list(meta.get("synonyms")) if isinstance(s, str)]
-        tags = [t for t in _safe_list(meta.get("tags")) if isinstance(t, str)]
+    label_hits = index.tokens.score(tokens, "label")
+    tag_hits = index.tokens.score(tokens, "tag")
+    norm = max(1.0, math.sqrt(max(1, len(tokens))))
 
-        label_tokens = set(tokenize(" ".join([label] + synonyms)))
-        tag_tokens = set(tokenize(" ".join(tags)))
+    touched = {index.tokens.document(position)[1] for position in (*label_hits, *tag_hits)}
+    touched.update(oid for oid in recent_set if oid in catalog)
+    for d_key in drivers:
+        touched.update(oid for oid in driver_targets.get(str(d_key), []) if oid in catalog)
 
-        kw_overlap = len(tokens.intersection(label_tokens))
-        tag_overlap = len(tokens.intersection(tag_tokens))
-        keyword_match = clamp01(kw_overlap / max(1.0, math.sqrt(max(1, len(tokens)))))
-        tag_match = clamp01(tag_overlap / max(1.0, math.sqrt(max(1, len(tokens)))))
+    # Only objects hit by a token, a recency mark or a driver can score above zero.
+    scores: Dict[str, float] = dict.fromkeys(catalog, 0.0)
+    matched: List[str] = []
+    for oid in sorted(touched, key=index.positions.__getitem__):
+        position = index.positions[oid]
+        kw_overlap = label_hits.get(position, 0.0)
+        tag_overlap = tag_hits.get(position, 0.0)
+        keyword_match = clamp01(kw_overlap / norm)
+        tag_match = clamp01(tag_overlap / norm)
         recency_boost = 1.0 if oid in recent_set else 0.0
 
         fragility_driver_boost = 0.0
@@ -162,11 +236,15 @@ def select_objects_v2(
         if kw_overlap > 0 or tag_overlap > 0:
             matched.append(oid)
 
-        text_hit = normalize(label) in ntext or any(normalize(syn) in ntext for syn in synonyms if len(normalize(syn)) > 2)
-        if text_hit:
-            direct_matches.append(oid)
+    direct_set = set(index.always_direct)
+    for phrase in index.direct.find(ntext):
+        direct_set.update(index.direct_owners[phrase])
+    direct_matches = sorted(direct_set, key=index.positions.__getitem__)
 
-    scored_pairs = topk(scores, len(scores))
+    # Same order as ``topk`` over every score: zero scores keep catalog order at the tail.
+    scored_pairs = [(oid, scores[oid]) for oid in sorted(touched, key=index.positions.__getitem__) if scores[oid] > 0]
+    scored_pairs.sort(key=lambda kv: kv[1], reverse=True)
+    scored_pairs.extend((oid, 0.0) for oid, s in scores.items() if s <= 0)
     threshold = 0.08
     selected = [oid for oid, s in scored_pairs if s >= threshold][:k]
 
@@ -0,0 +1,112 @@
+"""Inverted token index shared by the object inference paths.
+
+Each indexed object is a document identified by ``(group, object_id)``. Its
+searchable text is reduced once, at build time, to weighted terms per
+channel (for example ``"base"`` or ``"mode:business"``). Queries walk only the
+posting lists of the query tokens, so per-request cost depends on the number
+of matching objects rather than on dictionary size.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+from itertools import islice
+from typing import Callable
+
+
+TermChannels = Mapping[str, Mapping[str, float]]
+
+
+class ObjectTextIndex:
+    """Token -> posting list of ``(document, weight)`` per channel."""
+
+    def __init__(self) -> None:
+        self._docs: list[tuple[str, str]] = []
+        self._alive: list[bool] = []
+        self._postings: dict[str, dict[str, list[tuple[int, float]]]] = {}
+        self._group_sizes: dict[str, int] = {}
+        self._group_sources: dict[str, tuple[int, int]] = {}
+        # Writers (sync, add, drop) are serialized; `score` reads without it,
+        # since documents are only appended and retired, never moved.
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return sum(self._group_sizes.values())
+
+    def add(self, group: str, object_id: str, channels: TermChannels) -> int:
+        """Index one object and return its document position."""
+        with self._lock:
+            position = len(self._docs)
+            self._docs.append((group, object_id))
+            self._alive.append(True)
+            self._group_sizes[group] = self._group_sizes.get(group, 0) + 1
+            for channel, terms in channels.items():
+                postings = self._postings.setdefault(channel, {})
+                for term, weight in terms.items():
+                    if weight:
+                        postings.setdefault(term, []).append((position, float(weight)))
+            return position
+
+    def drop_group(self, group: str) -> None:
+        """Retire every document of a group; later queries skip them."""
+        with self._lock:
+            for position, (doc_group, _) in enumerate(self._docs):
+                if doc_group == group:
+                    self._alive[position] = False
+            self._group_sizes[group] = 0
+
+    def group_size(self, group: str) -> int:
+        return self._group_sizes.get(group, 0)
+
+    def document(self, position: int) -> tuple[str, str]:
+        return self._docs[position]
+
+    def score(
+        self,
+        tokens: Iterable[str],
+        channel: str,
+        *,
+        scale: float = 1.0,
+        into: dict[int, float] | None = None,
+    ) -> dict[int, float]:
+        """Accumulate ``scale * weight`` for every posting of the given tokens."""
+        scores: dict[int, float] = {} if into is None else into
+        postings = self._postings.get(channel)
+        if not postings:
+            return scores
+        alive = self._alive
+        for token in tokens:
+            for position, weight in postings.get(token, ()):
+                if alive[position]:
+                    scores[position] = scores.get(position, 0.0) + weight * scale
+        return scores
+
+    def sync_group(
+        self,
+        group: str,
+        source: Mapping[str, object],
+        channels_for: Callable[[str, object], TermChannels | None],
+    ) -> None:
+        """Index entries appended to ``source`` since the last sync.
+
+        Registries only ever grow at runtime (e.g. chat-created instances), so
+        new keys are picked up from the end of the mapping. A shrunk or
+        replaced source, or one whose ``generation`` counter reports removed
+        keys (see `SessionStateStore`), is re-indexed from scratch. Concurrent
+        syncs (``/chat`` runs in the threadpool) take turns, so each new entry
+        is indexed once.
+        """
+        with self._lock:
+            indexed = self.group_size(group)
+            origin = (id(source), getattr(source, "generation", 0))
+            if self._group_sources.get(group) != origin or len(source) < indexed:
+                if indexed:
+                    self.drop_group(group)
+                indexed = 0
+                self._group_sources[group] = origin
+            if len(source) == indexed:
+                return
+            for object_id, entry in islice(source.items(), indexed, None):
+                channels = channels_for(str(object_id), entry)
+                self.add(group, str(object_id), channels or {})
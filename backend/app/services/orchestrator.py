@@ -42,16 +42,17 @@ def analyze_full_pipeline(
     episode = None
     if episode_id:
         try:
-            episode = replay_store.get_episode(episode_id)
+            episode = replay_store.get_episode_summary(episode_id)
         except FileNotFoundError:
             replay_warning = "Episode not found; created a new replay."
             episode = None
     if episode is None:
-        episode = replay_store.create_episode(title="Analysis Replay")
-        episode_id = episode.episode_id
+        created = replay_store.create_episode(title="Analysis Replay")
+        episode = {"created_at": created.created_at}
+        episode_id = created.episode_id
 
     try:
-        t = (_now() - episode.created_at).total_seconds()
+        t = (_now() - episode["created_at"]).total_seconds()
         frame = build_replay_frame(
             t=t,
             input_text=text,
@@ -60,7 +61,7 @@ def analyze_full_pipeline(
             system_state=system_state,
             visual=visual,
         )
-        _, warnings = replay_store.append_frame(episode_id, frame)
+        _, warnings = replay_store.append_frame_summary(episode_id, frame)
         if warnings:
             replay_warning = (replay_warning or "") + ";".join(warnings)
     except Exception:
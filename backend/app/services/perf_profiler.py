@@ -0,0 +1,330 @@
+"""Always-on stage timers, latency histograms and an opt-in sampling profiler.
+
+`perf_span` times a block or a function (context manager or decorator) and
+records it into a per-stage log-bucketed histogram, so recording is a
+``bisect`` plus a counter increment and memory stays fixed however many
+samples arrive. `request_trace` groups the spans of one request into a trace
+shaped like the AI telemetry model (``trace_id``, ``stage``, ``latency_ms``,
+``success``, ``total_latency_ms``); recent slow traces are kept for
+``/debug/perf``. The trace travels in a context variable, so spans opened on
+``asyncio.to_thread`` workers attach to the request that started them.
+
+A trace started with ``profile=True`` (or picked by ``PERF_PROFILE_SAMPLE_RATE``)
+also runs a statistical profiler: a background thread samples the stacks of
+threads while they are inside that trace's spans and keeps collapsed stack
+counts.
+"""
+
+from __future__ import annotations
+
+import bisect
+import functools
+import heapq
+import logging
+import os
+import random
+import sys
+import threading
+import time
+import uuid
+from collections import Counter, deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from typing import Any, Callable, Iterator, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+PERF_ENABLED = os.getenv("NEXORA_PERF_ENABLED", "1") != "0"
+PERF_PROFILE_SAMPLE_RATE = float(os.getenv("NEXORA_PERF_PROFILE_SAMPLE_RATE", "0"))
+PERF_PROFILE_INTERVAL_MS = float(os.getenv("NEXORA_PERF_PROFILE_INTERVAL_MS", "2"))
+PERF_SLOW_TRACES = 20
+PERF_RECENT_TRACES = 100
+PROFILE_MAX_DEPTH = 40
+PROFILE_TOP_STACKS = 15
+
+# Bucket upper bounds in ms: 10us to ~3 minutes, each bucket ~19% wider than the last.
+_BUCKET_BOUNDS_MS = tuple(0.01 * 2 ** (step / 4) for step in range(97))
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+class LatencyHistogram:
+    """Fixed-size log-bucketed latency histogram; percentiles are bucket upper bounds."""
+
+    __slots__ = ("counts", "count", "errors", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(_BUCKET_BOUNDS_MS) + 1)
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, latency_ms: float, success: bool = True) -> None:
+        self.counts[bisect.bisect_left(_BUCKET_BOUNDS_MS, latency_ms)] += 1
+        self.count += 1
+        self.total_ms += latency_ms
+        if latency_ms > self.max_ms:
+            self.max_ms = latency_ms
+        if not success:
+            self.errors += 1
+
+    def percentile(self, pct: float) -> float:
+        if self.count == 0:
+            return 0.0
+        target = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if seen >= target:
+                bound = _BUCKET_BOUNDS_MS[index] if index < len(_BUCKET_BOUNDS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "p50_ms": round(self.percentile(50), 3),
+            "p95_ms": round(self.percentile(95), 3),
+            "p99_ms": round(self.percentile(99), 3),
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class _Trace:
+    __slots__ = ("trace_id", "name", "timestamp", "started_ns", "spans", "profile", "threads", "samples")
+
+    def __init__(self, name: str, profile: bool) -> None:
+        self.trace_id = uuid.uuid4().hex
+        self.name = name
+        self.timestamp = datetime.now(timezone.utc).isoformat()
+        self.started_ns = time.perf_counter_ns()
+        self.spans: list[tuple[str, int, float, bool]] = []
+        self.profile = profile
+        # Thread id -> open span depth; only threads inside a span are sampled.
+        self.threads: dict[int, int] = {}
+        self.samples: Counter[str] = Counter()
+
+    def to_dict(self, total_ms: float) -> dict[str, Any]:
+        trace: dict[str, Any] = {
+            "trace_id": self.trace_id,
+            "name": self.name,
+            "timestamp": self.timestamp,
+            "total_latency_ms": round(total_ms, 3),
+            "spans": [
+                {
+                    "stage": stage,
+                    "start_ms": round((started_ns - self.started_ns) / 1e6, 3),
+                    "latency_ms": round(latency_ms, 3),
+                    "success": success,
+                }
+                for stage, started_ns, latency_ms, success in sorted(self.spans, key=lambda span: span[1])
+            ],
+        }
+        if self.profile:
+            trace["profile"] = [
+                {"stack": stack, "samples": samples} for stack, samples in self.samples.most_common(PROFILE_TOP_STACKS)
+            ]
+        return trace
+
+
+_CURRENT_TRACE: ContextVar[_Trace | None] = ContextVar("nexora_perf_trace", default=None)
+
+
+class _StackSampler:
+    """Background thread sampling the stacks of threads working for profiled traces."""
+
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._traces: set[_Trace] = set()
+        self._thread: threading.Thread | None = None
+
+    def add(self, trace: _Trace) -> None:
+        with self._cond:
+            self._traces.add(trace)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="nexora-perf-sampler", daemon=True)
+                self._thread.start()
+            self._cond.notify()
+
+    def discard(self, trace: _Trace) -> None:
+        with self._cond:
+            self._traces.discard(trace)
+
+    def _run(self) -> None:
+        interval = max(0.0005, PERF_PROFILE_INTERVAL_MS / 1000.0)
+        while True:
+            with self._cond:
+                if not self._traces:
+                    self._cond.wait(timeout=30.0)
+                    if not self._traces:
+                        self._thread = None
+                        return
+                traces = list(self._traces)
+            frames = sys._current_frames()
+            for trace in traces:
+                for thread_id in list(trace.threads):
+                    frame = frames.get(thread_id)
+                    # An event loop parked in select() is idle, not working for this trace.
+                    if frame is not None and not (
+                        frame.f_code.co_name == "select" and frame.f_code.co_filename.endswith("selectors.py")
+                    ):
+                        trace.samples[_collapse(frame)] += 1
+            del frames
+            time.sleep(interval)
+
+
+def _collapse(frame: Any) -> str:
+    parts: list[str] = []
+    while frame is not None and len(parts) < PROFILE_MAX_DEPTH:
+        code = frame.f_code
+        parts.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+        frame = frame.f_back
+    return ";".join(reversed(parts))
+
+
+class PerfRegistry:
+    """Per-stage histograms plus the recent and slowest request traces."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: dict[str, LatencyHistogram] = {}
+        self._recent: deque[dict[str, Any]] = deque(maxlen=PERF_RECENT_TRACES)
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._sequence = 0
+        self._sampler = _StackSampler()
+
+    def record(self, stage: str, latency_ms: float, success: bool = True) -> None:
+        with self._lock:
+            histogram = self._stages.get(stage)
+            if histogram is None:
+                histogram = self._stages[stage] = LatencyHistogram()
+            histogram.record(latency_ms, success)
+
+    def finish_trace(self, trace: _Trace, total_ms: float) -> None:
+        if trace.profile:
+            self._sampler.discard(trace)
+        record = trace.to_dict(total_ms)
+        with self._lock:
+            self._recent.append(record)
+            self._sequence += 1
+            entry = (total_ms, self._sequence, record)
+            if len(self._slowest) < PERF_SLOW_TRACES:
+                heapq.heappush(self._slowest, entry)
+            elif total_ms > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def snapshot(self, *, trace_limit: int = 10) -> dict[str, Any]:
+        with self._lock:
+            stages = [{"stage": name, **histogram.summary()} for name, histogram in sorted(self._stages.items())]
+            slowest = [record for _, _, record in sorted(self._slowest, key=lambda entry: -entry[0])]
+            recent = list(self._recent)[-trace_limit:]
+        return {
+            "enabled": PERF_ENABLED,
+            "profile_sample_rate": PERF_PROFILE_SAMPLE_RATE,
+            "stages": stages,
+            "slowest_traces": slowest[:trace_limit],
+            "recent_traces": list(reversed(recent)),
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stages.clear()
+            self._recent.clear()
+            self._slowest.clear()
+
+
+_REGISTRY = PerfRegistry()
+
+
+class perf_span:
+    """Time a block (``with perf_span("x"):``) or every call of a function (``@perf_span("x")``)."""
+
+    __slots__ = ("stage", "_started_ns", "_trace")
+
+    def __init__(self, stage: str) -> None:
+        self.stage = stage
+        self._started_ns = 0
+        self._trace: _Trace | None = None
+
+    def __enter__(self) -> perf_span:
+        if PERF_ENABLED:
+            trace = self._trace = _CURRENT_TRACE.get()
+            if trace is not None and trace.profile:
+                thread_id = threading.get_ident()
+                trace.threads[thread_id] = trace.threads.get(thread_id, 0) + 1
+            self._started_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if not PERF_ENABLED or not self._started_ns:
+            return
+        latency_ms = (time.perf_counter_ns() - self._started_ns) / 1e6
+        success = exc_type is None
+        _REGISTRY.record(self.stage, latency_ms, success)
+        trace = self._trace
+        if trace is not None:
+            trace.spans.append((self.stage, self._started_ns, latency_ms, success))
+            if trace.profile:
+                thread_id = threading.get_ident()
+                depth = trace.threads.get(thread_id, 0) - 1
+                if depth > 0:
+                    trace.threads[thread_id] = depth
+                else:
+                    trace.threads.pop(thread_id, None)
+
+    def __call__(self, func: F) -> F:
+        stage = self.stage
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with perf_span(stage):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+def record_stage(stage: str, latency_ms: float, success: bool = True) -> None:
+    """Record a latency measured elsewhere (e.g. chat stage timings) as a span ending now."""
+    if not PERF_ENABLED:
+        return
+    _REGISTRY.record(stage, latency_ms, success)
+    trace = _CURRENT_TRACE.get()
+    if trace is not None:
+        trace.spans.append((stage, time.perf_counter_ns() - int(latency_ms * 1e6), latency_ms, success))
+
+
+@contextmanager
+def request_trace(name: str, *, profile: bool | None = None) -> Iterator[str | None]:
+    """Group the spans opened inside the block into one trace; yields its trace id."""
+    if not PERF_ENABLED or _CURRENT_TRACE.get() is not None:
+        with perf_span(name):
+            yield None
+        return
+    if profile is None:
+        profile = PERF_PROFILE_SAMPLE_RATE > 0 and random.random() < PERF_PROFILE_SAMPLE_RATE
+    trace = _Trace(name, profile)
+    token = _CURRENT_TRACE.set(trace)
+    if profile:
+        _REGISTRY._sampler.add(trace)
+    success = False
+    try:
+        yield trace.trace_id
+        success = True
+    finally:
+        _CURRENT_TRACE.reset(token)
+        total_ms = (time.perf_counter_ns() - trace.started_ns) / 1e6
+        _REGISTRY.record(name, total_ms, success)
+        _REGISTRY.finish_trace(trace, total_ms)
+
+
+def perf_snapshot(*, trace_limit: int = 10) -> dict[str, Any]:
+    return _REGISTRY.snapshot(trace_limit=trace_limit)
+
+
+def reset_perf() -> None:
+    _REGISTRY.reset()
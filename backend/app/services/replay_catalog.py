@@ -0,0 +1,145 @@
+"""SQLite catalog of replay episode summaries and last-frame system state.
+
+The catalog is derived data: every row records the header mtime it was built
+from, so rows written by a crashed or external writer are detected and rebuilt
+from the episode files during reconciliation.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+import threading
+from typing import Any, Dict, Iterable, List
+
+
+SORTABLE_FIELDS = ("episode_id", "title", "created_at", "updated_at", "frame_count", "duration")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    episode_id TEXT PRIMARY KEY,
+    title TEXT,
+    created_at TEXT,
+    updated_at TEXT,
+    frame_count INTEGER NOT NULL DEFAULT 0,
+    duration REAL NOT NULL DEFAULT 0.0,
+    last_system_state TEXT,
+    header_mtime_ns INTEGER NOT NULL DEFAULT 0
+)
+"""
+
+
+class ReplayCatalog:
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+
+    def upsert(self, summary: Dict[str, Any], last_system_state: Any, header_mtime_ns: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO episodes (
+                    episode_id, title, created_at, updated_at, frame_count, duration, last_system_state, header_mtime_ns
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(episode_id) DO UPDATE SET
+                    title = excluded.title,
+                    created_at = excluded.created_at,
+                    updated_at = excluded.updated_at,
+                    frame_count = excluded.frame_count,
+                    duration = excluded.duration,
+                    last_system_state = excluded.last_system_state,
+                    header_mtime_ns = excluded.header_mtime_ns
+                """,
+                (
+                    summary["episode_id"],
+                    summary.get("title"),
+                    _text(summary.get("created_at")),
+                    _text(summary.get("updated_at")),
+                    int(summary.get("frame_count") or 0),
+                    float(summary.get("duration") or 0.0),
+                    json.dumps(last_system_state) if isinstance(last_system_state, dict) else None,
+                    int(header_mtime_ns),
+                ),
+            )
+
+    def remove(self, episode_ids: Iterable[str]) -> None:
+        ids = [(episode_id,) for episode_id in episode_ids]
+        if not ids:
+            return
+        with self._lock:
+            self._conn.executemany("DELETE FROM episodes WHERE episode_id = ?", ids)
+
+    def touch(self, episode_id: str, header_mtime_ns: int) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE episodes SET header_mtime_ns = ? WHERE episode_id = ?",
+                (int(header_mtime_ns), episode_id),
+            )
+
+    def mtimes(self) -> Dict[str, int]:
+        with self._lock:
+            rows = self._conn.execute("SELECT episode_id, header_mtime_ns FROM episodes").fetchall()
+        return {episode_id: int(mtime) for episode_id, mtime in rows}
+
+    def mtime(self, episode_id: str) -> int | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT header_mtime_ns FROM episodes WHERE episode_id = ?",
+                (episode_id,),
+            ).fetchone()
+        return None if row is None else int(row[0])
+
+    def last_system_state(self, episode_id: str) -> tuple[bool, Dict[str, Any]]:
+        """Return ``(found, system_state)`` for an episode's last frame."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_system_state FROM episodes WHERE episode_id = ?",
+                (episode_id,),
+            ).fetchone()
+        if row is None:
+            return False, {}
+        state = json.loads(row[0]) if row[0] else {}
+        return True, state if isinstance(state, dict) else {}
+
+    def list(
+        self,
+        *,
+        limit: int | None = None,
+        offset: int = 0,
+        sort_by: str = "episode_id",
+        descending: bool = False,
+    ) -> List[dict]:
+        if sort_by not in SORTABLE_FIELDS:
+            raise ValueError(f"unsupported sort field: {sort_by}")
+        direction = "DESC" if descending else "ASC"
+        query = (
+            "SELECT episode_id, title, updated_at, frame_count, duration FROM episodes "
+            f"ORDER BY {sort_by} {direction}, episode_id {direction} LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, (-1 if limit is None else max(0, limit), max(0, offset))).fetchall()
+        return [
+            {
+                "episode_id": episode_id,
+                "title": title,
+                "updated_at": updated_at,
+                "frame_count": frame_count,
+                "duration": duration,
+            }
+            for episode_id, title, updated_at, frame_count, duration in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _text(value: Any) -> str | None:
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
@@ -1,16 +1,53 @@
-"""File-based storage for replay episodes with safety guards."""
+"""File-based storage for replay episodes with safety guards.
+
+Each episode is stored as a small JSON header (``<id>.json``), an append-only
+frame log (``<id>.frames.jsonl``, one frame per line) and a fixed-width offset
+index (``<id>.frames.idx``). Appends write one line plus one index entry and
+rewrite only the header, so their cost does not grow with episode length.
+Frames beyond ``max_frames`` are hidden immediately by advancing the header's
+first live frame and are physically dropped by background compaction.
+
+Legacy episodes written as a single JSON document are migrated to this layout
+the first time they are read or appended to, and all at once by
+`ReplayStore.migrate_legacy_episodes`, which the app runs on startup. Episode summaries and the last
+frame's ``system_state`` are mirrored into a SQLite catalog so listings and
+last-state lookups do not open episode files.
+
+Stores created without ``base_dir`` use ``NEXORA_REPLAY_DIR``, falling back to
+``backend/data/replay``.
+"""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 import json
+import os
 from pathlib import Path
-from typing import List, Tuple
+import sqlite3
+import struct
+import threading
+from typing import Any, Dict, List, Tuple
 from uuid import uuid4
 
 from app.models.replay import ReplayEpisode, ReplayFrame
+from app.services.replay_catalog import ReplayCatalog, SORTABLE_FIELDS
 from app.utils.clamp import ensure_finite
 
 
+EPISODE_FORMAT = "frame-log-v1"
+_OFFSET = struct.Struct("<Q")
+
+# Routers each hold their own ReplayStore, so episode locks are module-level:
+# a fixed set of shards keyed by episode file, so memory does not grow with
+# the number of episodes ever touched.
+_EPISODE_LOCK_SHARDS = 64
+_episode_locks = [threading.Lock() for _ in range(_EPISODE_LOCK_SHARDS)]
+_compaction_executor: ThreadPoolExecutor | None = None
+_compaction_guard = threading.Lock()
+_catalogs: Dict[str, ReplayCatalog] = {}
+_catalogs_guard = threading.Lock()
+
+
 def _safe_log(msg: str):
     # Keep logs minimal; avoid embedding user content.
     print(msg)
@@ -28,28 +65,84 @@ def _atomic_write(path: Path, payload: dict) -> None:
     tmp_path.replace(path)
 
 
+def _episode_lock(path: Path) -> threading.Lock:
+    # Never held for two episodes at once, so shard collisions cannot deadlock.
+    return _episode_locks[hash(str(path.resolve())) % _EPISODE_LOCK_SHARDS]
+
+
+def _get_catalog(path: Path) -> ReplayCatalog | None:
+    key = str(path.resolve())
+    with _catalogs_guard:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            try:
+                catalog = ReplayCatalog(path)
+            except sqlite3.Error:
+                _safe_log("[ReplayStore] Episode catalog unavailable; falling back to file scans")
+                return None
+            _catalogs[key] = catalog
+        return catalog
+
+
+def _get_compaction_executor() -> ThreadPoolExecutor:
+    global _compaction_executor
+    with _compaction_guard:
+        if _compaction_executor is None:
+            _compaction_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="replay-compaction")
+        return _compaction_executor
+
+
+def _encode_frame(frame: ReplayFrame) -> bytes:
+    return (json.dumps(frame.model_dump(mode="json"), sort_keys=True, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _parse_time(value: Any) -> datetime:
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(str(value))
+
+
 class ReplayStore:
-    def __init__(self, base_dir: str = "backend/data/replay", max_frames: int = 2000):
-        self.base_dir = Path(base_dir)
+    def __init__(
+        self,
+        base_dir: str | None = None,
+        max_frames: int = 2000,
+        background_compaction: bool = True,
+    ):
+        self.base_dir = Path(base_dir or os.getenv("NEXORA_REPLAY_DIR") or "backend/data/replay")
         self.current_dir = self.base_dir / "current"
         self.archive_dir = self.base_dir / "archive"
         self.corrupt_dir = self.base_dir / "corrupt"
         self.max_frames = max_frames
+        self.background_compaction = background_compaction
         self.current_dir.mkdir(parents=True, exist_ok=True)
         self.archive_dir.mkdir(parents=True, exist_ok=True)
         self.corrupt_dir.mkdir(parents=True, exist_ok=True)
+        self.catalog = _get_catalog(self.base_dir / "catalog.sqlite3")
 
-    def _path(self, episode_id: str) -> Path:
+    @staticmethod
+    def _safe_id(episode_id: str) -> str:
         safe = "".join(ch for ch in episode_id if ch.isalnum() or ch in ("-", "_"))
         if not safe:
             raise ValueError("invalid episode_id")
-        return self.current_dir / f"{safe}.json"
+        return safe
+
+    def _path(self, episode_id: str) -> Path:
+        return self.current_dir / f"{self._safe_id(episode_id)}.json"
 
     def _archive_path(self, episode_id: str) -> Path:
-        safe = "".join(ch for ch in episode_id if ch.isalnum() or ch in ("-", "_"))
-        if not safe:
-            raise ValueError("invalid episode_id")
-        return self.archive_dir / f"{safe}.json"
+        return self.archive_dir / f"{self._safe_id(episode_id)}.json"
+
+    @staticmethod
+    def _log_path(header_path: Path) -> Path:
+        return header_path.with_name(header_path.stem + ".frames.jsonl")
+
+    @staticmethod
+    def _index_path(header_path: Path) -> Path:
+        return header_path.with_name(header_path.stem + ".frames.idx")
+
+    def _episode_files(self, header_path: Path) -> List[Path]:
+        return [header_path, self._log_path(header_path), self._index_path(header_path)]
 
     def create_episode(self, title: str | None = None) -> ReplayEpisode:
         now = _now()
@@ -62,79 +155,140 @@ class ReplayStore:
             duration=0.0,
             version="v1",
         )
-        payload = episode.model_dump()
-        payload["created_at"] = episode.created_at.isoformat()
-        payload["updated_at"] = episode.updated_at.isoformat()
-        _atomic_write(self._path(episode.episode_id), payload)
+        path = self._path(episode.episode_id)
+        with _episode_lock(path):
+            self._write_log(path, [])
+            header = self._new_header(episode, frame_count=0, last_t=0.0, log_bytes=0)
+            _atomic_write(path, header)
+            self._catalog_upsert(path, header, {})
         return episode
 
     def append_frame(self, episode_id: str, frame: ReplayFrame) -> Tuple[ReplayEpisode, List[str]]:
+        """Append a frame and return the updated episode.
+
+        Callers that only need counts should prefer ``append_frame_summary``,
+        which does not read the frame log back.
+        """
+        _, warnings = self.append_frame_summary(episode_id, frame)
+        return self.get_episode(episode_id), warnings
+
+    def append_frame_summary(self, episode_id: str, frame: ReplayFrame) -> Tuple[Dict[str, Any], List[str]]:
+        """Append a frame in constant time and return the episode summary."""
         warnings: List[str] = []
-        episode = self.get_episode(episode_id)
-        frames = list(episode.frames)
-        last_t = frames[-1].t if frames else 0.0
-        incoming_t = ensure_finite(frame.t, last_t)
-        if incoming_t <= last_t:
-            incoming_t = last_t + 1e-3
-        safe_frame = frame.model_copy(update={"t": incoming_t})
-        frames.append(safe_frame)
-
-        if len(frames) > self.max_frames:
-            drop = len(frames) - self.max_frames
-            frames = frames[drop:]
-            warnings.append("frame_limit_reached_oldest_dropped")
-
-        frames.sort(key=lambda f: f.t)
-        max_t = max((f.t for f in frames), default=0.0)
-        updated = episode.model_copy(
-            update={
+        path = self._path(episode_id)
+        with _episode_lock(path):
+            header = self._load_header(path)
+            last_t = float(header.get("last_t", 0.0))
+            incoming_t = ensure_finite(frame.t, last_t)
+            if incoming_t <= last_t:
+                incoming_t = last_t + 1e-3
+            safe_frame = frame.model_copy(update={"t": incoming_t})
+            line = _encode_frame(safe_frame)
+
+            log_bytes = int(header["log_bytes"])
+            total_frames = int(header["total_frames"])
+            with self._log_path(path).open("r+b") as log:
+                log.seek(log_bytes)
+                log.write(line)
+                log.truncate()
+            with self._index_path(path).open("r+b") as index:
+                index.seek(total_frames * _OFFSET.size)
+                index.write(_OFFSET.pack(log_bytes))
+                index.truncate()
+
+            header["log_bytes"] = log_bytes + len(line)
+            header["total_frames"] = total_frames + 1
+            header["last_t"] = incoming_t
+            header["duration"] = max(float(header.get("duration", 0.0)), incoming_t)
+            header["updated_at"] = _now().isoformat()
+            live = header["total_frames"] - int(header["first_frame"])
+            if live > self.max_frames:
+                header["first_frame"] = header["total_frames"] - self.max_frames
+                warnings.append("frame_limit_reached_oldest_dropped")
+            _atomic_write(path, header)
+            self._catalog_upsert(path, header, safe_frame.system_state)
+            needs_compaction = int(header["first_frame"]) >= max(1, self.max_frames // 4)
+
+        if needs_compaction:
+            self._schedule_compaction(episode_id)
+        return self._summary(header, parse_times=True), warnings
+
+    def get_episode(self, episode_id: str) -> ReplayEpisode:
+        path = self._path(episode_id)
+        with _episode_lock(path):
+            header = self._load_header(path)
+            frames = self._read_frames(path, header, 0, self._frame_count(header))
+        return ReplayEpisode.model_validate(
+            {
+                "episode_id": header["episode_id"],
+                "created_at": header["created_at"],
+                "updated_at": header["updated_at"],
+                "title": header.get("title"),
                 "frames": frames,
-                "updated_at": _now(),
-                "duration": max(episode.duration, max_t),
+                "duration": header.get("duration", 0.0),
+                "version": header.get("version", "v1"),
             }
         )
-        payload = updated.model_dump()
-        payload["created_at"] = updated.created_at.isoformat()
-        payload["updated_at"] = updated.updated_at.isoformat()
-        _atomic_write(self._path(episode_id), payload)
-        return updated, warnings
 
-    def get_episode(self, episode_id: str) -> ReplayEpisode:
+    def get_episode_summary(self, episode_id: str) -> Dict[str, Any]:
+        """Return episode metadata without reading any frames."""
+        path = self._path(episode_id)
+        with _episode_lock(path):
+            header = self._load_header(path)
+        return self._summary(header, parse_times=True)
+
+    def read_frames(self, episode_id: str, start: int = 0, stop: int | None = None) -> List[ReplayFrame]:
+        """Read a slice of live frames, parsing only the requested range."""
+        path = self._path(episode_id)
+        with _episode_lock(path):
+            header = self._load_header(path)
+            begin, end, _ = slice(start, stop).indices(self._frame_count(header))
+            raw_frames = self._read_frames(path, header, begin, end) if end > begin else []
+        return [ReplayFrame.model_validate(raw) for raw in raw_frames]
+
+    def get_last_frame(self, episode_id: str) -> ReplayFrame | None:
+        """Return the newest live frame, or ``None`` for an empty episode."""
+        frames = self.read_frames(episode_id, -1)
+        return frames[0] if frames else None
+
+    def get_last_system_state(self, episode_id: str) -> Dict[str, Any]:
+        """Return the newest frame's ``system_state`` from the catalog when possible."""
         path = self._path(episode_id)
         if not path.exists():
             raise FileNotFoundError("episode not found")
-        try:
-            with path.open("r", encoding="utf-8") as f:
-                raw = json.load(f)
-            return ReplayEpisode.model_validate(raw)
-        except json.JSONDecodeError:
-            corrupt_path = self.corrupt_dir / path.name
-            path.replace(corrupt_path)
-            _safe_log(f"[ReplayStore] Corrupt episode moved to {corrupt_path}")
-            raise FileNotFoundError("episode corrupted")
+        if self.catalog is not None:
+            try:
+                # A stale row (header rewritten outside this store) falls through to the frame log.
+                if self.catalog.mtime(path.stem) == path.stat().st_mtime_ns:
+                    found, state = self.catalog.last_system_state(path.stem)
+                    if found:
+                        return state
+            except (OSError, sqlite3.Error):
+                pass
+        frame = self.get_last_frame(episode_id)
+        state = frame.system_state if frame is not None else None
+        return state if isinstance(state, dict) else {}
 
-    def list_episodes(self) -> List[dict]:
-        summaries: List[dict] = []
-        for path in sorted(self.current_dir.glob("*.json")):
+    def list_episodes(
+        self,
+        limit: int | None = None,
+        offset: int = 0,
+        sort_by: str = "episode_id",
+        descending: bool = False,
+    ) -> List[dict]:
+        """List episode summaries, optionally sorted and paginated."""
+        if sort_by not in SORTABLE_FIELDS:
+            raise ValueError(f"unsupported sort field: {sort_by}")
+        if self.catalog is not None:
             try:
-                with path.open("r", encoding="utf-8") as f:
-                    raw = json.load(f)
-                frames = raw.get("frames", []) or []
-                summaries.append(
-                    {
-                        "episode_id": raw.get("episode_id"),
-                        "title": raw.get("title"),
-                        "updated_at": raw.get("updated_at"),
-                        "frame_count": len(frames),
-                        "duration": raw.get("duration", 0.0),
-                    }
-                )
-            except json.JSONDecodeError:
-                corrupt_path = self.corrupt_dir / path.name
-                path.replace(corrupt_path)
-                _safe_log(f"[ReplayStore] Corrupt episode moved to {corrupt_path}")
-                continue
-        return summaries
+                self._reconcile_catalog()
+                return self.catalog.list(limit=limit, offset=offset, sort_by=sort_by, descending=descending)
+            except sqlite3.Error:
+                _safe_log("[ReplayStore] Episode catalog query failed; scanning episode files")
+        summaries = [summary for summary, _ in (self._scan_episode(path) for path in self._episode_paths()) if summary]
+        summaries.sort(key=lambda item: (item.get(sort_by) is not None, item.get(sort_by) or 0, item.get("episode_id") or ""), reverse=descending)
+        end = None if limit is None else offset + max(0, limit)
+        return summaries[max(0, offset):end]
 
     def delete_episode(self, episode_id: str) -> None:
         src = self._path(episode_id)
@@ -142,7 +296,63 @@ class ReplayStore:
         if not src.exists():
             raise FileNotFoundError("episode not found")
         dst.parent.mkdir(parents=True, exist_ok=True)
-        src.replace(dst)
+        with _episode_lock(src):
+            for src_file, dst_file in zip(self._episode_files(src), self._episode_files(dst)):
+                if src_file.exists():
+                    src_file.replace(dst_file)
+            self._catalog_remove(src.stem)
+
+    def compact_episode(self, episode_id: str) -> bool:
+        """Rewrite the frame log without frames dropped by the ``max_frames`` limit."""
+        path = self._path(episode_id)
+        with _episode_lock(path):
+            try:
+                header = self._load_header(path)
+            except FileNotFoundError:
+                return False
+            first_frame = int(header["first_frame"])
+            if first_frame <= 0:
+                return False
+            lines = self._read_lines(path, header, first_frame, int(header["total_frames"]))
+            header["log_bytes"] = self._write_log(path, lines)
+            header["total_frames"] = len(lines)
+            header["first_frame"] = 0
+            _atomic_write(path, header)
+            self._catalog_touch(path)
+        return True
+
+    def migrate_legacy_episodes(self) -> int:
+        """Convert every legacy single-document episode to the frame-log layout.
+
+        Files that do not parse or validate are moved to ``corrupt``; the rest are
+        still migrated. Returns the number of episodes converted.
+        """
+        migrated = 0
+        for path in sorted(self.current_dir.glob("*.json")):
+            with _episode_lock(path):
+                try:
+                    with path.open("r", encoding="utf-8") as f:
+                        raw = json.load(f)
+                except json.JSONDecodeError:
+                    self._move_to_corrupt(path)
+                    continue
+                if not isinstance(raw, dict):
+                    self._move_to_corrupt(path)
+                    continue
+                if raw.get("format") == EPISODE_FORMAT:
+                    continue
+                # One bad episode must not leave every later one unmigrated.
+                try:
+                    self._migrate_legacy(path, raw)
+                except ValueError:
+                    # Fails ReplayEpisode validation, so it could never be loaded either.
+                    self._move_to_corrupt(path)
+                    continue
+                except OSError as exc:
+                    _safe_log(f"[ReplayStore] Legacy episode {path.name} not migrated: {exc}")
+                    continue
+                migrated += 1
+        return migrated
 
     def create_branch_from_episode(
         self,
@@ -157,15 +367,14 @@ class ReplayStore:
         - If include_history=True, copies all frames.
         - Stores the parent relationship inside the copied frame's system_state.
         """
-        parent = self.get_episode(parent_episode_id)
+        parent_summary = self.get_episode_summary(parent_episode_id)
         new_title = title or f"branch:{parent_episode_id[:8]}"
         child = self.create_episode(title=new_title)
 
-        frames = parent.frames or []
-        if not frames:
+        if not parent_summary["frame_count"]:
             return child
 
-        to_copy = frames if include_history else [frames[-1]]
+        to_copy = self.read_frames(parent_episode_id) if include_history else self.read_frames(parent_episode_id, -1)
         for fr in to_copy:
             data = fr.model_dump()
             # Keep timeline valid (ReplayStore already enforces monotonic t)
@@ -175,6 +384,206 @@ class ReplayStore:
             sys_state["branch_parent_episode_id"] = parent_episode_id
             data["system_state"] = sys_state
 
-            self.append_frame(child.episode_id, type(fr)(**data))
+            self.append_frame_summary(child.episode_id, type(fr)(**data))
 
         return child
+
+    def _new_header(self, episode: ReplayEpisode, *, frame_count: int, last_t: float, log_bytes: int) -> dict:
+        return {
+            "format": EPISODE_FORMAT,
+            "episode_id": episode.episode_id,
+            "created_at": episode.created_at.isoformat(),
+            "updated_at": episode.updated_at.isoformat(),
+            "title": episode.title,
+            "duration": episode.duration,
+            "version": episode.version,
+            "first_frame": 0,
+            "total_frames": frame_count,
+            "last_t": last_t,
+            "log_bytes": log_bytes,
+        }
+
+    @staticmethod
+    def _frame_count(header: dict) -> int:
+        return int(header["total_frames"]) - int(header["first_frame"])
+
+    def _summary(self, header: dict, *, parse_times: bool = False) -> Dict[str, Any]:
+        summary: Dict[str, Any] = {
+            "episode_id": header.get("episode_id"),
+            "title": header.get("title"),
+            "updated_at": header.get("updated_at"),
+            "frame_count": self._frame_count(header),
+            "duration": header.get("duration", 0.0),
+        }
+        if parse_times:
+            summary["created_at"] = _parse_time(header.get("created_at"))
+            summary["updated_at"] = _parse_time(header.get("updated_at"))
+        return summary
+
+    def _load_header(self, path: Path) -> dict:
+        """Load an episode header, migrating legacy episodes. Caller holds the episode lock."""
+        if not path.exists():
+            raise FileNotFoundError("episode not found")
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except json.JSONDecodeError:
+            self._move_to_corrupt(path)
+            raise FileNotFoundError("episode corrupted")
+        if raw.get("format") == EPISODE_FORMAT:
+            return raw
+        return self._migrate_legacy(path, raw)
+
+    def _migrate_legacy(self, path: Path, raw: dict) -> dict:
+        episode = ReplayEpisode.model_validate(raw)
+        frames = episode.frames[-self.max_frames:] if self.max_frames > 0 else []
+        log_bytes = self._write_log(path, [_encode_frame(frame) for frame in frames])
+        header = self._new_header(
+            episode,
+            frame_count=len(frames),
+            last_t=frames[-1].t if frames else 0.0,
+            log_bytes=log_bytes,
+        )
+        # Replacing the legacy document with the header is the commit point of the migration.
+        _atomic_write(path, header)
+        self._catalog_upsert(path, header, frames[-1].system_state if frames else {})
+        return header
+
+    def _write_log(self, path: Path, lines: List[bytes]) -> int:
+        log_path = self._log_path(path)
+        index_path = self._index_path(path)
+        log_tmp = log_path.with_suffix(log_path.suffix + ".tmp")
+        index_tmp = index_path.with_suffix(index_path.suffix + ".tmp")
+        offset = 0
+        with log_tmp.open("wb") as log, index_tmp.open("wb") as index:
+            for line in lines:
+                index.write(_OFFSET.pack(offset))
+                log.write(line)
+                offset += len(line)
+        log_tmp.replace(log_path)
+        index_tmp.replace(index_path)
+        return offset
+
+    def _read_lines(self, path: Path, header: dict, start: int, stop: int) -> List[bytes]:
+        """Read raw log lines for physical frame positions ``[start, stop)``."""
+        if stop <= start:
+            return []
+        with self._index_path(path).open("rb") as index:
+            index.seek(start * _OFFSET.size)
+            begin = _OFFSET.unpack(index.read(_OFFSET.size))[0]
+            if stop < int(header["total_frames"]):
+                index.seek(stop * _OFFSET.size)
+                end = _OFFSET.unpack(index.read(_OFFSET.size))[0]
+            else:
+                end = int(header["log_bytes"])
+        with self._log_path(path).open("rb") as log:
+            log.seek(begin)
+            chunk = log.read(end - begin)
+        return chunk.splitlines(keepends=True)
+
+    def _read_frames(self, path: Path, header: dict, start: int, stop: int) -> List[dict]:
+        """Decode live frames ``[start, stop)``. Caller holds the episode lock."""
+        first_frame = int(header["first_frame"])
+        lines = self._read_lines(path, header, first_frame + start, first_frame + stop)
+        try:
+            return [json.loads(line) for line in lines]
+        except json.JSONDecodeError:
+            self._move_to_corrupt(path)
+            raise FileNotFoundError("episode corrupted")
+
+    def _move_to_corrupt(self, path: Path) -> None:
+        corrupt_path = self.corrupt_dir / path.name
+        for src_file, dst_file in zip(self._episode_files(path), self._episode_files(corrupt_path)):
+            if src_file.exists():
+                src_file.replace(dst_file)
+        self._catalog_remove(path.stem)
+        _safe_log(f"[ReplayStore] Corrupt episode moved to {corrupt_path}")
+
+    def _episode_paths(self) -> List[Path]:
+        return sorted(self.current_dir.glob("*.json"))
+
+    def _scan_episode(self, path: Path) -> Tuple[Dict[str, Any] | None, Dict[str, Any]]:
+        """Summarize one episode file without migrating it."""
+        try:
+            with path.open("r", encoding="utf-8") as f:
+                raw = json.load(f)
+            if raw.get("format") == EPISODE_FORMAT:
+                with _episode_lock(path):
+                    frames = self._read_frames(path, raw, self._frame_count(raw) - 1, self._frame_count(raw))
+                state = frames[0].get("system_state") if frames else None
+                return self._summary(raw), state if isinstance(state, dict) else {}
+            frames = raw.get("frames", []) or []
+            last = max(frames, key=lambda item: float(item.get("t") or 0.0)) if frames else {}
+            state = last.get("system_state") if isinstance(last, dict) else None
+            summary = {
+                "episode_id": raw.get("episode_id"),
+                "title": raw.get("title"),
+                "created_at": raw.get("created_at"),
+                "updated_at": raw.get("updated_at"),
+                "frame_count": len(frames),
+                "duration": raw.get("duration", 0.0),
+            }
+            return summary, state if isinstance(state, dict) else {}
+        except (json.JSONDecodeError, FileNotFoundError):
+            if path.exists():
+                self._move_to_corrupt(path)
+            return None, {}
+
+    def _reconcile_catalog(self) -> None:
+        """Index new or externally modified episode files and forget removed ones."""
+        assert self.catalog is not None
+        known = self.catalog.mtimes()
+        seen: set[str] = set()
+        for path in self._episode_paths():
+            seen.add(path.stem)
+            try:
+                mtime_ns = path.stat().st_mtime_ns
+            except OSError:
+                continue
+            if known.get(path.stem) == mtime_ns:
+                continue
+            summary, state = self._scan_episode(path)
+            if summary is not None:
+                summary["episode_id"] = path.stem
+                self.catalog.upsert(summary, state, mtime_ns)
+        self.catalog.remove(set(known) - seen)
+
+    def _catalog_upsert(self, path: Path, header: dict, last_system_state: Any) -> None:
+        if self.catalog is None:
+            return
+        try:
+            self.catalog.upsert(
+                self._summary(header) | {"episode_id": path.stem, "created_at": header.get("created_at")},
+                last_system_state,
+                path.stat().st_mtime_ns,
+            )
+        except (OSError, sqlite3.Error):
+            _safe_log("[ReplayStore] Episode catalog update failed")
+
+    def _catalog_touch(self, path: Path) -> None:
+        if self.catalog is None:
+            return
+        try:
+            self.catalog.touch(path.stem, path.stat().st_mtime_ns)
+        except (OSError, sqlite3.Error):
+            _safe_log("[ReplayStore] Episode catalog update failed")
+
+    def _catalog_remove(self, episode_id: str) -> None:
+        if self.catalog is None:
+            return
+        try:
+            self.catalog.remove([episode_id])
+        except sqlite3.Error:
+            _safe_log("[ReplayStore] Episode catalog update failed")
+
+    def _schedule_compaction(self, episode_id: str) -> None:
+        if not self.background_compaction:
+            self.compact_episode(episode_id)
+            return
+        _get_compaction_executor().submit(self._compact_quietly, episode_id)
+
+    def _compact_quietly(self, episode_id: str) -> None:
+        try:
+            self.compact_episode(episode_id)
+        except Exception:
+            _safe_log("[ReplayStore] Background compaction failed")
@@ -0,0 +1,138 @@
+"""Concurrent batch scoring for the Nexora Fragility Scanner."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from pydantic import ValidationError
+
+from app.models.scanner_input import FragilityScanRequest
+from app.models.scanner_output import (
+    FragilityBatchItem,
+    FragilityBatchScanResponse,
+    FragilityDimensionAggregate,
+    FragilityScanResponse,
+)
+from app.services.scanner.scanner_orchestrator import FragilityScannerOrchestrator
+from app.utils.responses import build_error_envelope
+
+
+logger = logging.getLogger(__name__)
+
+SCANNER_BATCH_WORKERS = int(os.getenv("NEXORA_SCANNER_BATCH_WORKERS", str(min(8, os.cpu_count() or 1))))
+
+_batch_executor: ThreadPoolExecutor | None = None
+_batch_guard = threading.Lock()
+
+
+def _get_batch_executor() -> ThreadPoolExecutor:
+    global _batch_executor
+    with _batch_guard:
+        if _batch_executor is None:
+            _batch_executor = ThreadPoolExecutor(
+                max_workers=max(1, SCANNER_BATCH_WORKERS),
+                thread_name_prefix="scanner-batch",
+            )
+        return _batch_executor
+
+
+def _error(status: int, error_type: str, message: str, details: Any = None) -> dict[str, Any]:
+    envelope = build_error_envelope(error_type, message, code=error_type, details=details, status=status)
+    return {**envelope["error"], "status": status}
+
+
+def scan_document(
+    orchestrator: FragilityScannerOrchestrator,
+    index: int,
+    document: FragilityScanRequest,
+) -> FragilityBatchItem:
+    """Score one document, turning failures into the error codes of the single-scan endpoint."""
+    try:
+        result = orchestrator.run_scan(document.model_dump())
+    except ValidationError as exc:
+        logger.warning("fragility_batch_document_invalid index=%s error=%s", index, exc)
+        return FragilityBatchItem(
+            index=index,
+            ok=False,
+            error=_error(422, "FRAGILITY_SCANNER_INVALID_INPUT", "Fragility scanner input is invalid.", exc.errors()),
+        )
+    except ValueError as exc:
+        logger.warning("fragility_batch_document_rejected index=%s error=%s", index, exc)
+        return FragilityBatchItem(index=index, ok=False, error=_error(400, "FRAGILITY_SCANNER_INPUT_ERROR", str(exc)))
+    except Exception:
+        logger.exception("fragility_batch_document_failed index=%s", index)
+        return FragilityBatchItem(
+            index=index,
+            ok=False,
+            error=_error(500, "FRAGILITY_SCANNER_ERROR", "Fragility scanner is currently unavailable."),
+        )
+    try:
+        response = FragilityScanResponse.model_validate(result)
+    except ValidationError:
+        logger.exception("fragility_batch_document_contract_invalid index=%s", index)
+        return FragilityBatchItem(
+            index=index,
+            ok=False,
+            error=_error(500, "FRAGILITY_SCANNER_CONTRACT_ERROR", "Fragility scanner returned an invalid response."),
+        )
+    return FragilityBatchItem(index=index, ok=True, result=response)
+
+
+def aggregate_dimension_scores(items: list[FragilityBatchItem]) -> dict[str, FragilityDimensionAggregate]:
+    """Mean and max of each dimension's category score; documents without the dimension count as 0."""
+    scored = [item.result for item in items if item.ok and item.result is not None]
+    totals: dict[str, list[float]] = {}
+    for response in scored:
+        category_scores = (response.debug or {}).get("category_scores") or {}
+        for dimension, score in category_scores.items():
+            totals.setdefault(str(dimension), []).append(float(score))
+    return {
+        dimension: FragilityDimensionAggregate(
+            mean=round(sum(scores) / len(scored), 4),
+            max=round(max(scores), 4),
+            document_count=len(scores),
+        )
+        for dimension, scores in sorted(totals.items())
+    }
+
+
+def _scan_chunk(
+    orchestrator: FragilityScannerOrchestrator,
+    start: int,
+    documents: list[FragilityScanRequest],
+) -> list[FragilityBatchItem]:
+    return [scan_document(orchestrator, start + offset, document) for offset, document in enumerate(documents)]
+
+
+async def run_batch_scan(
+    documents: list[FragilityScanRequest],
+    orchestrator: FragilityScannerOrchestrator,
+) -> FragilityBatchScanResponse:
+    """Score ``documents`` on the batch worker pool, keeping input order.
+
+    Documents are split into one contiguous chunk per worker, so a scan of a
+    few milliseconds is not outweighed by a pool round trip per document.
+    """
+    loop = asyncio.get_running_loop()
+    executor = _get_batch_executor()
+    size = -(-len(documents) // max(1, min(SCANNER_BATCH_WORKERS, len(documents))))
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(executor, _scan_chunk, orchestrator, start, documents[start : start + size])
+            for start in range(0, len(documents), size)
+        )
+    )
+    items = [item for chunk in chunks for item in chunk]
+    failed_count = sum(1 for item in items if not item.ok)
+    return FragilityBatchScanResponse(
+        ok=failed_count < len(items),
+        document_count=len(items),
+        failed_count=failed_count,
+        results=items,
+        dimension_scores=aggregate_dimension_scores(items),
+    )
@@ -5,6 +5,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
+from ingestion.rule_matcher import CompiledRuleMatcher
+
 
 @dataclass(frozen=True)
 class _SignalRule:
@@ -116,20 +118,57 @@ _ESCALATION_TERMS: tuple[str, ...] = (
 )
 
 
+@dataclass(frozen=True)
+class _RuleTable:
+    """The rules of one scanner mode with their vocabulary compiled for one-pass scans.
+
+    `CompiledRuleMatcher` finds the terms that occur as substrings; only those
+    candidates are confirmed against their precompiled ``\\bterm\\b`` pattern,
+    so matches are exactly those of a per-term word-boundary search.
+    """
+
+    rules: tuple[_SignalRule, ...]
+    matcher: CompiledRuleMatcher
+    patterns: dict[str, re.Pattern[str]]
+
+    @classmethod
+    def build(cls, rules: tuple[_SignalRule, ...]) -> _RuleTable:
+        vocabulary = {term for rule in rules for term in rule.terms} | set(_ESCALATION_TERMS)
+        return cls(
+            rules=rules,
+            matcher=CompiledRuleMatcher(vocabulary),
+            patterns={term: re.compile(rf"\b{re.escape(term)}\b") for term in vocabulary},
+        )
+
+    def matched_terms(self, normalized_text: str) -> frozenset[str]:
+        """Vocabulary terms occurring as whole words in normalized (lower-case) text."""
+        return frozenset(
+            term for term in self.matcher.present(normalized_text) if self.patterns[term].search(normalized_text)
+        )
+
+
+_RULE_TABLES: dict[str, _RuleTable] = {
+    mode: _RuleTable.build((*_COMMON_RULES, *mode_rules)) for mode, mode_rules in _MODE_RULES.items()
+}
+_COMMON_TABLE = _RuleTable.build(_COMMON_RULES)
+
+
 def extract_fragility_signals(text: str, mode: str = "business") -> list[dict]:
     """Extract explainable fragility signals from plain text using keyword rules."""
     normalized_text = _normalize(text)
     if not normalized_text:
         return []
 
-    rules = [*_COMMON_RULES, *_MODE_RULES.get(_normalize(mode), ())]
+    table = _RULE_TABLES.get(_normalize(mode), _COMMON_TABLE)
+    found = table.matched_terms(normalized_text)
+    escalation_count = sum(1 for term in _ESCALATION_TERMS if term in found)
     signals: list[dict] = []
 
-    for rule in rules:
-        matches = _matched_terms(normalized_text, rule.terms)
+    for rule in table.rules:
+        matches = [term for term in dict.fromkeys(rule.terms) if term in found]
         if not matches:
             continue
-        score = _score_for_matches(normalized_text, rule.base_score, len(matches))
+        score = _score_for_matches(rule.base_score, len(matches), escalation_count)
         signals.append(
             {
                 "id": rule.signal_id,
@@ -152,19 +191,9 @@ def _normalize(value: str | None) -> str:
     return re.sub(r"\s+", " ", value.strip().lower())
 
 
-def _matched_terms(text: str, terms: tuple[str, ...]) -> list[str]:
-    """Return ordered unique terms matched in the source text."""
-    matched: list[str] = []
-    for term in terms:
-        if re.search(rf"\b{re.escape(term)}\b", text) and term not in matched:
-            matched.append(term)
-    return matched
-
-
-def _score_for_matches(text: str, base_score: float, match_count: int) -> float:
+def _score_for_matches(base_score: float, match_count: int, escalation_count: int) -> float:
     """Compute a bounded severity score from match density and escalation terms."""
     score = base_score + min(match_count - 1, 3) * 0.08
-    escalation_count = sum(1 for term in _ESCALATION_TERMS if re.search(rf"\b{re.escape(term)}\b", text))
     score += min(escalation_count, 2) * 0.05
     return round(max(0.0, min(1.0, score)), 4)
 
@@ -0,0 +1,382 @@
+"""Bounded per-user session state for the long-lived API process.
+
+`SessionStateStore` is a thread-safe mapping that replaces the module-level
+dicts the MVP kept per user, per client IP and per registry instance. Stores
+are capped by entry count (least recently used entries are evicted; pass
+``max_entries=None`` for state that must never be dropped) and optionally by
+idle time (entries expire ``ttl_seconds`` after their last
+write, or last read when ``refresh_on_read``). Single operations are atomic;
+read-modify-write sequences on one key take ``store.lock(key)``, a lock picked
+from a fixed set of shards so different users do not serialize on each other.
+
+With a ``spill_path`` evicted entries are written to a local SQLite file
+instead of being dropped, `flush` persists every resident entry (run on
+shutdown), and `warm` loads unexpired rows back on startup, so session state
+survives restarts. Values must be JSON-serializable to spill.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Generic, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+SESSION_MAX_ENTRIES = int(os.getenv("NEXORA_SESSION_MAX_ENTRIES", "10000"))
+SESSION_TTL_SECONDS = float(os.getenv("NEXORA_SESSION_TTL_SECONDS", str(24 * 3600)))
+SESSION_SPILL_PATH = os.getenv("NEXORA_SESSION_SPILL_PATH") or None
+LOCK_SHARDS = 32
+
+V = TypeVar("V")
+
+_MISSING = object()
+
+
+@dataclass
+class SessionStoreStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    spilled: int = 0
+    restored: int = 0
+
+
+class _SpillFile:
+    """One table of ``(store, key) -> JSON value, expiry`` in a SQLite file."""
+
+    def __init__(self, path: str | Path, store: str) -> None:
+        self.path = Path(path)
+        self.store = store
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS session_state ("
+            "store TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, expires_at REAL, "
+            "PRIMARY KEY (store, key))"
+        )
+        self._lock = threading.Lock()
+
+    def write(self, rows: list[tuple[str, Any, float | None]]) -> int:
+        encoded = []
+        for key, value, expires_at in rows:
+            try:
+                encoded.append((self.store, key, json.dumps(value), expires_at))
+            except (TypeError, ValueError):
+                logger.warning("session_state_spill_skipped store=%s key=%s", self.store, key)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO session_state (store, key, value, expires_at) VALUES (?, ?, ?, ?)",
+                encoded,
+            )
+        return len(encoded)
+
+    def read(self, key: str) -> tuple[Any, float | None] | None:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM session_state WHERE store = ? AND key = ?",
+                (self.store, key),
+            ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def rows(self, now: float) -> list[tuple[str, Any, float | None]]:
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM session_state WHERE store = ? AND expires_at IS NOT NULL AND expires_at <= ?",
+                (self.store, now),
+            )
+            rows = self._conn.execute(
+                "SELECT key, value, expires_at FROM session_state WHERE store = ? ORDER BY rowid",
+                (self.store,),
+            ).fetchall()
+        return [(key, json.loads(value), expires_at) for key, value, expires_at in rows]
+
+    def delete(self, key: str | None = None) -> None:
+        with self._lock:
+            if key is None:
+                self._conn.execute("DELETE FROM session_state WHERE store = ?", (self.store,))
+            else:
+                self._conn.execute("DELETE FROM session_state WHERE store = ? AND key = ?", (self.store, key))
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM session_state WHERE store = ?", (self.store,)).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _approx_size(value: Any, depth: int = 3) -> int:
+    size = sys.getsizeof(value)
+    if depth <= 0 or isinstance(value, (str, bytes, int, float, bool)) or value is None:
+        return size
+    if isinstance(value, Mapping):
+        return size + sum(_approx_size(k, 0) + _approx_size(v, depth - 1) for k, v in value.items())
+    if isinstance(value, (list, tuple, set, frozenset, deque)):
+        return size + sum(_approx_size(item, depth - 1) for item in value)
+    return size
+
+
+class SessionStateStore(MutableMapping[str, V], Generic[V]):
+    """TTL + LRU bounded mapping with sharded per-key locks and SQLite spill."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        max_entries: int | None = SESSION_MAX_ENTRIES,
+        ttl_seconds: float | None = SESSION_TTL_SECONDS,
+        refresh_on_read: bool = True,
+        spill_path: str | Path | None = None,
+        shards: int = LOCK_SHARDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.name = name
+        self.max_entries = max(1, int(max_entries)) if max_entries is not None else None
+        self.ttl_seconds = ttl_seconds if ttl_seconds and ttl_seconds > 0 else None
+        self.refresh_on_read = refresh_on_read
+        self.stats = SessionStoreStats()
+        # Bumped whenever a key leaves the store, so append-only consumers
+        # (e.g. ObjectTextIndex.sync_group) can tell eviction from growth.
+        self.generation = 0
+        self._clock = clock
+        # Order is last-refresh order; with one TTL that is also expiry order,
+        # so expired entries are always found at the front.
+        self._entries: OrderedDict[str, tuple[V, float | None]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._shard_locks = [threading.RLock() for _ in range(max(1, int(shards)))]
+        self._spill = _SpillFile(spill_path, name) if spill_path else None
+        _register(self)
+
+    def lock(self, key: str) -> threading.RLock:
+        """Shard lock guarding read-modify-write sequences on ``key``."""
+        return self._shard_locks[hash(key) % len(self._shard_locks)]
+
+    # Helpers below expect the caller to hold ``self._lock``.
+    def _over_capacity(self) -> bool:
+        return self.max_entries is not None and len(self._entries) > self.max_entries
+
+    def _expiry(self, now: float) -> float | None:
+        return now + self.ttl_seconds if self.ttl_seconds is not None else None
+
+    def _purge_expired(self, now: float) -> None:
+        while self._entries:
+            key, (_, expires_at) = next(iter(self._entries.items()))
+            if expires_at is None or expires_at > now:
+                return
+            del self._entries[key]
+            self.stats.expirations += 1
+            self.generation += 1
+
+    def _store(self, key: str, value: V, now: float) -> None:
+        self._entries[key] = (value, self._expiry(now))
+        self._entries.move_to_end(key)
+        evicted: list[tuple[str, Any, float | None]] = []
+        while self._over_capacity():
+            old_key, (old_value, expires_at) = self._entries.popitem(last=False)
+            evicted.append((old_key, old_value, expires_at))
+            self.stats.evictions += 1
+            self.generation += 1
+        if evicted and self._spill is not None:
+            self.stats.spilled += self._spill.write(evicted)
+
+    def _lookup(self, key: str, now: float, *, count: bool) -> Any:
+        self._purge_expired(now)
+        item = self._entries.get(key)
+        if item is not None:
+            if self.refresh_on_read:
+                self._entries[key] = (item[0], self._expiry(now))
+                self._entries.move_to_end(key)
+            if count:
+                self.stats.hits += 1
+            return item[0]
+        if self._spill is not None:
+            row = self._spill.read(key)
+            if row is not None and (row[1] is None or row[1] > now):
+                self._store(key, row[0], now)
+                self.stats.restored += 1
+                if count:
+                    self.stats.hits += 1
+                return row[0]
+        if count:
+            self.stats.misses += 1
+        return _MISSING
+
+    def __getitem__(self, key: str) -> V:
+        with self._lock:
+            value = self._lookup(key, self._clock(), count=True)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            value = self._lookup(key, self._clock(), count=True)
+        return default if value is _MISSING else value
+
+    def __contains__(self, key: object) -> bool:
+        if not isinstance(key, str):
+            return False
+        with self._lock:
+            return self._lookup(key, self._clock(), count=False) is not _MISSING
+
+    def __setitem__(self, key: str, value: V) -> None:
+        with self._lock:
+            now = self._clock()
+            self._purge_expired(now)
+            self._store(key, value, now)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            now = self._clock()
+            value = self._lookup(key, now, count=True)
+            if value is _MISSING:
+                self._store(key, default, now)
+                value = default
+            return value
+
+    def __delitem__(self, key: str) -> None:
+        with self._lock:
+            found = self._entries.pop(key, None) is not None
+            if self._spill is not None:
+                found = found or self._spill.read(key) is not None
+                self._spill.delete(key)
+            if not found:
+                raise KeyError(key)
+            self.generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._purge_expired(self._clock())
+            return len(self._entries)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate a snapshot of resident keys, least recently used first."""
+        with self._lock:
+            self._purge_expired(self._clock())
+            return iter(list(self._entries))
+
+    def items(self) -> list[tuple[str, V]]:  # type: ignore[override]
+        """Snapshot of resident ``(key, value)`` pairs without refreshing them."""
+        with self._lock:
+            self._purge_expired(self._clock())
+            return [(key, value) for key, (value, _) in self._entries.items()]
+
+    def values(self) -> list[V]:  # type: ignore[override]
+        return [value for _, value in self.items()]
+
+    def clear(self) -> None:
+        """Remove every entry, including rows spilled to disk."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            if self._spill is not None:
+                self._spill.delete()
+
+    def reset(self, initial: Mapping[str, V] | None = None) -> None:
+        """Drop resident entries (spilled rows are kept) and load ``initial``."""
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+            now = self._clock()
+            for key, value in (initial or {}).items():
+                self._store(key, value, now)
+
+    def warm(self, *, overwrite: bool = False) -> int:
+        """Load unexpired spilled rows into memory; returns how many were loaded."""
+        if self._spill is None:
+            return 0
+        with self._lock:
+            now = self._clock()
+            loaded = 0
+            for key, value, expires_at in self._spill.rows(now):
+                if key in self._entries and not overwrite:
+                    continue
+                self._entries[key] = (value, expires_at)
+                self._entries.move_to_end(key)
+                loaded += 1
+            while self._over_capacity():
+                self._entries.popitem(last=False)
+            self.stats.restored += loaded
+            return loaded
+
+    def flush(self) -> int:
+        """Write every resident entry to the spill file; returns rows written."""
+        if self._spill is None:
+            return 0
+        with self._lock:
+            rows = [(key, value, expires_at) for key, (value, expires_at) in self._entries.items()]
+            return self._spill.write(rows)
+
+    def close(self) -> None:
+        if self._spill is not None:
+            self.flush()
+            self._spill.close()
+            self._spill = None
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            self._purge_expired(self._clock())
+            lookups = self.stats.hits + self.stats.misses
+            return {
+                "name": self.name,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "hit_rate": round(self.stats.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.stats.evictions,
+                "expirations": self.stats.expirations,
+                "spilled": self.stats.spilled,
+                "restored": self.stats.restored,
+                "spill_rows": self._spill.count() if self._spill is not None else None,
+                "approx_bytes": sum(
+                    _approx_size(key, 0) + _approx_size(value) for key, (value, _) in self._entries.items()
+                ),
+            }
+
+
+_STORES: "weakref.WeakValueDictionary[str, SessionStateStore]" = weakref.WeakValueDictionary()
+_STORES_LOCK = threading.Lock()
+
+
+def _register(store: SessionStateStore) -> None:
+    with _STORES_LOCK:
+        _STORES[store.name] = store
+
+
+def session_state_metrics() -> list[dict[str, Any]]:
+    """Snapshots of every live store, for the debug endpoint and logs."""
+    with _STORES_LOCK:
+        stores = sorted(_STORES.values(), key=lambda store: store.name)
+    return [store.snapshot() for store in stores]
+
+
+def flush_session_state() -> int:
+    """Persist every live store that has a spill file."""
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+    written = 0
+    for store in stores:
+        try:
+            written += store.flush()
+        except sqlite3.Error:
+            logger.warning("session_state_flush_failed store=%s", store.name, exc_info=False)
+    return written
@@ -19,6 +19,11 @@ from typing import List, Optional, Literal, Dict, Tuple
 import hashlib
 import math
 
+try:
+    from chaos_engine.keyword_matcher import KeywordAutomaton, TokenMatches
+except ImportError:  # executed from inside the chaos_engine directory
+    from keyword_matcher import KeywordAutomaton, TokenMatches
+
 Polarity = Literal["positive", "negative", "neutral"]
 SignalCategory = Literal[
     "risk",
@@ -35,6 +40,26 @@ SignalCategory = Literal[
 DomainHint = Literal["business", "finance", "devops", "strategy", "general"]
 ShockClass = Literal["shock", "pressure", "constraint", "degradation", "stability", "general"]
 
+_ROLE_HINTS: Dict[str, str] = {
+    "supplier": "source",
+    "vendor": "source",
+    "inventory": "buffer",
+    "stock": "buffer",
+    "buffer": "buffer",
+    "delivery": "flow",
+    "service": "node",
+    "database": "dependency",
+    "queue": "buffer",
+    "customer": "outcome",
+    "trust": "outcome",
+    "risk": "risk",
+    "pressure": "pressure",
+    "cash": "constraint",
+    "liquidity": "constraint",
+    "competitor": "actor",
+    "market": "outcome",
+}
+
 
 @dataclass(frozen=True)
 class ChaosSignal:
@@ -111,7 +136,11 @@ class ChaosEngine:
     `ChaosSignal` instances to the constructor.
     """
 
-    def __init__(self, signals: Optional[List[ChaosSignal]] = None):
+    def __init__(
+        self,
+        signals: Optional[List[ChaosSignal]] = None,
+        registry: Optional[Dict[str, Dict[str, object]]] = None,
+    ):
         # Default signals are simple examples; these are not hard-coded
         # behavioral branches, merely scored inputs that the engine uses.
         self.signals: List[ChaosSignal] = (
@@ -126,7 +155,7 @@ class ChaosEngine:
             ]
         )
 
-        self._registry: Dict[str, Dict[str, object]] = {
+        self._registry: Dict[str, Dict[str, object]] = dict(registry) if registry is not None else {
             "inventory": {
                 "keywords": ["inventory", "stock", "out_of_stock", "shortage", "backorder"],
                 "base_weight": 0.8,
@@ -189,7 +218,36 @@ class ChaosEngine:
             "strategy": ("competitor", "market", "pricing", "position", "share", "objective"),
             "general": (),
         }
-
+        self._keyword_automaton = KeywordAutomaton(self._keyword_vocabulary())
+        # keyword -> registry signals listing it (one entry per listing, so duplicates still count twice)
+        self._signal_order: Dict[str, int] = {name: idx for idx, name in enumerate(self._registry)}
+        self._keyword_signals: Dict[str, List[str]] = {}
+        for name, meta in self._registry.items():
+            for kw in meta.get("keywords", []):
+                self._keyword_signals.setdefault(str(kw).lower(), []).append(name)
+
+    def _keyword_vocabulary(self) -> List[str]:
+        """Every term the engine matches against tokens or candidate object ids."""
+        terms: List[str] = []
+        for name, meta in self._registry.items():
+            terms.append(name.lower())
+            terms.append(str(meta.get("category", "general")))
+            terms.extend(str(kw).lower() for kw in meta.get("keywords", []))
+        for signal in self.signals:
+            terms.append(signal.keyword.lower())
+            terms.append(signal.category)
+            terms.extend(signal.keywords)
+        for keywords in self._domain_keywords.values():
+            terms.extend(keywords)
+        terms.extend(_ROLE_HINTS)
+        return terms
+
+    def _match_tokens(self, tokens: List[str]) -> TokenMatches:
+        return TokenMatches.build(tokens, self._keyword_automaton)
+
+    def _object_terms(self, lowered: str) -> TokenMatches:
+        # Candidate ids are matched as a single "token" so substring checks share the automaton.
+        return TokenMatches.build([lowered], self._keyword_automaton)
 
     # --------------------
     # Utility: deterministic hash -> floats
@@ -242,7 +300,7 @@ class ChaosEngine:
             tokens.append("".join(cur))
         return tokens
 
-    def _extract_signals(self, text: str) -> List[ChaosSignal]:
+    def _extract_signals(self, text: str, matches: Optional[TokenMatches] = None) -> List[ChaosSignal]:
         """Extract semantic signals from free text using the internal registry.
 
         - Case-insensitive matching against registry keywords.
@@ -252,30 +310,27 @@ class ChaosEngine:
           returns an empty list. This function never raises.
         """
         try:
-            tokens = set(self._tokenize(text or ""))
+            if matches is None:
+                matches = self._match_tokens(self._tokenize(text or ""))
+            # Count matched keywords per signal; a keyword matches an exact
+            # token or a substring of one, to capture variants. Only keywords
+            # the automaton reported are visited.
+            counts: Dict[str, int] = {}
+            for keyword in matches.substring_counts:
+                for name in self._keyword_signals.get(keyword, ()):
+                    counts[name] = counts.get(name, 0) + 1
+            if "" in self._keyword_signals and matches.in_any_token(""):
+                for name in self._keyword_signals[""]:
+                    counts[name] = counts.get(name, 0) + 1
+
             found: List[ChaosSignal] = []
-            for name, meta in self._registry.items():
+            for name in sorted(counts, key=self._signal_order.__getitem__):
+                meta = self._registry[name]
                 kwlist = list(meta.get("keywords", []))
                 base = float(meta.get("base_weight", 0.0))
                 polarity = str(meta.get("polarity", "neutral"))
                 category = str(meta.get("category", "general"))
-
-                # Count matches across keywords; allow substring matches
-                # in tokens as well.
-                count = 0
-                for kw in kwlist:
-                    lkw = kw.lower()
-                    if lkw in tokens:
-                        count += 1
-                    else:
-                        # allow substring matches to capture variants
-                        for t in tokens:
-                            if lkw in t:
-                                count += 1
-                                break
-
-                if count <= 0:
-                    continue
+                count = counts[name]
 
                 # Non-linear weight growth: sqrt of count to give
                 # diminishing returns for repeated mentions.
@@ -304,20 +359,20 @@ class ChaosEngine:
             return 0.0
         return max(0.0, min(1.0, x))
 
-    def _matched_terms(self, text_tokens: List[str], signal: ChaosSignal) -> Tuple[str, ...]:
+    def _matched_terms(
+        self,
+        text_tokens: List[str],
+        signal: ChaosSignal,
+        matches: Optional[TokenMatches] = None,
+    ) -> Tuple[str, ...]:
+        if matches is None:
+            matches = self._match_tokens(text_tokens)
         matched: List[str] = []
         keywords = signal.keywords or (signal.keyword.lower(),)
-        token_set = set(text_tokens)
         for keyword in keywords:
-            if keyword in token_set:
+            if matches.has_token(keyword) or (len(keyword) >= 3 and matches.in_any_token(keyword)):
                 matched.append(keyword)
-                continue
-            if len(keyword) >= 3:
-                for token in token_set:
-                    if keyword in token:
-                        matched.append(keyword)
-                        break
-        if signal.keyword.lower() in token_set and signal.keyword.lower() not in matched:
+        if matches.has_token(signal.keyword.lower()) and signal.keyword.lower() not in matched:
             matched.append(signal.keyword.lower())
         return tuple(dict.fromkeys(matched))
 
@@ -338,7 +393,10 @@ class ChaosEngine:
         signals: List[ChaosSignal],
         raw_scores: Dict[str, float],
         contributions: Dict[str, float],
+        matches: Optional[TokenMatches] = None,
     ) -> List[ChaosSignalObservation]:
+        if matches is None:
+            matches = self._match_tokens(text_tokens)
         observations: List[ChaosSignalObservation] = []
         for signal in signals:
             keyword = signal.keyword
@@ -350,7 +408,7 @@ class ChaosEngine:
                     weight=float(signal.weight),
                     raw_score=float(raw_scores.get(keyword, 0.0)),
                     contribution=float(contributions.get(keyword, 0.0)),
-                    matched_terms=self._matched_terms(text_tokens, signal),
+                    matched_terms=self._matched_terms(text_tokens, signal, matches),
                     note=f"{keyword} scored from direct token and substring matches.",
                 )
             )
@@ -358,28 +416,12 @@ class ChaosEngine:
         return observations
 
     def _infer_role_hint(self, candidate_object: str) -> Optional[str]:
-        lowered = candidate_object.lower()
-        role_map = {
-            "supplier": "source",
-            "vendor": "source",
-            "inventory": "buffer",
-            "stock": "buffer",
-            "buffer": "buffer",
-            "delivery": "flow",
-            "service": "node",
-            "database": "dependency",
-            "queue": "buffer",
-            "customer": "outcome",
-            "trust": "outcome",
-            "risk": "risk",
-            "pressure": "pressure",
-            "cash": "constraint",
-            "liquidity": "constraint",
-            "competitor": "actor",
-            "market": "outcome",
-        }
-        for key, value in role_map.items():
-            if key in lowered:
+        return self._role_hint_from(self._object_terms(candidate_object.lower()))
+
+    @staticmethod
+    def _role_hint_from(object_terms: TokenMatches) -> Optional[str]:
+        for key, value in _ROLE_HINTS.items():
+            if object_terms.in_any_token(key):
                 return value
         return None
 
@@ -391,28 +433,28 @@ class ChaosEngine:
         idx: int,
         domain_hint: DomainHint,
     ) -> ChaosObjectHint:
-        lowered = candidate_object.lower()
+        object_terms = self._object_terms(candidate_object.lower())
         matched_terms: List[str] = []
         lexical_score = 0.0
 
         for observation in signal_observations:
             for term in observation.matched_terms:
-                if term and term in lowered:
+                if term and object_terms.in_any_token(term):
                     matched_terms.append(term)
                     lexical_score += observation.contribution * 0.85
-            if observation.signal in lowered:
+            if object_terms.in_any_token(observation.signal):
                 matched_terms.append(observation.signal)
                 lexical_score += observation.contribution
-            if observation.category != "general" and observation.category in lowered:
+            if observation.category != "general" and object_terms.in_any_token(observation.category):
                 matched_terms.append(observation.category)
                 lexical_score += observation.contribution * 0.55
 
-        role_hint = self._infer_role_hint(candidate_object)
+        role_hint = self._role_hint_from(object_terms)
         if role_hint and any(obs.category == "risk" for obs in signal_observations) and role_hint in {"risk", "pressure", "source", "dependency"}:
             lexical_score += 0.18
         if domain_hint != "general":
             for domain_kw in self._domain_keywords.get(domain_hint, ()):
-                if domain_kw in lowered:
+                if object_terms.in_any_token(domain_kw):
                     lexical_score += 0.08
                     matched_terms.append(domain_kw)
 
@@ -485,15 +527,16 @@ class ChaosEngine:
         seed = self._seed_from(text or "", history)
         tokens = self._tokenize(text or "")
         domain_hint = self._infer_domain_hint(tokens)
-        token_counts: Dict[str, int] = {}
-        for t in tokens:
-            token_counts[t] = token_counts.get(t, 0) + 1
+        # One automaton pass over the unique tokens serves extraction, scoring
+        # and matched-term reporting below.
+        matches = self._match_tokens(tokens)
+        token_counts = matches.token_counts
 
         # Allow semantic extraction from the free text. If the extractor
         # finds signals, use those; otherwise fall back to the engine's
         # configured `self.signals`. This keeps behavior backward
         # compatible while enabling richer detection.
-        extracted = self._extract_signals(text or "")
+        extracted = self._extract_signals(text or "", matches)
         signals_for_scoring = extracted if extracted else list(self.signals)
 
         # 1) Per-signal raw match scores (count-based + substring factor)
@@ -505,9 +548,7 @@ class ChaosEngine:
             # add substring presence bonus (e.g. "delay" in "delayed")
             substr_bonus = 0
             if c == 0 and len(key) >= 3:
-                for t in token_counts:
-                    if key in t:
-                        substr_bonus += token_counts[t]
+                substr_bonus = matches.occurrences_within_tokens(key)
             # normalized occurrence measure
             occ = float(c + substr_bonus)
             # apply a mild non-linear transform so diminishing returns occur
@@ -536,7 +577,7 @@ class ChaosEngine:
             contributions[sig.keyword] = max(0.0, contrib)
 
         signal_observations = self._build_signal_observations(
-            tokens, signals_for_scoring, raw_scores, contributions
+            tokens, signals_for_scoring, raw_scores, contributions, matches
         )
 
         # 3) Pairwise synergy (non-linear): for each pair, if both present,
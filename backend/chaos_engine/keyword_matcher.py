@@ -0,0 +1,121 @@
+"""Compiled multi-keyword matcher for the chaos signal engine.
+
+`KeywordAutomaton` is a small Aho-Corasick automaton built once from every
+keyword the engine can ask about. Scanning a text's unique tokens through it
+yields, in a single pass, every keyword that occurs inside any token together
+with the number of token occurrences containing it. The engine's exact-token
+and substring checks then become dictionary lookups instead of nested scans
+over signals, keywords and tokens.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, FrozenSet, Iterable, List, Mapping, Tuple
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed keyword vocabulary.
+
+    Results are memoized per scanned string; chat vocabularies repeat heavily,
+    so most tokens are answered from the cache after warm-up.
+    """
+
+    def __init__(self, keywords: Iterable[str], cache_size: int = 4096):
+        self.keywords: FrozenSet[str] = frozenset(keyword for keyword in keywords if keyword)
+        self.cache_size = max(0, int(cache_size))
+        self._cache: Dict[str, FrozenSet[str]] = {}
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._outputs: List[Tuple[str, ...]] = [()]
+        for keyword in sorted(self.keywords):
+            self._add(keyword)
+        self._link()
+
+    def _add(self, keyword: str) -> None:
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._outputs.append(())
+            state = nxt
+        self._outputs[state] = self._outputs[state] + (keyword,)
+
+    def _link(self) -> None:
+        queue: List[int] = list(self._goto[0].values())
+        head = 0
+        while head < len(queue):
+            state = queue[head]
+            head += 1
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # Fold the suffix state's outputs in so matching never walks fail links for output.
+                self._outputs[nxt] = self._outputs[nxt] + self._outputs[self._fail[nxt]]
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """Return every vocabulary keyword occurring as a substring of `text`."""
+        cached = self._cache.get(text)
+        if cached is not None:
+            return cached
+        found = self._scan(text)
+        if self.cache_size:
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[text] = found
+        return found
+
+    def _scan(self, text: str) -> FrozenSet[str]:
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+        state = 0
+        found: set[str] = set()
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return frozenset(found)
+
+
+@dataclass(frozen=True)
+class TokenMatches:
+    """Keyword hits for one tokenized text, computed in a single automaton pass."""
+
+    token_counts: Mapping[str, int]
+    substring_counts: Mapping[str, int] = field(default_factory=dict)
+    vocabulary: FrozenSet[str] = frozenset()
+
+    @classmethod
+    def build(cls, tokens: Iterable[str], automaton: KeywordAutomaton) -> "TokenMatches":
+        token_counts: Dict[str, int] = {}
+        for token in tokens:
+            token_counts[token] = token_counts.get(token, 0) + 1
+        substring_counts: Dict[str, int] = {}
+        for token, count in token_counts.items():
+            for keyword in automaton.find(token):
+                substring_counts[keyword] = substring_counts.get(keyword, 0) + count
+        return cls(token_counts=token_counts, substring_counts=substring_counts, vocabulary=automaton.keywords)
+
+    def has_token(self, term: str) -> bool:
+        return term in self.token_counts
+
+    def in_any_token(self, term: str) -> bool:
+        """Whether `term` is a substring of at least one token."""
+        return self.occurrences_within_tokens(term) > 0
+
+    def occurrences_within_tokens(self, term: str) -> int:
+        """Total count of token occurrences that contain `term` as a substring."""
+        if term in self.vocabulary:
+            return self.substring_counts.get(term, 0)
+        # Terms outside the compiled vocabulary (e.g. ad-hoc signals) fall back to a scan.
+        return sum(count for token, count in self.token_counts.items() if term in token)
@@ -52,6 +52,7 @@ class StrategicDecisionEngine:
             metadata={"source": "baseline_simulation"},
         )
         actions = candidate_actions or self.strategy_generator.generate(system_model)
+        self._prime_simulations(system_model, scenario, actions)
         evaluations = []
         comparison_inputs: dict[str, ScenarioInput] = {}
 
@@ -106,6 +107,27 @@ class StrategicDecisionEngine:
             scenario=request.scenario,
         )
 
+    def _prime_simulations(
+        self,
+        system_model: SystemModel,
+        scenario: ScenarioInput,
+        actions: list[CandidateAction],
+    ) -> None:
+        """Simulate every action plus the comparison baseline in one batch.
+
+        The batch runs as one state matrix, or across the simulation engine's
+        worker processes when there are many actions. The per-action runs and
+        `compare` below then read the results from the simulation cache
+        instead of simulating each scenario twice.
+        """
+        engine = self.simulation_engine
+        if not actions or not engine.cache.max_entries:
+            return
+        if self.strategy_simulator.simulation_engine is not engine:
+            return
+        scenarios = [self.strategy_simulator.scenario_for(baseline_scenario=scenario, action=action) for action in actions]
+        engine.simulate_batch(system_model, [ScenarioInput(), *scenarios])
+
     def _decision_summary(
         self,
         system_model: SystemModel,
@@ -22,12 +22,17 @@ class StrategySimulator:
         action: CandidateAction,
     ) -> tuple[SimulationResult, ScenarioInput]:
         """Simulate one action and return both the result and derived scenario."""
-        scenario = ScenarioInput(
+        scenario = self.scenario_for(baseline_scenario=baseline_scenario, action=action)
+        return self.simulation_engine.simulate(system_model, scenario), scenario
+
+    def scenario_for(self, *, baseline_scenario: ScenarioInput, action: CandidateAction) -> ScenarioInput:
+        """Return the scenario that simulates ``action`` on top of the baseline shocks."""
+        # Built from an already validated scenario and shocks, so skip re-validation.
+        return ScenarioInput.model_construct(
             shocks=[*baseline_scenario.shocks, *self._strategy_shocks(action)],
             time_steps=baseline_scenario.time_steps,
             metadata={"strategy_id": action.id},
         )
-        return self.simulation_engine.simulate(system_model, scenario), scenario
 
     def _strategy_shocks(self, action: CandidateAction) -> list[ScenarioShock]:
         text = f"{action.id} {action.description}".lower()
@@ -0,0 +1,141 @@
+"""Compiled, array-based form of a system model for batched simulation.
+
+`SimulationCore.compile` resolves every name-based lookup of the step loop
+(object signal affinities, relationship polarity, loop membership, drift
+polarity, fragility thresholds) into index arrays once per run. The kernels
+below then advance a ``(scenarios, signals)`` state matrix step by step.
+
+Updates keep the sequential order of the dictionary engine (relationship by
+relationship, loop member by loop member), and every intermediate value is
+clamped and rounded exactly like `SignalStateManager.clamp`, so timelines are
+identical to the per-signal implementation.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; SimulationCore falls back to the dict loop
+    np = None
+
+
+# builtin sum() switched to Neumaier-compensated float summation in 3.12.
+_COMPENSATED_SUM = sys.version_info >= (3, 12)
+
+
+@dataclass(frozen=True)
+class CompiledRelation:
+    """One relationship: source columns, target columns and per-target polarity."""
+
+    sources: tuple[int, ...]
+    targets: "np.ndarray"
+    signs: "np.ndarray"
+    effect: float
+
+
+@dataclass(frozen=True)
+class CompiledLoop:
+    """One feedback loop: matched columns in path order (may repeat) and polarity."""
+
+    members: tuple[int, ...]
+    signs: tuple[float, ...]
+    rate: float
+
+
+@dataclass(frozen=True)
+class CompiledFragilityPoint:
+    """A fragility point resolved to a column and a numeric threshold."""
+
+    index: int
+    kind: str
+    value: float
+    threshold: str
+
+
+@dataclass(frozen=True)
+class CompiledSystemModel:
+    """Index arrays for one system model over a fixed signal key order."""
+
+    signal_keys: tuple[str, ...]
+    relations: tuple[CompiledRelation, ...]
+    loops: tuple[CompiledLoop, ...]
+    drift_down: "np.ndarray"
+    fragility_points: tuple[CompiledFragilityPoint, ...]
+
+
+def clamp_round(values: "np.ndarray") -> "np.ndarray":
+    """Vectorized `SignalStateManager.clamp`: bound to 0..1, else round to 4 places."""
+    rounded = np.round(values, 4)
+    # np.round scales by 1e4 before rounding; only values within a hair of a
+    # half-way point can land on the other side of Python's exact round().
+    scaled = values * 1e4
+    near_tie = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near_tie.any():
+        for position in zip(*np.nonzero(near_tie)):
+            rounded[position] = round(float(values[position]), 4)
+    return np.where(values < 0.0, 0.0, np.where(values > 1.0, 1.0, rounded))
+
+
+def column_sum(state: "np.ndarray", columns: tuple[int, ...]) -> "np.ndarray":
+    """Per-row ``sum(state[row][c] for c in columns)`` with builtin sum() semantics."""
+    total = state[:, columns[0]].copy()
+    if not _COMPENSATED_SUM:
+        for column in columns[1:]:
+            total += state[:, column]
+        return total
+    compensation = np.zeros_like(total)
+    for column in columns[1:]:
+        item = state[:, column]
+        step = total + item
+        compensation += np.where(
+            np.abs(total) >= np.abs(item),
+            (total - step) + item,
+            (item - step) + total,
+        )
+        total = step
+    return total + compensation
+
+
+def propagate_relationships(state: "np.ndarray", relations: tuple[CompiledRelation, ...]) -> None:
+    """Apply relationship pressure in model order, updating ``state`` in place."""
+    for relation in relations:
+        source_pressure = column_sum(state, relation.sources) / len(relation.sources)
+        magnitude = relation.effect * np.maximum(source_pressure - 0.5, 0.0)
+        state[:, relation.targets] = clamp_round(
+            state[:, relation.targets] + magnitude[:, None] * relation.signs[None, :]
+        )
+
+
+def apply_loops(state: "np.ndarray", loops: tuple[CompiledLoop, ...]) -> None:
+    """Apply feedback loop deltas in loop and path order, updating ``state`` in place."""
+    for loop in loops:
+        delta = loop.rate * (column_sum(state, loop.members) / len(loop.members))
+        for column, sign in zip(loop.members, loop.signs):
+            state[:, column] = clamp_round(state[:, column] + (delta if sign > 0 else -delta))
+
+
+def apply_natural_drift(state: "np.ndarray", drift_down: "np.ndarray") -> "np.ndarray":
+    """Pull risk-like signals down from above 0.5 and the rest up from below 0.5."""
+    drift = np.where(
+        drift_down[None, :],
+        np.where(state > 0.5, -0.01, 0.0),
+        np.where(state < 0.5, 0.01, 0.0),
+    )
+    return clamp_round(state + drift)
+
+
+def step(state: "np.ndarray", compiled: CompiledSystemModel) -> "np.ndarray":
+    """Advance every scenario row by one time step."""
+    updated = state.copy()
+    propagate_relationships(updated, compiled.relations)
+    apply_loops(updated, compiled.loops)
+    return apply_natural_drift(updated, compiled.drift_down)
+
+
+def fragility_breaches(state: "np.ndarray", point: CompiledFragilityPoint) -> "np.ndarray":
+    """Boolean mask of scenario rows breaching one fragility point."""
+    values = state[:, point.index]
+    return values <= point.value if point.kind == "min" else values >= point.value
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from engines.scenario_simulation.compiled_model import CompiledFragilityPoint
 from engines.scenario_simulation.signal_state import SignalStateManager
 from engines.scenario_simulation.simulation_schema import SimulationEvent
 from engines.system_modeling.model_schema import SystemFragilityPoint
@@ -46,6 +47,46 @@ class FragilityMonitor:
             )
         return events
 
+    def compile(
+        self,
+        fragility_points: list[SystemFragilityPoint],
+        signal_keys: tuple[str, ...],
+    ) -> tuple[CompiledFragilityPoint, ...]:
+        """Resolve fragility points to state columns and thresholds once per run.
+
+        Points that resolve to an already compiled (signal, threshold) pair are
+        dropped, mirroring the per-step ``emitted_keys`` de-duplication.
+        """
+        state = dict.fromkeys(signal_keys, 0.0)
+        columns = {key: index for index, key in enumerate(signal_keys)}
+        compiled: list[CompiledFragilityPoint] = []
+        seen: set[tuple[str, str]] = set()
+        for point in fragility_points:
+            signal_key = self._resolve_signal(point.signal, state)
+            if signal_key is None or (signal_key, point.threshold) in seen:
+                continue
+            seen.add((signal_key, point.threshold))
+            threshold_kind, threshold_value = self._threshold_for(point.threshold, signal_key)
+            compiled.append(
+                CompiledFragilityPoint(
+                    index=columns[signal_key],
+                    kind=threshold_kind,
+                    value=threshold_value,
+                    threshold=point.threshold,
+                )
+            )
+        return tuple(compiled)
+
+    def event_for(self, *, time_step: int, signal_key: str, value: float, point: CompiledFragilityPoint) -> SimulationEvent:
+        """Build the warning event for a breached compiled fragility point."""
+        return SimulationEvent(
+            time=time_step,
+            type="fragility_warning",
+            signal=signal_key,
+            severity="high" if abs(value - point.value) >= 0.15 else "medium",
+            message=f"{signal_key} crossed fragility threshold: {point.threshold}",
+        )
+
     def _resolve_signal(self, label: str, state: dict[str, float]) -> str | None:
         normalized = self.state_manager.normalize_name(label)
         for key in state:
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from engines.scenario_simulation.compiled_model import CompiledLoop
 from engines.scenario_simulation.signal_state import SignalStateManager
 from engines.system_modeling.model_schema import SystemLoop
 
 
+_REINFORCING_INVERSE_TOKENS = ("reliability", "stability", "satisfaction", "margin", "liquidity", "morale", "legitimacy")
+_BALANCING_INVERSE_TOKENS = ("risk", "pressure", "delay", "cost", "panic", "protest")
+
+
 class LoopExecutor:
     """Apply reinforcing and balancing loop dynamics to signal state."""
 
@@ -19,6 +24,27 @@ class LoopExecutor:
             self._apply_loop(updated, loop)
         return updated
 
+    def compile(self, loops: list[SystemLoop], signal_keys: tuple[str, ...]) -> tuple[CompiledLoop, ...]:
+        """Resolve loop paths to state columns and member polarity once per run."""
+        state = dict.fromkeys(signal_keys, 0.0)
+        columns = {key: index for index, key in enumerate(signal_keys)}
+        compiled: list[CompiledLoop] = []
+        for loop in loops:
+            matched_keys = [self._match_signal_name(item, state) for item in loop.path]
+            matched_keys = [item for item in matched_keys if item is not None]
+            if not matched_keys:
+                continue
+            reinforcing = loop.type == "reinforcing"
+            inverse_tokens = _REINFORCING_INVERSE_TOKENS if reinforcing else _BALANCING_INVERSE_TOKENS
+            compiled.append(
+                CompiledLoop(
+                    members=tuple(columns[key] for key in matched_keys),
+                    signs=tuple(-1.0 if any(token in key for token in inverse_tokens) else 1.0 for key in matched_keys),
+                    rate=0.03 if reinforcing else 0.02,
+                )
+            )
+        return tuple(compiled)
+
     def _apply_loop(self, state: dict[str, float], loop: SystemLoop) -> None:
         matched_keys = [self._match_signal_name(item, state) for item in loop.path]
         matched_keys = [item for item in matched_keys if item is not None]
@@ -29,7 +55,7 @@ class LoopExecutor:
         if loop.type == "reinforcing":
             delta = 0.03 * average_state
             for key in matched_keys:
-                if any(token in key for token in ("reliability", "stability", "satisfaction", "margin", "liquidity", "morale", "legitimacy")):
+                if any(token in key for token in _REINFORCING_INVERSE_TOKENS):
                     self.state_manager.apply_delta(state, key, -delta)
                 else:
                     self.state_manager.apply_delta(state, key, delta)
@@ -37,7 +63,7 @@ class LoopExecutor:
 
         delta = 0.02 * average_state
         for key in matched_keys:
-            if any(token in key for token in ("risk", "pressure", "delay", "cost", "panic", "protest")):
+            if any(token in key for token in _BALANCING_INVERSE_TOKENS):
                 self.state_manager.apply_delta(state, key, -delta)
             else:
                 self.state_manager.apply_delta(state, key, delta)
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+from engines.scenario_simulation import compiled_model
 from engines.scenario_simulation.fragility_monitor import FragilityMonitor
 from engines.scenario_simulation.loop_executor import LoopExecutor
 from engines.scenario_simulation.shock_applier import ScenarioShockApplier
 from engines.scenario_simulation.signal_state import SignalStateManager
+from engines.scenario_simulation.simulation_cache import SimulationCache, copy_result, model_fingerprint, simulation_key
+from engines.scenario_simulation.simulation_pool import SIMULATION_WORKERS, should_parallelize, simulate_in_pool
 from engines.scenario_simulation.simulation_core import SimulationCore
 from engines.scenario_simulation.simulation_schema import (
     ScenarioComparisonEntry,
@@ -17,9 +20,17 @@ from engines.system_modeling.model_schema import SystemModel
 
 
 class ScenarioSimulationEngine:
-    """Run deterministic scenario simulations from a system model."""
+    """Run deterministic scenario simulations from a system model.
 
-    def __init__(self) -> None:
+    Results are memoized in ``cache`` (a private LRU unless one is passed in,
+    e.g. `shared_simulation_cache()` to reuse results across requests). Large
+    batches are split over ``workers`` processes (``NEXORA_SIMULATION_WORKERS``
+    by default; 1 keeps everything in-process).
+    """
+
+    def __init__(self, *, cache: SimulationCache | None = None, workers: int | None = None) -> None:
+        self.cache = cache if cache is not None else SimulationCache()
+        self.workers = max(1, workers if workers is not None else SIMULATION_WORKERS)
         self.state_manager = SignalStateManager()
         self.shock_applier = ScenarioShockApplier(self.state_manager)
         self.loop_executor = LoopExecutor(self.state_manager)
@@ -33,6 +44,16 @@ class ScenarioSimulationEngine:
     def simulate(self, system_model: SystemModel, scenario: ScenarioInput | None = None) -> SimulationResult:
         """Run the scenario simulation and return timeline output."""
         scenario = scenario or ScenarioInput()
+        if not self.cache.max_entries:
+            return self._simulate(system_model, scenario)
+        key = simulation_key(model_fingerprint(system_model), scenario)
+        result = self.cache.get(key)
+        if result is None:
+            result = self._simulate(system_model, scenario)
+            self.cache.put(key, result)
+        return result
+
+    def _simulate(self, system_model: SystemModel, scenario: ScenarioInput) -> SimulationResult:
         initial_state = self.state_manager.initialize(system_model)
         shocked_state = self.shock_applier.apply(initial_state, scenario.shocks)
         result = self.core.run(system_model=system_model, scenario=scenario, initial_state=shocked_state)
@@ -44,19 +65,78 @@ class ScenarioSimulationEngine:
         )
         return result
 
+    def simulate_batch(self, system_model: SystemModel, scenarios: list[ScenarioInput]) -> list[SimulationResult]:
+        """Run several scenarios of one model, returning results in input order.
+
+        Cached scenarios are reused and repeated scenarios are simulated once.
+        The misses advance together as rows of one state matrix (with numpy),
+        fanned out over ``workers`` processes when there are at least
+        `PARALLEL_MIN_SCENARIOS` of them.
+        """
+        if not self.cache.max_entries:
+            return self._compute_batch(system_model, scenarios, None)
+        fingerprint = model_fingerprint(system_model)
+        keys = [simulation_key(fingerprint, scenario) for scenario in scenarios]
+        results: list[SimulationResult | None] = [self.cache.get(key) for key in keys]
+        missing: dict[str, list[int]] = {}
+        for index, result in enumerate(results):
+            if result is None:
+                missing.setdefault(keys[index], []).append(index)
+        if missing:
+            computed = self._compute_batch(
+                system_model,
+                [scenarios[indexes[0]] for indexes in missing.values()],
+                fingerprint,
+            )
+            for (key, indexes), result in zip(missing.items(), computed):
+                self.cache.put(key, result)
+                results[indexes[0]] = result
+                for index in indexes[1:]:
+                    results[index] = copy_result(result)
+        return results  # type: ignore[return-value]
+
+    def _compute_batch(
+        self,
+        system_model: SystemModel,
+        scenarios: list[ScenarioInput],
+        fingerprint: str | None,
+    ) -> list[SimulationResult]:
+        if should_parallelize(len(scenarios), self.workers):
+            results = simulate_in_pool(
+                system_model,
+                scenarios,
+                workers=self.workers,
+                fingerprint=fingerprint or model_fingerprint(system_model),
+            )
+            if results is not None:
+                return results
+        return self._simulate_batch(system_model, scenarios)
+
+    def _simulate_batch(self, system_model: SystemModel, scenarios: list[ScenarioInput]) -> list[SimulationResult]:
+        if compiled_model.np is None:
+            return [self._simulate(system_model, scenario) for scenario in scenarios]
+        initial_state = self.state_manager.initialize(system_model)
+        shocked_states = [self.shock_applier.apply(initial_state, scenario.shocks) for scenario in scenarios]
+        results = self.core.run_batch(system_model=system_model, scenarios=scenarios, initial_states=shocked_states)
+        for result, shocked_state in zip(results, shocked_states):
+            result.metadata.update(
+                {
+                    "initial_state": dict(initial_state),
+                    "shocked_state": shocked_state,
+                }
+            )
+        return results
+
     def compare(
         self,
         system_model: SystemModel,
         scenarios: dict[str, ScenarioInput],
     ) -> ScenarioComparisonResult:
         """Run multiple named scenarios and compare their stability outcomes."""
-        baseline = self.simulate(system_model, ScenarioInput())
+        baseline, *results = self.simulate_batch(system_model, [ScenarioInput(), *scenarios.values()])
         scenario_results = [
-            ScenarioComparisonEntry(
-                scenario_name=name,
-                result=self.simulate(system_model, scenario),
-            )
-            for name, scenario in scenarios.items()
+            ScenarioComparisonEntry(scenario_name=name, result=result)
+            for name, result in zip(scenarios, results)
         ]
         ranked = sorted(scenario_results, key=lambda item: item.result.stability_score, reverse=True)
         return ScenarioComparisonResult(
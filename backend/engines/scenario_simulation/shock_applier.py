@@ -36,6 +36,11 @@ class ScenarioShockApplier:
                 self.state_manager.apply_delta(updated, candidate, shock.delta)
         return updated
 
+    def compile_targets(self, signal_name: str, signal_keys: tuple[str, ...]) -> tuple[int, ...]:
+        """Resolve a shock's target signals to state columns, in `apply` order."""
+        columns = {key: index for index, key in enumerate(signal_keys)}
+        return tuple(columns[key] for key in self._resolve_targets(signal_name, dict.fromkeys(signal_keys, 0.0)))
+
     def _resolve_targets(self, signal_name: str, state: dict[str, float]) -> list[str]:
         normalized = self.state_manager.normalize_name(signal_name)
         aliases = _SHOCK_ALIASES.get(normalized, (normalized,))
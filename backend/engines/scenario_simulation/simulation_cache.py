@@ -0,0 +1,122 @@
+"""Content-addressed memoization of scenario simulation results.
+
+A simulation is a pure function of the `SystemModel` and the scenario's
+shocks and horizon (``ScenarioInput.metadata`` never reaches the core), so
+results are keyed by a SHA-256 over the canonical JSON of exactly those
+inputs. Entries are stored and returned as copies of the result containers
+and metadata, so callers that annotate ``result.metadata`` or extend the
+lists never see each other's changes.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from engines.scenario_simulation.simulation_schema import ScenarioInput, SimulationResult
+from engines.system_modeling.model_schema import SystemModel
+
+
+SIMULATION_CACHE_MAX_ENTRIES = int(os.getenv("NEXORA_SIMULATION_CACHE_SIZE", "512"))
+
+
+def model_fingerprint(system_model: SystemModel) -> str:
+    payload = json.dumps(system_model.model_dump(mode="json"), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def simulation_key(model_fingerprint: str, scenario: ScenarioInput) -> str:
+    shocks = [(shock.signal, shock.delta) for shock in scenario.shocks]
+    payload = json.dumps([model_fingerprint, scenario.time_steps, shocks], separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+
+def _copy_metadata(value: Any) -> Any:
+    # Metadata is JSON-like (state snapshots, counts): rebuild its containers
+    # and share immutable scalars, without deepcopy's per-object memo work.
+    kind = type(value)
+    if kind is dict:
+        return {key: item if type(item) in _ATOMIC_TYPES else _copy_metadata(item) for key, item in value.items()}
+    if kind is list:
+        return [item if type(item) in _ATOMIC_TYPES else _copy_metadata(item) for item in value]
+    if kind in _ATOMIC_TYPES:
+        return value
+    return copy.deepcopy(value)
+
+
+def copy_result(result: SimulationResult) -> SimulationResult:
+    """Copy ``result`` the way the cache does before storing or returning it."""
+    # Containers and metadata are copied; timeline steps and events are shared
+    # and, like everywhere else in the engines, treated as immutable.
+    return SimulationResult.model_construct(
+        timeline=list(result.timeline),
+        events=list(result.events),
+        final_state=dict(result.final_state),
+        stability_score=result.stability_score,
+        metadata=_copy_metadata(result.metadata),
+    )
+
+
+class SimulationCache:
+    """Thread-safe LRU of simulation results; ``max_entries=0`` disables caching."""
+
+    def __init__(self, max_entries: int = SIMULATION_CACHE_MAX_ENTRIES) -> None:
+        self.max_entries = max(0, max_entries)
+        self._entries: OrderedDict[str, SimulationResult] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: str) -> SimulationResult | None:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return copy_result(result)
+
+    def put(self, key: str, result: SimulationResult) -> None:
+        if not self.max_entries:
+            return
+        stored = copy_result(result)
+        with self._lock:
+            self._entries[key] = stored
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+_SHARED_CACHE = SimulationCache()
+
+
+def shared_simulation_cache() -> SimulationCache:
+    """Process-wide cache for engines that should reuse results across requests."""
+    return _SHARED_CACHE
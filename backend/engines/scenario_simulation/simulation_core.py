@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from engines.scenario_simulation import compiled_model
+from engines.scenario_simulation.compiled_model import CompiledRelation, CompiledSystemModel
 from engines.scenario_simulation.fragility_monitor import FragilityMonitor
 from engines.scenario_simulation.loop_executor import LoopExecutor
 from engines.scenario_simulation.signal_state import SignalStateManager
-from engines.scenario_simulation.simulation_schema import ScenarioInput, SimulationResult, SimulationStep
+from engines.scenario_simulation.simulation_schema import ScenarioInput, SimulationEvent, SimulationResult, SimulationStep
 from engines.system_modeling.model_schema import SystemModel, SystemObject, SystemRelationship
 
 
@@ -38,6 +40,8 @@ _RELATION_EFFECTS: dict[str, float] = {
     "cooperation": 0.02,
 }
 
+_DRIFT_DOWN_TOKENS = ("risk", "cost", "delay", "pressure", "panic", "protest", "security")
+
 
 class SimulationCore:
     """Run deterministic scenario simulations across time steps."""
@@ -55,6 +59,115 @@ class SimulationCore:
 
     def run(self, *, system_model: SystemModel, scenario: ScenarioInput, initial_state: dict[str, float]) -> SimulationResult:
         """Execute the simulation timeline and return final state and events."""
+        if compiled_model.np is not None:
+            return self.run_batch(system_model=system_model, scenarios=[scenario], initial_states=[initial_state])[0]
+        return self._run_stepwise(system_model=system_model, scenario=scenario, initial_state=initial_state)
+
+    def compile(self, system_model: SystemModel, signal_keys: tuple[str, ...]) -> CompiledSystemModel:
+        """Resolve the model's name-based lookups into index arrays for `signal_keys`."""
+        np = compiled_model.np
+        state = dict.fromkeys(signal_keys, 0.0)
+        columns = {key: index for index, key in enumerate(signal_keys)}
+        objects_by_id = {item.id: item for item in system_model.objects}
+        keys_by_object: dict[str, list[str]] = {}
+        relations: list[CompiledRelation] = []
+        for relationship in system_model.relationships:
+            source = objects_by_id.get(relationship.from_object)
+            target = objects_by_id.get(relationship.to_object)
+            if source is None or target is None:
+                continue
+            for object_id in (source.id, target.id):
+                if object_id not in keys_by_object:
+                    keys_by_object[object_id] = self._signal_keys_for_object(object_id, state)
+            source_keys = keys_by_object[source.id]
+            target_keys = keys_by_object[target.id]
+            if not source_keys or not target_keys:
+                continue
+            relations.append(
+                CompiledRelation(
+                    sources=tuple(columns[key] for key in source_keys),
+                    targets=np.array([columns[key] for key in target_keys], dtype=np.intp),
+                    # Unit pressure above neutral yields the signed unit delta for each target.
+                    signs=np.array([self._delta_for_signal(key, relationship.type, 1.5, 1.0) for key in target_keys]),
+                    effect=_RELATION_EFFECTS.get(relationship.type, 0.02),
+                )
+            )
+        return CompiledSystemModel(
+            signal_keys=signal_keys,
+            relations=tuple(relations),
+            loops=self.loop_executor.compile(system_model.loops, signal_keys),
+            drift_down=np.array([any(token in key for token in _DRIFT_DOWN_TOKENS) for key in signal_keys], dtype=bool),
+            fragility_points=self.fragility_monitor.compile(system_model.fragility_points, signal_keys),
+        )
+
+    def run_batch(
+        self,
+        *,
+        system_model: SystemModel,
+        scenarios: list[ScenarioInput],
+        initial_states: list[dict[str, float]],
+    ) -> list[SimulationResult]:
+        """Simulate several scenarios of one model as a single (scenario, signal) matrix.
+
+        Requires numpy. Initial states must share the same signal keys, which
+        holds for states derived from `SignalStateManager.initialize`.
+        """
+        np = compiled_model.np
+        if not scenarios:
+            return []
+        signal_keys = tuple(initial_states[0])
+        if any(tuple(state) != signal_keys for state in initial_states[1:]):
+            return [
+                self.run_batch(system_model=system_model, scenarios=[scenario], initial_states=[state])[0]
+                for scenario, state in zip(scenarios, initial_states)
+            ]
+        compiled = self.compile(system_model, signal_keys)
+        horizons = [scenario.time_steps for scenario in scenarios]
+        timelines: list[list[SimulationStep]] = [[SimulationStep(t=0, signals=dict(state))] for state in initial_states]
+        events: list[list[SimulationEvent]] = [[] for _ in scenarios]
+        state = np.array([[state[key] for key in signal_keys] for state in initial_states], dtype=float).reshape(
+            len(scenarios), len(signal_keys)
+        )
+
+        for time_step in range(1, max(horizons) + 1):
+            state = compiled_model.step(state, compiled)
+            rows = state.tolist()
+            active = [index for index, horizon in enumerate(horizons) if horizon >= time_step]
+            for point in compiled.fragility_points:
+                breached = compiled_model.fragility_breaches(state, point)
+                signal_key = signal_keys[point.index]
+                for index in active:
+                    if breached[index]:
+                        events[index].append(
+                            self.fragility_monitor.event_for(
+                                time_step=time_step,
+                                signal_key=signal_key,
+                                value=rows[index][point.index],
+                                point=point,
+                            )
+                        )
+            for index in active:
+                timelines[index].append(SimulationStep(t=time_step, signals=dict(zip(signal_keys, rows[index]))))
+
+        results: list[SimulationResult] = []
+        for index, scenario in enumerate(scenarios):
+            final_state = dict(timelines[index][-1].signals)
+            results.append(
+                SimulationResult(
+                    timeline=timelines[index],
+                    events=events[index],
+                    final_state=final_state,
+                    stability_score=self._stability_score(final_state, len(events[index])),
+                    metadata={
+                        "time_steps": scenario.time_steps,
+                        "event_count": len(events[index]),
+                    },
+                )
+            )
+        return results
+
+    def _run_stepwise(self, *, system_model: SystemModel, scenario: ScenarioInput, initial_state: dict[str, float]) -> SimulationResult:
+        """Dictionary-based step loop, used when numpy is unavailable."""
         timeline = [SimulationStep(t=0, signals=dict(initial_state))]
         current_state = dict(initial_state)
         events = []
@@ -130,7 +243,7 @@ class SimulationCore:
     def _apply_natural_drift(self, state: dict[str, float]) -> dict[str, float]:
         updated = dict(state)
         for key, value in state.items():
-            if any(token in key for token in ("risk", "cost", "delay", "pressure", "panic", "protest", "security")):
+            if any(token in key for token in _DRIFT_DOWN_TOKENS):
                 drift = -0.01 if value > 0.5 else 0.0
                 self.state_manager.apply_delta(updated, key, drift)
             else:
@@ -142,7 +255,7 @@ class SimulationCore:
         risk_values = [
             value
             for key, value in state.items()
-            if any(token in key for token in ("risk", "cost", "delay", "pressure", "panic", "protest", "security"))
+            if any(token in key for token in _DRIFT_DOWN_TOKENS)
         ]
         health_values = [
             value
@@ -0,0 +1,107 @@
+"""Process-pool fan-out for simulating many scenarios of one system model.
+
+Scenarios are split into contiguous chunks, one per worker. Each task ships the
+model as compact JSON-mode data plus its fingerprint, and workers keep the
+validated model per fingerprint, so a model is validated once per worker
+rather than once per chunk. Results are reassembled in input order, and each
+chunk runs the same batched core as the serial path, so output does not depend
+on the worker count.
+
+Workers are started with ``spawn``: the pool is created lazily inside a
+threaded server process, where forking can copy locks held by other threads.
+The app shuts the pools down on exit (`shutdown_simulation_pools`).
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+from engines.scenario_simulation.simulation_schema import ScenarioInput, SimulationResult
+from engines.system_modeling.model_schema import SystemModel
+
+
+logger = logging.getLogger(__name__)
+
+SIMULATION_WORKERS = int(os.getenv("NEXORA_SIMULATION_WORKERS", str(min(4, os.cpu_count() or 1))))
+# Below this many scenarios the pool's pickling and IPC cost more than they save.
+PARALLEL_MIN_SCENARIOS = int(os.getenv("NEXORA_SIMULATION_PARALLEL_MIN", "8"))
+
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+# Worker-side state.
+_WORKER_MODELS: OrderedDict[str, SystemModel] = OrderedDict()
+_WORKER_MODEL_LIMIT = 8
+_WORKER_ENGINE = None
+
+
+def should_parallelize(scenario_count: int, workers: int) -> bool:
+    return workers > 1 and scenario_count >= max(2, PARALLEL_MIN_SCENARIOS)
+
+
+def _get_pool(workers: int) -> ProcessPoolExecutor:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            pool = _POOLS[workers] = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        return pool
+
+
+def _reset_pool(workers: int) -> None:
+    with _POOLS_LOCK:
+        pool = _POOLS.pop(workers, None)
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_simulation_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _simulate_chunk(fingerprint: str, model_data: dict[str, Any], scenarios: list[ScenarioInput]) -> list[SimulationResult]:
+    global _WORKER_ENGINE
+    if _WORKER_ENGINE is None:
+        from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine
+        from engines.scenario_simulation.simulation_cache import SimulationCache
+
+        # The parent process owns the cache; workers only compute.
+        _WORKER_ENGINE = ScenarioSimulationEngine(cache=SimulationCache(0), workers=1)
+    model = _WORKER_MODELS.get(fingerprint)
+    if model is None:
+        model = _WORKER_MODELS[fingerprint] = SystemModel.model_validate(model_data)
+        while len(_WORKER_MODELS) > _WORKER_MODEL_LIMIT:
+            _WORKER_MODELS.popitem(last=False)
+    return _WORKER_ENGINE.simulate_batch(model, scenarios)
+
+
+def simulate_in_pool(
+    system_model: SystemModel,
+    scenarios: list[ScenarioInput],
+    *,
+    workers: int,
+    fingerprint: str,
+) -> list[SimulationResult] | None:
+    """Simulate ``scenarios`` across ``workers`` processes; None if the pool failed."""
+    size = -(-len(scenarios) // workers)
+    chunks = [scenarios[start : start + size] for start in range(0, len(scenarios), size)]
+    model_data = system_model.model_dump(mode="json", exclude_defaults=True)
+    try:
+        pool = _get_pool(workers)
+        futures = [pool.submit(_simulate_chunk, fingerprint, model_data, chunk) for chunk in chunks]
+        return [result for future in futures for result in future.result()]
+    except Exception:
+        logger.warning("simulation_pool_failed workers=%s scenarios=%s", workers, len(scenarios), exc_info=True)
+        _reset_pool(workers)
+        return None
@@ -4,8 +4,10 @@ from engines.war_room.war_room_engine import StrategyWarRoomEngine
 from engines.war_room.war_room_schema import (
     DominantStrategy,
     WarRoomActor,
+    WarRoomActorDistribution,
     WarRoomActorOutcome,
     WarRoomConflictEvent,
+    WarRoomMonteCarloResult,
     WarRoomResult,
     WarRoomSimulation,
     WarRoomStrategy,
@@ -16,8 +18,10 @@ __all__ = [
     "DominantStrategy",
     "StrategyWarRoomEngine",
     "WarRoomActor",
+    "WarRoomActorDistribution",
     "WarRoomActorOutcome",
     "WarRoomConflictEvent",
+    "WarRoomMonteCarloResult",
     "WarRoomResult",
     "WarRoomSimulation",
     "WarRoomStrategy",
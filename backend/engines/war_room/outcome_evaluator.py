@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import math
 from collections import Counter
 
 from engines.war_room.war_room_schema import (
     DominantStrategy,
     WarRoomActor,
+    WarRoomActorDistribution,
     WarRoomActorOutcome,
     WarRoomStrategy,
 )
@@ -66,6 +68,56 @@ class WarRoomOutcomeEvaluator:
             score=score,
         )
 
+    def actor_distributions(
+        self,
+        actors: list[WarRoomActor],
+        outcomes_by_run: list[list[WarRoomActorOutcome]],
+    ) -> list[WarRoomActorDistribution]:
+        """Summarize each actor's payoff, risk and selected strategy across runs."""
+        by_actor: dict[str, list[WarRoomActorOutcome]] = {actor.id: [] for actor in actors}
+        for outcomes in outcomes_by_run:
+            for outcome in outcomes:
+                by_actor.setdefault(outcome.actor_id, []).append(outcome)
+        distributions: list[WarRoomActorDistribution] = []
+        for actor_id, outcomes in by_actor.items():
+            strategies = Counter(item.selected_strategy for item in outcomes)
+            distributions.append(
+                WarRoomActorDistribution(
+                    actor_id=actor_id,
+                    payoff=self.distribution([item.payoff for item in outcomes]),
+                    risk_exposure=self.distribution([item.risk_exposure for item in outcomes]),
+                    strategy_frequency={
+                        name: round(count / len(outcomes), 4) for name, count in strategies.most_common()
+                    },
+                )
+            )
+        return distributions
+
+    @staticmethod
+    def distribution(values: list[float]) -> dict[str, float]:
+        """Mean, spread and linearly interpolated percentiles of ``values``."""
+        if not values:
+            return {}
+        ordered = sorted(values)
+
+        def percentile(share: float) -> float:
+            position = (len(ordered) - 1) * share
+            low = math.floor(position)
+            high = math.ceil(position)
+            return ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+        mean = sum(ordered) / len(ordered)
+        variance = sum((value - mean) ** 2 for value in ordered) / len(ordered)
+        return {
+            "mean": round(mean, 4),
+            "std": round(math.sqrt(variance), 4),
+            "min": ordered[0],
+            "p05": round(percentile(0.05), 4),
+            "p50": round(percentile(0.5), 4),
+            "p95": round(percentile(0.95), 4),
+            "max": ordered[-1],
+        }
+
     def _payoff(self, actor: WarRoomActor, final_state: dict[str, float], final_stability: float, conflict_count: int) -> float:
         value = 0.4 * final_stability
         if actor.type.lower() in {"company", "competitor", "market"}:
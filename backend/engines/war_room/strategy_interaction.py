@@ -10,6 +10,12 @@ from engines.system_modeling.model_schema import SystemModel
 from engines.war_room.war_room_schema import WarRoomActor, WarRoomStrategy
 
 
+# Market conditions above this level shift strategy preferences.
+HIGH_CONDITION = 0.55
+# Every state key `market_conditions` reads.
+MARKET_CONDITION_SIGNALS = ("system pressure", "pressure", "demand", "system risk", "security risk")
+
+
 class StrategyInteractionEngine:
     """Select actor strategies and compute combined interaction shocks."""
 
@@ -29,11 +35,58 @@ class StrategyInteractionEngine:
         recommended_by_actor: dict[str, str],
     ) -> dict[str, WarRoomStrategy]:
         """Pick one strategy per actor using deterministic best-response heuristics."""
-        selections: dict[str, WarRoomStrategy] = {}
+        pressure, demand, risk = self.market_conditions(current_state)
+        return self._select(
+            actors=actors,
+            strategies_by_actor=strategies_by_actor,
+            pressure=pressure,
+            demand=demand,
+            risk=risk,
+            recommended_by_actor=recommended_by_actor,
+        )
+
+    def market_conditions(self, current_state: dict[str, float]) -> tuple[float, float, float]:
+        """Return the pressure, demand and risk levels that strategy scoring reacts to."""
         pressure = current_state.get("system pressure", current_state.get("pressure", 0.35))
         demand = current_state.get("demand", 0.5)
         risk = current_state.get("system risk", current_state.get("security risk", 0.3))
+        return pressure, demand, risk
+
+    def selection_regime(self, current_state: dict[str, float]) -> tuple[bool, bool, bool]:
+        """Which market conditions are high; `select_strategies` depends on nothing else in the state."""
+        pressure, demand, risk = self.market_conditions(current_state)
+        return (pressure > HIGH_CONDITION, demand > HIGH_CONDITION, risk > HIGH_CONDITION)
+
+    def select_for_regime(
+        self,
+        *,
+        actors: list[WarRoomActor],
+        strategies_by_actor: dict[str, list[WarRoomStrategy]],
+        recommended_by_actor: dict[str, str],
+        regime: tuple[bool, bool, bool],
+    ) -> dict[str, WarRoomStrategy]:
+        """Return the selections `select_strategies` makes in every state of ``regime``."""
+        pressure, demand, risk = (1.0 if high else 0.0 for high in regime)
+        return self._select(
+            actors=actors,
+            strategies_by_actor=strategies_by_actor,
+            pressure=pressure,
+            demand=demand,
+            risk=risk,
+            recommended_by_actor=recommended_by_actor,
+        )
 
+    def _select(
+        self,
+        *,
+        actors: list[WarRoomActor],
+        strategies_by_actor: dict[str, list[WarRoomStrategy]],
+        pressure: float,
+        demand: float,
+        risk: float,
+        recommended_by_actor: dict[str, str],
+    ) -> dict[str, WarRoomStrategy]:
+        selections: dict[str, WarRoomStrategy] = {}
         for actor in actors:
             options = strategies_by_actor.get(actor.id, [])
             if not options:
@@ -53,6 +106,32 @@ class StrategyInteractionEngine:
             selections[actor.id] = ranked[0]
         return selections
 
+    def prime_simulations(
+        self,
+        *,
+        actors: list[WarRoomActor],
+        strategies_by_actor: dict[str, list[WarRoomStrategy]],
+        system_model: SystemModel,
+        time_steps: int,
+    ) -> None:
+        """Simulate the baseline and every actor's strategy options as one batch.
+
+        The war-room baseline, each actor's decision analysis and its scenario
+        comparison then read their results from the simulation cache, instead
+        of running one batch per actor.
+        """
+        decision_engine = self.decision_engine
+        engine = decision_engine.simulation_engine
+        if not engine.cache.max_entries or decision_engine.strategy_simulator.simulation_engine is not engine:
+            return
+        # The horizon was validated with the war-room simulation.
+        baseline = ScenarioInput.model_construct(time_steps=time_steps)
+        scenarios = [baseline, ScenarioInput()]
+        for actor in actors:
+            for action in self._candidate_actions(strategies_by_actor.get(actor.id, [])):
+                scenarios.append(decision_engine.strategy_simulator.scenario_for(baseline_scenario=baseline, action=action))
+        engine.simulate_batch(system_model, scenarios)
+
     def recommend_actor_preferences(
         self,
         *,
@@ -71,11 +150,8 @@ class StrategyInteractionEngine:
             analysis = self.decision_engine.analyze(
                 system_model=system_model,
                 simulation=baseline_simulation,
-                candidate_actions=[
-                    CandidateAction(id=strategy.id, description=strategy.description)
-                    for strategy in options
-                ],
-                scenario=ScenarioInput(time_steps=time_steps),
+                candidate_actions=self._candidate_actions(options),
+                scenario=ScenarioInput.model_construct(time_steps=time_steps),
             )
             if analysis.recommended_action is not None:
                 preferred[actor.id] = analysis.recommended_action.id
@@ -121,6 +197,10 @@ class StrategyInteractionEngine:
             shocks.append(ScenarioShock(signal="demand", delta=0.06))
         return shocks
 
+    @staticmethod
+    def _candidate_actions(options: list[WarRoomStrategy]) -> list[CandidateAction]:
+        return [CandidateAction(id=strategy.id, description=strategy.description) for strategy in options]
+
     def _score_strategy(
         self,
         *,
@@ -140,11 +220,11 @@ class StrategyInteractionEngine:
             score += 0.16
         if actor.type.lower() == "government" and any(token in strategy.name.lower() for token in ("policy", "intervention", "regulation")):
             score += 0.18
-        if pressure > 0.55 and strategy.style in {"defensive", "cooperative"}:
+        if pressure > HIGH_CONDITION and strategy.style in {"defensive", "cooperative"}:
             score += 0.12
-        if demand > 0.55 and strategy.style == "aggressive":
+        if demand > HIGH_CONDITION and strategy.style == "aggressive":
             score += 0.1
-        if risk > 0.55 and strategy.style in {"defensive", "adaptive"}:
+        if risk > HIGH_CONDITION and strategy.style in {"defensive", "adaptive"}:
             score += 0.1
         score += 0.03 * len(strategy.shocks)
         return score
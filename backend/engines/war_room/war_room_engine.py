@@ -2,24 +2,25 @@
 
 from __future__ import annotations
 
-from collections import defaultdict
+import random
+from collections import Counter
 
 from engines.scenario_simulation.fragility_monitor import FragilityMonitor
 from engines.scenario_simulation.loop_executor import LoopExecutor
 from engines.scenario_simulation.shock_applier import ScenarioShockApplier
 from engines.scenario_simulation.signal_state import SignalStateManager
 from engines.scenario_simulation.simulation_core import SimulationCore
-from engines.scenario_simulation.simulation_schema import ScenarioInput
+from engines.scenario_simulation.simulation_schema import ScenarioInput, SimulationResult
 from engines.war_room.actor_model import ActorModel
 from engines.war_room.conflict_detector import WarRoomConflictDetector
 from engines.war_room.outcome_evaluator import WarRoomOutcomeEvaluator
 from engines.war_room.strategy_interaction import StrategyInteractionEngine
 from engines.war_room.strategy_model import StrategyModel
+from engines.war_room.war_room_runner import WarRoomRun, WarRoomRunner
 from engines.war_room.war_room_schema import (
-    WarRoomActor,
+    WarRoomMonteCarloResult,
     WarRoomResult,
     WarRoomSimulation,
-    WarRoomTimelineStep,
 )
 
 
@@ -44,79 +45,16 @@ class StrategyWarRoomEngine:
 
     def run(self, simulation: WarRoomSimulation) -> WarRoomResult:
         """Execute a full war-room simulation."""
-        actors = [self.actor_model.normalize(actor) for actor in simulation.actors]
-        actors_by_id = {actor.id: actor for actor in actors}
-        strategies_by_actor = {
-            actor_id: [self.strategy_model.build(actor_id, item) for item in items]
-            for actor_id, items in simulation.strategies.items()
-        }
-        baseline = self._baseline_simulation(simulation)
-        recommended = self.interaction_engine.recommend_actor_preferences(
-            actors=actors,
-            strategies_by_actor=strategies_by_actor,
-            system_model=simulation.system_model,
-            baseline_simulation=baseline,
-            time_steps=simulation.time_steps,
-        )
-
-        current_state = self.state_manager.initialize(simulation.system_model)
-        timeline = [WarRoomTimelineStep(t=0, signals=dict(current_state), actor_strategies={})]
-        fragility_events = []
-        conflict_events = []
-        emitted_keys: set[tuple[int, str, str]] = set()
-        strategy_history: dict[str, list] = defaultdict(list)
+        runner, baseline, recommended = self._prepare(simulation)
+        (played,) = runner.run([WarRoomRun(actors=runner.actors, timeline=[])])
+        fragility_events = played.fragility_events
+        conflict_events = played.conflict_events
 
-        for time_step in range(1, simulation.time_steps + 1):
-            selections = self.interaction_engine.select_strategies(
-                actors=actors,
-                strategies_by_actor=strategies_by_actor,
-                system_model=simulation.system_model,
-                baseline_simulation=baseline,
-                time_steps=simulation.time_steps,
-                current_state=current_state,
-                recommended_by_actor=recommended,
-            )
-            for actor_id, strategy in selections.items():
-                strategy_history[actor_id].append(strategy)
-
-            current_state = self.shock_applier.apply(
-                current_state,
-                self.interaction_engine.to_shocks(selections=selections, actors_by_id=actors_by_id),
-            )
-            current_state = self.shock_applier.apply(
-                current_state,
-                self.interaction_engine.interaction_shocks(selections),
-            )
-            current_state = self.core._propagate_relationships(  # noqa: SLF001
-                current_state,
-                simulation.system_model.objects,
-                simulation.system_model.relationships,
-            )
-            current_state = self.loop_executor.apply(current_state, simulation.system_model.loops)
-            current_state = self.core._apply_natural_drift(current_state)  # noqa: SLF001
-
-            conflict_events.extend(self.conflict_detector.detect(time_step, selections))
-            fragility_events.extend(
-                self.fragility_monitor.check(
-                    time_step=time_step,
-                    state=current_state,
-                    fragility_points=simulation.system_model.fragility_points,
-                    emitted_keys=emitted_keys,
-                )
-            )
-            timeline.append(
-                WarRoomTimelineStep(
-                    t=time_step,
-                    signals=dict(current_state),
-                    actor_strategies={actor_id: strategy.name for actor_id, strategy in selections.items()},
-                )
-            )
-
-        final_stability = self.core._stability_score(current_state, len(fragility_events) + len(conflict_events))  # noqa: SLF001
+        final_stability = self.core._stability_score(played.final_state, len(fragility_events) + len(conflict_events))  # noqa: SLF001
         actor_outcomes = self.outcome_evaluator.evaluate_actor_outcomes(
-            actors=actors,
-            strategy_history=strategy_history,
-            final_state=current_state,
+            actors=runner.actors,
+            strategy_history=played.strategy_history,
+            final_state=played.final_state,
             baseline_stability=baseline.stability_score,
             final_stability=final_stability,
             conflict_count=len(conflict_events),
@@ -128,7 +66,7 @@ class StrategyWarRoomEngine:
             "thresholds": [point.signal for point in simulation.system_model.fragility_points],
         }
         return WarRoomResult(
-            timeline=timeline,
+            timeline=played.timeline or [],
             strategy_paths=actor_outcomes,
             actor_outcomes=actor_outcomes,
             conflict_events=conflict_events,
@@ -142,8 +80,107 @@ class StrategyWarRoomEngine:
             },
         )
 
-    def _baseline_simulation(self, simulation: WarRoomSimulation):
+    def run_monte_carlo(
+        self,
+        simulation: WarRoomSimulation,
+        *,
+        runs: int = 100,
+        noise: float = 0.0,
+        seed: int = 0,
+        shuffle_actors: bool = True,
+    ) -> WarRoomMonteCarloResult:
+        """Play many randomized runs and return outcome distributions.
+
+        Each run draws its actor order (when ``shuffle_actors``) and a
+        Gaussian perturbation of standard deviation ``noise`` for every actor
+        shock from its own generator seeded off ``seed``, so results are
+        reproducible per seed. All runs share the precompiled model, the
+        decision-engine preferences and one state matrix.
+        """
+        if runs < 1:
+            raise ValueError("runs must be at least 1")
+        if noise < 0.0:
+            raise ValueError("noise must be non-negative")
+        runner, baseline, _ = self._prepare(simulation)
+        rng = random.Random(seed)
+        batch = []
+        for _ in range(runs):
+            run_rng = random.Random(rng.getrandbits(64))
+            order = run_rng.sample(runner.actors, len(runner.actors)) if shuffle_actors else list(runner.actors)
+            batch.append(WarRoomRun(actors=order, rng=run_rng))
+        runner.run(batch, noise=noise)
+
+        stability_scores: list[float] = []
+        outcomes_by_run = []
+        dominant: Counter[str] = Counter()
+        for played in batch:
+            conflict_count = len(played.conflict_events)
+            final_stability = self.core._stability_score(  # noqa: SLF001
+                played.final_state, len(played.fragility_events) + conflict_count
+            )
+            outcomes = self.outcome_evaluator.evaluate_actor_outcomes(
+                actors=played.actors,
+                strategy_history=played.strategy_history,
+                final_state=played.final_state,
+                baseline_stability=baseline.stability_score,
+                final_stability=final_stability,
+                conflict_count=conflict_count,
+            )
+            winner = self.outcome_evaluator.dominant_strategy(outcomes)
+            if winner is not None:
+                dominant[f"{winner.actor_id}:{winner.strategy}"] += 1
+            stability_scores.append(final_stability)
+            outcomes_by_run.append(outcomes)
+
+        distribution = self.outcome_evaluator.distribution
+        return WarRoomMonteCarloResult(
+            runs=runs,
+            seed=seed,
+            noise=noise,
+            stability_score=distribution(stability_scores),
+            conflict_count=distribution([float(len(played.conflict_events)) for played in batch]),
+            fragility_event_count=distribution([float(len(played.fragility_events)) for played in batch]),
+            actor_distributions=self.outcome_evaluator.actor_distributions(runner.actors, outcomes_by_run),
+            dominant_strategy_frequency={key: round(count / runs, 4) for key, count in dominant.most_common()},
+            metadata={
+                "time_steps": simulation.time_steps,
+                "baseline_stability": baseline.stability_score,
+                "shuffle_actors": shuffle_actors,
+            },
+        )
+
+    def _prepare(self, simulation: WarRoomSimulation) -> tuple[WarRoomRunner, SimulationResult, dict[str, str]]:
+        """Normalize inputs, derive actor preferences and compile the shared model once."""
+        actors = [self.actor_model.normalize(actor) for actor in simulation.actors]
+        strategies_by_actor = {
+            actor_id: [self.strategy_model.build(actor_id, item) for item in items]
+            for actor_id, items in simulation.strategies.items()
+        }
+        self.interaction_engine.prime_simulations(
+            actors=actors,
+            strategies_by_actor=strategies_by_actor,
+            system_model=simulation.system_model,
+            time_steps=simulation.time_steps,
+        )
+        baseline = self._baseline_simulation(simulation)
+        recommended = self.interaction_engine.recommend_actor_preferences(
+            actors=actors,
+            strategies_by_actor=strategies_by_actor,
+            system_model=simulation.system_model,
+            baseline_simulation=baseline,
+            time_steps=simulation.time_steps,
+        )
+        runner = WarRoomRunner(
+            self,
+            simulation=simulation,
+            actors=actors,
+            strategies_by_actor=strategies_by_actor,
+            recommended=recommended,
+        )
+        return runner, baseline, recommended
+
+    def _baseline_simulation(self, simulation: WarRoomSimulation) -> SimulationResult:
         return self.interaction_engine.decision_engine.simulation_engine.simulate(
             simulation.system_model,
-            ScenarioInput(time_steps=simulation.time_steps),
+            ScenarioInput.model_construct(time_steps=simulation.time_steps),
         )
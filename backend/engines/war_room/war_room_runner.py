@@ -0,0 +1,221 @@
+"""Compiled, batched execution of war-room timelines.
+
+`WarRoomRunner` resolves everything the step loop would otherwise look up by
+name once per simulation: shock targets become state columns, the system
+model is compiled with `SimulationCore.compile`, and each actor's best
+response is cached per market regime, because strategy selection depends on
+the state only through the threshold tests of
+`StrategyInteractionEngine.selection_regime`. Runs then advance together as
+the rows of one ``(runs, signals)`` matrix.
+
+Shocks are applied to each row in the order `ScenarioShockApplier` applies
+them and clamped after every shock, so a run with the declared actor order and
+no noise reproduces the stepwise dictionary timeline exactly.
+"""
+
+from __future__ import annotations
+
+import random
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from engines.scenario_simulation import compiled_model
+from engines.scenario_simulation.simulation_schema import ScenarioShock, SimulationEvent
+from engines.war_room.strategy_interaction import MARKET_CONDITION_SIGNALS
+from engines.war_room.war_room_schema import (
+    WarRoomActor,
+    WarRoomConflictEvent,
+    WarRoomSimulation,
+    WarRoomStrategy,
+    WarRoomTimelineStep,
+)
+
+if TYPE_CHECKING:
+    from engines.war_room.war_room_engine import StrategyWarRoomEngine
+
+
+Regime = tuple[bool, bool, bool]
+ShockOps = tuple[tuple[tuple[int, ...], float], ...]
+
+
+@dataclass
+class WarRoomRun:
+    """One war-room run: the actor order it plays in and what happened.
+
+    ``rng`` draws the shock noise; ``timeline`` is only recorded when it
+    starts out as a list.
+    """
+
+    actors: list[WarRoomActor]
+    rng: random.Random | None = None
+    timeline: list[WarRoomTimelineStep] | None = None
+    strategy_history: dict[str, list[WarRoomStrategy]] = field(default_factory=lambda: defaultdict(list))
+    conflict_events: list[WarRoomConflictEvent] = field(default_factory=list)
+    fragility_events: list[SimulationEvent] = field(default_factory=list)
+    final_state: dict[str, float] = field(default_factory=dict)
+    emitted_keys: set[tuple[int, str, str]] = field(default_factory=set)
+    selections: dict[Regime, dict[str, WarRoomStrategy]] = field(default_factory=dict)
+
+
+class WarRoomRunner:
+    """Advance war-room runs over one precompiled system model."""
+
+    def __init__(
+        self,
+        engine: StrategyWarRoomEngine,
+        *,
+        simulation: WarRoomSimulation,
+        actors: list[WarRoomActor],
+        strategies_by_actor: dict[str, list[WarRoomStrategy]],
+        recommended: dict[str, str],
+    ) -> None:
+        self.engine = engine
+        self.simulation = simulation
+        self.actors = actors
+        self.actors_by_id = {actor.id: actor for actor in actors}
+        self.strategies_by_actor = strategies_by_actor
+        self.recommended = recommended
+        self.initial_state = engine.state_manager.initialize(simulation.system_model)
+        self.signal_keys = tuple(self.initial_state)
+        self.compiled = (
+            engine.core.compile(simulation.system_model, self.signal_keys) if compiled_model.np is not None else None
+        )
+        self._condition_columns = tuple(
+            (key, index) for index, key in enumerate(self.signal_keys) if key in MARKET_CONDITION_SIGNALS
+        )
+        self._targets: dict[str, tuple[int, ...]] = {}
+        self._selections: dict[Regime, dict[str, WarRoomStrategy]] = {}
+        self._strategy_ops: dict[tuple[str, str], ShockOps] = {}
+        self._interaction_ops: dict[Regime, ShockOps] = {}
+
+    def run(self, runs: list[WarRoomRun], *, noise: float = 0.0) -> list[WarRoomRun]:
+        """Play every run for the simulation's horizon; noise perturbs each actor shock delta."""
+        engine = self.engine
+        clamp = engine.state_manager.clamp
+        rows = [list(self.initial_state.values()) for _ in runs]
+        for run in runs:
+            if run.timeline is not None:
+                run.timeline.append(WarRoomTimelineStep(t=0, signals=dict(self.initial_state), actor_strategies={}))
+
+        for time_step in range(1, self.simulation.time_steps + 1):
+            step_selections = []
+            for run, row in zip(runs, rows):
+                regime = engine.interaction_engine.selection_regime(
+                    {key: row[index] for key, index in self._condition_columns}
+                )
+                selections = run.selections.get(regime)
+                if selections is None:
+                    chosen = self._selections_for(regime)
+                    selections = run.selections[regime] = {
+                        actor.id: chosen[actor.id] for actor in run.actors if actor.id in chosen
+                    }
+                step_selections.append(selections)
+                noisy = noise > 0.0 and run.rng is not None
+                for actor_id, strategy in selections.items():
+                    run.strategy_history[actor_id].append(strategy)
+                    for columns, delta in self._ops_for_strategy(actor_id, strategy):
+                        if noisy:
+                            delta = max(min(delta + run.rng.gauss(0.0, noise), 1.0), -1.0)
+                        for column in columns:
+                            row[column] = clamp(row[column] + delta)
+                for columns, delta in self._ops_for_interaction(regime):
+                    for column in columns:
+                        row[column] = clamp(row[column] + delta)
+                run.conflict_events.extend(engine.conflict_detector.detect(time_step, selections))
+
+            rows = self._advance(runs, rows, time_step)
+
+            for run, row, selections in zip(runs, rows, step_selections):
+                if run.timeline is not None:
+                    run.timeline.append(
+                        WarRoomTimelineStep(
+                            t=time_step,
+                            signals=dict(zip(self.signal_keys, row)),
+                            actor_strategies={actor_id: strategy.name for actor_id, strategy in selections.items()},
+                        )
+                    )
+
+        for run, row in zip(runs, rows):
+            run.final_state = dict(zip(self.signal_keys, row))
+        return runs
+
+    def _advance(self, runs: list[WarRoomRun], rows: list[list[float]], time_step: int) -> list[list[float]]:
+        engine = self.engine
+        if self.compiled is None:
+            return [self._advance_stepwise(run, row, time_step) for run, row in zip(runs, rows)]
+        np = compiled_model.np
+        state = compiled_model.step(np.array(rows, dtype=float).reshape(len(rows), len(self.signal_keys)), self.compiled)
+        rows = state.tolist()
+        for point in self.compiled.fragility_points:
+            signal_key = self.signal_keys[point.index]
+            for index in np.flatnonzero(compiled_model.fragility_breaches(state, point)).tolist():
+                runs[index].fragility_events.append(
+                    engine.fragility_monitor.event_for(
+                        time_step=time_step,
+                        signal_key=signal_key,
+                        value=rows[index][point.index],
+                        point=point,
+                    )
+                )
+        return rows
+
+    def _advance_stepwise(self, run: WarRoomRun, row: list[float], time_step: int) -> list[float]:
+        """Dictionary-based step, used when numpy is unavailable."""
+        engine = self.engine
+        system_model = self.simulation.system_model
+        state = dict(zip(self.signal_keys, row))
+        state = engine.core._propagate_relationships(state, system_model.objects, system_model.relationships)  # noqa: SLF001
+        state = engine.loop_executor.apply(state, system_model.loops)
+        state = engine.core._apply_natural_drift(state)  # noqa: SLF001
+        run.fragility_events.extend(
+            engine.fragility_monitor.check(
+                time_step=time_step,
+                state=state,
+                fragility_points=system_model.fragility_points,
+                emitted_keys=run.emitted_keys,
+            )
+        )
+        return [state[key] for key in self.signal_keys]
+
+    def _selections_for(self, regime: Regime) -> dict[str, WarRoomStrategy]:
+        selections = self._selections.get(regime)
+        if selections is None:
+            selections = self._selections[regime] = self.engine.interaction_engine.select_for_regime(
+                actors=self.actors,
+                strategies_by_actor=self.strategies_by_actor,
+                recommended_by_actor=self.recommended,
+                regime=regime,
+            )
+        return selections
+
+    def _ops_for_strategy(self, actor_id: str, strategy: WarRoomStrategy) -> ShockOps:
+        key = (actor_id, strategy.id)
+        ops = self._strategy_ops.get(key)
+        if ops is None:
+            shocks = self.engine.interaction_engine.to_shocks(
+                selections={actor_id: strategy},
+                actors_by_id=self.actors_by_id,
+            )
+            ops = self._strategy_ops[key] = self._compile_shocks(shocks)
+        return ops
+
+    def _ops_for_interaction(self, regime: Regime) -> ShockOps:
+        ops = self._interaction_ops.get(regime)
+        if ops is None:
+            # Interaction shocks depend on which strategies were chosen, not on actor order.
+            shocks = self.engine.interaction_engine.interaction_shocks(self._selections_for(regime))
+            ops = self._interaction_ops[regime] = self._compile_shocks(shocks)
+        return ops
+
+    def _compile_shocks(self, shocks: list[ScenarioShock]) -> ShockOps:
+        ops = []
+        for shock in shocks:
+            columns = self._targets.get(shock.signal)
+            if columns is None:
+                columns = self._targets[shock.signal] = self.engine.shock_applier.compile_targets(
+                    shock.signal, self.signal_keys
+                )
+            if columns:
+                ops.append((columns, shock.delta))
+        return tuple(ops)
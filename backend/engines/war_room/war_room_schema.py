@@ -81,6 +81,29 @@ class WarRoomResult(BaseModel):
     metadata: dict[str, Any] = Field(default_factory=dict)
 
 
+class WarRoomActorDistribution(BaseModel):
+    """Outcome distribution for one actor across Monte Carlo war-room runs."""
+
+    actor_id: str
+    payoff: dict[str, float] = Field(default_factory=dict)
+    risk_exposure: dict[str, float] = Field(default_factory=dict)
+    strategy_frequency: dict[str, float] = Field(default_factory=dict)
+
+
+class WarRoomMonteCarloResult(BaseModel):
+    """Outcome distributions over many randomized war-room runs."""
+
+    runs: int = Field(ge=1)
+    seed: int
+    noise: float = Field(ge=0.0)
+    stability_score: dict[str, float] = Field(default_factory=dict)
+    conflict_count: dict[str, float] = Field(default_factory=dict)
+    fragility_event_count: dict[str, float] = Field(default_factory=dict)
+    actor_distributions: list[WarRoomActorDistribution] = Field(default_factory=list)
+    dominant_strategy_frequency: dict[str, float] = Field(default_factory=dict)
+    metadata: dict[str, Any] = Field(default_factory=dict)
+
+
 class WarRoomSimulation(BaseModel):
     """Input payload for a war-room simulation."""
 
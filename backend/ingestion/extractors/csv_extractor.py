@@ -4,7 +4,50 @@ from __future__ import annotations
 
 import csv
 import io
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+
+_SNIFF_SAMPLE_CHARS = 4096
+
+
+@dataclass(frozen=True)
+class CsvSamplingPolicy:
+    """Which data rows a streaming read feeds to the signal builder.
+
+    ``every_nth`` keeps one row out of every N (the first row always counts);
+    ``max_rows`` stops the read once that many rows have been kept.
+    """
+
+    every_nth: int = 1
+    max_rows: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.every_nth < 1:
+            raise ValueError("every_nth must be >= 1")
+        if self.max_rows is not None and self.max_rows < 1:
+            raise ValueError("max_rows must be >= 1")
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "CsvSamplingPolicy":
+        every_nth = config.get("sample_every")
+        max_rows = config.get("max_rows")
+        return cls(
+            every_nth=int(every_nth) if every_nth is not None else 1,
+            max_rows=int(max_rows) if max_rows is not None else None,
+        )
+
+
+@dataclass
+class CsvStreamProgress:
+    """Running counters of a streaming CSV read."""
+
+    columns: list[str] = field(default_factory=list)
+    rows_read: int = 0
+    rows_processed: int = 0
+    batches: int = 0
+    signals: int = 0
 
 
 def _read_csv_payload(payload: str) -> str:
@@ -16,29 +59,89 @@ def _read_csv_payload(payload: str) -> str:
     raise ValueError("CSV payload must be raw CSV content or a valid file path.")
 
 
+def _row_fragment(header: list[str], row: list[str]) -> str:
+    pairs: list[str] = []
+    for index, cell in enumerate(row):
+        key = str(header[index]).strip() if index < len(header) else f"column_{index + 1}"
+        value = str(cell).strip()
+        if not value:
+            continue
+        pairs.append(f"{key}: {value}")
+    return "; ".join(pairs)
+
+
+def columns_line(header: list[str]) -> str:
+    return "Columns: " + ", ".join(str(cell).strip() for cell in header if str(cell).strip())
+
+
+def _non_empty_rows(reader: Iterable[list[str]]) -> Iterator[list[str]]:
+    return (row for row in reader if any(str(cell).strip() for cell in row))
+
+
 def extract_text(payload: str) -> str:
     """Flatten CSV rows into deterministic readable text."""
     raw_csv = _read_csv_payload(payload)
-    buffer = io.StringIO(raw_csv)
-    reader = csv.reader(buffer)
-    rows = [row for row in reader if any(str(cell).strip() for cell in row)]
-    if not rows:
+    rows = _non_empty_rows(csv.reader(io.StringIO(raw_csv)))
+    header = next(rows, None)
+    if header is None:
         return ""
 
-    header = rows[0]
-    body = rows[1:] if len(rows) > 1 else []
-    if not body:
-        return "Columns: " + ", ".join(str(cell).strip() for cell in header if str(cell).strip())
-
-    fragments: list[str] = []
-    for row in body:
-        pairs: list[str] = []
-        for index, cell in enumerate(row):
-            key = str(header[index]).strip() if index < len(header) else f"column_{index + 1}"
-            value = str(cell).strip()
-            if not value:
-                continue
-            pairs.append(f"{key}: {value}")
-        if pairs:
-            fragments.append("; ".join(pairs))
+    fragments = [fragment for fragment in (_row_fragment(header, row) for row in rows) if fragment]
+    if not fragments:
+        return columns_line(header)
     return "\n".join(fragments)
+
+
+def _sniff_dialect(handle: TextIO) -> type[csv.Dialect] | csv.Dialect:
+    sample = handle.read(_SNIFF_SAMPLE_CHARS)
+    handle.seek(0)
+    if len(sample) >= 2:
+        try:
+            return csv.Sniffer().sniff(sample, delimiters=",;\t")
+        except csv.Error:
+            pass
+    return csv.get_dialect("excel")
+
+
+def iter_fragment_batches(
+    path: str | Path,
+    *,
+    batch_size: int = 5000,
+    sampling: CsvSamplingPolicy | None = None,
+    progress: CsvStreamProgress | None = None,
+) -> Iterator[list[str]]:
+    """Stream a CSV file as batches of row fragments (same text as `extract_text`).
+
+    Only one batch is held in memory at a time, so file size is unbounded.
+    ``progress`` is updated in place before each batch is yielded.
+    """
+    policy = sampling or CsvSamplingPolicy()
+    state = progress if progress is not None else CsvStreamProgress()
+    batch_size = max(1, int(batch_size))
+
+    with Path(path).expanduser().open("r", encoding="utf-8", errors="replace", newline="") as handle:
+        rows = _non_empty_rows(csv.reader(handle, dialect=_sniff_dialect(handle)))
+        header = next(rows, None)
+        if header is None:
+            return
+        state.columns = [str(cell).strip() for cell in header if str(cell).strip()]
+
+        batch: list[str] = []
+        for row in rows:
+            state.rows_read += 1
+            if (state.rows_read - 1) % policy.every_nth:
+                continue
+            fragment = _row_fragment(header, row)
+            if not fragment:
+                continue
+            batch.append(fragment)
+            state.rows_processed += 1
+            if len(batch) >= batch_size:
+                state.batches += 1
+                yield batch
+                batch = []
+            if policy.max_rows is not None and state.rows_processed >= policy.max_rows:
+                break
+        if batch:
+            state.batches += 1
+            yield batch
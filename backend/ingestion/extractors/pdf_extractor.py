@@ -1,34 +1,268 @@
-"""PDF extractor for Nexora ingestion."""
+"""PDF extractor for Nexora ingestion.
+
+Pages are extracted in contiguous ranges on a shared process pool and handed
+back in page order as soon as each prefix of the document is complete, so the
+caller can feed signal building while later pages are still being parsed.
+Extracted page text is cached by file content hash and page number; ingesting
+the same document again does not reopen the parser.
+
+Pool workers are started with ``spawn``, since the pool is created lazily
+inside a threaded server process; the app calls `shutdown_pdf_pool` on exit.
+"""
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import partial
 from pathlib import Path
+from typing import Iterator
 
+from ingestion.result_cache import file_digest
 
-def extract_text(payload: str) -> str:
-    """Extract text from a PDF file path using available lightweight readers."""
-    path = Path(payload).expanduser()
-    if not path.exists() or not path.is_file():
-        raise ValueError("PDF payload must be a valid file path.")
 
-    reader_cls = None
+PARALLEL_MIN_PAGES = 24
+PAGES_PER_TASK = 16
+MAX_WORKERS = max(1, min(4, (os.cpu_count() or 1)))
+PAGE_CACHE_MAX_PAGES = 4096
+
+_POOL: ProcessPoolExecutor | None = None
+_POOL_LOCK = threading.Lock()
+
+
+def _reader_cls():
     try:
-        from pypdf import PdfReader as reader_cls  # type: ignore
+        from pypdf import PdfReader  # type: ignore
     except Exception:
         try:
-            from PyPDF2 import PdfReader as reader_cls  # type: ignore
+            from PyPDF2 import PdfReader  # type: ignore
         except Exception as exc:
             raise RuntimeError("PDF extraction requires pypdf or PyPDF2.") from exc
+    return PdfReader
+
+
+def _resolve_path(payload: str) -> Path:
+    path = Path(payload).expanduser()
+    if not path.exists() or not path.is_file():
+        raise ValueError("PDF payload must be a valid file path.")
+    return path
+
+
+class PageTextCache:
+    """LRU of extracted page text keyed by ``(content digest, page index)``."""
+
+    def __init__(self, max_pages: int = PAGE_CACHE_MAX_PAGES) -> None:
+        self.max_pages = max(0, int(max_pages))
+        self._entries: OrderedDict[tuple[str, int], str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, digest: str, page: int) -> str | None:
+        with self._lock:
+            text = self._entries.get((digest, page))
+            if text is not None:
+                self._entries.move_to_end((digest, page))
+            return text
+
+    def put(self, digest: str, page: int, text: str) -> None:
+        if not self.max_pages:
+            return
+        with self._lock:
+            self._entries[(digest, page)] = text
+            self._entries.move_to_end((digest, page))
+            while len(self._entries) > self.max_pages:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+PAGE_CACHE = PageTextCache()
+
+
+@dataclass
+class PdfExtractionProgress:
+    """Running counters of one page-streamed extraction."""
+
+    page_count: int = 0
+    pages_planned: int = 0
+    pages_done: int = 0
+    pages_cached: int = 0
+    truncated_reason: str | None = None
+    digest: str = ""
+    parallel: bool = False
+    pages_with_text: int = 0
+
 
-    reader = reader_cls(str(path))
-    pages: list[str] = []
-    for page in getattr(reader, "pages", []):
+def _page_text(page) -> str:
+    try:
+        text = page.extract_text() or ""
+    except Exception:
+        text = ""
+    return text.strip()
+
+
+def _extract_range(path: str, start: int, stop: int) -> list[str]:
+    """Process-pool task: text of pages ``start..stop-1`` of one file."""
+    reader = _reader_cls()(path)
+    return [_page_text(reader.pages[index]) for index in range(start, stop)]
+
+
+def _cache_range(cache: PageTextCache, digest: str, start: int, future: Future) -> None:
+    # Ranges still running when a time budget expires land in the cache for next time.
+    if future.cancelled() or future.exception() is not None:
+        return
+    for offset, text in enumerate(future.result()):
+        cache.put(digest, start + offset, text)
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _POOL
+    with _POOL_LOCK:
+        if _POOL is None:
+            _POOL = ProcessPoolExecutor(max_workers=MAX_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _POOL
+
+
+def _reset_pool() -> None:
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def shutdown_pdf_pool() -> None:
+    """Stop the extraction workers; the next pooled extraction starts a new pool."""
+    global _POOL
+    with _POOL_LOCK:
+        pool, _POOL = _POOL, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _missing_ranges(missing: list[int], size: int) -> list[tuple[int, int]]:
+    ranges: list[tuple[int, int]] = []
+    for index in missing:
+        if ranges and ranges[-1][1] == index and index - ranges[-1][0] < size:
+            ranges[-1] = (ranges[-1][0], index + 1)
+        else:
+            ranges.append((index, index + 1))
+    return ranges
+
+
+def iter_page_texts(
+    payload: str,
+    *,
+    max_pages: int | None = None,
+    time_budget_s: float | None = None,
+    parallel: bool | None = None,
+    cache: PageTextCache | None = PAGE_CACHE,
+    progress: PdfExtractionProgress | None = None,
+) -> Iterator[tuple[int, str]]:
+    """Yield ``(page index, stripped text)`` in page order.
+
+    ``max_pages`` limits how many leading pages are read; ``time_budget_s``
+    stops handing out pages once the budget is spent (pages already done are
+    still yielded). ``parallel=None`` uses the process pool when more than one
+    CPU is available and at least `PARALLEL_MIN_PAGES` pages are uncached.
+    """
+    path = _resolve_path(payload)
+    state = progress if progress is not None else PdfExtractionProgress()
+    deadline = time.monotonic() + time_budget_s if time_budget_s is not None else None
+    state.digest = digest = file_digest(path)
+
+    reader = _reader_cls()(str(path))
+    state.page_count = len(getattr(reader, "pages", []))
+    planned = state.page_count if max_pages is None else min(state.page_count, max(0, int(max_pages)))
+    if planned < state.page_count:
+        state.truncated_reason = "max_pages"
+    state.pages_planned = planned
+
+    texts: dict[int, str] = {}
+    missing: list[int] = []
+    for index in range(planned):
+        cached = cache.get(digest, index) if cache is not None else None
+        if cached is None:
+            missing.append(index)
+        else:
+            texts[index] = cached
+            state.pages_cached += 1
+
+    def finished(index: int, text: str) -> None:
+        texts[index] = text
+        if cache is not None:
+            cache.put(digest, index, text)
+
+    def over_budget() -> bool:
+        return deadline is not None and time.monotonic() >= deadline
+
+    if parallel is None:
+        parallel = MAX_WORKERS > 1 and len(missing) >= PARALLEL_MIN_PAGES
+    futures: dict[Future, tuple[int, int]] = {}
+    if parallel and missing:
         try:
-            page_text = page.extract_text() or ""
-        except Exception:
-            page_text = ""
-        page_text = page_text.strip()
-        if page_text:
-            pages.append(page_text)
-    return "\n\n".join(pages)
+            pool = _get_pool()
+            for start, stop in _missing_ranges(missing, PAGES_PER_TASK):
+                future = pool.submit(_extract_range, str(path), start, stop)
+                if cache is not None:
+                    future.add_done_callback(partial(_cache_range, cache, digest, start))
+                futures[future] = (start, stop)
+            state.parallel = True
+        except (BrokenProcessPool, RuntimeError, OSError):
+            _reset_pool()
+            for future in futures:
+                future.cancel()
+            futures = {}
+
+    next_page = 0
+    pending_local = [] if futures else list(missing)
+    try:
+        while next_page < planned:
+            if next_page in texts:
+                text = texts.pop(next_page)
+                state.pages_done += 1
+                if text:
+                    state.pages_with_text += 1
+                    yield next_page, text
+                next_page += 1
+                continue
+            if over_budget():
+                state.truncated_reason = "time_budget"
+                break
+            if pending_local:
+                index = pending_local.pop(0)
+                finished(index, _page_text(reader.pages[index]))
+                continue
+            if not futures:
+                break
+            timeout = max(0.0, deadline - time.monotonic()) if deadline is not None else None
+            done, _ = wait(list(futures), timeout=timeout, return_when=FIRST_COMPLETED)
+            for future in done:
+                start, stop = futures.pop(future)
+                try:
+                    page_texts = future.result()
+                except Exception as exc:
+                    # A worker crash or parse error falls back to this thread.
+                    if isinstance(exc, BrokenProcessPool):
+                        _reset_pool()
+                    page_texts = [_page_text(reader.pages[index]) for index in range(start, stop)]
+                for offset, text in enumerate(page_texts):
+                    finished(start + offset, text)
+    finally:
+        for future in futures:
+            future.cancel()
 
+
+def extract_text(payload: str) -> str:
+    """Extract text from a PDF file path using available lightweight readers."""
+    return "\n\n".join(text for _, text in iter_page_texts(payload))
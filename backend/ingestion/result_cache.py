@@ -0,0 +1,214 @@
+"""Content-addressed on-disk cache of ingestion results.
+
+Entries are whole `SignalBundle`s stored as one JSON file per key under
+``data/ingestion_cache``. Keys hash the input type, a content fingerprint (file
+hash, or a connector's source identity), the request options and metadata, and
+`RULE_TABLE_VERSION`, so editing the signal rules never serves stale signals.
+Least recently used entries are evicted once either the entry count or the
+total size limit is exceeded.
+
+An entry may carry HTTP validators (ETag / Last-Modified); connectors that
+declare ``revalidate`` send them on the next fetch and reuse the entry on a
+``304 Not Modified``.
+
+Caches created without ``root`` use ``NEXORA_INGESTION_CACHE_DIR``, falling back
+to ``data/ingestion_cache``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from ingestion.schemas import SignalBundle
+from ingestion.signal_builder import RULE_TABLE_VERSION
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_DIR = Path(__file__).resolve().parents[1] / "data" / "ingestion_cache"
+CACHE_MAX_ENTRIES = 512
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+# Bump when extraction output changes in ways the rule-table version does not cover.
+CACHE_FORMAT_VERSION = 1
+
+
+def file_digest(path: Path) -> str:
+    """SHA-256 of a file's content, read in 1 MiB blocks."""
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def cache_key(
+    kind: str,
+    fingerprint: str,
+    *,
+    options: dict[str, Any] | None = None,
+    metadata: dict | None = None,
+) -> str:
+    material = json.dumps(
+        [CACHE_FORMAT_VERSION, RULE_TABLE_VERSION, kind, fingerprint, options or {}, metadata or {}],
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedIngestion:
+    bundle: SignalBundle
+    validators: dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidated: int = 0
+    stores: int = 0
+    evictions: int = 0
+
+
+class IngestionResultCache:
+    """LRU of serialized `SignalBundle`s on disk, bounded by entries and bytes."""
+
+    def __init__(
+        self,
+        root: Path | None = None,
+        *,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        max_bytes: int = CACHE_MAX_BYTES,
+    ) -> None:
+        self.root = Path(root or os.getenv("NEXORA_INGESTION_CACHE_DIR") or CACHE_DIR)
+        self.max_entries = max(1, int(max_entries))
+        self.max_bytes = max(1, int(max_bytes))
+        self.stats = CacheStats()
+        self._sizes: OrderedDict[str, int] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._load_index()
+
+    def _load_index(self) -> None:
+        if not self.root.is_dir():
+            return
+        files = sorted(self.root.glob("*.json"), key=lambda path: path.stat().st_mtime_ns)
+        for path in files:
+            size = path.stat().st_size
+            self._sizes[path.stem] = size
+            self._bytes += size
+
+    def _path(self, key: str) -> Path:
+        return self.root / f"{key}.json"
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def get(self, key: str, *, count: bool = True) -> CachedIngestion | None:
+        """Load an entry; ``count=False`` defers hit/miss accounting to `record_revalidation`."""
+        with self._lock:
+            if key not in self._sizes:
+                if count:
+                    self.stats.misses += 1
+                return None
+            try:
+                data = json.loads(self._path(key).read_text(encoding="utf-8"))
+                entry = CachedIngestion(
+                    bundle=SignalBundle.model_validate(data["bundle"]),
+                    validators=dict(data.get("validators") or {}),
+                )
+            except Exception:
+                logger.warning("ingestion_cache_entry_unreadable key=%s", key)
+                self._drop(key)
+                if count:
+                    self.stats.misses += 1
+                return None
+            self._sizes.move_to_end(key)
+            if count:
+                self.stats.hits += 1
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, bundle: SignalBundle, *, validators: dict[str, str] | None = None) -> None:
+        payload = json.dumps(
+            {"bundle": bundle.model_dump(mode="json"), "validators": validators or {}},
+            ensure_ascii=True,
+        )
+        size = len(payload)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self.root.mkdir(parents=True, exist_ok=True)
+            path = self._path(key)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(payload, encoding="utf-8")
+            tmp_path.replace(path)
+            self._bytes += size - self._sizes.pop(key, 0)
+            self._sizes[key] = size
+            self.stats.stores += 1
+            while len(self._sizes) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._sizes))
+                self._drop(oldest)
+                self.stats.evictions += 1
+
+    def record_revalidation(self, *, not_modified: bool) -> None:
+        with self._lock:
+            if not_modified:
+                self.stats.hits += 1
+                self.stats.revalidated += 1
+            else:
+                self.stats.misses += 1
+
+    def _drop(self, key: str) -> None:
+        self._bytes -= self._sizes.pop(key, 0)
+        try:
+            self._path(key).unlink()
+        except OSError:
+            pass
+
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self._sizes):
+                self._drop(key)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.stats.hits + self.stats.misses
+            return {
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "hit_rate": round(self.stats.hits / lookups, 4) if lookups else 0.0,
+                "revalidated": self.stats.revalidated,
+                "stores": self.stats.stores,
+                "evictions": self.stats.evictions,
+                "entries": len(self._sizes),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "rule_table_version": RULE_TABLE_VERSION,
+            }
+
+
+_SHARED_CACHE: IngestionResultCache | None = None
+_SHARED_LOCK = threading.Lock()
+
+
+def get_result_cache() -> IngestionResultCache:
+    """Process-wide cache used by the ingestion router and multi-source runs."""
+    global _SHARED_CACHE
+    with _SHARED_LOCK:
+        if _SHARED_CACHE is None:
+            _SHARED_CACHE = IngestionResultCache()
+        return _SHARED_CACHE
@@ -19,6 +19,7 @@ from ingestion.schemas import (
     TextIngestionRequest,
     TextIngestionResponse,
 )
+from ingestion.result_cache import get_result_cache
 from ingestion.service import IngestionService
 
 
@@ -29,7 +30,7 @@ router = APIRouter(prefix="/ingestion", tags=["ingestion"])
 
 def get_ingestion_service() -> IngestionService:
     """Return the shared ingestion service."""
-    return IngestionService()
+    return IngestionService(result_cache=get_result_cache())
 
 
 @router.get(
@@ -44,6 +45,15 @@ async def list_connectors() -> ConnectorCatalogResponse:
     return ConnectorCatalogResponse(connectors=definitions)
 
 
+@router.get(
+    "/cache/stats",
+    summary="Ingestion result cache counters",
+)
+async def ingestion_cache_stats() -> dict:
+    """Hit/miss/revalidation counters and size of the shared ingestion result cache."""
+    return {"ok": True, "cache": get_result_cache().snapshot()}
+
+
 @router.post(
     "/connector/run",
     response_model=TextIngestionResponse,
@@ -2,17 +2,28 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+from uuid import uuid4
 
 from ingestion.extractors import csv_extractor, pdf_extractor, text_extractor, web_extractor
-from ingestion.schemas import SignalBundle, SourceDocument, SourceDocumentType
-from ingestion.signal_builder import build_signals
+from ingestion.extractors.csv_extractor import CsvSamplingPolicy, CsvStreamProgress
+from ingestion.extractors.pdf_extractor import PdfExtractionProgress
+from ingestion.result_cache import IngestionResultCache, cache_key, file_digest
+from ingestion.schemas import Signal, SignalBundle, SourceDocument, SourceDocumentType
+from ingestion.signal_builder import SignalAccumulator, build_signals
 
 
 logger = logging.getLogger(__name__)
 
+CSV_STREAM_BATCH_ROWS = 5000
+CSV_STREAM_PREVIEW_ROWS = 50
+# File-backed types whose bundles are cached by content hash.
+_CONTENT_CACHED_TYPES = frozenset({"csv", "pdf"})
+_PAYLOAD_LOCATION_FIELDS = frozenset({"path", "file_path", "value"})
+
 
 def _trim(value: str | None) -> str | None:
     if value is None:
@@ -22,7 +33,14 @@ def _trim(value: str | None) -> str | None:
 
 
 class IngestionService:
-    """Convert raw inputs into canonical signal bundles."""
+    """Convert raw inputs into canonical signal bundles.
+
+    With a ``result_cache``, CSV and PDF results are reused while the file
+    content, options, metadata and rule table are unchanged.
+    """
+
+    def __init__(self, result_cache: IngestionResultCache | None = None) -> None:
+        self.result_cache = result_cache
 
     def ingest_text(
         self,
@@ -48,12 +66,199 @@ class IngestionService:
         payload: str | dict[str, Any],
         metadata: dict | None = None,
     ) -> SignalBundle:
+        key = self._result_cache_key(input_type, payload, metadata)
+        if key is not None:
+            cached = self.result_cache.get(key)
+            if cached is not None:
+                logger.info("ingestion_cache_hit source_type=%s source_id=%s", input_type, cached.bundle.source.id)
+                return cached.bundle
+
+        bundle = self._ingest(input_type, payload, metadata)
+        # Budget-truncated runs depend on timing, not content; never cache them.
+        if key is not None and bundle.ingestion_meta.get("truncated") != "time_budget":
+            self.result_cache.put(key, bundle)
+        return bundle
+
+    def _result_cache_key(
+        self,
+        input_type: SourceDocumentType,
+        payload: str | dict[str, Any],
+        metadata: dict | None,
+    ) -> str | None:
+        if self.result_cache is None or input_type not in _CONTENT_CACHED_TYPES:
+            return None
+        location = self._resolve_extractor_payload(input_type=input_type, payload=payload)
+        path = Path(location).expanduser()
+        options: dict[str, Any] = {}
+        if isinstance(payload, dict):
+            options = {k: v for k, v in payload.items() if k not in _PAYLOAD_LOCATION_FIELDS}
+        if path.is_file():
+            fingerprint = file_digest(path)
+            # Source metadata records the path, so it is part of the key too.
+            options["location"] = str(path)
+        elif input_type == "csv":
+            fingerprint = hashlib.sha256(location.encode("utf-8")).hexdigest()
+        else:
+            return None
+        return cache_key(input_type, fingerprint, options=options, metadata=metadata)
+
+    def _ingest(
+        self,
+        input_type: SourceDocumentType,
+        payload: str | dict[str, Any],
+        metadata: dict | None,
+    ) -> SignalBundle:
+        if input_type == "csv" and isinstance(payload, dict) and payload.get("stream"):
+            return self.ingest_csv_stream(
+                self._resolve_extractor_payload(input_type=input_type, payload=payload),
+                metadata=metadata,
+                batch_size=int(payload.get("batch_size") or CSV_STREAM_BATCH_ROWS),
+                sampling=CsvSamplingPolicy.from_config(payload),
+            )
+        if input_type == "pdf":
+            options = payload if isinstance(payload, dict) else {}
+            return self.ingest_pdf(
+                self._resolve_extractor_payload(input_type=input_type, payload=payload),
+                metadata=metadata,
+                max_pages=options.get("max_pages"),
+                time_budget_s=options.get("time_budget_s"),
+            )
+
         extractor = self._resolve_extractor(input_type)
         extractor_payload = self._resolve_extractor_payload(input_type=input_type, payload=payload)
         raw_text = extractor(extractor_payload)
         if not raw_text.strip():
             raise ValueError(f"{input_type} payload did not produce readable text")
 
+        title, md_in = self._split_metadata(metadata)
+        source = SourceDocument(
+            type=input_type,
+            title=title,
+            raw_content=raw_text,
+            metadata=self._build_metadata(
+                input_type=input_type,
+                payload=extractor_payload,
+                metadata=md_in,
+            ),
+        )
+        signals = build_signals(source.raw_content, source.id)
+        return self._bundle(source, signals, extracted_chars=len(source.raw_content))
+
+    def ingest_csv_stream(
+        self,
+        path: str,
+        *,
+        metadata: dict | None = None,
+        batch_size: int = CSV_STREAM_BATCH_ROWS,
+        sampling: CsvSamplingPolicy | None = None,
+        on_progress: Callable[[CsvStreamProgress], None] | None = None,
+        preview_rows: int = CSV_STREAM_PREVIEW_ROWS,
+    ) -> SignalBundle:
+        """Ingest a CSV file of any size in row batches.
+
+        Signals are identical to `ingest("csv", ...)` over the same sampled
+        rows, but only one batch and a short preview (kept as ``raw_content``)
+        are held in memory. ``on_progress`` is called after every batch.
+        """
+        source_id = f"src_{uuid4().hex}"
+        accumulator = SignalAccumulator(source_id)
+        progress = CsvStreamProgress()
+        preview: list[str] = []
+        for batch in csv_extractor.iter_fragment_batches(
+            path, batch_size=batch_size, sampling=sampling, progress=progress
+        ):
+            accumulator.add_text("\n".join(batch))
+            if len(preview) < preview_rows:
+                preview.extend(batch[: preview_rows - len(preview)])
+            progress.signals = accumulator.signal_count
+            if on_progress is not None:
+                on_progress(progress)
+
+        if not preview and progress.columns:
+            header_line = csv_extractor.columns_line(progress.columns)
+            accumulator.add_text(header_line)
+            preview.append(header_line)
+        if not preview:
+            raise ValueError("csv payload did not produce readable text")
+
+        title, md_in = self._split_metadata(metadata)
+        stream_meta = {
+            "rows_read": progress.rows_read,
+            "rows_processed": progress.rows_processed,
+            "batches": progress.batches,
+            "preview_rows": len(preview),
+        }
+        md_in.setdefault("columns", progress.columns[:32])
+        md_in["streaming"] = stream_meta
+        source = SourceDocument(
+            id=source_id,
+            type="csv",
+            title=title,
+            raw_content="\n".join(preview),
+            metadata=self._build_metadata(input_type="csv", payload=path, metadata=md_in),
+        )
+        return self._bundle(
+            source,
+            accumulator.signals(),
+            extracted_chars=accumulator.chars_seen,
+            extra_meta=stream_meta,
+        )
+
+    def ingest_pdf(
+        self,
+        path: str,
+        *,
+        metadata: dict | None = None,
+        max_pages: int | None = None,
+        time_budget_s: float | None = None,
+    ) -> SignalBundle:
+        """Ingest a PDF page by page, building signals while later pages extract.
+
+        ``max_pages`` and ``time_budget_s`` bound the work for very long
+        documents; the bundle then covers the leading pages only and records
+        why in ``ingestion_meta["truncated"]``.
+        """
+        source_id = f"src_{uuid4().hex}"
+        accumulator = SignalAccumulator(source_id)
+        progress = PdfExtractionProgress()
+        pages: list[str] = []
+        for _, page_text in pdf_extractor.iter_page_texts(
+            path,
+            max_pages=int(max_pages) if max_pages is not None else None,
+            time_budget_s=float(time_budget_s) if time_budget_s is not None else None,
+            progress=progress,
+        ):
+            accumulator.add_text(page_text)
+            pages.append(page_text)
+        if not pages:
+            raise ValueError("pdf payload did not produce readable text")
+
+        title, md_in = self._split_metadata(metadata)
+        source = SourceDocument(
+            id=source_id,
+            type="pdf",
+            title=title,
+            raw_content="\n\n".join(pages),
+            metadata=self._build_metadata(input_type="pdf", payload=path, metadata=md_in),
+        )
+        pdf_meta: dict[str, Any] = {
+            "page_count": progress.page_count,
+            "pages_extracted": progress.pages_done,
+            "pages_cached": progress.pages_cached,
+            "pages_with_text": progress.pages_with_text,
+            "parallel": progress.parallel,
+        }
+        if progress.truncated_reason:
+            pdf_meta["truncated"] = progress.truncated_reason
+        return self._bundle(
+            source,
+            accumulator.signals(),
+            extracted_chars=len(source.raw_content),
+            extra_meta=pdf_meta,
+        )
+
+    @staticmethod
+    def _split_metadata(metadata: dict | None) -> tuple[str | None, dict[str, Any]]:
         md_in = dict(metadata or {})
         _title_raw = md_in.pop("title", None)
         title = _trim(_title_raw) if isinstance(_title_raw, str) else None
@@ -66,19 +271,17 @@ class IngestionService:
             md_in.setdefault("source_label", source_label)
         if domain:
             md_in.setdefault("domain", domain)
+        return title, md_in
 
-        source = SourceDocument(
-            type=input_type,
-            title=title,
-            raw_content=raw_text,
-            metadata=self._build_metadata(
-                input_type=input_type,
-                payload=extractor_payload,
-                metadata=md_in,
-            ),
-        )
-        signals = build_signals(source.raw_content, source.id)
-
+    @staticmethod
+    def _bundle(
+        source: SourceDocument,
+        signals: list[Signal],
+        *,
+        extracted_chars: int,
+        extra_meta: dict[str, Any] | None = None,
+    ) -> SignalBundle:
+        input_type = source.type
         logger.debug(
             "[Nexora][Ingestion] extraction_complete source_type=%s signal_count=%s types=%s",
             source.type,
@@ -95,7 +298,7 @@ class IngestionService:
             )
 
         summary_parts = [
-            f"Ingested {input_type} source ({len(source.raw_content)} chars)",
+            f"Ingested {input_type} source ({extracted_chars} chars)",
             f"with {len(signals)} canonical signal(s).",
         ]
         if warnings:
@@ -109,14 +312,15 @@ class IngestionService:
             ingestion_meta={
                 "input_type": input_type,
                 "signal_types": [s.type for s in signals],
-                "extracted_chars": len(source.raw_content),
+                "extracted_chars": extracted_chars,
+                **(extra_meta or {}),
             },
         )
 
         logger.info(
             "ingestion_extracted source_type=%s raw_text_length=%s",
             source.type,
-            len(source.raw_content),
+            extracted_chars,
         )
         logger.info(
             "ingestion_completed source_type=%s signal_count=%s signal_types=%s",
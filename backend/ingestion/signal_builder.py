@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import hashlib
 import re
-from typing import Iterable
 
+from ingestion.rule_matcher import CompiledRuleMatcher, KeywordScan, iter_offsets
 from ingestion.schemas import Signal
 
 
@@ -91,38 +91,157 @@ _ENTITY_KEYWORDS = {
     "leadtime",
 }
 
-_UPPER_TOKEN_RE = re.compile(r"\b[A-Z][a-zA-Z]{2,}\b")
+# Part of every ingestion cache key: editing the rules invalidates cached bundles.
+RULE_TABLE_VERSION = hashlib.sha256(
+    repr((_SIGNAL_RULES, sorted(_ENTITY_KEYWORDS))).encode("utf-8")
+).hexdigest()[:16]
+
+# Same matches as r"\b[A-Z][a-zA-Z]{2,}\b"; leading with the character class lets
+# the regex engine skip ahead to upper-case letters instead of trying every offset.
+_UPPER_TOKEN_RE = re.compile(r"[A-Z](?<=\b[A-Z])[a-zA-Z]{2,}\b")
 _WORD_RE = re.compile(r"[a-zA-Z][a-zA-Z_-]+")
+_WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ_-")
+_MAX_ENTITIES = 8
 
+# Entity keywords that `_WORD_RE` can produce as a whole token ("lead time" cannot).
+_ENTITY_TOKENS = tuple(sorted(k for k in _ENTITY_KEYWORDS if _WORD_RE.fullmatch(k)))
+_RULE_KEYWORDS: tuple[tuple[str, ...], ...] = tuple(
+    tuple(str(k) for k in rule["keywords"]) for rule in _SIGNAL_RULES
+)
+_RULE_MATCHER = CompiledRuleMatcher(
+    [keyword.lower() for keywords in _RULE_KEYWORDS for keyword in keywords] + list(_ENTITY_TOKENS)
+)
+
+
+def scan_keywords(text: str) -> KeywordScan:
+    """Offsets and counts of every rule and entity keyword in ``text``."""
+    return _RULE_MATCHER.scan(text.lower())
 
-def _collect_entities(text: str) -> list[str]:
-    entities: list[str] = []
-    seen: set[str] = set()
 
-    for token in _UPPER_TOKEN_RE.findall(text):
+def _is_word_token(lowered: str, start: int, end: int) -> bool:
+    """True when ``lowered[start:end]`` is a whole token of `_WORD_RE`.
+
+    Tokens run greedily to the end of a ``[a-zA-Z_-]`` run and start at its
+    first letter, so only ``_``/``-`` may precede the token within the run.
+    """
+    if end < len(lowered) and lowered[end] in _WORD_CHARS:
+        return False
+    index = start
+    while index > 0 and lowered[index - 1] in "_-":
+        index -= 1
+    return index == 0 or lowered[index - 1] not in _WORD_CHARS
+
+
+def _upper_entities(text: str, seen: set[str], entities: list[str]) -> None:
+    # Upper-case tokens come first; once eight are known the rest cannot surface.
+    for match in _UPPER_TOKEN_RE.finditer(text):
+        if len(entities) >= _MAX_ENTITIES:
+            return
+        token = match.group()
         key = token.lower()
         if key in seen:
             continue
         seen.add(key)
         entities.append(token)
 
-    lowered = text.lower()
-    for token in _WORD_RE.findall(lowered):
-        if token not in _ENTITY_KEYWORDS or token in seen:
+
+def _keyword_entities(lowered: str, found: frozenset[str]) -> list[str]:
+    """Entity keywords occurring as whole tokens, in order of first occurrence."""
+    firsts: list[tuple[int, str]] = []
+    for keyword in _ENTITY_TOKENS:
+        if keyword not in found:
             continue
-        seen.add(token)
-        entities.append(token)
+        for start in iter_offsets(lowered, keyword):
+            if _is_word_token(lowered, start, start + len(keyword)):
+                firsts.append((start, keyword))
+                break
+    return [keyword for _, keyword in sorted(firsts)]
+
+
+def _collect_entities(text: str, lowered: str, found: frozenset[str]) -> list[str]:
+    entities: list[str] = []
+    seen: set[str] = set()
+    _upper_entities(text, seen, entities)
+    if len(entities) < _MAX_ENTITIES:
+        entities.extend(token for token in _keyword_entities(lowered, found) if token not in seen)
+    return entities[:_MAX_ENTITIES]
+
+
+def _rule_matches(found: frozenset[str]) -> list[list[str]]:
+    return [[keyword for keyword in keywords if keyword.lower() in found] for keywords in _RULE_KEYWORDS]
+
+
+class SignalAccumulator:
+    """Incremental `build_signals` over text fed in newline-separated chunks.
+
+    Keyword matches and entities are collected per chunk; `signals()` then
+    yields exactly what `build_signals` returns for the chunks joined with
+    newlines, while memory stays bounded by the rule set.
+    """
+
+    def __init__(self, source_id: str) -> None:
+        self.source_id = source_id
+        self.chars_seen = 0
+        self._matched: dict[str, set[str]] = {}
+        self._upper_entities: list[str] = []
+        self._upper_seen: set[str] = set()
+        self._keyword_entities: list[str] = []
+
+    @property
+    def signal_count(self) -> int:
+        return len(self._matched)
+
+    def add_text(self, text: str) -> None:
+        if not text:
+            return
+        self.chars_seen += len(text)
+        lowered = text.lower()
+        found = _RULE_MATCHER.present(lowered)
+        for rule, matches in zip(_SIGNAL_RULES, _rule_matches(found)):
+            if matches:
+                self._matched.setdefault(str(rule["type"]), set()).update(matches)
+
+        if len(self._upper_entities) < _MAX_ENTITIES:
+            _upper_entities(text, self._upper_seen, self._upper_entities)
+        if len(self._upper_entities) < _MAX_ENTITIES:
+            for token in _keyword_entities(lowered, found):
+                if token not in self._keyword_entities:
+                    self._keyword_entities.append(token)
+
+    def entities(self) -> list[str]:
+        entities = list(self._upper_entities)
+        entities.extend(token for token in self._keyword_entities if token not in self._upper_seen)
+        return entities[:_MAX_ENTITIES]
 
-    return entities[:8]
+    def signals(self) -> list[Signal]:
+        entities = self.entities()
+        signals: list[Signal] = []
+        for rule, keywords in zip(_SIGNAL_RULES, _RULE_KEYWORDS):
+            found = self._matched.get(str(rule["type"]))
+            if not found:
+                continue
+            matches = [keyword for keyword in keywords if keyword in found]
+            signals.append(_rule_signal(rule, matches, entities, self.source_id))
+        return signals
 
 
-def _match_keywords(text: str, keywords: Iterable[str]) -> list[str]:
-    matched: list[str] = []
-    for keyword in keywords:
-        kw = keyword.lower()
-        if kw in text:
-            matched.append(keyword)
-    return matched
+def _rule_signal(rule: dict[str, object], matches: list[str], entities: list[str], source_id: str) -> Signal:
+    signal_type = str(rule["type"])
+    base_strength = float(rule["base_strength"])
+    match_bonus = min(0.22, 0.07 * len(matches))
+    strength = min(1.0, base_strength + match_bonus)
+    description = f"Detected {signal_type.replace('_', ' ')} from keywords: {', '.join(matches)}."
+    sig_id = _stable_signal_id(source_id, signal_type, tuple(sorted(m.lower() for m in matches)))
+    return Signal(
+        id=sig_id,
+        type=signal_type,
+        label=str(rule["label"]),
+        description=description,
+        entities=entities,
+        strength=strength,
+        source_id=source_id,
+        metadata={"matched_keywords": matches},
+    )
 
 
 def build_signals(raw_text: str, source_id: str) -> list[Signal]:
@@ -132,32 +251,13 @@ def build_signals(raw_text: str, source_id: str) -> list[Signal]:
         return []
 
     lowered_text = normalized_text.lower()
-    entities = _collect_entities(normalized_text)
+    found = _RULE_MATCHER.present(lowered_text)
+    entities = _collect_entities(normalized_text, lowered_text, found)
     signals: list[Signal] = []
 
-    for rule in _SIGNAL_RULES:
-        signal_type = str(rule["type"])
-        label = str(rule["label"])
-        keywords = tuple(str(k) for k in rule["keywords"])
-        matches = _match_keywords(lowered_text, keywords)
+    for rule, matches in zip(_SIGNAL_RULES, _rule_matches(found)):
         if not matches:
             continue
-        base_strength = float(rule["base_strength"])
-        match_bonus = min(0.22, 0.07 * len(matches))
-        strength = min(1.0, base_strength + match_bonus)
-        description = f"Detected {signal_type.replace('_', ' ')} from keywords: {', '.join(matches)}."
-        sig_id = _stable_signal_id(source_id, signal_type, tuple(sorted(m.lower() for m in matches)))
-        signals.append(
-            Signal(
-                id=sig_id,
-                type=signal_type,
-                label=label,
-                description=description,
-                entities=entities,
-                strength=strength,
-                source_id=source_id,
-                metadata={"matched_keywords": matches},
-            )
-        )
+        signals.append(_rule_signal(rule, matches, entities, source_id))
 
     return signals
@@ -6,6 +6,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 from fastapi import FastAPI, Request, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 from pathlib import Path
@@ -50,15 +51,18 @@ from app.services.chat_ai import llm_chat_actions
 from app.services import build_loops_from_kpi
 from app.services.loop_engine import evaluate_loops
 from app.services.hybrid_rulebook import load_object_dictionary, infer_objects_from_text, pick_allowed_objects
-from app.services.object_selection_v2 import select_objects_v2
+from app.services.object_selection_v2 import select_objects_v2, warm_object_catalog_index
 from app.services.game_theory_v0 import game_advice_v0
 from app.services.decision_memory_v0 import record_decision_event_v0, build_memory_context_v0
 from app.services.conflict_map_v0 import build_conflict_map_v0
 from app.services.object_selection_v25 import build_object_selection_v25
+from app.services.object_text_index import ObjectTextIndex
 from app.services.decision_memory_v2 import build_memory_v2
 from app.services.risk_propagation_v0 import build_risk_propagation_v0
 from app.services.strategic_advice_v0 import build_strategic_advice_v0
 from engines.strategic_council.council_service import run_strategic_council_service
+from engines.scenario_simulation.simulation_pool import shutdown_simulation_pools
+from ingestion.extractors.pdf_extractor import shutdown_pdf_pool
 from app.services.opponent_model_v0 import build_opponent_model_v0
 from app.services.strategic_pattern_memory_v0 import build_strategic_patterns_v0
 from app.services.chat_contract_alignment import (
@@ -71,7 +75,7 @@ from app.services.ai_safety_guard import check_ai_input_safety
 from app.middleware.rate_limit import RateLimitMiddleware
 from app.middleware.request_audit import RequestAuditMiddleware
 from app.core.config import get_local_ai_settings
-from app.services.ai.orchestrator import LocalAIOrchestrator
+from app.services.ai.orchestrator import build_local_ai_orchestrator
 from app.models.system_archetypes import SystemArchetypeState
 from app.semantics.nexora_semantics import infer_allowed_objects_from_text
 from app.engines.fragility_v1 import compute_fragility_v1
@@ -100,6 +104,8 @@ from app.services.object_registry import (
     next_instance_id as _registry_next_instance_id,
     validate_object_dict as _registry_validate_object_dict,
 )
+from app.services.session_state import SESSION_SPILL_PATH, SessionStateStore, flush_session_state
+from app.services.ai.jsonl_sink import close_jsonl_sinks
 from app.services.scene_utils import (
     apply_intensity_to_objects as _apply_intensity_to_objects,
     build_base_scene_json as _build_base_scene_json,
@@ -113,30 +119,41 @@ from app.services.scene_utils import (
 
 _OBJECT_DICT: dict[str, dict] = {}
 _OBJECT_TYPES: dict[str, dict] = {}
-_OBJECT_INSTANCES: dict[str, dict] = {}
+# Registry instances and counters are never expired or evicted: a dropped
+# instance vanishes from chat, and a dropped counter would reissue used ids.
+_OBJECT_INSTANCES: SessionStateStore[dict] = SessionStateStore(
+    "object_instances", max_entries=None, ttl_seconds=None, refresh_on_read=False, spill_path=SESSION_SPILL_PATH
+)
 _LEGACY_OBJECTS: dict[str, dict] = {}
-_INSTANCE_COUNTERS: dict[str, int] = {}
+_INSTANCE_COUNTERS: SessionStateStore[int] = SessionStateStore(
+    "instance_counters", max_entries=None, ttl_seconds=None, refresh_on_read=False, spill_path=SESSION_SPILL_PATH
+)
+_OBJECT_INDEX = ObjectTextIndex()
 _OBJECT_DICT_PATH = Path(__file__).resolve().parent / "data" / "object_dictionary_v1.json"
 _INSTANCE_DICT_PATH = Path(__file__).resolve().parent / "data" / "object_instances_v1.json"
 #
 #
-# MVP note: per-user KPI state is kept in memory (resets on server restart).
-# This prevents different users from affecting each other's KPI/loop visuals.
-_KPI_STATE_BY_USER: dict[str, dict[str, float]] = {}
-_EPISODE_BY_USER: dict[str, str] = {}
+# Per-user KPI state keeps different users from affecting each other's KPI/loop
+# visuals. Idle users expire after the session TTL; set NEXORA_SESSION_SPILL_PATH
+# to keep state across restarts.
+_KPI_STATE_BY_USER: SessionStateStore[dict[str, float]] = SessionStateStore(
+    "kpi_state_by_user", spill_path=SESSION_SPILL_PATH
+)
+_EPISODE_BY_USER: SessionStateStore[str] = SessionStateStore("episode_by_user", spill_path=SESSION_SPILL_PATH)
 _KPI_DEFAULT = {"inventory": 0.5, "delivery": 0.5, "risk": 0.5}
 TICK_TEXT = "__tick__"
 
 def _kpi_step(user_id: str, text: str, allowed_objects: list[str], mode: str) -> dict:
-    return _run_kpi_step(
-        user_id=user_id,
-        text=text,
-        allowed_objects=allowed_objects,
-        mode=mode,
-        kpi_state_by_user=_KPI_STATE_BY_USER,
-        kpi_default=_KPI_DEFAULT,
-        build_loops=build_loops_from_kpi,
-    )
+    with _KPI_STATE_BY_USER.lock(user_id or "dev-anon"):
+        return _run_kpi_step(
+            user_id=user_id,
+            text=text,
+            allowed_objects=allowed_objects,
+            mode=mode,
+            kpi_state_by_user=_KPI_STATE_BY_USER,
+            kpi_default=_KPI_DEFAULT,
+            build_loops=build_loops_from_kpi,
+        )
 
 def _load_object_dict() -> dict[str, dict]:
     return _registry_load_object_dict(_OBJECT_DICT_PATH, _INSTANCE_DICT_PATH)
@@ -167,7 +184,8 @@ def _get_any_entry(obj_id: str) -> tuple[dict | None, dict | None]:
 
 
 def _next_instance_id(type_id: str) -> str:
-    return _registry_next_instance_id(type_id, _INSTANCE_COUNTERS)
+    with _INSTANCE_COUNTERS.lock(type_id):
+        return _registry_next_instance_id(type_id, _INSTANCE_COUNTERS)
 
 
 def get_object_profile(obj_id: str, mode: str | None = None) -> dict | None:
@@ -198,6 +216,7 @@ def _infer_allowed_objects_from_text(text: str, mode: str | None = None, allowed
         object_types=_OBJECT_TYPES,
         legacy_objects=_LEGACY_OBJECTS,
         allowed_only=allowed_only,
+        index=_OBJECT_INDEX,
     )
 
 app = FastAPI(title="StateStudio API")
@@ -307,21 +326,31 @@ async def init_chaos_engine():
     # Local AI startup state is initialized here without blocking existing startup behavior.
     app.state.local_ai_settings = get_local_ai_settings()
     app.state.local_ai_available = False
+    app.state.local_ai_orchestrator = build_local_ai_orchestrator(app.state.local_ai_settings)
     try:
-        local_ai_health = await LocalAIOrchestrator(settings=app.state.local_ai_settings).get_health()
+        local_ai_health = await app.state.local_ai_orchestrator.get_health()
         app.state.local_ai_available = bool(local_ai_health.available)
         if not local_ai_health.available:
             logger.warning("local_ai_unavailable_on_startup provider=%s", local_ai_health.provider)
     except Exception:
         logger.warning("local_ai_startup_check_failed", exc_info=False)
-    global _OBJECT_DICT, _OBJECT_TYPES, _OBJECT_INSTANCES, _LEGACY_OBJECTS
+    global _OBJECT_DICT, _OBJECT_TYPES, _LEGACY_OBJECTS, _OBJECT_INDEX
     registry_state = _registry_initialize_state(_OBJECT_DICT_PATH, _INSTANCE_DICT_PATH)
     _OBJECT_DICT = registry_state["raw_object_dict"]
     _OBJECT_TYPES = registry_state["object_types"]
-    _OBJECT_INSTANCES = registry_state["object_instances"]
+    _OBJECT_INSTANCES.reset(registry_state["object_instances"])
     _LEGACY_OBJECTS = registry_state["legacy_objects"]
-    _INSTANCE_COUNTERS.clear()
-    _INSTANCE_COUNTERS.update(registry_state["instance_counters"])
+    _OBJECT_INDEX = registry_state["object_index"]
+    # Build the rulebook and selection catalog indexes before the first chat request.
+    warm_object_catalog_index()
+    # Spilled chat-created instances follow the seeded ones; counters keep the higher value.
+    _OBJECT_INSTANCES.warm()
+    _INSTANCE_COUNTERS.reset()
+    _INSTANCE_COUNTERS.warm()
+    for type_id, count in registry_state["instance_counters"].items():
+        _INSTANCE_COUNTERS[type_id] = max(count, _INSTANCE_COUNTERS.get(type_id, 0))
+    _KPI_STATE_BY_USER.warm()
+    _EPISODE_BY_USER.warm()
     try:
         ensure_default_workspace_v0()
     except Exception:
@@ -329,6 +358,55 @@ async def init_chaos_engine():
         pass
 
 
+@app.on_event("startup")
+async def migrate_legacy_replay_episodes():
+    # One-time conversion of single-document episodes to frame logs, off the event loop.
+    try:
+        migrated = await run_in_threadpool(ReplayStore().migrate_legacy_episodes)
+    except Exception:
+        logger.warning("replay_legacy_migration_failed", exc_info=False)
+        return
+    if migrated:
+        logger.info("replay_legacy_episodes_migrated count=%s", migrated)
+
+
+@app.on_event("shutdown")
+async def flush_session_state_on_shutdown():
+    try:
+        flush_session_state()
+    except Exception:
+        logger.warning("session_state_flush_failed", exc_info=False)
+
+
+@app.on_event("shutdown")
+async def close_local_ai_orchestrator():
+    orchestrator = getattr(app.state, "local_ai_orchestrator", None)
+    if orchestrator is None:
+        return
+    try:
+        await orchestrator.aclose()
+    except Exception:
+        logger.warning("local_ai_shutdown_close_failed", exc_info=False)
+
+
+@app.on_event("shutdown")
+async def shutdown_worker_pools():
+    try:
+        shutdown_simulation_pools()
+    except Exception:
+        logger.warning("simulation_pool_shutdown_failed", exc_info=False)
+    try:
+        shutdown_pdf_pool()
+    except Exception:
+        logger.warning("pdf_pool_shutdown_failed", exc_info=False)
+
+
+@app.on_event("shutdown")
+async def close_jsonl_sinks_on_shutdown():
+    # Runs after the orchestrator closes so its last audit/telemetry records are drained too.
+    close_jsonl_sinks()
+
+
 class ChatIn(BaseModel):
     # Accept both "text" and "message" from clients; normalize to .text
     text: str | None = None
@@ -448,8 +526,8 @@ def _build_chat_pipeline_dependencies() -> ChatPipelineDependencies:
 
 
 @app.post("/chat", response_model=ChatResponseOut)
-def chat(payload: ChatIn, request: Request):
-    return execute_chat_pipeline(payload, request, _build_chat_pipeline_dependencies())
+async def chat(payload: ChatIn, request: Request):
+    return await execute_chat_pipeline(payload, request, _build_chat_pipeline_dependencies())
 
 
 @app.post("/system/analyze")
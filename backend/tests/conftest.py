@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+
+
+_REPLAY_DIR = tempfile.mkdtemp(prefix="nexora-test-replay-")
+_INGESTION_CACHE_DIR = tempfile.mkdtemp(prefix="nexora-test-ingestion-cache-")
+
+
+def pytest_configure(config) -> None:
+    # Routers build their ReplayStore at import time; keep episodes and the
+    # catalog out of backend/data/replay.
+    os.environ.setdefault("NEXORA_REPLAY_DIR", _REPLAY_DIR)
+    # The shared ingestion result cache would otherwise serve bundles cached by
+    # earlier runs instead of exercising extraction.
+    os.environ.setdefault("NEXORA_INGESTION_CACHE_DIR", _INGESTION_CACHE_DIR)
+
+
+def pytest_unconfigure(config) -> None:
+    shutil.rmtree(_REPLAY_DIR, ignore_errors=True)
+    shutil.rmtree(_INGESTION_CACHE_DIR, ignore_errors=True)
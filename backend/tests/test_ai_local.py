@@ -539,3 +539,18 @@ def test_local_ai_telemetry_events_endpoint_success():
     assert response.status_code == 200
     body = response.json()
     assert body["events"][0]["provider"] == "ollama"
+
+
+def test_local_ai_orchestrator_dependency_is_shared_across_requests():
+    # Only the startup hooks run here; requests would spend the suite-wide rate limit budget.
+    with TestClient(main.app):
+        orchestrator = main.app.state.local_ai_orchestrator
+        request = type("RequestStub", (), {"app": main.app})()
+        assert get_local_ai_orchestrator(request) is orchestrator
+        control_plane = orchestrator.control_plane
+        assert orchestrator.selection_engine.control_plane is control_plane
+        assert orchestrator.selection_engine._benchmark_loader.control_plane is control_plane
+        assert orchestrator.privacy_classifier.control_plane is control_plane
+        assert orchestrator.routing_policy.control_plane is control_plane
+        assert orchestrator.audit_logger.control_plane is control_plane
+        assert orchestrator.telemetry_collector.control_plane is control_plane
@@ -228,6 +228,52 @@ def test_reload_policy_changes_preserves_last_known_good(tmp_path: Path):
     assert service.get_snapshot().model.fast_model == "fast-v2"
 
 
+def test_effective_policy_is_cached_until_activation_or_reload(tmp_path: Path):
+    base_path = tmp_path / "ai_policy.json"
+    _write_json(base_path, _base_policy())
+    service = AIControlPlaneService(LocalAISettings(), policy_path=base_path)
+
+    record = service.submit_policy_change(
+        {
+            "title": "Safe model change",
+            "scope_type": "global",
+            "payload": {"model": {"fast_model": "fast-v2"}},
+        }
+    )
+    record = service.approve_policy_change(record.change_id, {"actor_id": "operator", "reason": "approve"})
+    service.activate_policy_change(record.change_id, {"actor_id": "operator", "reason": "activate"})
+
+    first = service.get_snapshot()
+    assert first.model.fast_model == "fast-v2"
+    first.model.fast_model = "mutated-by-caller"
+    assert service.get_snapshot().model.fast_model == "fast-v2"
+
+    resolved = service.resolve_effective_policy(tenant_id="tenant-a")
+    resolved.effective_policy.model.fast_model = "mutated-by-caller"
+    resolved.resolution_timestamp = "1970-01-01T00:00:00+00:00"
+    resolved.effective_policy.version_info.loaded_at = "1970-01-01T00:00:00+00:00"
+    again = service.resolve_effective_policy(tenant_id="tenant-a")
+    assert again is not resolved
+    assert again.effective_policy.model.fast_model == "fast-v2"
+    assert again.resolution_timestamp != "1970-01-01T00:00:00+00:00"
+    assert again.effective_policy.version_info.loaded_at == again.resolution_timestamp
+
+    second = service.submit_policy_change(
+        {
+            "title": "Another model change",
+            "scope_type": "global",
+            "payload": {"model": {"fast_model": "fast-v3"}},
+        }
+    )
+    second = service.approve_policy_change(second.change_id, {"actor_id": "operator", "reason": "approve"})
+    service.activate_policy_change(second.change_id, {"actor_id": "operator", "reason": "activate"})
+
+    assert service.get_snapshot().model.fast_model == "fast-v3"
+
+    service.reload()
+    assert service.get_effective_policy_cache_stats()["hits"] > 0
+
+
 def test_policy_endpoints_validate_and_pending_state(tmp_path: Path):
     base_path = tmp_path / "ai_policy.json"
     _write_json(base_path, _base_policy())
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import asyncio
 import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 
 import pytest
 
@@ -9,6 +11,7 @@ from app.core.config import LocalAISettings
 from app.schemas.ai import LocalAIAnalyzeRequest
 from app.services.ai.orchestrator import LocalAIOrchestrator
 from app.services.ai.providers.base import AIProvider
+from app.services.ai.providers.connection_manager import ProviderConnectionManager
 from app.services.ai.providers.exceptions import UnknownProviderError
 from app.services.ai.providers.factory import AIProviderFactory
 from app.services.ai.providers.ollama_provider import OllamaProvider
@@ -170,3 +173,49 @@ def test_ollama_provider_behaves_as_expected():
     assert result.ok is True
     assert result.provider == "ollama"
     assert result.models[0].name == "llama3.2:3b"
+
+
+class _TagsHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = json.dumps({"models": [{"name": "llama3.2:3b"}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        return None
+
+
+def test_ollama_provider_reuses_pooled_connections():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _TagsHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    settings = LocalAISettings(
+        ollama_base_url=f"http://127.0.0.1:{server.server_address[1]}",
+        ai_http2_enabled=False,
+    )
+    manager = ProviderConnectionManager(settings)
+    provider = OllamaProvider(settings=settings, connection_manager=manager)
+
+    async def run() -> None:
+        for _ in range(5):
+            result = await provider.list_models()
+            assert result.ok is True
+        await manager.aclose()
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    pool = manager.stats().pools[0]
+    assert pool.base_url == settings.base_url
+    assert pool.requests == 5
+    assert pool.connections_opened == 1
+    assert pool.reuse_ratio == 0.8
+    assert pool.in_use == 0
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+from app.core.config import LocalAISettings
+from app.services.ai.orchestrator import LocalAIOrchestrator
+from app.services.ai.provider_state_cache import CIRCUIT_OPEN_ERROR, ProviderStateCache
+from app.services.ai.providers.base import AIProvider
+from app.services.ai.providers.registry import AIProviderRegistry
+from app.services.ai.providers.types import (
+    ProviderChatRequest,
+    ProviderChatResponse,
+    ProviderDescriptor,
+    ProviderHealthStatus,
+    ProviderModelInfo,
+    ProviderModelList,
+)
+from app.services.ai.routing_types import RoutingDecisionRequest
+
+
+class SlowProvider(AIProvider):
+    def __init__(self, key: str, *, kind: str = "local", available: bool = True, delay: float = 0.0) -> None:
+        self._key = key
+        self._kind = kind
+        self.available = available
+        self.delay = delay
+        self.health_calls = 0
+        self.model_calls = 0
+
+    @property
+    def provider_key(self) -> str:
+        return self._key
+
+    @property
+    def default_model(self) -> str | None:
+        return "model-a"
+
+    def describe(self) -> ProviderDescriptor:
+        return ProviderDescriptor(key=self._key, kind=self._kind, enabled=True, configured=True)
+
+    async def health_check(self) -> ProviderHealthStatus:
+        self.health_calls += 1
+        await asyncio.sleep(self.delay)
+        return ProviderHealthStatus(provider=self._key, available=self.available)
+
+    async def list_models(self) -> ProviderModelList:
+        self.model_calls += 1
+        await asyncio.sleep(self.delay)
+        return ProviderModelList(
+            ok=self.available,
+            provider=self._key,
+            models=[ProviderModelInfo(name="model-a", provider=self._key)],
+        )
+
+    async def chat_json(self, request: ProviderChatRequest) -> ProviderChatResponse:
+        return ProviderChatResponse(ok=False, provider=self._key, model="model-a")
+
+
+class FakeFactory:
+    def __init__(self, providers: list[AIProvider]) -> None:
+        self._registry = AIProviderRegistry({provider.provider_key: provider for provider in providers})
+
+    def registry(self) -> AIProviderRegistry:
+        return self._registry
+
+    def get_provider(self, provider_key: str) -> AIProvider:
+        return self._registry.get(provider_key)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _settings(**overrides) -> LocalAISettings:
+    values = {
+        "ai_provider_health_ttl_seconds": 10.0,
+        "ai_provider_models_ttl_seconds": 10.0,
+        "ai_provider_negative_ttl_seconds": 1.0,
+        "ai_provider_circuit_failure_threshold": 2,
+        "ai_provider_circuit_open_seconds": 30.0,
+    }
+    values.update(overrides)
+    return LocalAISettings(**values)
+
+
+def test_provider_states_are_probed_concurrently_and_then_served_from_cache():
+    local = SlowProvider("ollama", delay=0.2)
+    cloud = SlowProvider("openai", kind="cloud", delay=0.2)
+    orchestrator = LocalAIOrchestrator(
+        settings=_settings(ai_cloud_provider_enabled=True),
+        provider_factory=FakeFactory([local, cloud]),
+    )
+    payload = RoutingDecisionRequest(task_type="classify_intent", cloud_permitted=True)
+
+    async def run():
+        started_at = time.perf_counter()
+        first = await orchestrator._collect_provider_states(payload)
+        elapsed = time.perf_counter() - started_at
+        second = await orchestrator._collect_provider_states(payload)
+        return first, second, elapsed
+
+    first, second, elapsed = asyncio.run(run())
+
+    assert elapsed < 0.35
+    assert [state.available for state in first] == [True, True]
+    assert first == second
+    assert local.health_calls == 1
+    assert cloud.health_calls == 1
+
+
+def test_model_listing_is_cached_for_model_selection():
+    provider = SlowProvider("ollama")
+    cache = ProviderStateCache(_settings())
+
+    async def run():
+        await cache.get_models(provider)
+        await cache.get_models(provider)
+
+    asyncio.run(run())
+
+    assert provider.model_calls == 1
+
+
+def test_stale_entry_is_served_while_refreshing_in_background():
+    provider = SlowProvider("ollama")
+    clock = FakeClock()
+    cache = ProviderStateCache(_settings(), clock=clock)
+
+    async def run():
+        await cache.get_health(provider)
+        provider.available = False
+        clock.now += 11.0
+        stale = await cache.get_health(provider)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        refreshed = await cache.get_health(provider)
+        return stale, refreshed
+
+    stale, refreshed = asyncio.run(run())
+
+    assert stale.available is True
+    assert refreshed.available is False
+    assert provider.health_calls == 2
+
+
+def test_repeated_failures_open_circuit_and_skip_probes():
+    provider = SlowProvider("ollama", available=False)
+    clock = FakeClock()
+    cache = ProviderStateCache(_settings(), clock=clock)
+
+    async def run():
+        await cache.get_health(provider)
+        clock.now += 2.0
+        await cache.get_health(provider)
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        clock.now += 2.0
+        return await cache.get_health(provider)
+
+    result = asyncio.run(run())
+
+    assert cache.is_circuit_open("ollama") is True
+    assert result.available is False
+    assert result.error == CIRCUIT_OPEN_ERROR
+    assert provider.health_calls == 2
+
+    clock.now += 31.0
+    provider.available = True
+    asyncio.run(cache.probe_health_many([provider]))
+    assert cache.is_circuit_open("ollama") is False
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+
+from app.core.config import LocalAISettings
+from app.schemas.ai import AIRequest
+from app.services.ai.control_plane.control_plane_service import AIControlPlaneService
+from app.services.ai.orchestrator import LocalAIOrchestrator
+from app.services.ai.providers.base import AIProvider
+from app.services.ai.providers.types import (
+    ProviderChatRequest,
+    ProviderChatResponse,
+    ProviderDescriptor,
+    ProviderHealthStatus,
+    ProviderModelInfo,
+    ProviderModelList,
+)
+from app.services.ai.response_cache import AIResponseCache
+from app.services.ai.telemetry_collector import AITelemetryCollector
+
+
+class CountingProvider(AIProvider):
+    def __init__(self) -> None:
+        self.chat_calls = 0
+
+    @property
+    def provider_key(self) -> str:
+        return "ollama"
+
+    @property
+    def default_model(self) -> str | None:
+        return "llama3.2:3b"
+
+    def describe(self) -> ProviderDescriptor:
+        return ProviderDescriptor(key="ollama", kind="local", enabled=True, configured=True, default_model="llama3.2:3b")
+
+    async def health_check(self) -> ProviderHealthStatus:
+        return ProviderHealthStatus(provider="ollama", available=True, default_model="llama3.2:3b")
+
+    async def list_models(self) -> ProviderModelList:
+        return ProviderModelList(provider="ollama", models=[ProviderModelInfo(name="llama3.2:3b", provider="ollama")])
+
+    async def chat_json(self, request: ProviderChatRequest) -> ProviderChatResponse:
+        self.chat_calls += 1
+        summary = f"answer {self.chat_calls}"
+        return ProviderChatResponse(
+            ok=True,
+            provider="ollama",
+            model=request.model or "llama3.2:3b",
+            raw_model=request.model or "llama3.2:3b",
+            output=f'{{"summary":"{summary}","risk_signals":[],"object_candidates":[]}}',
+            data={"summary": summary, "risk_signals": [], "object_candidates": []},
+            latency_ms=5.0,
+        )
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _analyze(orchestrator: LocalAIOrchestrator, text: str, **metadata):
+    return asyncio.run(orchestrator.analyze(AIRequest(text=text, metadata={"task": "analyze_scenario", **metadata})))
+
+
+def _response(summary: str = "ok") -> ProviderChatResponse:
+    return ProviderChatResponse(ok=True, provider="ollama", model="m", data={"summary": summary}, latency_ms=5.0)
+
+
+def test_repeated_prompt_is_served_from_cache_with_cache_hit_stage():
+    settings = LocalAISettings()
+    provider = CountingProvider()
+    collector = AITelemetryCollector(settings)
+    orchestrator = LocalAIOrchestrator(settings=settings, provider=provider, telemetry_collector=collector)
+
+    first = _analyze(orchestrator, "Analyze internal supplier delay.")
+    second = _analyze(orchestrator, "Analyze internal supplier delay.")
+    other = _analyze(orchestrator, "Analyze internal supplier delay in the north region.")
+
+    assert provider.chat_calls == 2
+    assert second.ok is True
+    assert second.output == first.output
+    assert first.metadata["response_cache_hit"] is False
+    assert second.metadata["response_cache_hit"] is True
+    assert other.metadata["response_cache_hit"] is False
+    hit_events = [event for event in collector.list_events(limit=100) if event.stage == "cache_hit"]
+    assert [event.trace_id for event in hit_events] == [second.trace_id]
+    second_stages = [event.stage for event in collector.list_events(limit=100) if event.trace_id == second.trace_id]
+    assert "provider_execution_started" not in second_stages
+    assert second_stages[-1] == "response_returned"
+
+
+def test_restricted_content_and_opt_out_requests_bypass_the_cache():
+    provider = CountingProvider()
+    orchestrator = LocalAIOrchestrator(settings=LocalAISettings(), provider=provider)
+
+    _analyze(orchestrator, "Summarize the patient record backlog.")
+    restricted = _analyze(orchestrator, "Summarize the patient record backlog.")
+    _analyze(orchestrator, "Analyze internal supplier delay.", response_cache=False)
+    _analyze(orchestrator, "Analyze internal supplier delay.", response_cache=False)
+
+    assert restricted.metadata["privacy_sensitivity_level"] == "restricted"
+    assert restricted.metadata["response_cache_hit"] is False
+    assert provider.chat_calls == 4
+    assert orchestrator.response_cache.snapshot()["stores"] == 0
+
+
+def test_restricted_content_is_cached_only_when_policy_allows_it(tmp_path: Path):
+    provider = CountingProvider()
+    settings = LocalAISettings(ai_response_cache_sensitivity_levels="public,internal,confidential,restricted")
+    orchestrator = LocalAIOrchestrator(
+        settings=settings,
+        provider=provider,
+        control_plane=AIControlPlaneService(settings, env_policy_dir=tmp_path),
+    )
+
+    _analyze(orchestrator, "Summarize the patient record backlog.")
+    second = _analyze(orchestrator, "Summarize the patient record backlog.")
+
+    assert second.metadata["response_cache_hit"] is True
+    assert provider.chat_calls == 1
+
+
+def test_disk_tier_persists_only_allowed_sensitivity_levels(tmp_path: Path):
+    settings = LocalAISettings(ai_response_cache_dir=str(tmp_path))
+    first = LocalAIOrchestrator(settings=settings, provider=CountingProvider())
+    _analyze(first, "Analyze internal supplier delay.")
+    _analyze(first, "Review the revenue forecast for next quarter.")
+
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    provider = CountingProvider()
+    restarted = LocalAIOrchestrator(settings=settings, provider=provider)
+    internal = _analyze(restarted, "Analyze internal supplier delay.")
+    confidential = _analyze(restarted, "Review the revenue forecast for next quarter.")
+
+    assert internal.metadata["response_cache_hit"] is True
+    assert confidential.metadata["response_cache_hit"] is False
+    assert provider.chat_calls == 1
+
+
+def test_response_cache_expires_entries_and_evicts_by_count_and_size(tmp_path: Path):
+    clock = FakeClock()
+    cache = AIResponseCache(max_entries=2, ttl_seconds=10.0, clock=clock, disk_dir=tmp_path)
+    cache.put("a", _response("a"), persist=True)
+    cache.put("b", _response("b"))
+    assert cache.get("a").data == {"summary": "a"}
+    cache.put("c", _response("c"))
+
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    clock.now += 11.0
+    assert cache.get("a") is None
+    assert not list(tmp_path.glob("*.json"))
+
+    entry_size = len(_response("x").model_dump_json())
+    sized = AIResponseCache(max_entries=10, max_bytes=entry_size * 2, clock=clock)
+    for key in ("x", "y", "z"):
+        sized.put(key, _response(key))
+    snapshot = sized.snapshot()
+    assert snapshot["entries"] == 2
+    assert snapshot["bytes"] <= entry_size * 2
+    assert sized.get("x") is None
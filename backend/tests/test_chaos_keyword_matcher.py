@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from chaos_engine.core import ChaosEngine
+from chaos_engine.keyword_matcher import KeywordAutomaton, TokenMatches
+
+
+def test_automaton_reports_overlapping_and_nested_keywords():
+    automaton = KeywordAutomaton(["he", "she", "his", "hers", "lag", "laggard"])
+
+    assert automaton.find("ushers") == {"he", "she", "hers"}
+    assert automaton.find("laggards") == {"lag", "laggard"}
+    assert automaton.find("calm") == frozenset()
+
+
+def test_token_matches_fall_back_for_terms_outside_vocabulary():
+    matches = TokenMatches.build(["delayed", "delayed", "risk"], KeywordAutomaton(["delay"]))
+
+    assert matches.occurrences_within_tokens("delay") == 2
+    assert matches.occurrences_within_tokens("isk") == 1
+    assert matches.in_any_token("missing") is False
+
+
+def test_compiled_extraction_matches_naive_keyword_scan():
+    engine = ChaosEngine()
+    text = "Backorders and out_of_stock events; risky exposure, late shipments and postponed budgets"
+
+    tokens = set(engine._tokenize(text))
+    expected = []
+    for name, meta in engine._registry.items():
+        count = sum(1 for kw in meta["keywords"] if any(kw in token for token in tokens))
+        if count:
+            expected.append((name, count))
+
+    extracted = engine._extract_signals(text)
+
+    assert [signal.keyword for signal in extracted] == [name for name, _ in expected]
+    assert engine.analyze(text).dominant_signal in {name for name, _ in expected}
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import re
+import sys
+import threading
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from app.services import chat_stages
+from app.services.chat_stages import ChatStage, run_chat_stages, stage_dependencies
+
+
+def _stages(log: list[str], gate: threading.Event | None = None) -> list[ChatStage]:
+    def append(name: str):
+        def apply(state, result):
+            state["response"].append(name)
+            log.append(name)
+
+        return apply
+
+    def slow(state):
+        if gate is not None:
+            gate.wait(2.0)
+        return {"slow": 1}
+
+    return [
+        ChatStage("slow", slow, outputs=("slow",), apply=append("slow"), blocking=True),
+        ChatStage("fast", lambda state: {"fast": 2}, outputs=("fast",), apply=append("fast")),
+        ChatStage("sum", lambda state: {"total": state["slow"] + state["fast"]}, inputs=("slow", "fast"), apply=append("sum")),
+        ChatStage("off", lambda state: {"off": True}, apply=append("off"), when=lambda state: False),
+    ]
+
+
+def test_dependencies_follow_latest_earlier_producer() -> None:
+    assert stage_dependencies(_stages([])) == [set(), set(), {0, 1}, set()]
+
+
+def test_parallel_run_applies_in_declaration_order_and_matches_serial() -> None:
+    results = {}
+    for parallel in (False, True):
+        log: list[str] = []
+        state = {"response": [], "slow": 0, "fast": 0}
+        timings = asyncio.run(run_chat_stages(_stages(log), state, parallel=parallel))
+        results[parallel] = (state["response"], state["total"], [timing["status"] for timing in timings])
+
+    assert results[False] == results[True] == (["slow", "fast", "sum"], 3, ["ok", "ok", "ok", "skipped"])
+
+
+def test_stage_over_budget_is_skipped_and_keeps_defaults() -> None:
+    gate = threading.Event()
+
+    def stuck(state):
+        gate.wait(2.0)
+        return {"value": "late"}
+
+    stages = [
+        ChatStage("stuck", stuck, outputs=("value",), budget_ms=20, blocking=True),
+        ChatStage("boom", lambda state: 1 / 0, outputs=("other",)),
+        ChatStage("after", lambda state: {"seen": state["value"]}, inputs=("value",)),
+    ]
+    state = {"value": "default", "other": "default"}
+
+    async def run():
+        started_at = time.perf_counter()
+        try:
+            return await run_chat_stages(stages, state, parallel=True), time.perf_counter() - started_at
+        finally:
+            gate.set()  # release the worker thread so the loop can shut down
+
+    timings, elapsed = asyncio.run(run())
+
+    assert elapsed < 1.0
+    assert [timing["status"] for timing in timings] == ["timeout", "error", "ok"]
+    assert state["seen"] == "default" and state["other"] == "default"
+
+
+_VOLATILE = [
+    (re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"), "<uuid>"),
+    (re.compile(r"\d{4}-\d{2}-\d{2}T[0-9:.]+(?:[+-]\d{2}:\d{2}|Z)?"), "<time>"),
+    (re.compile(r'"timestamp": \d+'), '"timestamp": 0'),
+    (re.compile(r"stage-parity-(?:serial|parallel)"), "<user>"),
+]
+
+
+def _stable(body: dict) -> str:
+    text = json.dumps(body, sort_keys=True)
+    for pattern, replacement in _VOLATILE:
+        text = pattern.sub(replacement, text)
+    return text
+
+
+# Later turns read the decision memory of earlier ones; the last runs the game stage.
+_PARITY_TURNS = [
+    {"text": "Supplier delays are raising inventory costs and delivery risk"},
+    {"text": "A competitor cut prices and our cash runway is shrinking"},
+    {"text": "How should we respond to the competitor's price war?", "mode": "strategy"},
+]
+
+
+def test_chat_enrichment_stages_match_serial_when_run_in_parallel(monkeypatch, tmp_path: Path) -> None:
+    from fastapi.testclient import TestClient
+
+    import main
+    import memory.engine
+    from app.services import decision_memory_v0
+    from app.services.decision_memory_store import DecisionMemoryStore
+
+    # Object memory decays by wall-clock seconds; pin the clock so both runs see the same dt.
+    monkeypatch.setattr(memory.engine, "now_ts", lambda: 1_700_000_000)
+    # Per-user memories start empty and stay out of backend/data.
+    monkeypatch.setattr(main, "JsonMemoryStore", functools.partial(main.JsonMemoryStore, base_dir=str(tmp_path / "memory")))
+    monkeypatch.setattr(
+        decision_memory_v0,
+        "DecisionMemoryStore",
+        functools.partial(DecisionMemoryStore, base_dir=str(tmp_path / "decision_memory")),
+    )
+    # Generous budgets: this checks the dependency edges, not slow CI machines.
+    monkeypatch.setattr(chat_stages, "CHAT_STAGE_BUDGET_MS", 60000.0)
+    bodies = {}
+    with TestClient(main.app) as client:
+        for parallel in (False, True):
+            monkeypatch.setattr(chat_stages, "CHAT_PARALLEL_STAGES", parallel)
+            user_id = f"stage-parity-{'parallel' if parallel else 'serial'}"
+            responses = [
+                # Own client key, so these requests do not spend the suite-wide rate limit.
+                client.post("/chat", json={**turn, "user_id": user_id}, headers={"x-forwarded-for": user_id})
+                for turn in _PARITY_TURNS
+            ]
+            assert [response.status_code for response in responses] == [200] * len(_PARITY_TURNS)
+            bodies[parallel] = [_stable(response.json()) for response in responses]
+
+    assert bodies[True] == bodies[False]
@@ -125,3 +125,48 @@ def test_fragility_scanner_accepts_signal_bundle_directly():
     assert payload["fragility_score"] > 0
     assert payload["scene_payload"]["highlighted_object_ids"]
     assert payload["object_impacts"]["primary"]
+
+
+def test_fragility_scanner_batch_matches_single_scans():
+    documents = [
+        {"text": "Supplier dependency and inventory shortage are causing severe delays.", "mode": "business"},
+        {"text": "Cash flow pressure and rising costs hurt margins.", "mode": "business"},
+        {"text": "Late delivery and backlog at the port.", "mode": "supply_chain"},
+    ]
+    with _client() as client:
+        singles = [client.post("/scanner/fragility", json=document).json() for document in documents]
+        response = client.post("/scanner/fragility/batch", json={"documents": documents})
+
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["ok"] is True
+    assert payload["document_count"] == 3
+    assert payload["failed_count"] == 0
+    assert [item["index"] for item in payload["results"]] == [0, 1, 2]
+    for item, single in zip(payload["results"], singles):
+        assert item["result"]["fragility_score"] == single["fragility_score"]
+        assert item["result"]["debug"]["category_scores"] == single["debug"]["category_scores"]
+
+    for dimension, aggregate in payload["dimension_scores"].items():
+        scores = [single["debug"]["category_scores"].get(dimension, 0.0) for single in singles]
+        assert aggregate["max"] == round(max(scores), 4)
+        assert aggregate["mean"] == round(sum(scores) / len(scores), 4)
+        assert aggregate["document_count"] == sum(1 for single in singles if dimension in single["debug"]["category_scores"])
+
+
+def test_fragility_scanner_batch_rejects_empty_batch():
+    with _client() as client:
+        response = client.post("/scanner/fragility/batch", json={"documents": []})
+
+    assert response.status_code == 422
+
+
+def test_signal_extractor_matches_whole_words_only():
+    from app.services.scanner.signal_extractor import extract_fragility_signals
+
+    signals = extract_fragility_signals("Delays and a stockout; the backlogged urgent order is delayed.", "operations")
+    by_id = {signal["id"]: signal for signal in signals}
+
+    assert by_id["sig_delay_risk"]["matched_terms"] == ["delays"]
+    assert by_id["sig_inventory_shortage"]["matched_terms"] == ["stockout"]
+    assert extract_fragility_signals("   ", "business") == []
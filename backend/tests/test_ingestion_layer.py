@@ -245,6 +245,74 @@ def test_ingestion_connector_run_csv_missing_file_returns_400() -> None:
     assert body["error"]["type"] == "INGESTION_INPUT_ERROR"
 
 
+def _ops_csv(tmp_path: Path, rows: int) -> Path:
+    csv_path = tmp_path / "stream.csv"
+    lines = ["sku,status,Supplier,note"]
+    notes = ("late delivery", "cost overrun", "", "customer complaint", "stockout risk")
+    for index in range(rows):
+        lines.append(f"SKU{index},{'open' if index % 2 else ''},Vendor{index % 11},{notes[index % len(notes)]}")
+    csv_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return csv_path
+
+
+def _signal_view(signals) -> list[tuple]:
+    return [(s.type, s.strength, s.entities, s.metadata["matched_keywords"]) for s in signals]
+
+
+def test_ingestion_csv_stream_matches_whole_file_signals(tmp_path: Path) -> None:
+    csv_path = _ops_csv(tmp_path, 240)
+    service = IngestionService()
+    progress_updates: list[tuple[int, int]] = []
+
+    whole = service.ingest(input_type="csv", payload={"path": str(csv_path)})
+    streamed = service.ingest_csv_stream(
+        str(csv_path),
+        batch_size=17,
+        preview_rows=5,
+        on_progress=lambda p: progress_updates.append((p.rows_processed, p.signals)),
+    )
+
+    assert _signal_view(streamed.signals) == _signal_view(whole.signals)
+    assert all(signal.source_id == streamed.source.id for signal in streamed.signals)
+    assert streamed.source.raw_content == "\n".join(whole.source.raw_content.splitlines()[:5])
+    assert streamed.ingestion_meta["rows_processed"] == 240
+    assert progress_updates[-1] == (240, len(whole.signals))
+    assert [rows for rows, _ in progress_updates] == sorted(rows for rows, _ in progress_updates)
+
+
+def test_ingestion_csv_stream_sampling_policy(tmp_path: Path) -> None:
+    csv_path = _ops_csv(tmp_path, 100)
+
+    result = IngestionService().ingest(
+        input_type="csv",
+        payload={"path": str(csv_path), "stream": True, "sample_every": 5, "max_rows": 4},
+    )
+
+    # Every fifth row carries the same note ("late delivery"); "Supplier" is a column name.
+    assert [signal.type for signal in result.signals] == ["delay", "supplier_impact"]
+    assert result.ingestion_meta["rows_processed"] == 4
+    assert result.ingestion_meta["rows_read"] == 16
+    assert result.source.metadata["streaming"]["rows_processed"] == 4
+
+
+def test_ingestion_connector_run_csv_upload_streams_large_file(tmp_path, monkeypatch) -> None:
+    from app.connectors import csv_connector
+
+    csv_path = _ops_csv(tmp_path, 400)
+    monkeypatch.setattr(csv_connector, "_MAX_CSV_BYTES", 1024)
+    with _client() as client:
+        response = client.post(
+            "/ingestion/connector/run",
+            json={"connector_id": "csv_upload", "config": {"file_path": str(csv_path), "batch_size": 50}},
+        )
+
+    assert response.status_code == 200, response.text
+    bundle = response.json()["bundle"]
+    assert bundle["ingestion_meta"]["rows_processed"] == 400
+    assert bundle["ingestion_meta"]["batches"] == 8
+    assert {signal["type"] for signal in bundle["signals"]} >= {"delay", "cost_pressure", "customer_impact"}
+
+
 def test_ingestion_connector_run_web_source_real_fetch(monkeypatch) -> None:
     from app.connectors import web_connector
 
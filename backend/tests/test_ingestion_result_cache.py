@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import threading
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+import ingestion.router as ingestion_router_mod
+from app.connectors import web_connector
+from app.connectors.connector_runner import run_connector
+from app.connectors.web_policy import WebIngestionPolicy
+from ingestion import result_cache
+from ingestion.result_cache import IngestionResultCache
+from ingestion.service import IngestionService
+
+
+def _csv(tmp_path: Path, name: str, body: str) -> Path:
+    path = tmp_path / name
+    path.write_text(body, encoding="utf-8")
+    return path
+
+
+def test_service_reuses_bundle_until_content_or_rules_change(tmp_path: Path, monkeypatch) -> None:
+    cache = IngestionResultCache(tmp_path / "cache")
+    service = IngestionService(result_cache=cache)
+    csv_path = _csv(tmp_path, "ops.csv", "item,note\nwidget,late delivery\n")
+
+    first = service.ingest("csv", {"path": str(csv_path)})
+    second = service.ingest("csv", {"path": str(csv_path)})
+    assert second.source.id == first.source.id
+    assert second.model_dump() == first.model_dump()
+
+    csv_path.write_text("item,note\nwidget,cost overrun\n", encoding="utf-8")
+    changed = service.ingest("csv", {"path": str(csv_path)})
+    assert changed.source.id != first.source.id
+    assert [s.type for s in changed.signals] == ["cost_pressure"]
+
+    monkeypatch.setattr(result_cache, "RULE_TABLE_VERSION", "edited-rules")
+    assert service.ingest("csv", {"path": str(csv_path)}).source.id != changed.source.id
+
+    assert cache.snapshot()["hits"] == 1
+    assert cache.snapshot()["misses"] == 3
+
+
+def test_cache_evicts_least_recently_used_and_survives_restart(tmp_path: Path) -> None:
+    root = tmp_path / "cache"
+    service = IngestionService(result_cache=IngestionResultCache(root, max_entries=2))
+    paths = [_csv(tmp_path, f"{index}.csv", f"sku,note\nA{index},delay\n") for index in range(3)]
+
+    ids = [service.ingest("csv", str(path)).source.id for path in paths[:2]]
+    service.ingest("csv", str(paths[0]))  # touch 0 so 1 becomes the eviction candidate
+    service.ingest("csv", str(paths[2]))
+
+    reloaded = IngestionService(result_cache=IngestionResultCache(root, max_entries=2))
+    assert reloaded.ingest("csv", str(paths[0])).source.id == ids[0]
+    assert reloaded.ingest("csv", str(paths[1])).source.id != ids[1]
+    assert service.result_cache.snapshot()["evictions"] == 1
+
+
+@contextmanager
+def _etag_server(requests: list[dict]):
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            requests.append(dict(self.headers))
+            if self.headers.get("If-None-Match") == '"v1"':
+                self.send_response(304)
+                self.end_headers()
+                return
+            payload = b"<html><body><h1>Supplier delay</h1><p>Inventory risk rising</p></body></html>"
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("ETag", '"v1"')
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, *args) -> None:  # noqa: ARG002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}/news"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_web_connector_revalidates_with_etag(tmp_path: Path, monkeypatch) -> None:
+    policy = WebIngestionPolicy(allowed_domains={"127.0.0.1"}, blocked_domains=set())
+    monkeypatch.setattr(web_connector, "_WEB_POLICY", policy)
+    cache = IngestionResultCache(tmp_path / "cache")
+    service = IngestionService(result_cache=cache)
+    requests: list[dict] = []
+
+    with _etag_server(requests) as url:
+        first = asyncio.run(run_connector("web_source", {"url": url}, service))
+        second = asyncio.run(run_connector("web_source", {"url": url}, service))
+
+    assert second.model_dump() == first.model_dump()
+    assert "If-None-Match" not in requests[0]
+    assert requests[1]["If-None-Match"] == '"v1"'
+    stats = cache.snapshot()
+    assert (stats["hits"], stats["misses"], stats["revalidated"]) == (1, 1, 1)
+
+
+def test_csv_connector_short_circuits_unchanged_file_and_router_reports_stats(tmp_path: Path, monkeypatch) -> None:
+    cache = IngestionResultCache(tmp_path / "cache")
+    monkeypatch.setattr(ingestion_router_mod, "get_result_cache", lambda: cache)
+    csv_path = _csv(tmp_path, "ops.csv", "inventory,supplier\nlow,Acme Corp\n")
+    app = FastAPI()
+    app.include_router(ingestion_router_mod.router)
+
+    with TestClient(app) as client:
+        body = {"connector_id": "csv_upload", "config": {"file_path": str(csv_path)}}
+        first = client.post("/ingestion/connector/run", json=body).json()["bundle"]
+        second = client.post("/ingestion/connector/run", json=body).json()["bundle"]
+        stats = client.get("/ingestion/cache/stats").json()["cache"]
+
+    assert second["source"]["id"] == first["source"]["id"]
+    assert stats["hits"] == 1
+    assert stats["entries"] == 1
+    assert stats["rule_table_version"] == result_cache.RULE_TABLE_VERSION
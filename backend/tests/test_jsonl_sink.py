@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from app.schemas.telemetry import TelemetryEvent
+from app.services.ai.jsonl_sink import JsonlBatchSink
+
+
+def _lines(*paths: Path) -> list[dict]:
+    return [json.loads(line) for path in paths for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_sink_writes_batches_in_order_and_drains_on_close(tmp_path: Path) -> None:
+    file_path = tmp_path / "logs" / "telemetry.jsonl"
+    sink = JsonlBatchSink(file_path, batch_size=50, flush_interval_s=0.01)
+    event = TelemetryEvent(trace_id="trace-model", timestamp="2026-01-01T00:00:00+00:00", stage="request_received")
+
+    assert sink.submit(event)
+    for index in range(499):
+        assert sink.submit({"seq": index})
+    assert sink.flush()
+    sink.close()
+    sink.submit({"seq": "late"})
+
+    records = _lines(file_path)
+    assert records[0]["trace_id"] == "trace-model"
+    assert [record["seq"] for record in records[1:]] == list(range(499)) + ["late"]
+    assert sink.snapshot()["written"] == 501 and sink.batches < 501
+
+
+def test_sink_rotates_by_size_without_losing_records(tmp_path: Path) -> None:
+    file_path = tmp_path / "audit.jsonl"
+    sink = JsonlBatchSink(file_path, batch_size=10, flush_interval_s=0.01, rotate_max_bytes=400)
+    for index in range(100):
+        sink.submit({"seq": index, "pad": "x" * 20})
+    sink.close()
+
+    rotated = sorted(tmp_path.glob("audit.*.jsonl"), key=lambda path: int(path.name.split(".")[-2]))
+    assert sink.rotations == len(rotated) > 0
+    assert [record["seq"] for record in _lines(*rotated, file_path)] == list(range(100))
+    assert all(path.stat().st_size <= 400 for path in rotated)
+
+
+def test_overflow_policies_drop_newest_or_oldest(tmp_path: Path) -> None:
+    results = {}
+    for policy in ("drop_newest", "drop_oldest"):
+        file_path = tmp_path / f"{policy}.jsonl"
+        # The writer waits for a full batch or a long interval, so the queue fills first.
+        sink = JsonlBatchSink(file_path, batch_size=100, flush_interval_s=30.0, max_queue=3, overflow_policy=policy)
+        accepted = [sink.submit({"seq": index}) for index in range(5)]
+        sink.close()
+        results[policy] = (accepted, [record["seq"] for record in _lines(file_path)], sink.dropped)
+
+    assert results["drop_newest"] == ([True, True, True, False, False], [0, 1, 2], 2)
+    assert results["drop_oldest"] == ([True] * 5, [2, 3, 4], 2)
+
+
+def test_records_are_captured_at_submit_time(tmp_path: Path) -> None:
+    file_path = tmp_path / "telemetry.jsonl"
+    sink = JsonlBatchSink(file_path, batch_size=100, flush_interval_s=30.0)
+    record = {"stage": "request_received", "tags": ["a"]}
+    sink.submit(record)
+    record["stage"] = "mutated"
+    record["tags"].append("b")
+    sink.close()
+
+    assert _lines(file_path) == [{"stage": "request_received", "tags": ["a"]}]
+
+
+def test_block_policy_never_waits_on_an_event_loop_thread(tmp_path: Path) -> None:
+    sink = JsonlBatchSink(
+        tmp_path / "audit.jsonl",
+        batch_size=100,
+        flush_interval_s=30.0,
+        max_queue=1,
+        overflow_policy="block",
+        block_timeout_s=5.0,
+    )
+
+    async def submit_twice() -> list[bool]:
+        return [sink.submit({"seq": 0}), sink.submit({"seq": 1})]
+
+    started_at = time.monotonic()
+    accepted = asyncio.run(submit_twice())
+    elapsed = time.monotonic() - started_at
+    sink.close()
+
+    assert accepted == [True, False]
+    assert elapsed < 1.0
@@ -2,6 +2,10 @@ from __future__ import annotations
 
 import asyncio
 import sys
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 
 
@@ -13,8 +17,10 @@ for path in (BACKEND_DIR, ROOT_DIR):
     if normalized not in sys.path:
         sys.path.insert(0, normalized)
 
+from app.connectors import csv_connector, web_connector
 from app.connectors.merge_contract import ConnectorRunInput, MultiSourceIngestionRequest
 from app.connectors.merge_service import run_multi_source_ingestion
+from app.connectors.web_policy import WebIngestionPolicy
 from ingestion.schemas import Signal, SignalBundle, SourceDocument
 
 
@@ -254,3 +260,106 @@ def test_merge_service_successful_sources_zero_signals(monkeypatch) -> None:
     assert res.bundle.merge_meta["weighted_signal_count"] == 0
     assert "manual_text" in res.bundle.merge_meta["source_weights"]
 
+
+
+@contextmanager
+def _slow_news_server(delay_seconds: float):
+    class _Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:  # noqa: N802
+            time.sleep(delay_seconds)
+            body = f"<html><body><h1>Supplier delay</h1><p>Inventory pressure at {self.path}</p></body></html>"
+            payload = body.encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args) -> None:  # noqa: A002, ARG002
+            return
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def _allow_local_web_sources(monkeypatch) -> None:
+    policy = WebIngestionPolicy(allowed_domains={"127.0.0.1"}, blocked_domains=set())
+    monkeypatch.setattr(web_connector, "_WEB_POLICY", policy)
+
+
+def test_merge_service_fetches_web_sources_concurrently(monkeypatch) -> None:
+    _allow_local_web_sources(monkeypatch)
+    delays = [0.4, 0.6, 0.9]
+    with _slow_news_server(delays[0]) as a, _slow_news_server(delays[1]) as b, _slow_news_server(delays[2]) as c:
+        urls = [f"{c}/slowest", f"{a}/fast", f"{b}/medium"]
+        req = MultiSourceIngestionRequest(
+            sources=[ConnectorRunInput(connector_id="web_source", config={"url": url}) for url in urls]
+        )
+        started_at = time.perf_counter()
+        res = asyncio.run(run_multi_source_ingestion(req))
+        elapsed = time.perf_counter() - started_at
+
+    assert res.ok is True
+    assert [r.bundle.source.metadata["url"] for r in res.bundle.sources] == urls
+    assert max(delays) <= elapsed < 0.75 * sum(delays)
+
+
+def test_merge_service_times_out_slow_source_and_keeps_others(monkeypatch) -> None:
+    _allow_local_web_sources(monkeypatch)
+    with _slow_news_server(0.1) as fast, _slow_news_server(1.5) as slow:
+        req = MultiSourceIngestionRequest(
+            sources=[
+                ConnectorRunInput(connector_id="web_source", config={"url": f"{slow}/stalled"}),
+                ConnectorRunInput(connector_id="web_source", config={"url": f"{fast}/ok"}),
+            ]
+        )
+
+        async def _timed():
+            # Measure inside the loop: asyncio.run() also waits for the abandoned fetch thread on exit.
+            started_at = time.perf_counter()
+            result = await run_multi_source_ingestion(req, timeout_seconds=0.5)
+            return result, time.perf_counter() - started_at
+
+        res, elapsed = asyncio.run(_timed())
+
+    assert res.ok is True
+    assert [r.ok for r in res.bundle.sources] == [False, True]
+    assert res.bundle.sources[0].errors == ["connector_timeout_after_0.5s"]
+    assert res.errors == ["web_source: connector_timeout_after_0.5s"]
+    assert elapsed < 1.2
+
+
+def test_merge_service_times_out_slow_csv_read(monkeypatch, tmp_path: Path) -> None:
+    csv_path = tmp_path / "ops.csv"
+    csv_path.write_text("item,cost\nwidget,120\n", encoding="utf-8")
+    read_csv = csv_connector._read_csv
+
+    def _slow_read_csv(path: Path, stream: bool):
+        time.sleep(1.5)
+        return read_csv(path, stream)
+
+    monkeypatch.setattr(csv_connector, "_read_csv", _slow_read_csv)
+    req = MultiSourceIngestionRequest(
+        sources=[
+            ConnectorRunInput(connector_id="csv_upload", config={"file_path": str(csv_path)}),
+            ConnectorRunInput(connector_id="manual_text", config={"text": "Supplier delays raise inventory cost"}),
+        ]
+    )
+
+    async def _timed():
+        started_at = time.perf_counter()
+        result = await run_multi_source_ingestion(req, timeout_seconds=0.5)
+        return result, time.perf_counter() - started_at
+
+    res, elapsed = asyncio.run(_timed())
+
+    assert [r.ok for r in res.bundle.sources] == [False, True]
+    assert res.bundle.sources[0].errors == ["connector_timeout_after_0.5s"]
+    assert elapsed < 1.2
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+import sys
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+from fastapi.testclient import TestClient
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from app.middleware.rate_limit import InMemoryRateLimiter, RateLimitMiddleware
+from app.middleware.request_audit import RequestAuditMiddleware
+
+
+def _app(*, sample_rate: float = 1.0, max_requests: int = 60) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    def health():
+        return {"ok": True}
+
+    @app.get("/items")
+    def items():
+        return {"ok": True}
+
+    @app.get("/missing")
+    def missing():
+        return StreamingResponse(iter([b"no"]), status_code=404)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter([b"a", b"b", b"c"]), media_type="text/plain")
+
+    app.add_middleware(RequestAuditMiddleware, sample_rate=sample_rate)
+    app.add_middleware(RateLimitMiddleware, max_requests=max_requests, window_seconds=60)
+    return app
+
+
+def test_sliding_window_counter_weights_previous_window() -> None:
+    limiter = InMemoryRateLimiter(max_requests=10, window_seconds=60)
+    assert all(limiter.allow_request("1.2.3.4", now=60.0 + i) for i in range(10))
+    assert not limiter.allow_request("1.2.3.4", now=119.0)
+
+    # 15s into the next window three quarters of the previous count still apply.
+    assert [limiter.allow_request("1.2.3.4", now=135.0) for _ in range(3)] == [True, True, True]
+    assert not limiter.allow_request("1.2.3.4", now=135.0)
+    assert limiter.allow_request("1.2.3.4", now=300.0)
+
+
+def test_rate_limit_middleware_rejects_excess_requests_but_not_health() -> None:
+    with TestClient(_app(max_requests=2)) as client:
+        statuses = [client.get("/items").status_code for _ in range(3)]
+        health = client.get("/health")
+        other_client = client.get("/items", headers={"x-forwarded-for": "10.9.9.9"})
+        rejected = client.get("/items", headers={"origin": "http://127.0.0.1:3000"})
+
+    assert statuses == [200, 200, 429]
+    assert health.status_code == 200
+    assert other_client.status_code == 200
+    assert rejected.json()["error"]["type"] == "RATE_LIMIT_EXCEEDED"
+    assert rejected.headers["access-control-allow-origin"] == "http://127.0.0.1:3000"
+
+
+def test_audit_sampling_always_logs_errors_and_streams_pass_through(caplog) -> None:
+    caplog.set_level(logging.INFO, logger="nexora.request_audit")
+    with TestClient(_app(sample_rate=0.0)) as client:
+        streamed = client.get("/stream")
+        client.get("/items")
+        client.get("/missing")
+
+    assert streamed.text == "abc"
+    lines = [record.getMessage() for record in caplog.records if record.name == "nexora.request_audit"]
+    assert len(lines) == 1
+    assert "path=/missing" in lines[0] and "status_code=404" in lines[0]
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from app.services.hybrid_rulebook import _text_tokens, infer_objects_from_text_scored
+from app.services.object_registry import infer_allowed_objects_from_text, sync_object_index
+from app.services.object_text_index import ObjectTextIndex
+
+
+def _entry(oid: str, label: str, *, tags=None, hints=None) -> dict:
+    return {"id": oid, "label": label, "tags": tags or [], "domain_hints": hints or {}}
+
+
+def test_index_scores_postings_and_syncs_appended_entries():
+    index = ObjectTextIndex()
+    source = {"a": {"t": ["risk", "delay"]}, "b": {"t": ["risk"]}}
+
+    def terms(_oid, entry):
+        return {"base": {token: 1.0 for token in entry["t"]}}
+
+    index.sync_group("g", source, terms)
+    source["c"] = {"t": ["delay", "delay_cost"]}
+    index.sync_group("g", source, terms)
+
+    scores = index.score({"risk", "delay"}, "base")
+    assert {index.document(pos)[1]: score for pos, score in scores.items()} == {"a": 2.0, "b": 1.0, "c": 1.0}
+
+    index.sync_group("g", {"z": {"t": ["risk"]}}, terms)
+    scores = index.score({"risk"}, "base")
+    assert [index.document(pos)[1] for pos in scores] == ["z"]
+    assert len(index) == 1
+
+
+def test_concurrent_syncs_index_each_entry_once():
+    index = ObjectTextIndex()
+    source = {f"o{position}": {"t": ["risk"]} for position in range(40)}
+    barrier = threading.Barrier(8)
+
+    def terms(_oid, entry):
+        time.sleep(0.0005)  # widen the window between reading the size and appending
+        return {"base": {token: 1.0 for token in entry["t"]}}
+
+    def sync():
+        barrier.wait()
+        index.sync_group("g", source, terms)
+
+    threads = [threading.Thread(target=sync) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    found = [index.document(pos)[1] for pos in index.score({"risk"}, "base")]
+    assert sorted(found) == sorted(source)
+    assert len(index) == len(source)
+
+
+def test_registry_inference_sees_new_instances_and_mode_bonus():
+    instances = {"obj_inventory__1": _entry("obj_inventory__1", "Warehouse stock")}
+    types = {"obj_delivery": _entry("obj_delivery", "Delivery", hints={"business": ["shipment delays"]})}
+    index = sync_object_index(ObjectTextIndex(), object_instances=instances, object_types=types, legacy_objects={})
+
+    kwargs = dict(object_instances=instances, object_types=types, legacy_objects={}, index=index)
+    assert infer_allowed_objects_from_text("delays", mode="business", **kwargs) == ["obj_delivery"]
+    assert infer_allowed_objects_from_text("delays", mode="business", allowed_only=["obj_other"], **kwargs) == []
+
+    instances["obj_delivery__1"] = _entry("obj_delivery__1", "Delays at port")
+    assert infer_allowed_objects_from_text("delays", mode="business", **kwargs) == ["obj_delivery__1"]
+
+
+def test_rulebook_scores_match_field_overlap():
+    object_dict = {
+        "instances": [_entry("obj_b", "Cash buffer", tags=["liquidity"])],
+        "types": {"obj_a": _entry("obj_a", "Cash flow", hints={"ops": ["cash", "runway"]})},
+        "objects": [_entry("obj_c", "Quality")],
+    }
+    text = "cash runway obj_b liquidity"
+
+    expected = []
+    tokens = set(_text_tokens(text))
+    for oid, entry in (("obj_b", object_dict["instances"][0]), ("obj_a", object_dict["types"]["obj_a"])):
+        fields = [entry["id"], entry["label"], *entry["tags"], *sum(entry["domain_hints"].values(), [])]
+        field_tokens = {token for field in fields for token in _text_tokens(field)}
+        expected.append((oid, len(tokens & field_tokens) + (0.25 if oid in tokens else 0.0)))
+    expected.sort(key=lambda item: item[1], reverse=True)
+
+    assert infer_objects_from_text_scored(text, "business", object_dict) == expected
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from ingestion.extractors import pdf_extractor
+from ingestion.service import IngestionService
+from ingestion.signal_builder import build_signals
+
+
+def _write_pdf(path: Path, pages: list[str]) -> None:
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", "", "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for text in pages:
+        ops = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(f"<< /Length {len(ops)} >>\nstream\n{ops}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+PAGES = [
+    "Acme supplier reports a late shipment",
+    "",
+    "Cost overrun on freight lanes",
+    "Customer churn after delivery backlog",
+]
+
+
+def test_pdf_ingest_streams_pages_and_reuses_page_cache(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "report.pdf"
+    _write_pdf(pdf_path, PAGES)
+    pdf_extractor.PAGE_CACHE.clear()
+    service = IngestionService()
+
+    first = service.ingest(input_type="pdf", payload={"path": str(pdf_path)})
+    second = service.ingest(input_type="pdf", payload=str(pdf_path))
+
+    text = pdf_extractor.extract_text(str(pdf_path))
+    assert first.source.raw_content == text
+    assert text.split("\n\n") == [page for page in PAGES if page]
+    expected = [(s.type, s.strength, s.entities) for s in build_signals(text, "src_x")]
+    assert [(s.type, s.strength, s.entities) for s in first.signals] == expected
+    assert first.ingestion_meta["pages_cached"] == 0
+    assert first.ingestion_meta["pages_with_text"] == len(PAGES) - 1
+    assert first.ingestion_meta["parallel"] is False
+    assert second.ingestion_meta["pages_cached"] == len(PAGES)
+    assert "truncated" not in second.ingestion_meta
+
+
+def test_pdf_ingest_honours_max_pages(tmp_path: Path) -> None:
+    pdf_path = tmp_path / "report.pdf"
+    _write_pdf(pdf_path, PAGES)
+
+    bundle = IngestionService().ingest(input_type="pdf", payload={"path": str(pdf_path), "max_pages": 1})
+
+    assert bundle.source.raw_content == PAGES[0]
+    assert bundle.ingestion_meta["truncated"] == "max_pages"
+    assert bundle.ingestion_meta["page_count"] == len(PAGES)
+
+
+def test_pdf_pool_extraction_matches_sequential(tmp_path: Path, monkeypatch) -> None:
+    pdf_path = tmp_path / "long.pdf"
+    _write_pdf(pdf_path, [f"Page {index} supplier delay" for index in range(9)])
+    monkeypatch.setattr(pdf_extractor, "PAGES_PER_TASK", 4)
+
+    progress = pdf_extractor.PdfExtractionProgress()
+    try:
+        pooled = list(pdf_extractor.iter_page_texts(str(pdf_path), parallel=True, cache=None, progress=progress))
+        assert pdf_extractor._POOL._mp_context.get_start_method() == "spawn"
+    finally:
+        pdf_extractor.shutdown_pdf_pool()
+    sequential = list(pdf_extractor.iter_page_texts(str(pdf_path), parallel=False, cache=None))
+
+    assert progress.parallel is True
+    assert pooled == sequential
+    assert [index for index, _ in pooled] == list(range(9))
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from app.services.perf_profiler import (
+    LatencyHistogram,
+    perf_snapshot,
+    perf_span,
+    request_trace,
+    reset_perf,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_registry():
+    reset_perf()
+    yield
+    reset_perf()
+
+
+def test_histogram_percentiles_are_within_one_bucket() -> None:
+    histogram = LatencyHistogram()
+    for value in range(1, 1001):
+        histogram.record(value / 10.0)
+
+    assert histogram.count == 1000
+    assert 50.0 <= histogram.percentile(50) <= 50.0 * 1.2
+    assert 99.0 <= histogram.percentile(99) <= 100.0
+    assert histogram.percentile(100) == histogram.max_ms == 100.0
+
+
+def test_span_works_as_decorator_and_context_manager_and_counts_errors() -> None:
+    @perf_span("unit.decorated")
+    def work(fail: bool) -> int:
+        if fail:
+            raise ValueError("boom")
+        return 1
+
+    assert work(False) == 1
+    with pytest.raises(ValueError):
+        work(True)
+    with perf_span("unit.block"):
+        pass
+
+    stages = {row["stage"]: row for row in perf_snapshot()["stages"]}
+    assert stages["unit.decorated"]["count"] == 2
+    assert stages["unit.decorated"]["errors"] == 1
+    assert stages["unit.block"]["count"] == 1
+
+
+def test_request_trace_collects_spans_from_worker_threads_and_profiles() -> None:
+    def busy() -> None:
+        with perf_span("unit.worker"):
+            deadline = time.perf_counter() + 0.05
+            while time.perf_counter() < deadline:
+                pass
+
+    async def handler() -> str | None:
+        with request_trace("unit.request", profile=True) as trace_id:
+            await asyncio.to_thread(busy)
+        return trace_id
+
+    trace_id = asyncio.run(handler())
+    snapshot = perf_snapshot()
+    trace = snapshot["slowest_traces"][0]
+
+    assert trace["trace_id"] == trace_id
+    assert [span["stage"] for span in trace["spans"]] == ["unit.worker"]
+    assert trace["total_latency_ms"] >= trace["spans"][0]["latency_ms"] >= 50.0
+    assert any("busy" in entry["stack"] for entry in trace["profile"])
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from app.models.replay import ReplayFrame, ReplayMeta
+from app.services import replay_store
+from app.services.replay_store import EPISODE_FORMAT, ReplayStore
+
+
+def _frame(t: float, text: str = "hello") -> ReplayFrame:
+    return ReplayFrame(
+        t=t,
+        input_text=text,
+        human_state={},
+        system_signals={"pressure": 0.4},
+        system_state={"kpi": {"risk": 0.2}},
+        visual={"scene_json": {}},
+        meta=ReplayMeta(note=None, tags=["test"]),
+    )
+
+
+def test_append_frames_round_trip_and_ranges(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    episode = store.create_episode(title="demo")
+
+    for index in range(5):
+        summary, warnings = store.append_frame_summary(episode.episode_id, _frame(0.0, text=f"turn-{index}"))
+        assert warnings == []
+    updated, _ = store.append_frame(episode.episode_id, _frame(10.0, text="turn-5"))
+
+    assert summary["frame_count"] == 5
+    assert len(updated.frames) == 6
+    assert [frame.input_text for frame in updated.frames] == [f"turn-{index}" for index in range(6)]
+    assert all(a.t < b.t for a, b in zip(updated.frames, updated.frames[1:]))
+    assert [frame.input_text for frame in store.read_frames(episode.episode_id, 2, 4)] == ["turn-2", "turn-3"]
+    assert store.read_frames(episode.episode_id, -1)[0].input_text == "turn-5"
+    assert store.list_episodes()[0]["frame_count"] == 6
+
+
+def test_frame_limit_drops_oldest_and_compacts(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), max_frames=4, background_compaction=False)
+    episode = store.create_episode()
+
+    warnings: list[str] = []
+    for index in range(6):
+        _, warnings = store.append_frame_summary(episode.episode_id, _frame(index + 1.0, text=f"turn-{index}"))
+
+    loaded = store.get_episode(episode.episode_id)
+    header = json.loads(store._path(episode.episode_id).read_text(encoding="utf-8"))
+
+    assert warnings == ["frame_limit_reached_oldest_dropped"]
+    assert [frame.input_text for frame in loaded.frames] == ["turn-2", "turn-3", "turn-4", "turn-5"]
+    assert header["total_frames"] - header["first_frame"] == 4
+    assert header["first_frame"] < 2
+
+
+def test_legacy_episode_is_migrated_on_first_access(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    legacy = {
+        "episode_id": "legacy-1",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "updated_at": "2025-01-01T00:00:00+00:00",
+        "title": "legacy",
+        "frames": [_frame(1.0).model_dump(), _frame(2.0, text="second").model_dump()],
+        "duration": 2.0,
+        "version": "v1",
+    }
+    store._path("legacy-1").write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert store.list_episodes()[0]["frame_count"] == 2
+
+    store.append_frame_summary("legacy-1", _frame(0.0, text="third"))
+    episode = store.get_episode("legacy-1")
+    header = json.loads(store._path("legacy-1").read_text(encoding="utf-8"))
+
+    assert header["format"] == EPISODE_FORMAT
+    assert [frame.input_text for frame in episode.frames] == ["hello", "second", "third"]
+    assert episode.frames[-1].t > 2.0
+
+
+def test_bulk_migration_converts_legacy_episodes_with_bounded_locks(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    for index in range(3):
+        legacy = {
+            "episode_id": f"legacy-{index}",
+            "created_at": "2025-01-01T00:00:00+00:00",
+            "updated_at": "2025-01-01T00:00:00+00:00",
+            "frames": [_frame(1.0).model_dump()],
+            "duration": 1.0,
+            "version": "v1",
+        }
+        store._path(f"legacy-{index}").write_text(json.dumps(legacy), encoding="utf-8")
+    for _ in range(200):
+        store.create_episode()
+
+    assert store.migrate_legacy_episodes() == 3
+    assert store.migrate_legacy_episodes() == 0
+    headers = [json.loads(store._path(f"legacy-{index}").read_text(encoding="utf-8")) for index in range(3)]
+    assert {header["format"] for header in headers} == {EPISODE_FORMAT}
+    assert len(replay_store._episode_locks) == replay_store._EPISODE_LOCK_SHARDS
+
+
+def test_bulk_migration_moves_invalid_legacy_episodes_aside_and_continues(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    legacy = {
+        "episode_id": "b_ok",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "updated_at": "2025-01-01T00:00:00+00:00",
+        "frames": [_frame(1.0).model_dump()],
+        "duration": 1.0,
+        "version": "v1",
+    }
+    store._path("a_bad").write_text(
+        json.dumps({**legacy, "episode_id": "a_bad", "frames": [{"t": "not-a-time"}]}), encoding="utf-8"
+    )
+    store._path("a_list").write_text("[]", encoding="utf-8")
+    store._path("b_ok").write_text(json.dumps(legacy), encoding="utf-8")
+
+    assert store.migrate_legacy_episodes() == 1
+    assert json.loads(store._path("b_ok").read_text(encoding="utf-8"))["format"] == EPISODE_FORMAT
+    assert sorted(path.name for path in store.corrupt_dir.glob("*.json")) == ["a_bad.json", "a_list.json"]
+
+
+def test_branch_copies_last_frame_with_parent_reference(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    parent = store.create_episode()
+    store.append_frame_summary(parent.episode_id, _frame(1.0, text="first"))
+    store.append_frame_summary(parent.episode_id, _frame(2.0, text="last"))
+
+    child = store.create_branch_from_episode(parent.episode_id)
+    frames = store.get_episode(child.episode_id).frames
+
+    assert [frame.input_text for frame in frames] == ["last"]
+    assert frames[0].system_state["branch_parent_episode_id"] == parent.episode_id
+
+
+def test_catalog_lists_sorted_pages_and_last_system_state(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    ids = []
+    for count in (3, 1, 2):
+        episode = store.create_episode(title=f"episode-{count}")
+        for index in range(count):
+            frame = _frame(index + 1.0).model_copy(update={"system_state": {"kpi": {"risk": index / 10}}})
+            store.append_frame_summary(episode.episode_id, frame)
+        ids.append(episode.episode_id)
+
+    by_frames = store.list_episodes(sort_by="frame_count", descending=True)
+    page = store.list_episodes(limit=1, offset=1, sort_by="frame_count")
+
+    assert [item["frame_count"] for item in by_frames] == [3, 2, 1]
+    assert [item["frame_count"] for item in page] == [2]
+    assert store.get_last_system_state(ids[0]) == {"kpi": {"risk": 0.2}}
+    assert store.get_last_frame(ids[1]).system_state == {"kpi": {"risk": 0.0}}
+
+    store.delete_episode(ids[2])
+    assert {item["episode_id"] for item in store.list_episodes()} == set(ids[:2])
+
+
+def test_catalog_reconciles_files_written_outside_the_store(tmp_path: Path):
+    store = ReplayStore(base_dir=str(tmp_path), background_compaction=False)
+    legacy = {
+        "episode_id": "external-1",
+        "created_at": "2025-01-01T00:00:00+00:00",
+        "updated_at": "2025-01-01T00:00:00+00:00",
+        "title": "external",
+        "frames": [_frame(1.0).model_dump()],
+        "duration": 1.0,
+        "version": "v1",
+    }
+    store._path("external-1").write_text(json.dumps(legacy), encoding="utf-8")
+
+    listed = store.list_episodes()
+
+    assert [item["episode_id"] for item in listed] == ["external-1"]
+    assert store.get_last_system_state("external-1") == {"kpi": {"risk": 0.2}}
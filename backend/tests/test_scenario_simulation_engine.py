@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine
 from engines.scenario_simulation.simulation_schema import ScenarioInput, ScenarioShock
 from engines.system_modeling.system_model_builder import UniversalSystemModelBuilder
@@ -79,3 +81,42 @@ def test_simulation_engine_compares_named_scenarios():
     assert comparison.worst_scenario is not None
     assert len(comparison.scenarios) == 2
     assert comparison.baseline.stability_score >= 0.0
+
+
+def test_batched_compare_matches_stepwise_engine():
+    pytest.importorskip("numpy")
+    builder = UniversalSystemModelBuilder()
+    model = builder.build(
+        "Supply chain delays are increasing costs and reducing customer satisfaction. "
+        "Suppliers are unreliable, inventory shortages create panic orders and liquidity is tight."
+    )
+    scenarios = {
+        "demand_spike": ScenarioInput(shocks=[ScenarioShock(signal="demand", delta=0.37)], time_steps=12),
+        "inventory_crash": ScenarioInput(shocks=[ScenarioShock(signal="inventory", delta=-0.45)], time_steps=30),
+        "calm": ScenarioInput(time_steps=3),
+    }
+
+    engine = ScenarioSimulationEngine()
+    comparison = engine.compare(model, scenarios)
+
+    initial_state = engine.state_manager.initialize(model)
+    for entry in comparison.scenarios:
+        scenario = scenarios[entry.scenario_name]
+        expected = engine.core._run_stepwise(
+            system_model=model,
+            scenario=scenario,
+            initial_state=engine.shock_applier.apply(initial_state, scenario.shocks),
+        )
+        assert entry.result.timeline == expected.timeline
+        assert entry.result.events == expected.events
+        assert entry.result.stability_score == expected.stability_score
+
+
+def test_compiled_clamp_matches_signal_state_rounding():
+    np = pytest.importorskip("numpy")
+    from engines.scenario_simulation.compiled_model import clamp_round
+    from engines.scenario_simulation.signal_state import SignalStateManager
+
+    values = np.array([-0.2, 0.0, 0.12345, 0.00015, 0.33335, 0.5, 0.99996, 1.00004, 0.6 + 0.03 * 0.35])
+
+    assert clamp_round(values).tolist() == [SignalStateManager.clamp(float(value)) for value in values]
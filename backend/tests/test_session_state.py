@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sys
+import threading
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from app.middleware.rate_limit import InMemoryRateLimiter
+from app.services.event_store_mem import EventStoreMem
+from app.services.object_text_index import ObjectTextIndex
+from app.services.session_state import SessionStateStore, session_state_metrics
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_store_evicts_least_recently_used_and_expires_idle_entries() -> None:
+    clock = _Clock()
+    store: SessionStateStore[int] = SessionStateStore("t_lru", max_entries=2, ttl_seconds=10, clock=clock)
+
+    store["a"] = 1
+    store["b"] = 2
+    assert store["a"] == 1  # refreshes "a", so "b" is the eviction candidate
+    store["c"] = 3
+    assert sorted(store) == ["a", "c"]
+
+    clock.now += 6
+    store["c"] = 4
+    clock.now += 6
+    assert "a" not in store
+    assert dict(store.items()) == {"c": 4}
+
+    stats = store.snapshot()
+    assert (stats["evictions"], stats["expirations"], stats["entries"]) == (1, 1, 1)
+    assert stats["approx_bytes"] > 0
+    assert any(entry["name"] == "t_lru" for entry in session_state_metrics())
+
+
+def test_spill_keeps_evicted_and_flushed_state_across_restarts(tmp_path: Path) -> None:
+    spill = tmp_path / "session.sqlite3"
+    store: SessionStateStore[dict] = SessionStateStore("t_spill", max_entries=1, spill_path=spill)
+    store["u1"] = {"risk": 0.4}
+    store["u2"] = {"risk": 0.6}
+    assert list(store) == ["u2"]
+    assert store["u1"] == {"risk": 0.4}  # restored from disk, evicting u2 to disk
+    store["u1"]["risk"] = 0.9
+    store.close()
+
+    reopened: SessionStateStore[dict] = SessionStateStore("t_spill", max_entries=4, spill_path=spill)
+    assert reopened.warm() == 2
+    assert dict(reopened.items()) == {"u2": {"risk": 0.6}, "u1": {"risk": 0.9}}
+    del reopened["u2"]
+    reopened.reset()
+    assert reopened.get("u2") is None
+    assert reopened.get("u1") == {"risk": 0.9}
+    reopened.close()
+
+
+def test_sharded_lock_serializes_read_modify_write() -> None:
+    store: SessionStateStore[int] = SessionStateStore("t_counter", ttl_seconds=None)
+
+    def bump() -> None:
+        for _ in range(500):
+            with store.lock("user"):
+                store["user"] = store.get("user", 0) + 1
+
+    threads = [threading.Thread(target=bump) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert store["user"] == 4000
+
+
+def test_rate_limiter_and_event_store_are_bounded() -> None:
+    limiter = InMemoryRateLimiter(max_requests=2, window_seconds=60, max_clients=3)
+    assert limiter.allow_request("10.0.0.1") and limiter.allow_request("10.0.0.1")
+    assert not limiter.allow_request("10.0.0.1")
+    for index in range(2, 10):
+        limiter.allow_request(f"10.0.0.{index}")
+    assert len(limiter._requests) == 3
+
+    events = EventStoreMem(max_per_user=2, max_users=2)
+    for user in ("a", "b", "c"):
+        for turn in range(3):
+            events.append(user, f"msg {turn}", "ok", [])
+    assert events.recent("a") == []
+    assert [event["user_text"] for event in events.recent("c")] == ["msg 1", "msg 2"]
+
+
+def test_object_index_reindexes_after_store_eviction() -> None:
+    store: SessionStateStore[dict] = SessionStateStore(
+        "t_instances", max_entries=2, ttl_seconds=None, refresh_on_read=False
+    )
+    index = ObjectTextIndex()
+    channels = lambda object_id, entry: {"base": {entry["label"]: 1.0}}  # noqa: E731
+
+    store["i1"] = {"label": "warehouse"}
+    store["i2"] = {"label": "supplier"}
+    index.sync_group("instances", store, channels)
+    store["i3"] = {"label": "carrier"}  # evicts i1; the size stays at 2
+    index.sync_group("instances", store, channels)
+
+    found = {index.document(position)[1] for position in index.score(["warehouse", "carrier"], "base")}
+    assert found == {"i3"}
+
+
+def test_registry_counters_are_never_evicted_so_instance_ids_stay_unique() -> None:
+    import main
+    from app.services.session_state import SESSION_MAX_ENTRIES
+
+    saved = main._INSTANCE_COUNTERS.items()
+    try:
+        main._INSTANCE_COUNTERS.reset()
+        first = main._next_instance_id("type_warehouse")
+        for index in range(SESSION_MAX_ENTRIES + 1):
+            main._next_instance_id(f"type_bulk_{index}")
+        issued = {first, main._next_instance_id("type_warehouse"), main._next_instance_id("type_warehouse")}
+
+        assert len(issued) == 3
+        assert len(main._INSTANCE_COUNTERS) == SESSION_MAX_ENTRIES + 2
+        assert main._OBJECT_INSTANCES.max_entries is None
+    finally:
+        main._INSTANCE_COUNTERS.reset(dict(saved))
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import re
+import sys
+from pathlib import Path
+
+
+ROOT_DIR = Path(__file__).resolve().parents[2]
+BACKEND_DIR = ROOT_DIR / "backend"
+
+for path in (BACKEND_DIR, ROOT_DIR):
+    normalized = str(path)
+    if normalized not in sys.path:
+        sys.path.insert(0, normalized)
+
+from ingestion.rule_matcher import CompiledRuleMatcher
+from ingestion.signal_builder import build_signals, scan_keywords
+
+
+def test_matcher_reports_overlapping_and_contained_occurrences() -> None:
+    matcher = CompiledRuleMatcher(["late", "latency", "overrun", "budget overrun", "demand"])
+    text = "budget overrun; latency is late. overloademand"
+
+    scan = matcher.scan(text)
+
+    assert scan.offsets["budget overrun"] == (0,)
+    assert scan.offsets["overrun"] == (7,)
+    assert scan.offsets["late"] == (16, 27)
+    assert scan.spans("latency") == [(16, 23)]
+    assert scan.count("demand") == 1
+    assert matcher.present(text) == frozenset(scan.offsets)
+    assert "budget overrun" not in matcher.scan("budget cuts only")
+
+
+def test_scan_keywords_offsets_match_substring_search() -> None:
+    text = "Behind schedule: supplier out of stock, late delivery; Customer churn after delays."
+
+    scan = scan_keywords(text)
+
+    lowered = text.lower()
+    for keyword, offsets in scan.offsets.items():
+        assert offsets == tuple(m.start() for m in re.finditer(f"(?={re.escape(keyword)})", lowered))
+    assert {"behind schedule", "out of stock", "late", "delay", "supplier", "customer"} <= set(scan.offsets)
+
+
+def test_build_signals_entities_keep_token_boundaries() -> None:
+    text = "Acme reports delay. x_inventory and pre-cash are not entities; supplier and cost are."
+
+    signals = build_signals(text, "src_test")
+
+    assert signals[0].entities == ["Acme", "supplier", "cost"]
+    assert [s.type for s in signals] == ["delay", "cost_pressure", "supplier_impact"]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from engines.decision_engine.decision_engine import StrategicDecisionEngine
+from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine
+from engines.scenario_simulation.simulation_cache import SimulationCache, model_fingerprint, simulation_key
+from engines.scenario_simulation.simulation_schema import ScenarioInput, ScenarioShock
+from engines.system_modeling.system_model_builder import UniversalSystemModelBuilder
+
+
+PROMPT = (
+    "Supply chain delays are increasing costs and reducing customer satisfaction. "
+    "Suppliers are unreliable and inventory shortages create panic orders."
+)
+
+
+def _analysis(cache_size: int) -> tuple[dict, SimulationCache]:
+    model = UniversalSystemModelBuilder().build(PROMPT)
+    simulation_engine = ScenarioSimulationEngine(cache=SimulationCache(cache_size))
+    baseline = simulation_engine.simulate(model, ScenarioInput(time_steps=10))
+    analysis = StrategicDecisionEngine(simulation_engine=simulation_engine).analyze(
+        system_model=model,
+        simulation=baseline,
+    )
+    return analysis.model_dump(mode="json"), simulation_engine.cache
+
+
+def test_cached_analysis_matches_uncached_and_compare_reuses_action_runs() -> None:
+    uncached, _ = _analysis(0)
+    cached, cache = _analysis(64)
+
+    assert cached == uncached
+    strategies = len(cached["strategies"])
+    # Only the baseline and one batched pass (comparison baseline + actions) simulate;
+    # the per-action runs and compare() are all served from the cache.
+    assert cache.misses == strategies + 2
+    assert cache.hits == 2 * strategies + 1
+
+
+def test_key_ignores_metadata_but_not_shocks_or_horizon() -> None:
+    fingerprint = model_fingerprint(UniversalSystemModelBuilder().build(PROMPT))
+    base = ScenarioInput(shocks=[ScenarioShock(signal="demand", delta=0.2)], time_steps=8)
+
+    assert simulation_key(fingerprint, base) == simulation_key(
+        fingerprint, base.model_copy(update={"metadata": {"strategy_id": "x"}})
+    )
+    assert simulation_key(fingerprint, base) != simulation_key(fingerprint, base.model_copy(update={"time_steps": 9}))
+    assert simulation_key(fingerprint, base) != simulation_key(
+        fingerprint, ScenarioInput(shocks=[ScenarioShock(signal="demand", delta=0.3)], time_steps=8)
+    )
+
+
+def test_cache_evicts_lru_and_returns_independent_copies() -> None:
+    model = UniversalSystemModelBuilder().build(PROMPT)
+    engine = ScenarioSimulationEngine(cache=SimulationCache(2))
+    first = engine.simulate(model, ScenarioInput(time_steps=3))
+    first.metadata["annotated"] = True
+
+    again = engine.simulate(model, ScenarioInput(time_steps=3))
+    engine.simulate(model, ScenarioInput(time_steps=4))
+    engine.simulate(model, ScenarioInput(time_steps=5))
+
+    assert "annotated" not in again.metadata
+    assert engine.cache.snapshot()["entries"] == 2
+    assert engine.cache.evictions == 1
+    assert engine.cache.hits == 1
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+from engines.decision_engine.decision_engine import StrategicDecisionEngine
+from engines.decision_engine.decision_schema import CandidateAction
+from engines.scenario_simulation import simulation_pool
+from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine
+from engines.scenario_simulation.simulation_cache import SimulationCache
+from engines.scenario_simulation.simulation_schema import ScenarioInput, ScenarioShock
+from engines.system_modeling.system_model_builder import UniversalSystemModelBuilder
+
+
+MODEL = UniversalSystemModelBuilder().build(
+    "Supply chain delays are increasing costs and suppliers are unreliable while competitors cut prices."
+)
+SCENARIOS = [
+    ScenarioInput(shocks=[ScenarioShock(signal="cost", delta=index / 100)], time_steps=6 + index % 4)
+    for index in range(10)
+]
+
+
+def _dumps(results) -> list[dict]:
+    return [result.model_dump() for result in results]
+
+
+def test_pool_results_match_serial_in_input_order(monkeypatch) -> None:
+    monkeypatch.setattr(simulation_pool, "PARALLEL_MIN_SCENARIOS", 4)
+    serial = ScenarioSimulationEngine(cache=SimulationCache(0), workers=1).simulate_batch(MODEL, SCENARIOS)
+    try:
+        parallel = ScenarioSimulationEngine(cache=SimulationCache(0), workers=3).simulate_batch(MODEL, SCENARIOS)
+    finally:
+        simulation_pool.shutdown_simulation_pools()
+
+    assert _dumps(parallel) == _dumps(serial)
+
+
+def test_small_batches_and_pool_failures_run_serially(monkeypatch) -> None:
+    assert not simulation_pool.should_parallelize(simulation_pool.PARALLEL_MIN_SCENARIOS - 1, 8)
+    assert not simulation_pool.should_parallelize(100, 1)
+
+    def broken_pool(workers):
+        raise OSError("no processes")
+
+    monkeypatch.setattr(simulation_pool, "PARALLEL_MIN_SCENARIOS", 2)
+    monkeypatch.setattr(simulation_pool, "_get_pool", broken_pool)
+    engine = ScenarioSimulationEngine(cache=SimulationCache(0), workers=4)
+
+    serial = ScenarioSimulationEngine(cache=SimulationCache(0), workers=1).simulate_batch(MODEL, SCENARIOS)
+    assert _dumps(engine.simulate_batch(MODEL, SCENARIOS)) == _dumps(serial)
+
+
+def test_parallel_decision_analysis_is_identical(monkeypatch) -> None:
+    monkeypatch.setattr(simulation_pool, "PARALLEL_MIN_SCENARIOS", 4)
+    actions = [
+        CandidateAction(id=f"action_{index}", description=description)
+        for index, description in enumerate(
+            ["buffer inventory", "diversify suppliers", "cost efficiency", "pressure intervention", "pricing review"]
+        )
+    ]
+    baseline = ScenarioSimulationEngine(workers=1).simulate(MODEL, ScenarioInput(time_steps=8))
+    outputs = []
+    try:
+        for workers in (1, 2):
+            engine = StrategicDecisionEngine(simulation_engine=ScenarioSimulationEngine(workers=workers))
+            analysis = engine.analyze(
+                system_model=MODEL,
+                simulation=baseline,
+                candidate_actions=actions,
+                scenario=ScenarioInput(time_steps=8),
+            )
+            outputs.append(analysis.model_dump(mode="json"))
+    finally:
+        simulation_pool.shutdown_simulation_pools()
+
+    assert outputs[0] == outputs[1]
+
+
+def test_pool_uses_spawned_workers_and_closes_on_app_shutdown() -> None:
+    from fastapi.testclient import TestClient
+
+    import main
+
+    with TestClient(main.app):
+        pool = simulation_pool._get_pool(2)
+        assert pool._mp_context.get_start_method() == "spawn"
+    assert simulation_pool._POOLS == {}
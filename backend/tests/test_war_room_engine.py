@@ -75,3 +75,88 @@ def test_war_room_engine_tracks_fragility_and_strategy_paths():
     assert "event_count" in result.system_fragility
     assert result.strategy_paths
     assert all(item.strategy_history for item in result.actor_outcomes)
+
+
+def _competition_simulation(time_steps: int = 12) -> WarRoomSimulation:
+    model = UniversalSystemModelBuilder().build(
+        "Supply chain delays are increasing costs and reducing customer satisfaction. "
+        "Suppliers are unreliable and inventory shortages create panic orders while competitors cut prices."
+    )
+    return WarRoomSimulation(
+        system_model=model,
+        actors=[
+            WarRoomActor(id="actor_company", type="company"),
+            WarRoomActor(id="actor_competitor", type="competitor"),
+            WarRoomActor(id="actor_alliance", type="alliance"),
+        ],
+        strategies={
+            "actor_company": ["expand capacity", "diversify suppliers", "defend margin"],
+            "actor_competitor": ["price war", "product innovation"],
+            "actor_alliance": ["form alliance", "hedge exposure"],
+        },
+        time_steps=time_steps,
+    )
+
+
+def test_war_room_regime_selection_matches_state_selection():
+    engine = StrategyWarRoomEngine()
+    simulation = _competition_simulation()
+    actors = [engine.actor_model.normalize(actor) for actor in simulation.actors]
+    strategies = {
+        actor_id: [engine.strategy_model.build(actor_id, item) for item in items]
+        for actor_id, items in simulation.strategies.items()
+    }
+    recommended = {"actor_company": strategies["actor_company"][2].id}
+    baseline = engine.interaction_engine.decision_engine.simulation_engine.simulate(simulation.system_model)
+    for pressure in (0.2, 0.55, 0.56, 0.9):
+        for demand in (0.3, 0.8):
+            for risk in (0.1, 0.7):
+                state = {"system pressure": pressure, "demand": demand, "security risk": risk}
+                expected = engine.interaction_engine.select_strategies(
+                    actors=actors,
+                    strategies_by_actor=strategies,
+                    system_model=simulation.system_model,
+                    baseline_simulation=baseline,
+                    time_steps=simulation.time_steps,
+                    current_state=state,
+                    recommended_by_actor=recommended,
+                )
+                regime = engine.interaction_engine.selection_regime(state)
+                assert engine.interaction_engine.select_for_regime(
+                    actors=actors,
+                    strategies_by_actor=strategies,
+                    recommended_by_actor=recommended,
+                    regime=regime,
+                ) == expected
+
+
+def test_war_room_compiled_run_matches_dictionary_fallback(monkeypatch):
+    from engines.scenario_simulation import compiled_model
+
+    simulation = _competition_simulation()
+    compiled = StrategyWarRoomEngine().run(simulation)
+    monkeypatch.setattr(compiled_model, "np", None)
+    stepwise = StrategyWarRoomEngine().run(simulation)
+
+    assert compiled.model_dump() == stepwise.model_dump()
+
+
+def test_war_room_monte_carlo_returns_reproducible_distributions():
+    engine = StrategyWarRoomEngine()
+    simulation = _competition_simulation(time_steps=10)
+
+    first = engine.run_monte_carlo(simulation, runs=24, noise=0.03, seed=11)
+    second = StrategyWarRoomEngine().run_monte_carlo(simulation, runs=24, noise=0.03, seed=11)
+    assert first.model_dump() == second.model_dump()
+
+    assert first.runs == 24
+    assert first.stability_score["min"] <= first.stability_score["p50"] <= first.stability_score["max"]
+    assert [item.actor_id for item in first.actor_distributions] == ["actor_company", "actor_competitor", "actor_alliance"]
+    for item in first.actor_distributions:
+        assert abs(sum(item.strategy_frequency.values()) - 1.0) < 1e-3
+    assert abs(sum(first.dominant_strategy_frequency.values()) - 1.0) < 1e-3
+
+    # Without noise or shuffling every run replays the deterministic war room.
+    fixed = engine.run_monte_carlo(simulation, runs=3, shuffle_actors=False)
+    expected = engine.run(simulation).stability_score
+    assert fixed.stability_score["min"] == fixed.stability_score["max"] == expected
@@ -0,0 +1,114 @@
+"""Benchmark ChaosEngine keyword matching across registry sizes.
+
+Builds synthetic registries with 50, 500 and 5000 keywords and compares the
+legacy nested signal x keyword x token scan with the compiled automaton pass
+used by ``ChaosEngine``, with the per-token cache cold and warm. Full
+``analyze`` latency is reported as well.
+"""
+
+from __future__ import annotations
+
+import argparse
+import math
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from chaos_engine.core import ChaosEngine  # noqa: E402
+
+
+TEXT = (
+    "Supplier delays are increasing and inventory shortages keep growing; quality defects "
+    "and rejected batches put pressure on delivery, cash liquidity and customer trust. "
+    "The database outage raised latency while competitor pricing squeezes market share."
+)
+KEYWORDS_PER_SIGNAL = 5
+
+
+def _registry(keyword_count: int) -> dict:
+    base = ChaosEngine()._registry
+    registry = {name: dict(meta) for name, meta in base.items()}
+    synthetic = max(0, keyword_count - sum(len(meta["keywords"]) for meta in registry.values()))
+    for index in range(math.ceil(synthetic / KEYWORDS_PER_SIGNAL)):
+        registry[f"synthetic_{index}"] = {
+            "keywords": [f"kw{index}x{k}" for k in range(KEYWORDS_PER_SIGNAL)],
+            "base_weight": 0.5,
+            "polarity": "neutral",
+            "category": "general",
+        }
+    return registry
+
+
+def _legacy_extract(engine: ChaosEngine, text: str) -> int:
+    tokens = set(engine._tokenize(text))
+    hits = 0
+    for meta in engine._registry.values():
+        for kw in meta.get("keywords", []):
+            lkw = str(kw).lower()
+            if lkw in tokens:
+                hits += 1
+            else:
+                for token in tokens:
+                    if lkw in token:
+                        hits += 1
+                        break
+    return hits
+
+
+def _compiled_extract(engine: ChaosEngine, text: str, *, cold: bool = False) -> int:
+    if cold:
+        engine._keyword_automaton._cache.clear()
+    return len(engine._extract_signals(text, engine._match_tokens(engine._tokenize(text))))
+
+
+def _time_us(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started_at) * 1_000_000)
+    return statistics.median(samples)
+
+
+def run_benchmark(sizes: list[int], iterations: int) -> list[dict]:
+    """Measure keyword extraction and full analysis latency per registry size."""
+    results: list[dict] = []
+    for size in sizes:
+        registry = _registry(size)
+        started_at = time.perf_counter()
+        engine = ChaosEngine(registry=registry)
+        compile_ms = (time.perf_counter() - started_at) * 1000
+        keywords = sum(len(meta["keywords"]) for meta in registry.values())
+        results.append(
+            {
+                "keywords": keywords,
+                "compile_ms": round(compile_ms, 3),
+                "legacy_scan_p50_us": round(_time_us(lambda: _legacy_extract(engine, TEXT), iterations), 1),
+                "compiled_cold_p50_us": round(
+                    _time_us(lambda: _compiled_extract(engine, TEXT, cold=True), iterations), 1
+                ),
+                "compiled_warm_p50_us": round(_time_us(lambda: _compiled_extract(engine, TEXT), iterations), 1),
+                "analyze_p50_us": round(_time_us(lambda: engine.analyze(TEXT), iterations), 1),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 500, 5000])
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    for row in run_benchmark(args.sizes, max(1, args.iterations)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
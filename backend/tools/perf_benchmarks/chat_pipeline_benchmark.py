@@ -0,0 +1,100 @@
+"""Benchmark end-to-end ``POST /chat`` latency with serial vs concurrent enrichment stages.
+
+Drives the real FastAPI app (startup hooks included) through ``TestClient``
+with a rotating set of prompts and reports p50/p95/p99 latency per mode.
+``serial`` runs every enrichment stage in order on one worker thread, the way
+the pipeline ran before it was staged; ``parallel`` lets independent stages
+overlap. Each request uses its own ``X-Forwarded-For`` so the per-IP rate
+limiter stays out of the measurement, and all data files are written under a
+temporary working directory.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+for path in (BACKEND_DIR, BACKEND_DIR.parent):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+PROMPTS = (
+    "inventory is low and supplier delay risk rising",
+    "competitor pricing strategy in the market",
+    "delivery late because of a warehouse bottleneck",
+    "risk incident after a quality drop",
+    "stockout spike while restock is delayed",
+    "rival game plan on pricing and market share",
+)
+
+
+def _percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100.0 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def run_benchmark(requests: int, concurrency: int) -> list[dict]:
+    from fastapi.testclient import TestClient
+
+    import main as backend_main
+    from app.services import chat_stages
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        os.chdir(tmp)
+        with TestClient(backend_main.app) as client:
+            counter = iter(range(10**9))
+
+            def one(mode_index: int) -> float:
+                index = next(counter)
+                started_at = time.perf_counter()
+                response = client.post(
+                    "/chat",
+                    json={"text": PROMPTS[index % len(PROMPTS)], "user_id": f"bench-{index % 8}"},
+                    headers={"x-forwarded-for": f"10.{mode_index}.{index // 256 % 256}.{index % 256}"},
+                )
+                assert response.status_code == 200, response.text[:200]
+                return (time.perf_counter() - started_at) * 1000.0
+
+            for mode_index, (mode, parallel) in enumerate((("serial", False), ("parallel", True)), start=1):
+                chat_stages.CHAT_PARALLEL_STAGES = parallel
+                for _ in range(min(20, requests)):
+                    one(mode_index)
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    samples = list(pool.map(one, [mode_index] * requests))
+                rows.append(
+                    {
+                        "mode": mode,
+                        "requests": requests,
+                        "concurrency": concurrency,
+                        "cpus": os.cpu_count(),
+                        "p50_ms": round(statistics.median(samples), 2),
+                        "p95_ms": round(_percentile(samples, 95), 2),
+                        "p99_ms": round(_percentile(samples, 99), 2),
+                    }
+                )
+        os.chdir(BACKEND_DIR)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=1)
+    args = parser.parse_args()
+    for row in run_benchmark(args.requests, args.concurrency):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+"""Benchmark streaming CSV ingestion on a generated large file.
+
+Writes a synthetic operations CSV (default 1M rows) to a temporary directory
+and ingests it with ``IngestionService.ingest_csv_stream``. Reports file size,
+rows/sec and peak RSS before and after the run; RSS should stay flat as the
+row count grows. ``--whole-file`` also times the in-memory ``ingest("csv")``
+path on the same file for comparison (its peak RSS grows with file size).
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import resource
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from ingestion.extractors.csv_extractor import CsvSamplingPolicy  # noqa: E402
+from ingestion.service import IngestionService  # noqa: E402
+
+
+NOTES = (
+    "late delivery",
+    "cost overrun on freight",
+    "customer complaint",
+    "stockout risk",
+    "",
+    "demand spike",
+    "supplier outage",
+    "normal",
+)
+
+
+def _peak_rss_mb() -> float:
+    # ru_maxrss is KiB on Linux and bytes on macOS.
+    scale = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / scale
+
+
+def _write_csv(path: Path, rows: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        handle.write("sku,warehouse,qty,lead_days,supplier,note\n")
+        for index in range(rows):
+            handle.write(
+                f"SKU{index},WH{rng.randint(1, 40)},{rng.randint(0, 900)},{rng.randint(1, 30)},"
+                f"Vendor{rng.randint(1, 200)},{rng.choice(NOTES)}\n"
+            )
+
+
+def run_benchmark(rows: int, batch_size: int, sample_every: int, whole_file: bool) -> dict:
+    """Generate the CSV, then time streaming (and optionally whole-file) ingestion."""
+    service = IngestionService()
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "ops.csv"
+        _write_csv(path, rows)
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+        rss_before = _peak_rss_mb()
+        started_at = time.perf_counter()
+        bundle = service.ingest_csv_stream(
+            str(path), batch_size=batch_size, sampling=CsvSamplingPolicy(every_nth=sample_every)
+        )
+        stream_s = time.perf_counter() - started_at
+        row = {
+            "rows": rows,
+            "file_mb": round(size_mb, 1),
+            "batch_size": batch_size,
+            "sample_every": sample_every,
+            "signals": len(bundle.signals),
+            "stream_s": round(stream_s, 2),
+            "rows_per_s": int(rows / stream_s),
+            "peak_rss_before_mb": round(rss_before, 1),
+            "peak_rss_after_mb": round(_peak_rss_mb(), 1),
+        }
+
+        if whole_file:
+            started_at = time.perf_counter()
+            service.ingest("csv", {"path": str(path)})
+            row["whole_file_s"] = round(time.perf_counter() - started_at, 2)
+            row["peak_rss_whole_mb"] = round(_peak_rss_mb(), 1)
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=5000)
+    parser.add_argument("--sample-every", type=int, default=1)
+    parser.add_argument("--whole-file", action="store_true")
+    args = parser.parse_args()
+    row = run_benchmark(args.rows, args.batch_size, args.sample_every, args.whole_file)
+    print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""Benchmark AI audit/telemetry JSONL writes: per-event open/append/close vs the batched sink.
+
+``legacy`` reproduces the previous ``_write_jsonl`` (open, ``json.dumps`` one
+event, close) for every event. ``sink_caller`` measures what the request path
+now pays per event (``JsonlBatchSink.submit``), and ``sink_end_to_end``
+includes draining everything to disk. Events are real ``TelemetryEvent``
+models, and several producer threads mimic concurrent requests.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.schemas.telemetry import TelemetryEvent  # noqa: E402
+from app.services.ai.jsonl_sink import JsonlBatchSink  # noqa: E402
+
+
+def _legacy_write(path: Path, event: TelemetryEvent) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(event.model_dump(), ensure_ascii=True) + "\n")
+
+
+def _events(count: int) -> list[TelemetryEvent]:
+    return [
+        TelemetryEvent(
+            trace_id=f"trace-{index // 8}",
+            timestamp="2026-01-01T00:00:00+00:00",
+            stage="provider_execution_completed",
+            task_type="analyze_scenario",
+            provider="ollama",
+            model="llama3",
+            latency_ms=12.5,
+            success=True,
+            metadata={"policy_version": "v1", "attempt": index % 3},
+        )
+        for index in range(count)
+    ]
+
+
+def _produce(events: list[TelemetryEvent], threads: int, write) -> float:
+    chunks = [events[index::threads] for index in range(threads)]
+    workers = [threading.Thread(target=lambda chunk=chunk: [write(event) for event in chunk]) for chunk in chunks]
+    started_at = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - started_at
+
+
+def run_benchmark(events: int, threads: int, batch_size: int) -> list[dict]:
+    payload = _events(events)
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        legacy_path = Path(tmp) / "legacy" / "telemetry.jsonl"
+        elapsed = _produce(payload, threads, lambda event: _legacy_write(legacy_path, event))
+        rows.append({"mode": "legacy", "events": events, "threads": threads, "events_per_s": round(events / elapsed)})
+
+        sink = JsonlBatchSink(Path(tmp) / "sink" / "telemetry.jsonl", batch_size=batch_size, max_queue=events)
+        started_at = time.perf_counter()
+        caller = _produce(payload, threads, sink.submit)
+        sink.close(timeout=None)
+        total = time.perf_counter() - started_at
+        rows.append({"mode": "sink_caller", "events": events, "threads": threads, "events_per_s": round(events / caller)})
+        rows.append({"mode": "sink_end_to_end", "events": events, "threads": threads, "events_per_s": round(events / total)})
+        assert sink.written == events, sink.snapshot()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--events", type=int, default=50000)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--batch-size", type=int, default=256)
+    args = parser.parse_args()
+    for row in run_benchmark(args.events, args.threads, args.batch_size):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,158 @@
+"""Load-test the rate-limit + request-audit middleware stack.
+
+Builds two copies of a small FastAPI app, one behind the previous
+``BaseHTTPMiddleware`` implementations (kept below as the baseline) and one
+behind the current pure-ASGI middleware, then hammers ``GET /health`` and
+``POST /chat`` with concurrent in-process ASGI clients. ``/chat`` is a sync
+stub so it runs on the threadpool like the real endpoint, keeping the
+numbers about middleware overhead rather than the chat pipeline. The audit
+logger writes to an in-memory stream so log formatting is part of the cost.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import logging
+import sys
+import time
+from collections import defaultdict, deque
+from datetime import datetime, timezone
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+import httpx  # noqa: E402
+from fastapi import FastAPI, Request  # noqa: E402
+from starlette.middleware.base import BaseHTTPMiddleware  # noqa: E402
+from starlette.responses import JSONResponse  # noqa: E402
+
+from app.middleware.rate_limit import RateLimitMiddleware  # noqa: E402
+from app.middleware.request_audit import RequestAuditMiddleware, logger as audit_logger  # noqa: E402
+
+
+class _LegacyRateLimitMiddleware(BaseHTTPMiddleware):
+    """Previous limiter: BaseHTTPMiddleware with a per-IP deque of timestamps."""
+
+    def __init__(self, app, *, max_requests: int, window_seconds: int) -> None:
+        super().__init__(app)
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self._requests: dict[str, deque] = defaultdict(deque)
+
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path == "/health":
+            return await call_next(request)
+        forwarded_for = request.headers.get("x-forwarded-for")
+        client_ip = forwarded_for.split(",")[0].strip() if forwarded_for else request.client.host
+        now = time.time()
+        timestamps = self._requests[client_ip]
+        while timestamps and timestamps[0] < now - self.window_seconds:
+            timestamps.popleft()
+        if len(timestamps) >= self.max_requests:
+            return JSONResponse(status_code=429, content={"ok": False})
+        timestamps.append(now)
+        return await call_next(request)
+
+
+class _LegacyRequestAuditMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        started_at = time.perf_counter()
+        timestamp = datetime.now(timezone.utc).isoformat()
+        response = await call_next(request)
+        audit_logger.info(
+            "request_audit timestamp=%s method=%s path=%s client_ip=%s status_code=%s duration_ms=%s",
+            timestamp,
+            request.method,
+            request.url.path,
+            request.client.host if request.client else "unknown",
+            response.status_code,
+            round((time.perf_counter() - started_at) * 1000, 2),
+        )
+        return response
+
+
+def build_app(stack: str, sample_rate: float) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/health")
+    async def health():
+        return {"ok": True}
+
+    @app.post("/chat")
+    def chat(payload: dict):
+        return {"ok": True, "reply": f"echo: {payload.get('text', '')}", "actions": []}
+
+    # Limits are high enough that no request is rejected; the limiter still runs.
+    if stack == "legacy":
+        app.add_middleware(_LegacyRequestAuditMiddleware)
+        app.add_middleware(_LegacyRateLimitMiddleware, max_requests=10**9, window_seconds=60)
+    else:
+        app.add_middleware(RequestAuditMiddleware, sample_rate=sample_rate)
+        app.add_middleware(RateLimitMiddleware, max_requests=10**9, window_seconds=60)
+    return app
+
+
+async def _hammer(app: FastAPI, path: str, requests: int, concurrency: int, clients: int) -> float:
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 5000))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        counter = iter(range(requests))
+
+        async def worker() -> None:
+            for index in counter:
+                headers = {"x-forwarded-for": f"10.0.{index % clients // 256}.{index % 256}"}
+                if path == "/chat":
+                    response = await client.post(path, json={"text": "supplier delay"}, headers=headers)
+                else:
+                    response = await client.get(path, headers=headers)
+                assert response.status_code == 200, response.status_code
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        return time.perf_counter() - started_at
+
+
+def run_benchmark(requests: int, concurrency: int, clients: int, sample_rate: float) -> list[dict]:
+    sink = logging.StreamHandler(io.StringIO())
+    audit_logger.addHandler(sink)
+    audit_logger.setLevel(logging.INFO)
+    audit_logger.propagate = False
+    rows = []
+    try:
+        for path in ("/health", "/chat"):
+            for stack in ("legacy", "asgi"):
+                app = build_app(stack, sample_rate)
+                asyncio.run(_hammer(app, path, min(200, requests), concurrency, clients))  # warm-up
+                elapsed = asyncio.run(_hammer(app, path, requests, concurrency, clients))
+                rows.append(
+                    {
+                        "path": path,
+                        "stack": stack,
+                        "requests": requests,
+                        "concurrency": concurrency,
+                        "rps": round(requests / elapsed, 1),
+                    }
+                )
+    finally:
+        audit_logger.removeHandler(sink)
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--clients", type=int, default=1000, help="distinct client IPs")
+    parser.add_argument("--sample-rate", type=float, default=1.0, help="audit log sample rate for the ASGI stack")
+    args = parser.parse_args()
+    for row in run_benchmark(args.requests, args.concurrency, args.clients, args.sample_rate):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark Monte Carlo fragility sampling: per-sample loop vs numpy batch.
+
+Runs ``sample_fragility`` through the pure-Python loop (the former
+implementation, still used when numpy is missing) and through the vectorized
+path for growing sample counts. The loop is skipped above ``--loop-max``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import montecarlo_service  # noqa: E402
+
+
+BASE_VEC = {"inventory": 0.35, "delivery": 0.45, "risk": 0.6}
+LOOPS = [{"id": "loop_supply"}]
+CHAOS = montecarlo_service._ChaosShim(intensity=0.4, volatility=0.5)
+
+
+def _run(sampler, n: int) -> None:
+    sampler(BASE_VEC, loops=LOOPS, chaos=CHAOS, n=n, sigma=0.08, seed=7, high_score_threshold=0.65)
+
+
+def _time_ms(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(samples)
+
+
+def run_benchmark(sizes: list[int], iterations: int, loop_max: int) -> list[dict]:
+    """Measure median sampling latency per sample count for both paths."""
+    if montecarlo_service.np is None:
+        raise SystemExit("numpy is required for the vectorized path")
+    results: list[dict] = []
+    for n in sizes:
+        row: dict = {"n": n}
+        if n <= loop_max:
+            row["loop_p50_ms"] = round(_time_ms(lambda: _run(montecarlo_service._sample_loop, n), iterations), 2)
+        else:
+            row["loop_p50_ms"] = "skipped"
+        row["vectorized_p50_ms"] = round(
+            _time_ms(lambda: _run(montecarlo_service._sample_vectorized, n), iterations), 2
+        )
+        results.append(row)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[200, 5000, 100_000, 1_000_000])
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--loop-max", type=int, default=100_000)
+    args = parser.parse_args()
+    for row in run_benchmark(args.sizes, max(1, args.iterations), args.loop_max):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
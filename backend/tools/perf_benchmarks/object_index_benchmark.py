@@ -0,0 +1,148 @@
+"""Benchmark object inference over synthetic dictionaries of growing size.
+
+Builds dictionaries with 50, 5k and 50k objects (split between instances,
+types and legacy entries) and reports the one-off index build time and the
+per-request latency of the three inference paths: the hybrid rulebook, the
+registry inference used by ``/chat`` and ``select_objects_v2``. The legacy
+per-request scan is timed for the rulebook as a baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.services import hybrid_rulebook, object_selection_v2  # noqa: E402
+from app.services.hybrid_rulebook import _rulebook_terms, get_rulebook_index, infer_objects_from_text_scored  # noqa: E402
+from app.services.object_registry import infer_allowed_objects_from_text, sync_object_index  # noqa: E402
+from app.services.object_text_index import ObjectTextIndex  # noqa: E402
+
+
+TEXT = "Inventory drop and supplier delays are raising delivery risk and cash pressure this quarter"
+VOCABULARY = (
+    "inventory stock supplier delivery delay risk cash liquidity quality defect demand price "
+    "warehouse port logistics capacity budget margin customer churn outage latency"
+).split()
+
+
+def _entry(rng: random.Random, oid: str) -> dict:
+    words = lambda n: " ".join(rng.choice(VOCABULARY) for _ in range(n))  # noqa: E731
+    return {
+        "id": oid,
+        "label": f"{words(2)} {oid}",
+        "summary": words(6),
+        "tags": [words(1) for _ in range(3)],
+        "synonyms": [words(2) for _ in range(2)],
+        "domain_hints": {"business": [words(1) for _ in range(2)], "ops": [words(1)]},
+    }
+
+
+def _dictionary(size: int, seed: int = 7) -> dict:
+    rng = random.Random(seed)
+    third = max(1, size // 3)
+    return {
+        "instances": [_entry(rng, f"obj_inst_{i}") for i in range(size - 2 * third)],
+        "types": {f"obj_type_{i}": _entry(rng, f"obj_type_{i}") for i in range(third)},
+        "objects": [_entry(rng, f"obj_legacy_{i}") for i in range(third)],
+    }
+
+
+def _legacy_rulebook_scan(object_dict: dict) -> int:
+    tokens = set(hybrid_rulebook._text_tokens(TEXT))
+    hits = 0
+    for entry in [*object_dict["instances"], *object_dict["types"].values(), *object_dict["objects"]]:
+        terms = _rulebook_terms(entry, entry["id"])
+        if tokens.intersection(terms["base"]):
+            hits += 1
+    return hits
+
+
+def _time_ms(fn, iterations: int) -> float:
+    samples = []
+    for _ in range(iterations):
+        started_at = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(samples)
+
+
+def run_benchmark(sizes: list[int], iterations: int) -> list[dict]:
+    """Measure index build and per-request inference latency per dictionary size."""
+    results: list[dict] = []
+    original_loader = object_selection_v2.load_object_dictionary
+    try:
+        for size in sizes:
+            object_dict = _dictionary(size)
+            instances = {entry["id"]: entry for entry in object_dict["instances"]}
+            legacy = {entry["id"]: entry for entry in object_dict["objects"]}
+
+            started_at = time.perf_counter()
+            get_rulebook_index(object_dict)
+            rulebook_build_ms = (time.perf_counter() - started_at) * 1000
+
+            started_at = time.perf_counter()
+            index = sync_object_index(
+                ObjectTextIndex(), object_instances=instances, object_types=object_dict["types"], legacy_objects=legacy
+            )
+            registry_build_ms = (time.perf_counter() - started_at) * 1000
+
+            object_selection_v2.load_object_dictionary = lambda d=object_dict: d
+            started_at = time.perf_counter()
+            object_selection_v2.load_object_catalog()
+            catalog_build_ms = (time.perf_counter() - started_at) * 1000
+
+            results.append(
+                {
+                    "objects": size,
+                    "rulebook_build_ms": round(rulebook_build_ms, 1),
+                    "registry_build_ms": round(registry_build_ms, 1),
+                    "catalog_build_ms": round(catalog_build_ms, 1),
+                    "legacy_scan_p50_ms": round(_time_ms(lambda: _legacy_rulebook_scan(object_dict), 3), 3),
+                    "rulebook_p50_ms": round(
+                        _time_ms(lambda: infer_objects_from_text_scored(TEXT, "business", object_dict), iterations), 3
+                    ),
+                    "registry_p50_ms": round(
+                        _time_ms(
+                            lambda: infer_allowed_objects_from_text(
+                                TEXT,
+                                mode="business",
+                                object_instances=instances,
+                                object_types=object_dict["types"],
+                                legacy_objects=legacy,
+                                index=index,
+                            ),
+                            iterations,
+                        ),
+                        3,
+                    ),
+                    "selection_p50_ms": round(
+                        _time_ms(lambda: object_selection_v2.select_objects_v2(TEXT, "business"), iterations), 3
+                    ),
+                }
+            )
+    finally:
+        object_selection_v2.load_object_dictionary = original_loader
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 5000, 50000])
+    parser.add_argument("--iterations", type=int, default=20)
+    args = parser.parse_args()
+    for row in run_benchmark(args.sizes, max(1, args.iterations)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
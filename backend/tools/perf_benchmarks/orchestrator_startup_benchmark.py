@@ -0,0 +1,94 @@
+"""Benchmark per-request local AI orchestrator construction cost.
+
+Compares the legacy behaviour (a fresh ``LocalAIOrchestrator`` per request)
+with resolving the shared orchestrator from ``app.state`` through the router
+dependency, and counts control plane reloads triggered in each mode.
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.routers.ai_local import get_local_ai_orchestrator  # noqa: E402
+from app.services.ai.control_plane.control_plane_service import AIControlPlaneService  # noqa: E402
+from app.services.ai.orchestrator import LocalAIOrchestrator, build_local_ai_orchestrator  # noqa: E402
+
+
+def _count_reloads() -> list[int]:
+    counter = [0]
+    original_reload = AIControlPlaneService.reload
+
+    def counting_reload(self):
+        counter[0] += 1
+        return original_reload(self)
+
+    AIControlPlaneService.reload = counting_reload
+    return counter
+
+
+def _summarize(label: str, samples_ms: list[float], reloads: int, requests: int) -> dict:
+    ordered = sorted(samples_ms)
+    return {
+        "mode": label,
+        "requests": requests,
+        "mean_ms": round(statistics.fmean(ordered), 4),
+        "p50_ms": round(ordered[len(ordered) // 2], 4),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 4),
+        "control_plane_reloads_per_request": round(reloads / requests, 2),
+    }
+
+
+def run_benchmark(requests: int) -> list[dict]:
+    """Measure orchestrator acquisition cost for both construction modes."""
+    counter = _count_reloads()
+
+    per_request_samples: list[float] = []
+    counter[0] = 0
+    for _ in range(requests):
+        started_at = time.perf_counter()
+        LocalAIOrchestrator()
+        per_request_samples.append((time.perf_counter() - started_at) * 1000)
+    per_request_reloads = counter[0]
+
+    startup_started_at = time.perf_counter()
+    app_state = SimpleNamespace(local_ai_orchestrator=build_local_ai_orchestrator())
+    startup_ms = (time.perf_counter() - startup_started_at) * 1000
+    request = SimpleNamespace(app=SimpleNamespace(state=app_state))
+
+    shared_samples: list[float] = []
+    counter[0] = 0
+    for _ in range(requests):
+        started_at = time.perf_counter()
+        get_local_ai_orchestrator(request)
+        shared_samples.append((time.perf_counter() - started_at) * 1000)
+    shared_reloads = counter[0]
+
+    results = [
+        _summarize("per_request_construction", per_request_samples, per_request_reloads, requests),
+        _summarize("shared_app_state", shared_samples, shared_reloads, requests),
+    ]
+    results[1]["one_time_startup_ms"] = round(startup_ms, 4)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    for row in run_benchmark(max(1, args.requests)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Scaling benchmark for process-pool strategy evaluation in the decision engine.
+
+Runs ``StrategicDecisionEngine.analyze`` over a synthetic system model (see
+``scenario_simulation_benchmark``) with ``--actions`` candidate actions at the
+maximum API horizon, once per worker count (default 1, 2, 4 and 8), and reports
+the median wall time, the speedup over one worker and whether the analysis is
+identical to the single-worker result. Each repeat starts from an empty
+simulation cache, so every strategy is actually simulated.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+for path in (BACKEND_DIR, CURRENT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from engines.decision_engine.decision_engine import StrategicDecisionEngine  # noqa: E402
+from engines.decision_engine.decision_schema import CandidateAction  # noqa: E402
+from engines.scenario_simulation import simulation_pool  # noqa: E402
+from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine  # noqa: E402
+from engines.scenario_simulation.simulation_cache import SimulationCache  # noqa: E402
+from engines.scenario_simulation.simulation_schema import ScenarioInput  # noqa: E402
+from scenario_simulation_benchmark import _model  # noqa: E402
+
+
+LEVERS = (
+    "buffer inventory",
+    "diversify supplier base",
+    "cost efficiency program",
+    "pressure de-escalation",
+    "adoption training",
+    "security hardening",
+    "governance communication",
+    "liquidity reserve",
+    "pricing and capacity",
+)
+
+
+def _actions(count: int) -> list[CandidateAction]:
+    return [
+        CandidateAction(id=f"action_{index}", description=f"{LEVERS[index % len(LEVERS)]} and {LEVERS[(index * 4 + 1) % len(LEVERS)]}")
+        for index in range(count)
+    ]
+
+
+def run_benchmark(actions: int, signals: int, steps: int, workers: list[int], repeats: int) -> list[dict]:
+    model = _model(signals, random.Random(7))
+    candidates = _actions(actions)
+    scenario = ScenarioInput(time_steps=steps)
+    baseline = ScenarioSimulationEngine(workers=1).simulate(model, scenario)
+    rows = []
+    reference = None
+    base_ms = None
+    for count in workers:
+        engine = ScenarioSimulationEngine(workers=count)
+        decision_engine = StrategicDecisionEngine(simulation_engine=engine)
+        samples = []
+        output = None
+        for repeat in range(repeats + 1):
+            engine.cache = SimulationCache()
+            started_at = time.perf_counter()
+            analysis = decision_engine.analyze(
+                system_model=model, simulation=baseline, candidate_actions=candidates, scenario=scenario
+            )
+            if repeat:  # the first run warms the worker processes
+                samples.append((time.perf_counter() - started_at) * 1000)
+            output = json.dumps(analysis.model_dump(mode="json"), sort_keys=True)
+        reference = reference or output
+        median_ms = statistics.median(samples)
+        base_ms = base_ms or median_ms
+        rows.append(
+            {
+                "workers": count,
+                "actions": actions,
+                "signals": signals,
+                "steps": steps,
+                "cpus": os.cpu_count(),
+                "analyze_ms": round(median_ms, 1),
+                "speedup": round(base_ms / median_ms, 2),
+                "identical": output == reference,
+            }
+        )
+    simulation_pool.shutdown_simulation_pools()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--actions", type=int, default=32)
+    parser.add_argument("--signals", type=int, default=200)
+    parser.add_argument("--steps", type=int, default=50)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    for row in run_benchmark(args.actions, args.signals, args.steps, args.workers, args.repeats):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
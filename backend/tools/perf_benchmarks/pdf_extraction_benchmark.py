@@ -0,0 +1,117 @@
+"""Benchmark page-parallel PDF extraction on a generated multi-hundred-page PDF.
+
+Writes a text-only PDF (default 400 pages of ~55 lines) with a minimal
+hand-rolled writer, then reports sequential in-thread extraction, process
+pool extraction (cold pool and warm pool on a second document), a cached
+re-ingest through ``IngestionService.ingest_pdf`` and how many pages a time
+budget admits. Pool speedup is bounded by the CPU count, which is printed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from ingestion.extractors import pdf_extractor  # noqa: E402
+from ingestion.service import IngestionService  # noqa: E402
+
+
+WORDS = (
+    "supplier delay cost risk customer the of and operations inventory backlog report "
+    "quarter margin demand forecast warehouse shipment team plan"
+).split()
+
+
+def write_text_pdf(path: Path, pages: list[str]) -> None:
+    """Write one Helvetica text page per entry (lines split on newlines)."""
+    objects: list[str | None] = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        None,
+        "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    kids: list[str] = []
+    for text in pages:
+        lines = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in text.splitlines()]
+        ops = "BT /F1 11 Tf 13 TL 40 760 Td " + " ".join(f"({line}) Tj T*" for line in lines) + " ET"
+        objects.append(f"<< /Length {len(ops)} >>\nstream\n{ops}\nendstream")
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>"
+        )
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets: list[int] = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode("latin-1")
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    path.write_bytes(bytes(out))
+
+
+def _pages(count: int, seed: int) -> list[str]:
+    rng = random.Random(seed)
+    return ["\n".join(" ".join(rng.choice(WORDS) for _ in range(14)) for _ in range(55)) for _ in range(count)]
+
+
+def _time_s(fn) -> float:
+    started_at = time.perf_counter()
+    fn()
+    return time.perf_counter() - started_at
+
+
+def run_benchmark(pages: int, budget_s: float) -> dict:
+    """Time each extraction mode once on freshly generated documents."""
+    service = IngestionService()
+    with tempfile.TemporaryDirectory() as tmp:
+        first, second = Path(tmp) / "a.pdf", Path(tmp) / "b.pdf"
+        write_text_pdf(first, _pages(pages, 1))
+        write_text_pdf(second, _pages(pages, 2))
+        drain = lambda path, **kw: sum(1 for _ in pdf_extractor.iter_page_texts(str(path), cache=None, **kw))  # noqa: E731
+
+        row = {
+            "pages": pages,
+            "cpus": os.cpu_count(),
+            "pool_workers": pdf_extractor.MAX_WORKERS,
+            "sequential_s": round(_time_s(lambda: drain(first, parallel=False)), 2),
+            "pool_cold_s": round(_time_s(lambda: drain(first, parallel=True)), 2),
+            "pool_warm_s": round(_time_s(lambda: drain(second, parallel=True)), 2),
+        }
+
+        pdf_extractor.PAGE_CACHE.clear()
+        row["ingest_first_s"] = round(_time_s(lambda: service.ingest_pdf(str(first))), 2)
+        row["ingest_cached_ms"] = round(_time_s(lambda: service.ingest_pdf(str(first))) * 1000, 1)
+
+        pdf_extractor.PAGE_CACHE.clear()
+        bundle = service.ingest_pdf(str(second), time_budget_s=budget_s)
+        row["budget_s"] = budget_s
+        row["budget_pages"] = bundle.ingestion_meta["pages_extracted"]
+    return row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=400)
+    parser.add_argument("--budget-s", type=float, default=0.5)
+    args = parser.parse_args()
+    row = run_benchmark(args.pages, args.budget_s)
+    print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""Benchmark control plane ``get_snapshot`` throughput.
+
+Measures snapshot lookups per second for the plain global policy, an active
+global policy change, and tenant/workspace overlay resolution, with the
+effective-policy cache enabled and with it cleared before every call.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.config import LocalAISettings  # noqa: E402
+from app.services.ai.control_plane.control_plane_service import AIControlPlaneService  # noqa: E402
+
+
+def _build_service(workdir: Path) -> AIControlPlaneService:
+    policy_path = workdir / "ai_policy.json"
+    policy_path.write_text(
+        json.dumps({"version_info": {"policy_version": "bench-v1", "source": "file"}}),
+        encoding="utf-8",
+    )
+    service = AIControlPlaneService(LocalAISettings(), policy_path=policy_path)
+    record = service.submit_policy_change(
+        {
+            "title": "Benchmark model change",
+            "scope_type": "global",
+            "payload": {"model": {"fast_model": "bench-fast"}},
+        }
+    )
+    record = service.approve_policy_change(record.change_id, {"actor_id": "bench", "reason": "approve"})
+    service.activate_policy_change(record.change_id, {"actor_id": "bench", "reason": "activate"})
+    return service
+
+
+def _calls_per_second(service: AIControlPlaneService, calls: int, *, cached: bool, **scope: str) -> float:
+    started_at = time.perf_counter()
+    for _ in range(calls):
+        if not cached:
+            service._invalidate_effective_policy_cache()
+        service.get_snapshot(**scope)
+    elapsed = time.perf_counter() - started_at
+    return calls / elapsed if elapsed > 0 else float("inf")
+
+
+def run_benchmark(calls: int) -> list[dict]:
+    """Measure ``get_snapshot`` calls per second for each scope, cached and uncached."""
+    scopes = {
+        "global_active_change": {},
+        "tenant_overlay": {"tenant_id": "bench-tenant"},
+        "workspace_overlay": {"tenant_id": "bench-tenant", "workspace_id": "bench-workspace"},
+    }
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        service = _build_service(Path(tmp))
+        for label, scope in scopes.items():
+            uncached = _calls_per_second(service, calls, cached=False, **scope)
+            cached = _calls_per_second(service, calls, cached=True, **scope)
+            results.append(
+                {
+                    "scope": label,
+                    "calls": calls,
+                    "uncached_calls_per_sec": round(uncached, 1),
+                    "cached_calls_per_sec": round(cached, 1),
+                    "speedup": round(cached / uncached, 1) if uncached else 0.0,
+                }
+            )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=2000)
+    args = parser.parse_args()
+    for row in run_benchmark(max(1, args.calls)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
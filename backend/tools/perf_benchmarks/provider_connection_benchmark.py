@@ -0,0 +1,125 @@
+"""Benchmark pooled provider HTTP clients against per-request clients.
+
+Starts a local stand-in for the Ollama tags endpoint and issues the same
+sequence of ``list_models`` calls through a short-lived client per request
+and through the shared ``ProviderConnectionManager`` pool.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.config import LocalAISettings  # noqa: E402
+from app.services.ai.providers.connection_manager import ProviderConnectionManager  # noqa: E402
+from app.services.ai.providers.ollama_provider import OllamaProvider  # noqa: E402
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        # Real providers disable Nagle; without this, keep-alive responses stall on delayed ACKs.
+        self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        type(self).connections += 1
+
+    def do_GET(self) -> None:
+        body = json.dumps({"models": [{"name": "llama3.2:3b"}]}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args) -> None:
+        return None
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
+
+
+async def _run(provider: OllamaProvider, requests: int) -> list[float]:
+    samples: list[float] = []
+    for _ in range(requests):
+        started_at = time.perf_counter()
+        await provider.list_models()
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return samples
+
+
+def run_benchmark(requests: int) -> list[dict]:
+    """Return latency and connection reuse for per-request and pooled clients."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StandInHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    settings = LocalAISettings(ollama_base_url=f"http://127.0.0.1:{server.server_address[1]}")
+    rows: list[dict] = []
+    try:
+        _StandInHandler.connections = 0
+        samples = asyncio.run(_run(OllamaProvider(settings=settings), requests))
+        rows.append(
+            {
+                "mode": "per_request_client",
+                "requests": requests,
+                "connections": _StandInHandler.connections,
+                "reuse_ratio": round(1 - _StandInHandler.connections / requests, 4),
+                "p50_ms": _percentile(samples, 0.5),
+                "p99_ms": _percentile(samples, 0.99),
+            }
+        )
+
+        _StandInHandler.connections = 0
+        manager = ProviderConnectionManager(settings)
+        provider = OllamaProvider(settings=settings, connection_manager=manager)
+
+        async def pooled() -> list[float]:
+            try:
+                return await _run(provider, requests)
+            finally:
+                await manager.aclose()
+
+        samples = asyncio.run(pooled())
+        pool = manager.stats().pools[0]
+        rows.append(
+            {
+                "mode": "pooled_client",
+                "requests": requests,
+                "connections": _StandInHandler.connections,
+                "reuse_ratio": pool.reuse_ratio,
+                "p50_ms": _percentile(samples, 0.5),
+                "p99_ms": _percentile(samples, 0.99),
+                "avg_wait_ms": pool.avg_wait_ms,
+            }
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    for row in run_benchmark(max(1, args.requests)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark replay frame append latency at different episode lengths.
+
+Seeds an episode with N frames, then measures appending further frames with
+the constant-time ``append_frame_summary`` path and with the legacy
+whole-document rewrite (load, validate, append, dump, atomic replace).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.models.replay import ReplayEpisode, ReplayFrame, ReplayMeta  # noqa: E402
+from app.services.replay_store import ReplayStore  # noqa: E402
+
+
+def _frame(index: int) -> ReplayFrame:
+    return ReplayFrame(
+        t=float(index + 1),
+        input_text=f"benchmark turn {index}",
+        human_state={"stress": 0.4},
+        system_signals={"pressure": 0.5, "load": 0.3},
+        system_state={"kpi": {"inventory": 0.6, "delivery": 0.7, "risk": 0.3}, "loops": [{"id": "R1"}]},
+        visual={"scene_json": {"objects": [{"id": f"obj_{n}", "scale": 1.0} for n in range(8)]}},
+        meta=ReplayMeta(note=None, tags=["bench"]),
+    )
+
+
+def _legacy_append(path: Path, frame: ReplayFrame) -> None:
+    with path.open("r", encoding="utf-8") as f:
+        episode = ReplayEpisode.model_validate(json.load(f))
+    frames = list(episode.frames) + [frame.model_copy(update={"t": episode.frames[-1].t + 1.0})]
+    frames.sort(key=lambda item: item.t)
+    payload = episode.model_copy(update={"frames": frames}).model_dump(mode="json")
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    tmp_path.replace(path)
+
+
+def _percentiles(samples_ms: list[float]) -> dict:
+    ordered = sorted(samples_ms)
+    return {
+        "p50_ms": round(ordered[len(ordered) // 2], 4),
+        "p99_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))], 4),
+        "mean_ms": round(statistics.fmean(ordered), 4),
+    }
+
+
+def run_benchmark(sizes: list[int], appends: int) -> list[dict]:
+    """Measure append latency after seeding episodes of each size."""
+    results: list[dict] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ReplayStore(base_dir=tmp, max_frames=max(sizes) + appends, background_compaction=False)
+        for size in sizes:
+            episode = store.create_episode(title=f"bench-{size}")
+            for index in range(size):
+                store.append_frame_summary(episode.episode_id, _frame(index))
+
+            legacy_path = Path(tmp) / f"legacy-{size}.json"
+            legacy_path.write_text(store.get_episode(episode.episode_id).model_dump_json(), encoding="utf-8")
+
+            log_samples: list[float] = []
+            legacy_samples: list[float] = []
+            for index in range(appends):
+                frame = _frame(size + index)
+                started_at = time.perf_counter()
+                store.append_frame_summary(episode.episode_id, frame)
+                log_samples.append((time.perf_counter() - started_at) * 1000)
+
+                started_at = time.perf_counter()
+                _legacy_append(legacy_path, frame)
+                legacy_samples.append((time.perf_counter() - started_at) * 1000)
+
+            results.append({"frames": size, "mode": "frame_log", **_percentiles(log_samples)})
+            results.append({"frames": size, "mode": "legacy_rewrite", **_percentiles(legacy_samples)})
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 500, 2000])
+    parser.add_argument("--appends", type=int, default=50)
+    args = parser.parse_args()
+    for row in run_benchmark(sorted(max(1, size) for size in args.sizes), max(1, args.appends)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
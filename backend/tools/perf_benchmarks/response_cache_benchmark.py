@@ -0,0 +1,129 @@
+"""Benchmark ``LocalAIOrchestrator.analyze`` with and without the response cache.
+
+A stand-in provider sleeps ``--provider-ms`` per chat call, like a local model
+generating a short answer. ``--requests`` analyses cycle over ``--prompts``
+distinct internal-sensitivity prompts, once with response caching disabled and
+once with the default in-memory cache, and report median and p95 latency,
+provider calls and the cache hit rate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from app.core.config import LocalAISettings  # noqa: E402
+from app.schemas.ai import AIRequest  # noqa: E402
+from app.services.ai.orchestrator import LocalAIOrchestrator  # noqa: E402
+from app.services.ai.providers.base import AIProvider  # noqa: E402
+from app.services.ai.providers.types import (  # noqa: E402
+    ProviderChatRequest,
+    ProviderChatResponse,
+    ProviderDescriptor,
+    ProviderHealthStatus,
+    ProviderModelInfo,
+    ProviderModelList,
+)
+
+
+class _SleepingProvider(AIProvider):
+    def __init__(self, delay_ms: float) -> None:
+        self.delay_s = delay_ms / 1000.0
+        self.chat_calls = 0
+
+    @property
+    def provider_key(self) -> str:
+        return "ollama"
+
+    @property
+    def default_model(self) -> str | None:
+        return "llama3.2:3b"
+
+    def describe(self) -> ProviderDescriptor:
+        return ProviderDescriptor(key="ollama", kind="local", enabled=True, configured=True, default_model="llama3.2:3b")
+
+    async def health_check(self) -> ProviderHealthStatus:
+        return ProviderHealthStatus(provider="ollama", available=True, default_model="llama3.2:3b")
+
+    async def list_models(self) -> ProviderModelList:
+        return ProviderModelList(provider="ollama", models=[ProviderModelInfo(name="llama3.2:3b", provider="ollama")])
+
+    async def chat_json(self, request: ProviderChatRequest) -> ProviderChatResponse:
+        self.chat_calls += 1
+        await asyncio.sleep(self.delay_s)
+        data = {"summary": "Supplier delay raises delivery risk.", "risk_signals": [], "object_candidates": []}
+        return ProviderChatResponse(
+            ok=True,
+            provider="ollama",
+            model=request.model or "llama3.2:3b",
+            raw_model=request.model or "llama3.2:3b",
+            data=data,
+            latency_ms=self.delay_s * 1000.0,
+        )
+
+
+def _percentile(samples: list[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    return round(ordered[min(len(ordered) - 1, int(len(ordered) * fraction))], 3)
+
+
+async def _run(orchestrator: LocalAIOrchestrator, prompts: list[str], requests: int) -> list[float]:
+    samples: list[float] = []
+    for index in range(requests):
+        request = AIRequest(text=prompts[index % len(prompts)], metadata={"task": "analyze_scenario"})
+        started_at = time.perf_counter()
+        response = await orchestrator.analyze(request)
+        samples.append((time.perf_counter() - started_at) * 1000.0)
+        if not response.ok:
+            raise RuntimeError(f"analyze failed: {response.error}")
+    return samples
+
+
+def run(requests: int, prompt_count: int, provider_ms: float, cached: bool) -> dict:
+    settings = LocalAISettings(ai_response_cache_enabled=cached)
+    provider = _SleepingProvider(provider_ms)
+    orchestrator = LocalAIOrchestrator(settings=settings, provider=provider)
+    prompts = [f"Analyze internal supplier delay for region {index}." for index in range(prompt_count)]
+    loop = asyncio.new_event_loop()
+    try:
+        samples = loop.run_until_complete(_run(orchestrator, prompts, requests))
+    finally:
+        loop.close()
+    cache = orchestrator.response_cache
+    return {
+        "mode": "cached" if cached else "uncached",
+        "requests": requests,
+        "prompts": prompt_count,
+        "provider_calls": provider.chat_calls,
+        "hit_rate": cache.snapshot()["hit_rate"] if cache is not None else 0.0,
+        "median_ms": round(statistics.median(samples), 3),
+        "p95_ms": _percentile(samples, 0.95),
+        "total_s": round(sum(samples) / 1000.0, 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--prompts", type=int, default=20)
+    parser.add_argument("--provider-ms", type=float, default=150.0)
+    args = parser.parse_args()
+    rows = [run(args.requests, args.prompts, args.provider_ms, cached) for cached in (False, True)]
+    for row in rows:
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+    print(f"speedup_median={round(rows[0]['median_ms'] / rows[1]['median_ms'], 1)}")
+    print(f"speedup_total={round(rows[0]['total_s'] / rows[1]['total_s'], 1)}")
+
+
+if __name__ == "__main__":
+    main()
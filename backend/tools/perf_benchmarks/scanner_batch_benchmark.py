@@ -0,0 +1,192 @@
+"""Benchmark fragility signal extraction and the batch scan service.
+
+Extraction compares the legacy extractor, which built a ``\\bterm\\b`` pattern
+per term per call and rescanned the escalation terms for every matched rule,
+with the per-mode compiled rule tables, over synthetic documents of
+``--words`` words each, and checks both return the same signals. The batch
+section scores ``--documents`` documents through the orchestrator one after
+another, validating each response as the single-scan endpoint does, and
+through ``run_batch_scan``, then over HTTP as one request per document
+against one batch request. Throughput is reported in documents per second.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from fastapi import FastAPI  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.models.scanner_input import FragilityScanRequest  # noqa: E402
+from app.models.scanner_output import FragilityScanResponse  # noqa: E402
+from app.services.scanner import signal_extractor  # noqa: E402
+from app.services.scanner.batch_scanner import run_batch_scan  # noqa: E402
+from app.services.scanner.scanner_orchestrator import FragilityScannerOrchestrator  # noqa: E402
+
+
+FILLER = (
+    "the team reviewed quarterly plans with regional partners while operations continued and customers "
+    "asked about pricing schedules contracts budgets forecasts and hiring"
+).split()
+MODES = ("business", "operations", "supply_chain")
+
+
+def _vocabulary() -> list[str]:
+    rules = [*signal_extractor._COMMON_RULES, *(rule for rules in signal_extractor._MODE_RULES.values() for rule in rules)]
+    return sorted({term for rule in rules for term in rule.terms} | set(signal_extractor._ESCALATION_TERMS))
+
+
+def _documents(count: int, words: int, rng: random.Random) -> list[str]:
+    vocabulary = _vocabulary()
+    documents = []
+    for _ in range(count):
+        tokens = [rng.choice(FILLER) for _ in range(words)]
+        for _ in range(max(1, words // 25)):
+            tokens[rng.randrange(len(tokens))] = rng.choice(vocabulary)
+        documents.append(" ".join(tokens).capitalize() + ".")
+    return documents
+
+
+def _legacy_extract(text: str, mode: str = "business") -> list[dict]:
+    """The former per-call regex extractor."""
+    normalized_text = signal_extractor._normalize(text)
+    if not normalized_text:
+        return []
+    rules = [*signal_extractor._COMMON_RULES, *signal_extractor._MODE_RULES.get(signal_extractor._normalize(mode), ())]
+    signals = []
+    for rule in rules:
+        matches: list[str] = []
+        for term in rule.terms:
+            if re.search(rf"\b{re.escape(term)}\b", normalized_text) and term not in matches:
+                matches.append(term)
+        if not matches:
+            continue
+        score = rule.base_score + min(len(matches) - 1, 3) * 0.08
+        escalation_count = sum(
+            1 for term in signal_extractor._ESCALATION_TERMS if re.search(rf"\b{re.escape(term)}\b", normalized_text)
+        )
+        score += min(escalation_count, 2) * 0.05
+        score = round(max(0.0, min(1.0, score)), 4)
+        signals.append(
+            {
+                "id": rule.signal_id,
+                "label": rule.label,
+                "score": score,
+                "severity": signal_extractor._severity_for_score(score),
+                "matched_terms": matches,
+                "evidence_text": signal_extractor._evidence_text(text, matches),
+                "dimension": rule.dimension,
+            }
+        )
+    return sorted(signals, key=lambda item: (item["score"], item["label"]), reverse=True)
+
+
+def _docs_per_second(fn, documents: list[str]) -> tuple[float, list]:
+    started_at = time.perf_counter()
+    results = [fn(document, MODES[index % len(MODES)]) for index, document in enumerate(documents)]
+    return len(documents) / (time.perf_counter() - started_at), results
+
+
+def run_extraction(words: int, count: int) -> dict:
+    documents = _documents(count, words, random.Random(words))
+    legacy_rate, legacy = _docs_per_second(_legacy_extract, documents)
+    compiled_rate, compiled = _docs_per_second(signal_extractor.extract_fragility_signals, documents)
+    return {
+        "words": words,
+        "documents": count,
+        "legacy_docs_s": round(legacy_rate, 1),
+        "compiled_docs_s": round(compiled_rate, 1),
+        "speedup": round(compiled_rate / legacy_rate, 2),
+        "identical": legacy == compiled,
+    }
+
+
+def run_batch(count: int, words: int) -> dict:
+    orchestrator = FragilityScannerOrchestrator()
+    requests = [
+        FragilityScanRequest(text=text, mode=MODES[index % len(MODES)])
+        for index, text in enumerate(_documents(count, words, random.Random(count)))
+    ]
+    orchestrator.run_scan(requests[0].model_dump())  # warm imports and catalogs
+
+    started_at = time.perf_counter()
+    # What a client pays calling the single-scan endpoint once per document.
+    serial = [
+        FragilityScanResponse.model_validate(orchestrator.run_scan(request.model_dump())) for request in requests
+    ]
+    serial_s = time.perf_counter() - started_at
+
+    # Not asyncio.run: on exit it reprs the finished task, and with it every result.
+    loop = asyncio.new_event_loop()
+    try:
+        started_at = time.perf_counter()
+        batch = loop.run_until_complete(run_batch_scan(requests, orchestrator))
+        batch_s = time.perf_counter() - started_at
+    finally:
+        loop.close()
+
+    return {
+        "batch_documents": count,
+        "serial_docs_s": round(count / serial_s, 1),
+        "batch_docs_s": round(count / batch_s, 1),
+        "failed": batch.failed_count,
+        "scores_match": [item.result.fragility_score for item in batch.results]
+        == [result.fragility_score for result in serial],
+    }
+
+
+def run_http(count: int, words: int) -> dict:
+    from app.routers.fragility_scanner_router import router
+
+    app = FastAPI()
+    app.include_router(router)
+    documents = [
+        {"text": text, "mode": MODES[index % len(MODES)]}
+        for index, text in enumerate(_documents(count, words, random.Random(count)))
+    ]
+    with TestClient(app) as client:
+        client.post("/scanner/fragility", json=documents[0])
+
+        started_at = time.perf_counter()
+        for document in documents:
+            client.post("/scanner/fragility", json=document).raise_for_status()
+        single_s = time.perf_counter() - started_at
+
+        started_at = time.perf_counter()
+        client.post("/scanner/fragility/batch", json={"documents": documents}).raise_for_status()
+        batch_s = time.perf_counter() - started_at
+
+    return {
+        "http_documents": count,
+        "single_requests_docs_s": round(count / single_s, 1),
+        "batch_request_docs_s": round(count / batch_s, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--words", type=int, nargs="+", default=[50, 300, 3000])
+    parser.add_argument("--documents", type=int, default=200, help="at most 200 for the HTTP batch request")
+    parser.add_argument("--batch-words", type=int, default=120)
+    args = parser.parse_args()
+    for words in args.words:
+        row = run_extraction(words, args.documents)
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+    for row in (run_batch(args.documents, args.batch_words), run_http(args.documents, args.batch_words)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
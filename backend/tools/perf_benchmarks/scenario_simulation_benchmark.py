@@ -0,0 +1,136 @@
+"""Benchmark the compiled, batched scenario simulation against the dict step loop.
+
+Builds a synthetic system model (default 200 signals) and runs a batch of
+scenarios (default 50) for a long horizon (default 1000 steps). Reports the
+one-off compile time, the raw array kernel time for the whole batch, the full
+``run_batch`` time including timeline materialization, and the legacy
+per-signal loop measured on ``--legacy-scenarios`` scenarios and scaled to the
+batch size. ``ScenarioInput`` caps ``time_steps`` at 50 for API callers, so
+inputs here are built with ``model_construct``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from engines.scenario_simulation import compiled_model  # noqa: E402
+from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine  # noqa: E402
+from engines.scenario_simulation.simulation_core import _OBJECT_SIGNAL_AFFINITIES  # noqa: E402
+from engines.scenario_simulation.simulation_schema import ScenarioInput, ScenarioShock  # noqa: E402
+from engines.system_modeling.model_schema import (  # noqa: E402
+    SystemFragilityPoint,
+    SystemLoop,
+    SystemModel,
+    SystemObject,
+    SystemRelationship,
+    SystemSignal,
+)
+
+
+TOKENS = (
+    "risk cost delay pressure panic protest security inventory reliability stability "
+    "satisfaction margin liquidity morale legitimacy adoption demand revenue growth"
+).split()
+RELATION_TYPES = ("dependency", "influence", "control", "competition", "cooperation")
+
+
+def _model(signal_count: int, rng: random.Random) -> SystemModel:
+    names = [f"{rng.choice(TOKENS)} {rng.choice(TOKENS)} {index}" for index in range(signal_count)]
+    object_ids = list(_OBJECT_SIGNAL_AFFINITIES)
+    return SystemModel(
+        problem_summary="benchmark",
+        objects=[SystemObject(id=oid, type="actor", name=oid, description="") for oid in object_ids],
+        signals=[SystemSignal(id=str(index), name=name, type="metric") for index, name in enumerate(names)],
+        relationships=[
+            SystemRelationship(
+                **{"from": rng.choice(object_ids), "to": rng.choice(object_ids), "type": rng.choice(RELATION_TYPES)}
+            )
+            for _ in range(max(1, signal_count // 5))
+        ],
+        loops=[
+            SystemLoop(name=f"loop {index}", type=rng.choice(("reinforcing", "balancing")), path=rng.sample(names, 4))
+            for index in range(max(1, signal_count // 20))
+        ],
+        fragility_points=[
+            SystemFragilityPoint(signal=rng.choice(names), threshold="critical shortage")
+            for _ in range(max(1, signal_count // 20))
+        ],
+    )
+
+
+def _scenarios(count: int, steps: int, rng: random.Random) -> list[ScenarioInput]:
+    return [
+        ScenarioInput.model_construct(
+            shocks=[ScenarioShock(signal=rng.choice(TOKENS), delta=round(rng.uniform(-0.3, 0.3), 2)) for _ in range(3)],
+            time_steps=steps,
+            metadata={},
+        )
+        for _ in range(count)
+    ]
+
+
+def run_benchmark(steps: int, signals: int, scenarios: int, legacy_scenarios: int) -> dict:
+    """Time compile, kernel, batched run and the legacy loop for one configuration."""
+    if compiled_model.np is None:
+        raise SystemExit("numpy is required for the compiled engine")
+    rng = random.Random(7)
+    engine = ScenarioSimulationEngine()
+    model = _model(signals, rng)
+    inputs = _scenarios(scenarios, steps, rng)
+    initial = engine.state_manager.initialize(model)
+    states = [engine.shock_applier.apply(initial, scenario.shocks) for scenario in inputs]
+    signal_keys = tuple(initial)
+
+    started_at = time.perf_counter()
+    compiled = engine.core.compile(model, signal_keys)
+    compile_ms = (time.perf_counter() - started_at) * 1000
+
+    matrix = compiled_model.np.array([[state[key] for key in signal_keys] for state in states])
+    started_at = time.perf_counter()
+    for _ in range(steps):
+        matrix = compiled_model.step(matrix, compiled)
+    kernel_ms = (time.perf_counter() - started_at) * 1000
+
+    started_at = time.perf_counter()
+    engine.core.run_batch(system_model=model, scenarios=inputs, initial_states=states)
+    batch_ms = (time.perf_counter() - started_at) * 1000
+
+    started_at = time.perf_counter()
+    for scenario, state in zip(inputs[:legacy_scenarios], states):
+        engine.core._run_stepwise(system_model=model, scenario=scenario, initial_state=state)  # noqa: SLF001
+    legacy_ms = (time.perf_counter() - started_at) * 1000 * scenarios / max(1, min(legacy_scenarios, scenarios))
+
+    return {
+        "steps": steps,
+        "signals": len(signal_keys),
+        "scenarios": scenarios,
+        "compile_ms": round(compile_ms, 2),
+        "kernel_ms": round(kernel_ms, 1),
+        "run_batch_ms": round(batch_ms, 1),
+        "legacy_est_ms": round(legacy_ms, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--steps", type=int, default=1000)
+    parser.add_argument("--signals", type=int, default=200)
+    parser.add_argument("--scenarios", type=int, default=50)
+    parser.add_argument("--legacy-scenarios", type=int, default=1)
+    args = parser.parse_args()
+    row = run_benchmark(args.steps, args.signals, args.scenarios, args.legacy_scenarios)
+    print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
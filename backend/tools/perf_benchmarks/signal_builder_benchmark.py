@@ -0,0 +1,96 @@
+"""Benchmark `build_signals` on generated documents of 10KB, 1MB and 50MB.
+
+Documents are lower-case report prose with rule keywords sprinkled in, which
+is the worst case for entity collection (no early exit on capitalized tokens).
+Reports the compiled single-pass scan on its own, the full ``build_signals``
+and the legacy approach (``keyword in text`` per rule keyword plus two full
+regex passes for entities) re-implemented here as a baseline.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from ingestion import signal_builder  # noqa: E402
+from ingestion.signal_builder import build_signals, scan_keywords  # noqa: E402
+
+
+LEGACY_UPPER_TOKEN_RE = re.compile(r"\b[A-Z][a-zA-Z]{2,}\b")
+PROSE = (
+    "the quarterly report shows team output holding steady while operations continue across "
+    "regions with new hires onboarding and plans for expansion into adjacent markets"
+).split()
+
+
+def _document(size_bytes: int, seed: int = 7) -> str:
+    rng = random.Random(seed)
+    keywords = [str(k) for rule in signal_builder._SIGNAL_RULES for k in rule["keywords"]]  # noqa: SLF001
+    words: list[str] = []
+    length = 0
+    while length < size_bytes:
+        word = rng.choice(keywords) if rng.random() < 0.01 else rng.choice(PROSE)
+        words.append(word)
+        length += len(word) + 1
+    return " ".join(words)[:size_bytes]
+
+
+def _legacy_build(text: str) -> int:
+    lowered = text.lower()
+    matched = 0
+    for rule in signal_builder._SIGNAL_RULES:  # noqa: SLF001
+        matched += sum(1 for keyword in rule["keywords"] if str(keyword).lower() in lowered)
+    LEGACY_UPPER_TOKEN_RE.findall(text)
+    signal_builder._WORD_RE.findall(lowered)  # noqa: SLF001
+    return matched
+
+
+def _time_s(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+def run_benchmark(sizes: list[int], repeat: int) -> list[dict]:
+    """Best-of-``repeat`` timings per document size."""
+    results: list[dict] = []
+    for size in sizes:
+        text = _document(size)
+        scan = scan_keywords(text)
+        results.append(
+            {
+                "bytes": size,
+                "occurrences": sum(scan.counts().values()),
+                "signals": len(build_signals(text, "src_bench")),
+                "scan_ms": round(_time_s(lambda: scan_keywords(text), repeat) * 1000, 2),
+                "build_ms": round(_time_s(lambda: build_signals(text, "src_bench"), repeat) * 1000, 2),
+                "legacy_ms": round(_time_s(lambda: _legacy_build(text), repeat) * 1000, 2),
+            }
+        )
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000, 50_000_000])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    for row in run_benchmark(args.sizes, max(1, args.repeat)):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
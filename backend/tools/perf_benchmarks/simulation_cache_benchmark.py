@@ -0,0 +1,115 @@
+"""Benchmark simulation memoization on the decision-analysis and war-room paths.
+
+``decision`` mimics the chat attachment: per prompt, build a system model,
+simulate the baseline and run ``StrategicDecisionEngine.analyze`` (one
+simulation per action, then ``compare`` over the same scenarios). ``war_room``
+runs ``StrategyWarRoomEngine.run``, whose per-actor ``analyze`` calls share one
+system model. Each path runs with the cache disabled (``max_entries=0``, the
+previous behaviour) and enabled, and checks the outputs are identical.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.insert(0, str(BACKEND_DIR))
+
+from engines.decision_engine.decision_engine import StrategicDecisionEngine  # noqa: E402
+from engines.scenario_simulation.scenario_engine import ScenarioSimulationEngine  # noqa: E402
+from engines.scenario_simulation.simulation_cache import SimulationCache  # noqa: E402
+from engines.scenario_simulation.simulation_schema import ScenarioInput  # noqa: E402
+from engines.system_modeling.system_model_builder import UniversalSystemModelBuilder  # noqa: E402
+from engines.war_room.war_room_engine import StrategyWarRoomEngine  # noqa: E402
+from engines.war_room.war_room_schema import WarRoomActor, WarRoomSimulation  # noqa: E402
+
+
+PROMPTS = (
+    "Supply chain delays are increasing costs and suppliers are unreliable.",
+    "A competitor price war is hurting margin and demand.",
+    "Government legitimacy is falling and protests are growing.",
+    "Bank liquidity stress is raising credit risk.",
+    "Team morale is falling after a leadership change.",
+)
+
+
+def _decision(rounds: int, cache_size: int) -> tuple[float, list[str], dict]:
+    builder = UniversalSystemModelBuilder()
+    simulation_engine = ScenarioSimulationEngine(cache=SimulationCache(cache_size))
+    decision_engine = StrategicDecisionEngine(simulation_engine=simulation_engine)
+    outputs = []
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        for prompt in PROMPTS:
+            model = builder.build(prompt)
+            baseline = simulation_engine.simulate(model, ScenarioInput(time_steps=12))
+            analysis = decision_engine.analyze(system_model=model, simulation=baseline)
+            outputs.append(json.dumps(analysis.model_dump(mode="json"), sort_keys=True))
+    return time.perf_counter() - started_at, outputs, simulation_engine.cache.snapshot()
+
+
+def _war_room(rounds: int, cache_size: int) -> tuple[float, list[str], dict]:
+    model = UniversalSystemModelBuilder().build(PROMPTS[0] + " Competitors cut prices.")
+    simulation = WarRoomSimulation(
+        system_model=model,
+        actors=[
+            WarRoomActor(id="actor_company", type="company"),
+            WarRoomActor(id="actor_competitor", type="competitor"),
+            WarRoomActor(id="actor_supplier", type="supplier"),
+            WarRoomActor(id="actor_regulator", type="regulator"),
+        ],
+        strategies={
+            "actor_company": ["expand capacity", "diversify suppliers", "cost efficiency"],
+            "actor_competitor": ["price war", "product innovation", "expand capacity"],
+            "actor_supplier": ["diversify suppliers", "buffer inventory"],
+            "actor_regulator": ["governance review", "price war"],
+        },
+        time_steps=12,
+    )
+    engine = StrategyWarRoomEngine()
+    simulation_engine = engine.interaction_engine.decision_engine.simulation_engine
+    simulation_engine.cache = SimulationCache(cache_size)
+    outputs = []
+    started_at = time.perf_counter()
+    for _ in range(rounds):
+        outputs.append(json.dumps(engine.run(simulation).model_dump(mode="json"), sort_keys=True))
+    return time.perf_counter() - started_at, outputs, simulation_engine.cache.snapshot()
+
+
+def run_benchmark(rounds: int) -> list[dict]:
+    rows = []
+    for path, runner in (("decision", _decision), ("war_room", _war_room)):
+        runner(1, 0)  # warm-up
+        before, before_out, _ = runner(rounds, 0)
+        after, after_out, stats = runner(rounds, 512)
+        rows.append(
+            {
+                "path": path,
+                "rounds": rounds,
+                "uncached_ms": round(before * 1000, 1),
+                "cached_ms": round(after * 1000, 1),
+                "speedup": round(before / after, 2),
+                "hit_rate": stats["hit_rate"],
+                "identical": before_out == after_out,
+            }
+        )
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=10)
+    args = parser.parse_args()
+    for row in run_benchmark(args.rounds):
+        print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()
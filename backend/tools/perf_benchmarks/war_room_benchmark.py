@@ -0,0 +1,225 @@
+"""Benchmark the compiled war-room runner against the former stepwise loop.
+
+Plays ``--actors`` actors with ``--strategies`` options each over a synthetic
+system model (see ``scenario_simulation_benchmark``, plus the pressure, demand
+and risk signals strategy selection reacts to) for ``--steps`` steps. The
+legacy path is the former ``StrategyWarRoomEngine.run``: one decision analysis
+batch per actor, then per step a full strategy re-ranking, name-matched shock
+application and the dictionary step functions. Reports median wall times,
+whether both produce the same result, and the time of a ``--runs`` Monte Carlo
+batch against running the legacy loop that many times. ``WarRoomSimulation``
+caps ``time_steps`` at 50 for API callers, so the input is built with
+``model_construct``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from collections import defaultdict
+from pathlib import Path
+
+
+CURRENT_DIR = Path(__file__).resolve().parent
+BACKEND_DIR = CURRENT_DIR.parents[1]
+for path in (BACKEND_DIR, CURRENT_DIR):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+from engines.scenario_simulation.simulation_schema import ScenarioInput  # noqa: E402
+from engines.system_modeling.model_schema import SystemSignal  # noqa: E402
+from engines.war_room.war_room_engine import StrategyWarRoomEngine  # noqa: E402
+from engines.war_room.war_room_schema import (  # noqa: E402
+    WarRoomActor,
+    WarRoomResult,
+    WarRoomSimulation,
+    WarRoomTimelineStep,
+)
+from scenario_simulation_benchmark import _model  # noqa: E402
+
+
+ACTOR_TYPES = ("company", "competitor", "government", "market", "department", "alliance", "pressure_group")
+MOVES = (
+    "expand capacity",
+    "reduce price",
+    "diversify suppliers",
+    "product innovation",
+    "policy intervention",
+    "form alliance",
+    "budget freeze",
+    "retain talent",
+    "defend margin",
+    "hedge exposure",
+    "aggressive pressure",
+    "cooperate on reform",
+)
+
+
+def _simulation(actors: int, strategies: int, steps: int, signals: int) -> WarRoomSimulation:
+    model = _model(signals, random.Random(7))
+    extra = [
+        SystemSignal(id=f"x{index}", name=name, type="metric")
+        for index, name in enumerate(("system pressure", "demand", "system risk"))
+    ]
+    model = model.model_copy(update={"signals": [*model.signals, *extra]})
+    actor_list = [WarRoomActor(id=f"actor_{index}", type=ACTOR_TYPES[index % len(ACTOR_TYPES)]) for index in range(actors)]
+    options = {
+        actor.id: [
+            f"{MOVES[(index + offset) % len(MOVES)]} and {MOVES[(index * 3 + offset * 5 + 1) % len(MOVES)]}"
+            for offset in range(strategies)
+        ]
+        for index, actor in enumerate(actor_list)
+    }
+    return WarRoomSimulation.model_construct(
+        system_model=model,
+        actors=actor_list,
+        strategies=options,
+        time_steps=steps,
+    )
+
+
+def _legacy_run(engine: StrategyWarRoomEngine, simulation: WarRoomSimulation) -> WarRoomResult:
+    """The former stepwise ``StrategyWarRoomEngine.run``."""
+    interaction = engine.interaction_engine
+    actors = [engine.actor_model.normalize(actor) for actor in simulation.actors]
+    actors_by_id = {actor.id: actor for actor in actors}
+    strategies_by_actor = {
+        actor_id: [engine.strategy_model.build(actor_id, item) for item in items]
+        for actor_id, items in simulation.strategies.items()
+    }
+    baseline = interaction.decision_engine.simulation_engine.simulate(
+        simulation.system_model,
+        ScenarioInput.model_construct(time_steps=simulation.time_steps),
+    )
+    recommended = interaction.recommend_actor_preferences(
+        actors=actors,
+        strategies_by_actor=strategies_by_actor,
+        system_model=simulation.system_model,
+        baseline_simulation=baseline,
+        time_steps=simulation.time_steps,
+    )
+    current_state = engine.state_manager.initialize(simulation.system_model)
+    timeline = [WarRoomTimelineStep(t=0, signals=dict(current_state), actor_strategies={})]
+    fragility_events = []
+    conflict_events = []
+    emitted_keys: set[tuple[int, str, str]] = set()
+    strategy_history: dict[str, list] = defaultdict(list)
+    for time_step in range(1, simulation.time_steps + 1):
+        selections = interaction.select_strategies(
+            actors=actors,
+            strategies_by_actor=strategies_by_actor,
+            system_model=simulation.system_model,
+            baseline_simulation=baseline,
+            time_steps=simulation.time_steps,
+            current_state=current_state,
+            recommended_by_actor=recommended,
+        )
+        for actor_id, strategy in selections.items():
+            strategy_history[actor_id].append(strategy)
+        current_state = engine.shock_applier.apply(
+            current_state, interaction.to_shocks(selections=selections, actors_by_id=actors_by_id)
+        )
+        current_state = engine.shock_applier.apply(current_state, interaction.interaction_shocks(selections))
+        current_state = engine.core._propagate_relationships(  # noqa: SLF001
+            current_state, simulation.system_model.objects, simulation.system_model.relationships
+        )
+        current_state = engine.loop_executor.apply(current_state, simulation.system_model.loops)
+        current_state = engine.core._apply_natural_drift(current_state)  # noqa: SLF001
+        conflict_events.extend(engine.conflict_detector.detect(time_step, selections))
+        fragility_events.extend(
+            engine.fragility_monitor.check(
+                time_step=time_step,
+                state=current_state,
+                fragility_points=simulation.system_model.fragility_points,
+                emitted_keys=emitted_keys,
+            )
+        )
+        timeline.append(
+            WarRoomTimelineStep(
+                t=time_step,
+                signals=dict(current_state),
+                actor_strategies={actor_id: strategy.name for actor_id, strategy in selections.items()},
+            )
+        )
+    final_stability = engine.core._stability_score(current_state, len(fragility_events) + len(conflict_events))  # noqa: SLF001
+    actor_outcomes = engine.outcome_evaluator.evaluate_actor_outcomes(
+        actors=actors,
+        strategy_history=strategy_history,
+        final_state=current_state,
+        baseline_stability=baseline.stability_score,
+        final_stability=final_stability,
+        conflict_count=len(conflict_events),
+    )
+    return WarRoomResult(
+        timeline=timeline,
+        strategy_paths=actor_outcomes,
+        actor_outcomes=actor_outcomes,
+        conflict_events=conflict_events,
+        system_fragility={
+            "event_count": len(fragility_events),
+            "signals": [event.signal for event in fragility_events],
+            "thresholds": [point.signal for point in simulation.system_model.fragility_points],
+        },
+        dominant_strategy=engine.outcome_evaluator.dominant_strategy(actor_outcomes),
+        stability_score=final_stability,
+        metadata={
+            "time_steps": simulation.time_steps,
+            "baseline_stability": baseline.stability_score,
+            "recommended_preferences": recommended,
+        },
+    )
+
+
+def _median_ms(fn, repeats: int) -> tuple[float, object]:
+    samples = []
+    result = None
+    for _ in range(repeats):
+        # A fresh engine starts with an empty simulation cache.
+        engine = StrategyWarRoomEngine()
+        started_at = time.perf_counter()
+        result = fn(engine)
+        samples.append((time.perf_counter() - started_at) * 1000)
+    return statistics.median(samples), result
+
+
+def run_benchmark(actors: int, strategies: int, steps: int, signals: int, runs: int, repeats: int) -> dict:
+    simulation = _simulation(actors, strategies, steps, signals)
+    legacy_ms, legacy = _median_ms(lambda engine: _legacy_run(engine, simulation), repeats)
+    compiled_ms, compiled = _median_ms(lambda engine: engine.run(simulation), repeats)
+    monte_carlo_ms, _ = _median_ms(
+        lambda engine: engine.run_monte_carlo(simulation, runs=runs, noise=0.02, seed=7),
+        max(1, repeats // 2),
+    )
+    return {
+        "actors": actors,
+        "strategies": strategies,
+        "steps": steps,
+        "signals": len(simulation.system_model.signals),
+        "legacy_ms": round(legacy_ms, 1),
+        "compiled_ms": round(compiled_ms, 1),
+        "speedup": round(legacy_ms / compiled_ms, 2),
+        "identical": legacy.model_dump() == compiled.model_dump(),
+        "mc_runs": runs,
+        "mc_ms": round(monte_carlo_ms, 1),
+        "legacy_runs_est_ms": round(legacy_ms * runs, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--actors", type=int, default=10)
+    parser.add_argument("--strategies", type=int, default=10)
+    parser.add_argument("--steps", type=int, default=100)
+    parser.add_argument("--signals", type=int, default=60)
+    parser.add_argument("--runs", type=int, default=200)
+    parser.add_argument("--repeats", type=int, default=5)
+    args = parser.parse_args()
+    row = run_benchmark(args.actors, args.strategies, args.steps, args.signals, args.runs, args.repeats)
+    print(" ".join(f"{key}={value}" for key, value in row.items()))
+
+
+if __name__ == "__main__":
+    main()